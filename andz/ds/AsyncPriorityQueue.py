@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+An asynchronous priority queue is a priority queue which can be shared by
+multiple asyncio tasks (coroutines) running in the same event loop.
+
+It's the asyncio counterpart of BlockingPriorityQueue: a task which tries to
+remove an element from an empty queue (or to add an element to a full queue, if
+the queue has a capacity) is suspended until another task adds (or removes) an
+element. Since all tasks run in the same thread, no lock is needed: the waiting
+tasks are kept in two FIFO queues of futures, which are resolved (in order)
+when an element is added or removed, like in asyncio.Queue.
+
+The elements are kept in a MinHeap, so the smallest element is always the
+first to be removed.
+
+This class is not thread-safe. To wait with a timeout, use asyncio.wait_for.
+
+# References
+
+- https://docs.python.org/3/library/asyncio-queue.html
+- https://github.com/python/cpython/blob/main/Lib/asyncio/queues.py
+"""
+
+import asyncio
+from collections import deque
+
+from andz.ds.MinHeap import MinHeap
+
+__all__ = ["AsyncPriorityQueue"]
+
+
+def _wake_up_next(waiters: deque) -> None:
+    """Wakes up the first waiter in waiters which is not done (e.g. cancelled).
+
+    Time complexity: O(1) amortized."""
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            break
+
+
+async def _wait(waiters: deque, predicate) -> None:
+    """Suspends the current task while predicate() returns true, by waiting on
+    a future appended to waiters."""
+    while predicate():
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # The waiter had already been woken up, so that wake-up is
+                # passed on to the next waiter.
+                _wake_up_next(waiters)
+            raise
+
+
+class AsyncPriorityQueue:
+    """asyncio min-priority queue.
+
+    If capacity is None, the queue is unbounded, otherwise it can contain at
+    most capacity elements.
+
+    Public interface:
+
+    - size
+    - capacity
+    - is_empty
+    - is_full
+    - find_min
+    - put
+    - put_nowait
+    - get
+    - get_nowait
+    - get_many"""
+
+    def __init__(self, capacity: int = None):
+        if capacity is not None:
+            if not isinstance(capacity, int):
+                raise TypeError("capacity must be an instance of int")
+            if capacity < 1:
+                raise ValueError("capacity must be greater or equal to 1")
+        self._capacity = capacity
+        self._heap = MinHeap()
+        # Futures of the tasks waiting to get and to put, respectively.
+        self._getters = deque()
+        self._putters = deque()
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this queue.
+
+        Time complexity: O(1)."""
+        return self._heap.size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of elements in this queue, or None if this
+        queue is unbounded.
+
+        Time complexity: O(1)."""
+        return self._capacity
+
+    def is_empty(self) -> bool:
+        """Returns true if this queue is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._heap.is_empty()
+
+    def is_full(self) -> bool:
+        """Returns true if this queue is full, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._capacity is not None and self._heap.size >= self._capacity
+
+    def find_min(self) -> object:
+        """Returns (without removing it) the smallest element in this queue, or
+        None if this queue is empty.
+
+        Time complexity: O(1)."""
+        return self._heap.find_min()
+
+    async def put(self, x: object) -> None:
+        """Adds x to this queue, waiting until a slot becomes available, if this
+        queue is full.
+
+        Time complexity: O(log(n)), excluding the waiting time."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        await _wait(self._putters, self.is_full)
+        self.put_nowait(x)
+
+    def put_nowait(self, x: object) -> None:
+        """Adds x to this queue, if it's not full, otherwise asyncio.QueueFull
+        is raised.
+
+        Time complexity: O(log(n))."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        if self.is_full():
+            raise asyncio.QueueFull
+        self._heap.add(x)
+        _wake_up_next(self._getters)
+
+    async def get(self) -> object:
+        """Removes and returns the smallest element in this queue, waiting until
+        an element is added, if this queue is empty.
+
+        Time complexity: O(log(n)), excluding the waiting time."""
+        await _wait(self._getters, self.is_empty)
+        return self.get_nowait()
+
+    def get_nowait(self) -> object:
+        """Removes and returns the smallest element in this queue, if it's not
+        empty, otherwise asyncio.QueueEmpty is raised.
+
+        Time complexity: O(log(n))."""
+        if self.is_empty():
+            raise asyncio.QueueEmpty
+        x = self._heap.remove_min()
+        _wake_up_next(self._putters)
+        return x
+
+    async def get_many(self, k: int) -> list:
+        """Removes and returns (at most) the k smallest elements in this queue,
+        in increasing order.
+
+        If this queue is empty, it waits for (at least) one element, but then it
+        does not wait for more elements, so fewer than k elements may be
+        returned.
+
+        Time complexity: O(k * log(n)), excluding the waiting time."""
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 1:
+            raise ValueError("k must be greater or equal to 1")
+        await _wait(self._getters, self.is_empty)
+        result = self._heap.pop_many(k)
+        for _ in result:
+            _wake_up_next(self._putters)
+        # If elements are left, another waiting getter can take them.
+        if not self.is_empty():
+            _wake_up_next(self._getters)
+        return result
+
+    def __str__(self):
+        return str(self._heap)
+
+    def __repr__(self):
+        return self.__str__()
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 01/07/2015
 
-Updated: 06/04/2018
+Updated: 19/10/2026
 
 # Description
 
@@ -31,6 +31,10 @@ Contains the abstract class BinaryHeap.
 import io
 import math
 from abc import ABC, abstractmethod
+from itertools import count
+from logging import getLogger
+
+logger = getLogger(__name__)
 
 __all__ = ["BinaryHeap", "build_pretty_binary_heap"]
 
@@ -43,7 +47,25 @@ class BinaryHeap(ABC):
     It's the responsibility of the client to ensure that inserted elements are
     comparable among them.
 
-    Their order also defines their priority.
+    Their order also defines their priority, unless a key function is given, in
+    which case the priority of an element x is defined by key(x). key(x) is
+    computed only once, when x is inserted, and it's stored, together with x
+    and an insertion sequence number, in an entry (key(x), sequence number, x)
+    of self.heap. Since sequence numbers are unique, elements with equal keys
+    are ordered by insertion (the first inserted is the first removed) and the
+    elements themselves are never compared (so they do not need to be
+    comparable).
+
+    If lazy_delete is true, delete does not search for the element to remove
+    (which takes O(n) time), but only records a "tombstone" for it in a
+    dictionary, in O(1) time, and the element is physically removed only when
+    it reaches the root (the operations which access the root skip the deleted
+    elements). Once the tombstones are more than compact_fraction times the
+    number of entries in self.heap, all deleted elements are removed at once and
+    the heap is rebuilt, in O(n) time, so delete takes O(1) amortized time. In
+    this mode, the elements must be hashable (and equal elements must have equal
+    keys), since the number of copies of each element is also kept in a
+    dictionary, which makes contains take O(1) time too.
 
     Public interface:
 
@@ -51,22 +73,76 @@ class BinaryHeap(ABC):
     - is_empty
     - clear
     - add
+    - add_many
+    - pop_many
+    - pushpop
+    - replace
     - contains
     - delete
+    - update_many
     - merge
 
+    The "root" of a heap is the element at index 0, i.e. the element with the
+    highest priority, which is the smallest one in a MinHeap or a MinMaxHeap and
+    the greatest one in a MaxHeap. pop_many, pushpop and replace all operate on
+    the root.
+
     MinHeap, MaxHeap and MinMaxHeap all derive from this class."""
 
-    def __init__(self, ls=None):
-        self.heap = [] if not isinstance(ls, list) else ls
+    # Step of the insertion sequence numbers, which is negative in heaps whose
+    # root is their greatest element, so that elements with equal keys are
+    # removed in insertion order.
+    _seq_step = 1
+
+    def __init__(
+        self, ls=None, key=None, lazy_delete: bool = False, compact_fraction=0.5
+    ):
+        if key is not None and not callable(key):
+            raise TypeError("key must be callable")
+        if not isinstance(compact_fraction, (int, float)):
+            raise TypeError("compact_fraction must be a number")
+        if not 0 < compact_fraction < 1:
+            raise ValueError("compact_fraction must be in the interval (0, 1)")
+        self._key = key
+        self._seq = count(0, self._seq_step)
+        self._lazy_delete = lazy_delete
+        self._compact_fraction = compact_fraction
+        # Number of tombstones of each deleted element which is still in
+        # self.heap, and their total number.
+        self._deleted = {}
+        self._n_deleted = 0
+        # Number of (non-deleted) copies of each element, if lazy_delete.
+        self._counts = {} if lazy_delete else None
+        if key is None:
+            self.heap = [] if not isinstance(ls, list) else ls
+        else:
+            self.heap = [] if not isinstance(ls, list) else self._decorate_all(ls)
+        if lazy_delete:
+            for entry in self.heap:
+                self._count(self._undecorate(entry), 1)
         self._build_heap()
 
+    @property
+    def key(self):
+        """Returns the key function of this heap, or None if the elements are
+        compared directly.
+
+        Time complexity: O(1)."""
+        return self._key
+
+    @property
+    def lazy_delete(self) -> bool:
+        """Returns true if this heap deletes elements lazily, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._lazy_delete
+
     @property
     def size(self) -> int:
-        """Returns the number of elements in this heap.
+        """Returns the number of (non-deleted) elements in this heap.
 
         Time complexity: O(1)."""
-        return len(self.heap)
+        return len(self.heap) - self._n_deleted
 
     def is_empty(self) -> bool:
         """Returns true if this heap is empty, false otherwise.
@@ -79,6 +155,10 @@ class BinaryHeap(ABC):
 
         Time complexity: O(1)."""
         self.heap.clear()
+        self._deleted.clear()
+        self._n_deleted = 0
+        if self._lazy_delete:
+            self._counts.clear()
 
     def add(self, x: object) -> None:
         """Adds object x to this heap.
@@ -89,47 +169,249 @@ class BinaryHeap(ABC):
         Time complexity: O(log n)."""
         if x is None:
             raise ValueError("x cannot be None")
+        if self._lazy_delete:
+            self._count(x, 1)
+        if self._key is not None:
+            x = self._decorate(x)
         self.heap.append(x)
-        if self.size > 1:
-            self._push_up(self.size - 1)
+        if len(self.heap) > 1:
+            self._push_up(len(self.heap) - 1)
+
+    def add_many(self, iterable) -> None:
+        """Adds all objects in iterable to this heap.
+
+        If k, the number of objects to add, is large with respect to n, the
+        current size of this heap, i.e. if k * log(n + k) > n + k, then the
+        objects are appended to the underlying list and the heap is rebuilt from
+        scratch with Floyd's algorithm (see self._build_heap), otherwise each
+        object is bubbled up individually.
+
+        If one of the objects is None, ValueError is raised and this heap is not
+        modified.
+
+        Time complexity: O(min(k * log(n + k), n + k))."""
+        items = list(iterable)
+        if any(x is None for x in items):
+            raise ValueError("all elements of iterable must be not None")
+        if self._lazy_delete:
+            for x in items:
+                self._count(x, 1)
+        if self._key is not None:
+            items = self._decorate_all(items)
+
+        k = len(items)
+        total = len(self.heap) + k
+
+        if k * total.bit_length() > total:
+            self.heap.extend(items)
+            self._build_heap()
+        else:
+            for x in items:
+                self.heap.append(x)
+                self._push_up(len(self.heap) - 1)
+
+    def pop_many(self, k: int) -> list:
+        """Removes and returns (at most) the k elements with the highest
+        priority in this heap, in the order in which they would be removed one
+        at a time from the root.
+
+        If k is greater than the size of this heap, all elements are returned.
+
+        Time complexity: O(k * log(n))."""
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 0:
+            raise ValueError("k must be greater or equal to 0")
+        result = [self._remove_root() for _ in range(min(k, self.size))]
+        if self._key is not None:
+            result = [entry[2] for entry in result]
+        return result
+
+    def pushpop(self, x: object) -> object:
+        """Adds x to this heap and then removes and returns the root.
+
+        This is more efficient than calling self.add(x) followed by a removal of
+        the root, because at most one sift-down is performed. In particular, if
+        x would become the new root, x is returned immediately and this heap is
+        not modified.
+
+        Time complexity: O(log n)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        self._purge_root()
+        entry = x if self._key is None else self._decorate(x)
+        if self.heap and self._has_higher_priority(self.heap[0], entry):
+            entry, self.heap[0] = self.heap[0], entry
+            self._push_down(0)
+            if self._lazy_delete:
+                self._count(x, 1)
+                self._count(self._undecorate(entry), -1)
+        return self._undecorate(entry)
+
+    def replace(self, x: object) -> object:
+        """Removes and returns the root of this heap and then adds x to it.
+
+        This is more efficient than removing the root followed by a call to
+        self.add(x), because only one sift-down is performed. Note that the
+        returned element may have a lower priority than x.
+
+        If this heap is empty, x is simply added to it and None is returned.
+
+        Time complexity: O(log n)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        self._purge_root()
+        if self._lazy_delete:
+            self._count(x, 1)
+        if self._key is not None:
+            x = self._decorate(x)
+        if not self.heap:
+            self.heap.append(x)
+            return None
+        root = self.heap[0]
+        self.heap[0] = x
+        self._push_down(0)
+        if self._lazy_delete:
+            self._count(self._undecorate(root), -1)
+        return self._undecorate(root)
 
     def contains(self, x: object) -> bool:
         """Returns true if x is in this heap, false otherwise.
 
-        Time complexity: O(n)."""
+        Time complexity: O(n), or O(1) if self.lazy_delete."""
         if x is None:
             raise ValueError("x cannot be None")
+        if self._lazy_delete:
+            return x in self._counts
         return self._index(x) != -1
 
     def delete(self, x: object) -> None:
         """Removes the first found x from this heap.
 
+        If self.lazy_delete, a tombstone is recorded for x, which is physically
+        removed later (see the class docstring).
+
         If x is not in this heap, LookupError is raised.
 
-        Time complexity: O(n)."""
+        Time complexity: O(n), or O(1) amortized if self.lazy_delete."""
         if x is None:
             raise ValueError("x cannot be None")
 
+        if self._lazy_delete:
+            if x not in self._counts:
+                raise LookupError("x not found")
+            self._count(x, -1)
+            self._deleted[x] = self._deleted.get(x, 0) + 1
+            self._n_deleted += 1
+            if self._n_deleted > self._compact_fraction * len(self.heap):
+                self._compact()
+            return
+
         i = self._index(x)
         if i == -1:
             raise LookupError("x not found")
 
-        # self has at least one element.
-        if i == self.size - 1:
-            self.heap.pop()
-        else:
-            self._swap(i, self.size - 1)
-            self.heap.pop()
-            self._push_down(i)
+        self._remove_at(i)
+
+    def update_many(self, pairs, factor: float = 1.0) -> str:
+        """Replaces, for each pair (old, new) in pairs, in order, an element
+        equal to old with new, as if self.delete(old) and self.add(new) were
+        called, and returns the chosen strategy, either "sift" or "rebuild".
+
+        The positions of the old elements are found with a single scan of this
+        heap, so the elements must be hashable. Then, if k, the number of
+        pairs, is large with respect to n, the size of this heap, i.e. if
+        k * log(n) * factor > n, all elements are replaced and the heap is
+        rebuilt with Floyd's algorithm (the "rebuild" strategy), otherwise each
+        new element is sifted up and down individually (the "sift" strategy).
+        The chosen strategy is also logged (at the DEBUG level), together with
+        k and n, so that factor can be tuned.
+
+        If an old element is not in this heap (or new is None), LookupError
+        (or ValueError) is raised and this heap is not modified.
+
+        Time complexity: O(n + min(k * log(n), n))."""
+        pairs = list(pairs)
+        if any(new is None for _, new in pairs):
+            raise ValueError("the new elements cannot be None")
+
+        positions = {old: [] for old, _ in pairs}
+        for i, entry in enumerate(self.heap):
+            x = self._undecorate(entry)
+            if x in positions:
+                positions[x].append(i)
+
+        # Check that each old element is available, given the (non-deleted)
+        # elements in this heap and the new elements of the previous pairs.
+        available = {
+            old: (self._counts.get(old, 0) if self._lazy_delete else len(ps))
+            for old, ps in positions.items()
+        }
+        for old, new in pairs:
+            if available.get(old, 0) == 0:
+                raise LookupError(f"{old} not found")
+            available[old] -= 1
+            if new in available:
+                available[new] += 1
+
+        k = len(pairs)
+        n = len(self.heap)
+        strategy = "rebuild" if k * n.bit_length() * factor > n else "sift"
+        logger.debug("update_many: k = %d, n = %d, strategy = %s", k, n, strategy)
+
+        for old, new in pairs:
+            if self._lazy_delete:
+                self._count(old, -1)
+                self._count(new, 1)
+            entry = new if self._key is None else self._decorate(new)
+
+            if strategy == "rebuild":
+                i = positions[old].pop()
+                self.heap[i] = entry
+                if new in positions:
+                    positions[new].append(i)
+                continue
+
+            # The previous sifts may have moved the elements, so the candidate
+            # positions are checked before being used, and, if none is still
+            # valid, this heap is scanned again.
+            ps = positions[old]
+            while ps and self._undecorate(self.heap[ps[-1]]) != old:
+                ps.pop()
+            i = ps.pop() if ps else self._index(old)
+            self.heap[i] = entry
             self._push_up(i)
+            self._push_down(i)
 
-    def merge(self, o: "Heap") -> None:
+        if strategy == "rebuild":
+            self._build_heap()
+        return strategy
+
+    def merge(self, o: "BinaryHeap") -> None:
         """Merges this heap with the o heap.
 
+        If this heap has a key function, the elements of o are added with keys
+        computed by it (and new sequence numbers).
+
         Time complexity: O(n + m)."""
-        self.heap += o.heap
+        # pylint: disable=protected-access
+        if o._n_deleted > 0:
+            o._compact()
+        if self._lazy_delete:
+            for entry in o.heap:
+                self._count(o._undecorate(entry), 1)
+        if self._key is None and o._key is None:
+            self.heap += o.heap
+        else:
+            items = [o._undecorate(entry) for entry in o.heap]
+            self.heap += items if self._key is None else self._decorate_all(items)
         self._build_heap()
 
+    @abstractmethod
+    def _has_higher_priority(self, x: object, y: object) -> bool:
+        """Returns true if x must be strictly closer to the root than y, false
+        otherwise."""
+
     @abstractmethod
     def _push_down(self, i: int) -> None:
         """Classical "heapify" operation for heaps."""
@@ -156,14 +438,132 @@ class BinaryHeap(ABC):
             for index in range(len(self.heap) // 2, -1, -1):
                 self._push_down(index)
 
+    def _decorate(self, x: object) -> tuple:
+        """Returns the entry of x, i.e. (key(x), sequence number, x), which is
+        stored in self.heap, if this heap has a key function.
+
+        Time complexity: O(1), plus the time to compute key(x)."""
+        return self._key(x), next(self._seq), x
+
+    def _decorate_all(self, items: list) -> list:
+        """Returns the list of the entries of the elements in items.
+
+        Time complexity: O(n), plus the time to compute the keys."""
+        key = self._key
+        seq = self._seq
+        return [(key(x), next(seq), x) for x in items]
+
+    def _undecorate(self, entry: object) -> object:
+        """Returns the element stored in entry, which is entry itself if this
+        heap has no key function.
+
+        Time complexity: O(1)."""
+        return entry if self._key is None else entry[2]
+
+    def _pop_root(self) -> object:
+        """Removes and returns the root (entry) of this heap, which is assumed
+        to be non-empty, even if it's deleted.
+
+        Time complexity: O(log n)."""
+        last = self.heap.pop()
+        if not self.heap:
+            return last
+        root = self.heap[0]
+        self.heap[0] = last
+        self._push_down(0)
+        return root
+
+    def _remove_root(self) -> object:
+        """Removes and returns the root (entry) of this heap, which is assumed
+        to contain at least one non-deleted element, after removing the deleted
+        elements at the root.
+
+        Time complexity: O(log n), plus O(log n) for each removed deleted
+        element."""
+        self._purge_root()
+        root = self._pop_root()
+        if self._lazy_delete:
+            self._count(self._undecorate(root), -1)
+        return root
+
+    def _remove_at(self, i: int) -> object:
+        """Removes and returns the entry at index i of this heap.
+
+        Time complexity: O(log n)."""
+        last = self.heap.pop()
+        if i == len(self.heap):
+            return last
+        entry = self.heap[i]
+        self.heap[i] = last
+        # The order matters for MinMaxHeap: if the moved element is pushed up,
+        # the element which replaces it at index i may need to be pushed down
+        # (and not vice-versa).
+        self._push_up(i)
+        self._push_down(i)
+        return entry
+
+    def _purge_root(self) -> None:
+        """Removes the root while it's a deleted element, i.e. until the root is
+        a non-deleted element or this heap is empty.
+
+        Time complexity: O(1), if there are no deleted elements, otherwise
+        O(log n) for each removed element."""
+        while self._deleted and self.heap:
+            if not self._consume_tombstone(self._undecorate(self.heap[0])):
+                break
+            self._pop_root()
+
+    def _consume_tombstone(self, x: object) -> bool:
+        """If x has a tombstone, it removes it and returns true, otherwise it
+        returns false.
+
+        Time complexity: O(1)."""
+        c = self._deleted.get(x)
+        if c is None:
+            return False
+        if c == 1:
+            del self._deleted[x]
+        else:
+            self._deleted[x] = c - 1
+        self._n_deleted -= 1
+        return True
+
+    def _compact(self) -> None:
+        """Removes all deleted elements from this heap and rebuilds it.
+
+        Time complexity: Θ(n)."""
+        # Slice assignment keeps self.heap the same list object.
+        self.heap[:] = [
+            entry
+            for entry in self.heap
+            if not self._consume_tombstone(self._undecorate(entry))
+        ]
+        self._build_heap()
+
+    def _count(self, x: object, delta: int) -> None:
+        """Adds delta to the number of (non-deleted) copies of x in this heap,
+        which must have lazy_delete set.
+
+        Time complexity: O(1)."""
+        c = self._counts.get(x, 0) + delta
+        if c == 0:
+            del self._counts[x]
+        else:
+            self._counts[x] = c
+
     def _index(self, x: object) -> int:
         """Returns the index of x in this heap if x is in this heap, otherwise
         it returns -1.
 
         Time complexity: O(n)."""
-        for i, node in enumerate(self.heap):
-            if node == x:
-                return i
+        if self._key is None:
+            for i, node in enumerate(self.heap):
+                if node == x:
+                    return i
+        else:
+            for i, entry in enumerate(self.heap):
+                if entry[2] == x:
+                    return i
         return -1
 
     def _swap(self, i: int, j: int) -> None:
@@ -204,13 +604,25 @@ class BinaryHeap(ABC):
         """Returns true if i is in the bounds of self.heap, false otherwise.
 
         Time complexity: O(1)."""
-        return not (i < 0 or i >= self.size)
+        return not (i < 0 or i >= len(self.heap))
 
     def __str__(self):
-        return str(self.heap)
+        if self._n_deleted == 0:
+            return str([self._undecorate(entry) for entry in self.heap])
+        deleted = dict(self._deleted)
+        live = []
+        for entry in self.heap:
+            x = self._undecorate(entry)
+            if deleted.get(x, 0) > 0:
+                deleted[x] -= 1
+            else:
+                live.append(x)
+        return str(live)
 
     def __repr__(self):
-        return build_pretty_binary_heap(self.heap)
+        return build_pretty_binary_heap(
+            [self._undecorate(entry) for entry in self.heap]
+        )
 
 
 def build_pretty_binary_heap(heap: list, total_width=36, fill=" ") -> str:
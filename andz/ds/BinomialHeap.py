@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A binomial heap is a collection of binomial trees, each of which is
+heap-ordered, i.e. every node is smaller than or equal to its children.
+
+A binomial tree of order (or degree) k is defined recursively: a binomial tree
+of order 0 is a single node, and a binomial tree of order k is obtained by
+linking two binomial trees of order k - 1, i.e. by making the root of one of
+them the leftmost child of the root of the other. Thus, a binomial tree of
+order k has exactly 2ᵏ nodes and its root has k children, which are roots of
+binomial trees of orders 0, 1, ..., k - 1.
+
+A binomial heap contains at most one binomial tree of each order, so the
+binomial trees in a binomial heap with n elements correspond to the 1s in the
+binary representation of n, and there are at most ⌊log₂(n)⌋ + 1 of them.
+
+Merging two binomial heaps is thus analogous to adding two binary numbers:
+two trees of the same order k are linked into one of order k + 1, which is
+"carried" to the next position.
+
+# Implementation
+
+The roots are stored in a list, where the tree of order k is at index k (or
+None if there's no tree of order k). The children of each node are stored in a
+list, ordered by increasing order, so that the ith child is the root of a
+binomial tree of order i.
+
+decrease_key swaps elements between nodes while bubbling up, so the handle
+returned by add is not the node itself but an entry which keeps track of the
+node where the element currently is.
+
+# References
+
+- Chapter 19 of Introduction to Algorithms (2nd ed.) by CLRS
+- https://en.wikipedia.org/wiki/Binomial_heap
+"""
+
+from andz.ds.MergeableHeap import MergeableHeap
+
+__all__ = ["BinomialHeap", "is_binomial_heap"]
+
+
+class _BinomialHeapEntry:
+    """_BinomialHeapEntry is the handle returned by BinomialHeap.add."""
+
+    def __init__(self, key):
+        self.key = key
+        # The node of the BinomialHeap in which this entry currently is.
+        self.node = None
+
+    def __str__(self):
+        return str(self.key)
+
+    def __repr__(self):
+        return f"(key: {self.key})"
+
+
+class _BinomialHeapNode:
+    """_BinomialHeapNode is the node used internally by BinomialHeap."""
+
+    def __init__(self, entry: _BinomialHeapEntry):
+        self.entry = entry
+        entry.node = self
+        self.parent = None
+        # The ith child is the root of a binomial tree of order i.
+        self.children = []
+
+    @property
+    def degree(self) -> int:
+        """Returns the order of the binomial tree rooted at this node."""
+        return len(self.children)
+
+    def __str__(self):
+        return str(self.entry.key)
+
+    def __repr__(self):
+        return f"(key: {self.entry.key}, degree: {self.degree})"
+
+
+def _link(a: _BinomialHeapNode, b: _BinomialHeapNode) -> _BinomialHeapNode:
+    """Links the binomial trees rooted at a and b, which must have the same
+    order, and returns the root of the resulting tree.
+
+    Time complexity: O(1)."""
+    if b.entry.key < a.entry.key:
+        a, b = b, a
+    b.parent = a
+    a.children.append(b)
+    return a
+
+
+class BinomialHeap(MergeableHeap):
+    """Min binomial heap.
+
+    This heap allows duplicates.
+
+    Time complexities:
+
+    - add: O(1) amortized, O(log(n)) in the worst case
+    - find_min: O(1)
+    - merge: O(log(n + m))
+    - decrease_key: O(log(n))
+    - remove_min: O(log(n))"""
+
+    def __init__(self, ls=None):
+        # The binomial tree of order k is at index k, if it exists.
+        self._trees = []
+        # The root with the smallest element.
+        self._min = None
+        MergeableHeap.__init__(self, ls)
+
+    def clear(self) -> None:
+        """Removes all elements from this BinomialHeap.
+
+        Time complexity: O(1)."""
+        self._trees = []
+        self._min = None
+        self._n = 0
+
+    def add(self, x: object) -> _BinomialHeapEntry:
+        """Adds x to this BinomialHeap and returns a handle to it.
+
+        Time complexity: O(1) amortized."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        entry = _BinomialHeapEntry(x)
+        root = self._insert_tree(_BinomialHeapNode(entry))
+        # If the previous minimum was linked below another root, then that root
+        # contains an element which is at most as big.
+        if (
+            self._min is None
+            or self._min.parent is not None
+            or root.entry.key < self._min.entry.key
+        ):
+            self._min = root
+        self._n += 1
+        return entry
+
+    def find_min(self) -> object:
+        """Returns the smallest element in this BinomialHeap.
+
+        Time complexity: O(1)."""
+        return self._min.entry.key if self._min is not None else None
+
+    def remove_min(self) -> object:
+        """Removes and returns the smallest element in this BinomialHeap.
+
+        Time complexity: O(log(n))."""
+        if self._min is None:
+            return None
+        m = self._min
+        self._trees[m.degree] = None
+        for child in m.children:
+            child.parent = None
+            self._insert_tree(child)
+        m.children = []
+        m.entry.node = None
+        self._n -= 1
+        self._update_min()
+        return m.entry.key
+
+    def decrease_key(self, handle: _BinomialHeapEntry, x: object) -> None:
+        """Replaces the element referred to by handle with x, which must be
+        smaller than or equal to it.
+
+        Time complexity: O(log(n))."""
+        self._check_decrease_key(handle, x)
+        handle.key = x
+        node = self._bubble_up(handle.node)
+        if node.parent is None and x < self._min.entry.key:
+            self._min = node
+
+    def merge(self, o: "BinomialHeap") -> None:
+        """Moves all elements of o to this BinomialHeap, so that o is empty
+        afterwards.
+
+        Time complexity: O(log(n + m))."""
+        self._check_merge(o)
+        for tree in o._trees:
+            if tree is not None:
+                self._insert_tree(tree)
+        self._n += o._n
+        self._update_min()
+        o.clear()
+
+    def _remove(self, handle: _BinomialHeapEntry) -> None:
+        """Removes the element referred to by handle from this BinomialHeap.
+
+        The element is moved up to the root of its tree, as if it were smaller
+        than every other element, and then it's removed as the minimum.
+
+        Time complexity: O(log(n))."""
+        self._min = self._bubble_up(handle.node, force=True)
+        self.remove_min()
+
+    def _insert_tree(self, tree: _BinomialHeapNode) -> _BinomialHeapNode:
+        """Inserts the binomial tree rooted at tree into the list of trees,
+        linking it with the trees of the same order (as in a binary addition
+        with carry), and returns the root of the tree where tree ends up.
+
+        Time complexity: O(log(n))."""
+        k = tree.degree
+        while k < len(self._trees) and self._trees[k] is not None:
+            tree = _link(tree, self._trees[k])
+            self._trees[k] = None
+            k += 1
+        if k >= len(self._trees):
+            self._trees.extend([None] * (k + 1 - len(self._trees)))
+        self._trees[k] = tree
+        return tree
+
+    def _update_min(self) -> None:
+        """Removes the trailing empty positions from the list of trees and
+        finds the root with the smallest element.
+
+        Time complexity: O(log(n))."""
+        while self._trees and self._trees[-1] is None:
+            self._trees.pop()
+        self._min = None
+        for tree in self._trees:
+            if tree is not None and (
+                self._min is None or tree.entry.key < self._min.entry.key
+            ):
+                self._min = tree
+
+    @staticmethod
+    def _bubble_up(node: _BinomialHeapNode, force=False) -> _BinomialHeapNode:
+        """Moves the entry of node up, by swapping it with the entry of its
+        parent, while it's smaller than the latter (or until the root, if force
+        is true), and returns the node where the entry ends up.
+
+        Time complexity: O(log(n))."""
+        parent = node.parent
+        while parent is not None and (force or node.entry.key < parent.entry.key):
+            node.entry, parent.entry = parent.entry, node.entry
+            node.entry.node = node
+            parent.entry.node = parent
+            node = parent
+            parent = node.parent
+        return node
+
+    def _handles(self):
+        """Returns an iterator over all entries of this BinomialHeap.
+
+        Time complexity: O(n)."""
+        stack = [tree for tree in self._trees if tree is not None]
+        while stack:
+            node = stack.pop()
+            yield node.entry
+            stack.extend(node.children)
+
+
+# pylint: disable=protected-access
+def is_binomial_heap(h: BinomialHeap) -> bool:
+    """Returns true if h is a valid BinomialHeap, false otherwise."""
+    if not isinstance(h, BinomialHeap):
+        return False
+    n = 0
+    for k, tree in enumerate(h._trees):
+        if tree is None:
+            continue
+        if tree.parent is not None or tree.degree != k:
+            return False
+        if h._min is None or tree.entry.key < h._min.entry.key:
+            return False
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            n += 1
+            if node.entry.node is not node:
+                return False
+            for i, child in enumerate(node.children):
+                if child.parent is not node or child.degree != i:
+                    return False
+                if child.entry.key < node.entry.key:
+                    return False
+                stack.append(child)
+    return n == h.size and (h._min is None) == (n == 0)
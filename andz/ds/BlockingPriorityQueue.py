@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A blocking priority queue is a priority queue which can be safely shared by
+multiple threads (e.g. producers and consumers in a worker pool).
+
+All operations are performed while holding a lock. A thread which tries to
+remove an element from an empty queue (or to add an element to a full queue,
+if the queue has a capacity) waits on a condition variable until another thread
+adds (or removes) an element, or until a timeout expires.
+
+The elements are kept in a MinHeap, so the smallest element is always the
+first to be removed.
+
+Removing many elements at once with get_many acquires the lock only once, which
+reduces the number of lock hand-offs between threads when the queue is highly
+contended.
+
+# References
+
+- https://docs.python.org/3/library/threading.html#condition-objects
+- https://docs.python.org/3/library/queue.html
+- https://en.wikipedia.org/wiki/Monitor_(synchronization)
+"""
+
+import threading
+import time
+from queue import Empty, Full
+
+from andz.ds.MinHeap import MinHeap
+
+__all__ = ["BlockingPriorityQueue", "Empty", "Full"]
+
+
+class BlockingPriorityQueue:
+    """Thread-safe min-priority queue.
+
+    If capacity is None, the queue is unbounded, otherwise it can contain at
+    most capacity elements.
+
+    get and get_many raise queue.Empty if no element becomes available before
+    the timeout expires (or immediately, if block is false), whereas put raises
+    queue.Full if no slot becomes available.
+
+    Public interface:
+
+    - size
+    - capacity
+    - is_empty
+    - is_full
+    - find_min
+    - put
+    - get
+    - get_many
+
+    Note that size, is_empty, is_full and find_min return a snapshot, which may
+    be outdated by the time it's used, if other threads modify the queue."""
+
+    def __init__(self, capacity: int = None):
+        if capacity is not None:
+            if not isinstance(capacity, int):
+                raise TypeError("capacity must be an instance of int")
+            if capacity < 1:
+                raise ValueError("capacity must be greater or equal to 1")
+        self._capacity = capacity
+        self._heap = MinHeap()
+        self._lock = threading.Lock()
+        # Both conditions share the same lock.
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this queue.
+
+        Time complexity: O(1)."""
+        with self._lock:
+            return self._heap.size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of elements in this queue, or None if this
+        queue is unbounded.
+
+        Time complexity: O(1)."""
+        return self._capacity
+
+    def is_empty(self) -> bool:
+        """Returns true if this queue is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        with self._lock:
+            return self._heap.is_empty()
+
+    def is_full(self) -> bool:
+        """Returns true if this queue is full, false otherwise.
+
+        Time complexity: O(1)."""
+        with self._lock:
+            return self._is_full()
+
+    def find_min(self) -> object:
+        """Returns (without removing it) the smallest element in this queue, or
+        None if this queue is empty.
+
+        Time complexity: O(1)."""
+        with self._lock:
+            return self._heap.find_min()
+
+    def put(self, x: object, block: bool = True, timeout: float = None) -> None:
+        """Adds x to this queue.
+
+        If this queue is full and block is true, it waits until a slot becomes
+        available or, if timeout is not None, at most timeout seconds, after
+        which queue.Full is raised. If this queue is full and block is false,
+        queue.Full is raised immediately.
+
+        Time complexity: O(log(n)), excluding the waiting time."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        with self._not_full:
+            if self._is_full():
+                self._wait(self._not_full, self._is_full, block, timeout, Full)
+            self._heap.add(x)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float = None) -> object:
+        """Removes and returns the smallest element in this queue.
+
+        If this queue is empty and block is true, it waits until an element is
+        added or, if timeout is not None, at most timeout seconds, after which
+        queue.Empty is raised. If this queue is empty and block is false,
+        queue.Empty is raised immediately.
+
+        Time complexity: O(log(n)), excluding the waiting time."""
+        with self._not_empty:
+            if self._heap.is_empty():
+                self._wait(self._not_empty, self._heap.is_empty, block, timeout, Empty)
+            x = self._heap.remove_min()
+            self._not_full.notify()
+            return x
+
+    def get_many(self, k: int, block: bool = True, timeout: float = None) -> list:
+        """Removes and returns (at most) the k smallest elements in this queue,
+        in increasing order, while holding the lock only once.
+
+        If this queue is empty, it waits for (at least) one element, as
+        described in self.get, but then it does not wait for more elements, so
+        fewer than k elements may be returned.
+
+        Time complexity: O(k * log(n)), excluding the waiting time."""
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 1:
+            raise ValueError("k must be greater or equal to 1")
+        with self._not_empty:
+            if self._heap.is_empty():
+                self._wait(self._not_empty, self._heap.is_empty, block, timeout, Empty)
+            result = self._heap.pop_many(k)
+            self._not_full.notify(len(result))
+            return result
+
+    def _is_full(self) -> bool:
+        """Returns true if this queue is full, false otherwise.
+
+        It must be called while holding the lock."""
+        return self._capacity is not None and self._heap.size >= self._capacity
+
+    @staticmethod
+    def _wait(condition, predicate, block: bool, timeout: float, exception) -> None:
+        """Waits on condition, whose lock must be held, while predicate()
+        returns true.
+
+        If block is false or timeout is not None and timeout seconds elapse
+        while predicate() is still true, exception is raised."""
+        if not block:
+            raise exception
+        if timeout is None:
+            while predicate():
+                condition.wait()
+        else:
+            if timeout < 0:
+                raise ValueError("timeout must be a non-negative number")
+            end = time.monotonic() + timeout
+            while predicate():
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    raise exception
+                condition.wait(remaining)
+
+    def __str__(self):
+        with self._lock:
+            return str(self._heap)
+
+    def __repr__(self):
+        return self.__str__()
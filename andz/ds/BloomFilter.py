@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A Bloom filter is a probabilistic data structure which represents a set and
+answers membership queries with no false negatives, but with false positives:
+if an element was added, the filter always says that it might be in the set,
+but, if an element was not added, the filter may (with a small probability)
+still say that it might be in the set. Elements cannot be removed.
+
+The filter is an array of m bits, initially all 0, and k hash functions, each
+of which maps an element to one of the m bits. Adding an element sets its k
+bits to 1, and an element might be in the set only if all its k bits are 1.
+
+After n elements have been added, the probability that a given bit is still 0
+is (about) e^(-kn/m), so the false-positive rate is (about)
+
+    p = (1 - e^(-kn/m))^k,
+
+which, for given m and n, is minimized by k = (m / n) ln 2. Conversely, to hold
+n elements with a false-positive rate p, the filter needs
+
+    m = -n ln p / (ln 2)^2
+
+bits (e.g. about 9.6 bits per element, for p = 1%) and k = -log2(p) hash
+functions, independently of the size of the elements.
+
+The k hash functions are derived from two 64-bit hash codes h1 and h2 with
+double hashing (Kirsch and Mitzenmacher), i.e. the i-th hash function is
+
+    g_i(x) = (h1(x) + i * h2(x)) mod m,
+
+which has (asymptotically) the same false-positive rate as k independent hash
+functions. h1 is the hash code of the element mixed with a seed (with
+andz.ds.hashing.mix, as in LinearProbingHashTable) and h2 is h1 mixed again
+(and made odd).
+
+The bits are stored in a bytearray. The bulk operations add_many and
+might_contain_many compute the positions of the bits of all elements (and all
+hash functions) with vectorized NumPy operations on a view of the bytearray.
+
+# References
+
+- https://en.wikipedia.org/wiki/Bloom_filter
+- Burton H. Bloom, "Space/Time Trade-offs in Hash Coding with Allowable
+Errors", Communications of the ACM, 1970.
+- Adam Kirsch and Michael Mitzenmacher, "Less Hashing, Same Performance:
+Building a Better Bloom Filter", ESA 2006.
+"""
+
+import math
+from collections.abc import Hashable
+from secrets import randbits
+
+import numpy as np
+
+from andz.ds.hashing import MASK_64, mix
+
+__all__ = ["BloomFilter", "is_bloom_filter"]
+
+
+def _masks(positions: np.ndarray) -> np.ndarray:
+    """Returns the masks of the bits at positions in their bytes."""
+    return np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8))
+
+
+class BloomFilter:
+    """Bloom filter sized to hold expected_size elements with (at most) the
+    given false_positive_rate.
+
+    Public interface:
+
+    - size
+    - expected_size
+    - false_positive_rate
+    - num_bits
+    - num_hashes
+    - seed
+    - add
+    - add_many
+    - might_contain
+    - might_contain_many
+    - estimated_false_positive_rate
+    - clear
+
+    The in operator is equivalent to might_contain."""
+
+    def __init__(
+        self,
+        expected_size: int,
+        false_positive_rate: float = 0.01,
+        hash_function=None,
+        seed: int = None,
+    ):
+        if not isinstance(expected_size, int):
+            raise TypeError("expected_size must be an instance of int")
+        if expected_size < 1:
+            raise ValueError("expected_size must be greater or equal to 1")
+        if not isinstance(false_positive_rate, (int, float)):
+            raise TypeError("false_positive_rate must be a number")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be in the interval (0, 1)")
+        if hash_function is not None and not callable(hash_function):
+            raise TypeError("hash_function must be callable")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        self._expected_size = expected_size
+        self._false_positive_rate = false_positive_rate
+        self._hash_function = hash if hash_function is None else hash_function
+        self._seed = randbits(64) if seed is None else seed
+        m = math.ceil(-expected_size * math.log(false_positive_rate) / math.log(2) ** 2)
+        self._m = max(8, m)  # The number of bits.
+        self._k = max(1, round(self._m / expected_size * math.log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+        self._size = 0  # The number of elements which changed some bit.
+
+    @property
+    def size(self) -> int:
+        """Returns the number of added elements which set at least one bit,
+        which is an estimate of the number of distinct added elements (an
+        element added again, or a false positive, is not counted, but equal
+        elements added by the same call to add_many are).
+
+        Time complexity: O(1)."""
+        return self._size
+
+    @property
+    def expected_size(self) -> int:
+        """Returns the number of elements this filter was sized for.
+
+        Time complexity: O(1)."""
+        return self._expected_size
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Returns the false-positive rate this filter was sized for.
+
+        Time complexity: O(1)."""
+        return self._false_positive_rate
+
+    @property
+    def num_bits(self) -> int:
+        """Returns the number of bits (m) of this filter.
+
+        Time complexity: O(1)."""
+        return self._m
+
+    @property
+    def num_hashes(self) -> int:
+        """Returns the number of hash functions (k) of this filter.
+
+        Time complexity: O(1)."""
+        return self._k
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed which is mixed with the hash codes of the elements.
+
+        Time complexity: O(1)."""
+        return self._seed
+
+    def _hashes(self, key: object) -> tuple:
+        """Returns the two 64-bit hash codes (h1, h2) of key.
+
+        If key is None or it's not hashable, a TypeError is raised."""
+        if key is None:
+            raise TypeError("key cannot be None.")
+        if not isinstance(key, Hashable):
+            raise TypeError("key must be an instance of a hashable type")
+        h1 = mix(self._hash_function(key), self._seed)
+        return h1, mix(h1, self._seed) | 1
+
+    def _positions(self, keys) -> np.ndarray:
+        """Returns the matrix of the positions of the bits of the keys, where
+        the row i contains the k positions of the i-th key.
+
+        Time complexity: O(k * n), where n is the number of keys."""
+        h1 = []
+        h2 = []
+        for key in keys:
+            a, b = self._hashes(key)
+            h1.append(a)
+            h2.append(b)
+        h1 = np.array(h1, dtype=np.uint64)
+        h2 = np.array(h2, dtype=np.uint64)
+        i = np.arange(self._k, dtype=np.uint64)
+        # The uint64 arithmetic wraps around, as the masking in add does.
+        return (h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(self._m)
+
+    def add(self, key: object) -> None:
+        """Adds key to this filter.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(k)."""
+        h1, h2 = self._hashes(key)
+        bits = self._bits
+        m = self._m
+        changed = False
+        for i in range(self._k):
+            p = ((h1 + i * h2) & MASK_64) % m
+            mask = 1 << (p & 7)
+            if not bits[p >> 3] & mask:
+                bits[p >> 3] |= mask
+                changed = True
+        if changed:
+            self._size += 1
+
+    def add_many(self, keys) -> None:
+        """Adds the keys in the iterable keys to this filter.
+
+        If a key is not valid, an exception is raised before any key is added.
+
+        Time complexity: O(k * n), where n is the number of keys."""
+        positions = self._positions(keys)
+        if len(positions) == 0:
+            return
+        bits = np.frombuffer(self._bits, dtype=np.uint8)
+        before = bits[positions >> np.uint64(3)]
+        masks = _masks(positions)
+        # The keys which find all their bits already set are not counted.
+        self._size += int(((before & masks) == 0).any(axis=1).sum())
+        np.bitwise_or.at(bits, (positions >> np.uint64(3)).ravel(), masks.ravel())
+
+    def might_contain(self, key: object) -> bool:
+        """Returns false if key was definitely not added to this filter, and
+        true if it might have been added.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(k)."""
+        h1, h2 = self._hashes(key)
+        bits = self._bits
+        m = self._m
+        for i in range(self._k):
+            p = ((h1 + i * h2) & MASK_64) % m
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+    def might_contain_many(self, keys) -> list:
+        """Returns the list of the results of might_contain for the keys in the
+        iterable keys.
+
+        Time complexity: O(k * n), where n is the number of keys."""
+        positions = self._positions(keys)
+        if len(positions) == 0:
+            return []
+        bits = np.frombuffer(self._bits, dtype=np.uint8)
+        masks = _masks(positions)
+        found = (bits[positions >> np.uint64(3)] & masks) != 0
+        return found.all(axis=1).tolist()
+
+    def estimated_false_positive_rate(self) -> float:
+        """Returns the estimate (1 - e^(-kn/m))^k of the current false-positive
+        rate of this filter, where n is its size.
+
+        Time complexity: O(1)."""
+        return (1 - math.exp(-self._k * self._size / self._m)) ** self._k
+
+    def clear(self) -> None:
+        """Removes all elements from this filter.
+
+        Time complexity: O(m)."""
+        self._bits = bytearray(len(self._bits))
+        self._size = 0
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        return self.might_contain(key)
+
+    def __len__(self):
+        return self._size
+
+    def __str__(self):
+        return (
+            f"BloomFilter(size={self._size}, num_bits={self._m}, "
+            f"num_hashes={self._k})"
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_bloom_filter(f: BloomFilter) -> bool:
+    """Returns true if f is a valid BloomFilter, false otherwise."""
+    if not isinstance(f, BloomFilter):
+        return False
+    if len(f._bits) != (f._m + 7) // 8 or f._k < 1:
+        return False
+    # The padding bits of the last byte are never set.
+    if f._m % 8 != 0 and f._bits[-1] >> (f._m % 8) != 0:
+        return False
+    return (f._size == 0) == (not any(f._bits))
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A hash table with a Bloom filter in front of it, which contains (at least) all
+keys of the table, so that most lookups (and deletions) of absent keys are
+answered by the filter, without probing the table.
+
+This pays off only when most lookups are misses and probing the table is
+expensive compared to hashing the key twice and testing k bits of the filter
+(in Python), e.g. when the table is on disk (as MmapHashTable) or when the
+keys have expensive __eq__ methods. In front of an in-memory table such as
+LinearProbingHashTable, where a miss costs about one probe, the filter makes
+the lookups slower (even with get_many, which checks all keys against the
+filter with a few vectorized NumPy operations), so the table to wrap must be
+given explicitly.
+
+Since keys cannot be removed from a Bloom filter, the keys deleted from the
+table stay in the filter and only increase its false-positive rate. So, the
+filter is rebuilt from the keys of the table when the number of keys it
+contains exceeds twice the size of the table (or when it exceeds the number of
+keys for which it was sized, in which case its size is doubled). The cost of a
+rebuild is linear in the size of the table, and it's O(1) amortized per
+operation.
+
+# References
+
+- https://en.wikipedia.org/wiki/Bloom_filter#Examples
+"""
+
+from andz.ds.BloomFilter import BloomFilter
+from andz.ds.HashTable import HashTable
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+
+__all__ = ["BloomFilteredHashTable"]
+
+# The minimum number of keys a filter is sized for.
+_MIN_FILTER_SIZE = 64
+
+
+class BloomFilteredHashTable(HashTable):
+    """Wrapper around the HashTable table, whose probes should be expensive
+    (e.g. an MmapHashTable), with a Bloom filter with the given
+    false_positive_rate in front of it.
+
+    Public interface:
+
+    - table
+    - bloom_filter
+    - size
+    - put
+    - get
+    - delete
+    - put_many
+    - get_many
+
+    and the views and the operators of HashTable. The wrapped table must not
+    be modified directly, otherwise the filter may miss some of its keys."""
+
+    def __init__(self, table: HashTable, false_positive_rate: float = 0.01):
+        if not isinstance(table, HashTable):
+            raise TypeError("table must be an instance of HashTable")
+        self._table = table
+        self._false_positive_rate = false_positive_rate
+        self._rebuild_filter(2 * len(table))
+
+    @property
+    def table(self) -> HashTable:
+        """Returns the wrapped hash table.
+
+        Time complexity: O(1)."""
+        return self._table
+
+    @property
+    def bloom_filter(self) -> BloomFilter:
+        """Returns the Bloom filter in front of the wrapped hash table.
+
+        Time complexity: O(1)."""
+        return self._filter
+
+    @property
+    def size(self) -> int:
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(1)."""
+        return len(self._table)
+
+    @classmethod
+    def from_items(
+        cls, iterable, expected_size: int = None, table: HashTable = None
+    ) -> "BloomFilteredHashTable":
+        """Returns a new BloomFilteredHashTable, which wraps table, and which
+        contains the pairs (key, value) of iterable, as HashTable.from_items.
+
+        If table is None, a new LinearProbingHashTable is wrapped, only so that
+        this method can be called as the one of the other hash tables (but the
+        filter does not pay off in front of it, see above).
+
+        Time complexity: O(k * p) expected, where k is the number of pairs in
+        iterable and p the number of hash functions of the filter."""
+        if expected_size is not None:
+            if not isinstance(expected_size, int):
+                raise TypeError("expected_size must be an instance of int")
+            if expected_size < 0:
+                raise ValueError("expected_size must be greater or equal to 0")
+        t = cls(LinearProbingHashTable() if table is None else table)
+        if expected_size is not None:
+            t._reserve(expected_size)
+        t.put_many(iterable)
+        return t
+
+    def _rebuild_filter(self, expected_size: int) -> None:
+        """Replaces the filter with a new one, sized for expected_size keys,
+        which contains the keys of the wrapped table.
+
+        Time complexity: O(n + m), where n is the size of the table and m the
+        number of bits of the new filter."""
+        self._filter = BloomFilter(
+            max(_MIN_FILTER_SIZE, expected_size), self._false_positive_rate
+        )
+        self._filter.add_many(self._table.keys())
+
+    def _check_filter(self) -> None:
+        """Rebuilds the filter, if it contains too many keys, either because it
+        has become too small or because too many keys have been deleted.
+
+        Time complexity: O(1) amortized."""
+        f = self._filter
+        if f.size > f.expected_size:
+            self._rebuild_filter(2 * max(len(self._table), f.expected_size))
+        elif f.size > 2 * len(self._table) + _MIN_FILTER_SIZE:
+            self._rebuild_filter(2 * len(self._table))
+
+    def put(self, key: object, value: object) -> None:
+        """Inserts the pair (key: value) in this map.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(k) expected amortized, if the wrapped table takes
+        O(1) expected amortized time, where k is the number of hash functions
+        of the filter."""
+        self._table.put(key, value)
+        self._filter.add(key)
+        self._check_filter()
+
+    def get(self, key: object) -> object:
+        """Returns the value associated with key, or None, if there's no such
+        key, without probing the wrapped table, if the filter rejects key.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(k) expected, if the wrapped table takes O(1)
+        expected time."""
+        if not self._filter.might_contain(key):
+            return None
+        return self._table.get(key)
+
+    def delete(self, key: object) -> object:
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
+
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(k) expected amortized, if the wrapped table takes
+        O(1) expected amortized time."""
+        if not self._filter.might_contain(key):
+            return None
+        value = self._table.delete(key)
+        self._check_filter()
+        return value
+
+    def put_many(self, iterable) -> None:
+        """Inserts the pairs (key, value) of iterable in this map, adding all
+        keys to the filter at once, before inserting them in the wrapped table.
+
+        If a key is not valid, an exception is raised before any pair is
+        inserted.
+
+        Time complexity: O(k * n) expected amortized, if the wrapped table
+        takes O(1) expected amortized time per pair, where n is the number of
+        pairs."""
+        pairs = list(iterable)
+        # If the wrapped table fails to insert some pairs, their keys are just
+        # false positives of the filter.
+        self._filter.add_many([key for key, _ in pairs])
+        self._table.put_many(pairs)
+        self._check_filter()
+
+    def get_many(self, keys) -> list:
+        """Returns the list of the values associated with the keys in the
+        iterable keys (None for the keys which are not in this map), checking
+        all keys against the filter at once, and looking up in the wrapped
+        table only the ones which passed.
+
+        If a key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(k * n) expected, if the wrapped table takes O(1)
+        expected time per key, where n is the number of keys."""
+        keys = list(keys)
+        passed = [
+            key
+            for key, found in zip(keys, self._filter.might_contain_many(keys))
+            if found
+        ]
+        if not passed:
+            return [None] * len(keys)
+        found = dict(zip(passed, self._table.get_many(passed)))
+        return [found.get(key) for key in keys]
+
+    def _reserve(self, size: int) -> None:
+        """Enlarges the wrapped table and the filter, if needed, so that they
+        can hold size pairs key-value."""
+        self._table._reserve(size)  # pylint: disable=protected-access
+        if size > self._filter.expected_size:
+            self._rebuild_filter(2 * size)
+
+    def _iter_items(self):
+        """Returns an iterator over the pairs (key, value) of this map."""
+        return iter(self._table.items())
+
+    def __len__(self):
+        return len(self._table)
+
+    def __contains__(self, key):
+        if key is None or not self._filter.might_contain(key):
+            return False
+        return key in self._table
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __str__(self):
+        return str(self._table)
+
+    def __repr__(self):
+        return self.__str__()
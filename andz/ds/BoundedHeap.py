@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A bounded heap keeps (at most) the k largest (or smallest) elements of a
+possibly very long stream of elements, using O(k) memory, independently of the
+length of the stream.
+
+To keep the k largest elements, a MinHeap of size (at most) k is used: its root
+is the smallest of the k largest elements seen so far, i.e. the element that an
+incoming element must beat in order to be kept. So, once the heap is full, an
+incoming element which is not greater than the root is rejected with a single
+comparison, otherwise it replaces the root (which is evicted) in O(log(k))
+time. Symmetrically, a MaxHeap is used to keep the k smallest elements.
+
+Given a stream of n elements, finding the k largest elements in this way takes
+O(n * log(k)) time in the worst case, but, if the elements are in random order,
+only O(k * log(n / k)) of them are expected to enter the heap, so it takes
+O(n + k * log(k) * log(n / k)) time, which is O(n) in practice.
+
+# References
+
+- https://en.wikipedia.org/wiki/Partial_sorting
+- https://docs.python.org/3/library/heapq.html#heapq.nlargest
+"""
+
+import operator
+from itertools import islice
+
+from andz.ds.MaxHeap import MaxHeap
+from andz.ds.MinHeap import MinHeap
+
+__all__ = ["BoundedHeap"]
+
+
+class BoundedHeap:
+    """Heap which keeps (at most) the k largest elements added to it, if largest
+    is true, or the k smallest ones, otherwise.
+
+    Public interface:
+
+    - size
+    - capacity
+    - is_empty
+    - is_full
+    - clear
+    - threshold
+    - add
+    - feed
+    - sorted_result
+
+    It's the responsibility of the client to ensure that added elements are
+    comparable among them."""
+
+    def __init__(self, k: int, largest: bool = True):
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 1:
+            raise ValueError("k must be greater or equal to 1")
+        self._k = k
+        # The root of self._heap is the "worst" of the kept elements.
+        self._heap = MinHeap() if largest else MaxHeap()
+        # self._beats(x, root) is true if x must replace root.
+        self._beats = operator.gt if largest else operator.lt
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this BoundedHeap.
+
+        Time complexity: O(1)."""
+        return self._heap.size
+
+    @property
+    def capacity(self) -> int:
+        """Returns k, the maximum number of elements in this BoundedHeap.
+
+        Time complexity: O(1)."""
+        return self._k
+
+    def is_empty(self) -> bool:
+        """Returns true if this BoundedHeap is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._heap.is_empty()
+
+    def is_full(self) -> bool:
+        """Returns true if this BoundedHeap contains k elements, false
+        otherwise.
+
+        Time complexity: O(1)."""
+        return self._heap.size == self._k
+
+    def clear(self) -> None:
+        """Removes all elements from this BoundedHeap.
+
+        Time complexity: O(1)."""
+        self._heap.clear()
+
+    @property
+    def threshold(self) -> object:
+        """Returns the smallest of the kept elements, if largest is true,
+        otherwise the greatest, or None if this BoundedHeap is empty.
+
+        If this BoundedHeap is full, an element is kept only if it's greater
+        (or smaller, if largest is false) than the threshold.
+
+        Time complexity: O(1)."""
+        return self._heap.heap[0] if not self._heap.is_empty() else None
+
+    def add(self, x: object) -> bool:
+        """Adds x to this BoundedHeap, if x is among the k largest (or smallest)
+        elements added so far, evicting the threshold if this BoundedHeap is
+        full.
+
+        Returns true if x is kept, false otherwise.
+
+        Time complexity: O(log(k))."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        if self._heap.size < self._k:
+            self._heap.add(x)
+            return True
+        if self._beats(x, self._heap.heap[0]):
+            self._heap.replace(x)
+            return True
+        return False
+
+    def feed(self, iterable) -> None:
+        """Adds all elements of iterable to this BoundedHeap.
+
+        This is faster than calling self.add for each element: the heap is
+        first filled with Floyd's algorithm and then each element is compared
+        only against the threshold, which is kept in a local variable.
+
+        If one of the elements is None, ValueError is raised, but the elements
+        before it have already been added.
+
+        Time complexity: O(n * log(k)), where n is the number of elements in
+        iterable."""
+        it = iter(iterable)
+        heap = self._heap
+
+        if heap.size < self._k:
+            chunk = list(islice(it, self._k - heap.size))
+            for i, x in enumerate(chunk):
+                if x is None:
+                    heap.add_many(chunk[:i])
+                    raise ValueError("all elements of iterable must be not None")
+            heap.add_many(chunk)
+            if heap.size < self._k:
+                return
+
+        beats = self._beats
+        threshold = heap.heap[0]
+
+        for x in it:
+            if x is None:
+                raise ValueError("all elements of iterable must be not None")
+            if beats(x, threshold):
+                heap.replace(x)
+                threshold = heap.heap[0]
+
+    def sorted_result(self) -> list:
+        """Removes and returns all elements of this BoundedHeap, from the
+        greatest to the smallest, if largest is true, otherwise from the
+        smallest to the greatest.
+
+        Time complexity: O(k * log(k))."""
+        result = self._heap.pop_many(self._heap.size)
+        result.reverse()
+        return result
+
+    def __str__(self):
+        return str(self._heap)
+
+    def __repr__(self):
+        return self.__str__()
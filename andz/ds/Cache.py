@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A cache is a bounded map which keeps the entries that are most likely to be
+accessed again: when a new entry would make the total weight of the entries
+exceed the capacity of the cache, other entries are evicted, according to a
+replacement policy, e.g.
+
+- LRU (least recently used), which evicts the entry which has not been accessed
+for the longest time (see LRUCache), or
+
+- LFU (least frequently used), which evicts the entry which has been accessed
+the least number of times (see LFUCache).
+
+By default, the weight of each entry is 1, so the capacity is the maximum
+number of entries, but a function which computes the weight of each entry
+(e.g. the length of its value) can be given, too.
+
+The entries are kept in a dict (which maps the keys to the entries), and the
+entries themselves are the nodes of the doubly-linked lists used by the
+policies (i.e. the lists are "intrusive"), so that an entry can be moved or
+removed from the middle of a list in O(1) time, given its key.
+
+This class also counts the hits (i.e. the calls to get which found the key), the
+misses and the evictions, and provides the memoize decorator, which caches the
+results of a function (e.g. the functions in andz.algorithms.dp).
+
+# References
+
+- https://en.wikipedia.org/wiki/Cache_replacement_policies
+- https://docs.python.org/3/library/functools.html#functools.lru_cache
+"""
+
+import functools
+from abc import ABC, abstractmethod
+
+__all__ = ["Cache"]
+
+# The default value of get, which distinguishes the absence of a key from a
+# cached None.
+_MISSING = object()
+
+# Separates the positional from the keyword arguments, in the keys of memoize.
+_KWARGS_MARK = object()
+
+
+class _CacheEntry:
+    """_CacheEntry is an entry of a Cache, which is also a node of the
+    doubly-linked lists used by its replacement policy."""
+
+    __slots__ = ("key", "value", "weight", "prev", "next", "bucket")
+
+    def __init__(self, key: object = None, value: object = None, weight=0):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        # The neighbours of this entry in its list (or this entry itself, if
+        # it's the sentinel of an empty list).
+        self.prev = self
+        self.next = self
+        # The frequency bucket which contains this entry (used by LFUCache).
+        self.bucket = None
+
+    def __repr__(self):
+        return f"({self.key}: {self.value})"
+
+
+def _list_insert_after(node: _CacheEntry, entry: _CacheEntry) -> None:
+    """Inserts entry into the list of node, after node.
+
+    Time complexity: O(1)."""
+    entry.prev = node
+    entry.next = node.next
+    node.next.prev = entry
+    node.next = entry
+
+
+def _list_remove(entry: _CacheEntry) -> None:
+    """Removes entry from its list.
+
+    Time complexity: O(1)."""
+    entry.prev.next = entry.next
+    entry.next.prev = entry.prev
+    entry.prev = entry.next = entry
+
+
+class Cache(ABC):
+    """Abstract class from which LRUCache and LFUCache derive, which holds
+    entries whose total weight is at most capacity.
+
+    weight, if given, is a function which takes a key and its value and returns
+    the weight of the entry, a non-negative number (otherwise, the weight of
+    each entry is 1).
+
+    Public interface:
+
+    - size
+    - capacity
+    - weight
+    - hits
+    - misses
+    - evictions
+    - hit_rate
+    - get
+    - put
+    - delete
+    - clear
+    - reset_stats
+    - memoize
+
+    The in operator and len do not count as accesses (nor as hits or misses).
+    Subclasses implement the replacement policy with the methods _link,
+    _touch, _unlink and _victim."""
+
+    def __init__(self, capacity, weight=None):
+        if not isinstance(capacity, (int, float)):
+            raise TypeError("capacity must be a number")
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+        if weight is not None and not callable(weight):
+            raise TypeError("weight must be callable")
+        self._capacity = capacity
+        self._weigh = weight
+        self._entries = {}
+        self._weight = 0  # The total weight of the entries.
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def size(self) -> int:
+        """Returns the number of entries of this cache.
+
+        Time complexity: O(1)."""
+        return len(self._entries)
+
+    @property
+    def capacity(self):
+        """Returns the maximum total weight of the entries of this cache.
+
+        Time complexity: O(1)."""
+        return self._capacity
+
+    @property
+    def weight(self):
+        """Returns the total weight of the entries of this cache.
+
+        Time complexity: O(1)."""
+        return self._weight
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of calls to get which found the key.
+
+        Time complexity: O(1)."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of calls to get which did not find the key.
+
+        Time complexity: O(1)."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Returns the number of entries evicted to make room for other ones.
+
+        Time complexity: O(1)."""
+        return self._evictions
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the ratio between the hits and the calls to get (or 0, if get
+        has not been called).
+
+        Time complexity: O(1)."""
+        total = self._hits + self._misses
+        return self._hits / total if total > 0 else 0.0
+
+    def _entry_weight(self, key: object, value: object):
+        """Returns the weight of the entry (key: value).
+
+        If the weight is not a number, a TypeError is raised, and, if it's
+        negative or greater than the capacity, a ValueError is raised."""
+        if self._weigh is None:
+            return 1
+        w = self._weigh(key, value)
+        if not isinstance(w, (int, float)):
+            raise TypeError("the weight of an entry must be a number")
+        if w < 0:
+            raise ValueError("the weight of an entry must be non-negative")
+        if w > self._capacity:
+            raise ValueError("the weight of the entry exceeds the capacity")
+        return w
+
+    def get(self, key: object, default: object = None) -> object:
+        """Returns the value associated with key, or default, if key is not in
+        this cache, and counts the access as a hit or as a miss.
+
+        Time complexity: O(1) expected."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key: object, value: object) -> None:
+        """Associates value with key (which counts as an access of key) and
+        evicts other entries, if needed, so that the total weight does not
+        exceed the capacity. The entry of key itself is never evicted.
+
+        If the weight of the entry exceeds the capacity, a ValueError is
+        raised, and this cache is not modified.
+
+        Time complexity: O(1) expected (plus O(1) per evicted entry)."""
+        w = self._entry_weight(key, value)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _CacheEntry(key, value, w)
+            self._entries[key] = entry
+            self._link(entry)
+        else:
+            self._weight -= entry.weight
+            entry.value = value
+            entry.weight = w
+            self._touch(entry)
+        self._weight += w
+        # The check on the number of entries guards against rounding errors of
+        # float weights.
+        while self._weight > self._capacity and len(self._entries) > 1:
+            self._remove(self._victim(entry))
+            self._evictions += 1
+
+    def delete(self, key: object) -> object:
+        """Removes the entry of key and returns its value.
+
+        If key is not in this cache, nothing is done (and None is returned).
+
+        Time complexity: O(1) expected."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._remove(entry)
+        return entry.value
+
+    def _remove(self, entry: _CacheEntry) -> None:
+        """Removes entry from this cache.
+
+        Time complexity: O(1) expected."""
+        del self._entries[entry.key]
+        self._unlink(entry)
+        self._weight -= entry.weight
+
+    def clear(self) -> None:
+        """Removes all entries from this cache (but not its statistics).
+
+        Time complexity: O(n)."""
+        for entry in list(self._entries.values()):
+            self._remove(entry)
+
+    def reset_stats(self) -> None:
+        """Resets the numbers of hits, misses and evictions to 0.
+
+        Time complexity: O(1)."""
+        self._hits = self._misses = self._evictions = 0
+
+    def memoize(self, func):
+        """Returns a wrapper of func, which caches the results of func in this
+        cache (where the key is given by the arguments, which must be
+        hashable), and returns the cached result, if any, instead of calling
+        func. It can be used as a decorator:
+
+            cache = LRUCache(1000)
+
+            @cache.memoize
+            def f(n):
+                return n if n < 2 else f(n - 1) + f(n - 2)
+
+        The cache is also available as the attribute cache of the wrapper. The
+        results whose weight exceeds the capacity are not cached.
+
+        Time complexity: O(1) expected, plus the time of func on a miss."""
+        if not callable(func):
+            raise TypeError("func must be callable")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            result = self.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                try:
+                    self.put(key, result)
+                except ValueError:
+                    pass
+            return result
+
+        wrapper.cache = self
+        return wrapper
+
+    @abstractmethod
+    def _link(self, entry: _CacheEntry) -> None:
+        """Inserts the new entry into the lists of the replacement policy."""
+
+    @abstractmethod
+    def _touch(self, entry: _CacheEntry) -> None:
+        """Records an access of entry."""
+
+    @abstractmethod
+    def _unlink(self, entry: _CacheEntry) -> None:
+        """Removes entry from the lists of the replacement policy."""
+
+    @abstractmethod
+    def _victim(self, keep: _CacheEntry) -> _CacheEntry:
+        """Returns the entry to be evicted next, other than keep (which is
+        never the only entry, when this method is called)."""
+
+    @abstractmethod
+    def _iter_entries(self):
+        """Returns an iterator over the entries, from the next to be evicted to
+        the last one."""
+
+    def items(self) -> list:
+        """Returns the list of the pairs (key, value) of this cache, from the
+        next to be evicted to the last one, without counting them as accesses.
+
+        Time complexity: O(n)."""
+        return [(e.key, e.value) for e in self._iter_entries()]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __str__(self):
+        return str(self.items())
+
+    def __repr__(self):
+        return self.__str__()
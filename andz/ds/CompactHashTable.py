@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A compact hash table splits the usual array of slots of an open-addressing hash
+table into two parts (as CPython's dict does since version 3.6):
+
+- a sparse index, i.e. an array of small integers with one slot for each
+position of the hash table, where each slot is either empty (-1) or contains the
+position of an entry in the dense arrays, and
+
+- dense arrays of entries, i.e. of hash codes (as machine integers), keys and
+values, where the entries are appended in insertion order.
+
+The sparse index needs to have many empty slots (for the probing to be short),
+but each of them only takes 1, 2, 4 or 8 bytes, depending on the capacity,
+rather than two (or three) pointers, and the dense arrays contain (almost) only
+live entries.
+
+The hash codes of the keys are mixed with a seed, chosen (by default) at random
+for each table (see andz.ds.hashing), since the index is probed from the low
+bits of the hash codes, which, for example, are all equal for the integers
+which are multiples of a large power of 2. The (mixed) hash codes are stored,
+so that the index can be rebuilt (when the table is resized) without calling
+hash on the keys again, and so that the keys are compared (with __eq__) only
+when their hash codes are equal.
+
+The index uses linear probing with backward-shift deletion (as
+LinearProbingHashTable), so it never contains tombstones. A deleted entry
+leaves a hole in the dense arrays, so that the order of the other entries is
+preserved. The holes are removed when the table is resized or, if there are
+many of them, when the dense arrays would get as long as the maximum number of
+entries of the index.
+
+# References
+
+- https://mail.python.org/pipermail/python-dev/2012-December/123028.html
+- https://github.com/python/cpython/blob/3.12/Objects/dictobject.c
+"""
+
+from array import array
+from collections.abc import Hashable
+from secrets import randbits
+
+from tabulate import tabulate
+
+from andz.ds.hashing import mix
+from andz.ds.HashTable import HashTable
+
+__all__ = ["CompactHashTable", "is_compact_hash_table"]
+
+# The value of the empty slots of the index.
+_EMPTY = -1
+
+
+def _index_typecode(capacity: int) -> str:
+    """Returns the typecode of the smallest signed integer type (of the array
+    module) which can hold all positions of the dense arrays of a table with
+    the given capacity (and -1)."""
+    for typecode in ("b", "h", "i", "l", "q"):
+        if capacity <= 1 << (8 * array(typecode).itemsize - 1):
+            return typecode
+    raise ValueError("capacity is too large")
+
+
+class CompactHashTable(HashTable):
+    """Resizable hash table with a sparse index of small integers and dense
+    arrays of entries, which are kept in insertion order.
+
+    The capacity (i.e. the size of the index) is always a power of 2. It's
+    doubled, whenever the load factor would exceed max_load_factor, or halved,
+    whenever it drops below max_load_factor / 4 (but the capacity never goes
+    below the initial one). The hash codes of the keys are mixed with seed (by
+    default, a random 64-bit integer).
+
+    Public interface:
+
+    - size
+    - capacity
+    - load_factor
+    - max_load_factor
+    - seed
+    - put
+    - get
+    - delete
+    - show
+    - from_items
+    - put_many
+    - get_many
+    - keys
+    - values
+    - items
+
+    You can access and put an item in the hash table by using the same
+    convenient notation that is used by the Python's standard dict class.
+
+    Updating the value of a key does not change its position in the insertion
+    order."""
+
+    def __init__(
+        self, capacity: int = 8, max_load_factor: float = 0.7, seed: int = None
+    ):
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an instance of int")
+        if capacity < 1:
+            raise ValueError("capacity must be greater or equal to 1")
+        if not isinstance(max_load_factor, (int, float)):
+            raise TypeError("max_load_factor must be a number")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in the interval (0, 1)")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        self._seed = randbits(64) if seed is None else seed
+        n = 1
+        while n < capacity:
+            n *= 2
+        self._n = n  # self._n holds the size of the index.
+        self._min_capacity = n
+        self._max_load_factor = max_load_factor
+        self._size = 0  # The number of pairs key-value.
+        self._indices = array(_index_typecode(n), [_EMPTY]) * n
+        # The dense arrays, where the holes have None as key (and 0 as hash).
+        self._hashes = array("Q")
+        self._keys = []
+        self._values = []
+
+    @property
+    def size(self) -> int:
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(1)."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slots of the index.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the size and the capacity of this map.
+
+        Time complexity: O(1)."""
+        return self._size / self._n
+
+    @property
+    def max_load_factor(self) -> float:
+        """Returns the load factor above which this map is enlarged.
+
+        Time complexity: O(1)."""
+        return self._max_load_factor
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed which is mixed with the hash codes of the keys.
+
+        Time complexity: O(1)."""
+        return self._seed
+
+    def _hash(self, key: object) -> int:
+        """Returns the hash code of key, mixed with the seed of this map."""
+        return mix(hash(key), self._seed)
+
+    @staticmethod
+    def _check_key(key: object) -> None:
+        """Raises TypeError if key is None or it's not hashable."""
+        if key is None:
+            raise TypeError("key cannot be None.")
+        if not isinstance(key, Hashable):
+            raise TypeError("key must be an instance of a hashable type")
+
+    def put(self, key: object, value: object) -> None:
+        """Inserts the pair (key: value) in this map.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected amortized."""
+        CompactHashTable._check_key(key)
+        h = self._hash(key)
+
+        i = self._find_slot(key, h)
+        e = self._indices[i]
+        if e != _EMPTY:
+            self._values[e] = value
+            return
+
+        if len(self._keys) + 1 > self._max_load_factor * self._n:
+            # If the dense arrays contain many holes, removing them suffices.
+            if self._size + 1 > self._max_load_factor * self._n / 2:
+                self._rebuild(2 * self._n)
+            else:
+                self._rebuild(self._n)
+            i = self._find_slot(key, h)
+
+        self._indices[i] = len(self._keys)
+        self._hashes.append(h)
+        self._keys.append(key)
+        self._values.append(value)
+        self._size += 1
+
+    def get(self, key: object) -> object:
+        """Returns the value associated with key, or None, if there's no such
+        key.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected."""
+        CompactHashTable._check_key(key)
+        e = self._indices[self._find_slot(key, self._hash(key))]
+        return self._values[e] if e != _EMPTY else None
+
+    def delete(self, key: object) -> object:
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
+
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(1) expected amortized."""
+        CompactHashTable._check_key(key)
+        indices = self._indices
+        hashes = self._hashes
+        mask = self._n - 1
+
+        i = self._find_slot(key, self._hash(key))
+        e = indices[i]
+        if e == _EMPTY:
+            return None
+        v = self._values[e]
+        hashes[e] = 0
+        self._keys[e] = self._values[e] = None
+
+        # Backward-shift deletion, as in LinearProbingHashTable.delete.
+        j = i
+        while True:
+            j = (j + 1) & mask
+            f = indices[j]
+            if f == _EMPTY:
+                break
+            h = hashes[f] & mask
+            if (i < j and i < h <= j) or (j < i and (h <= j or i < h)):
+                continue
+            indices[i] = f
+            i = j
+        indices[i] = _EMPTY
+        self._size -= 1
+
+        if (
+            self._size < self._max_load_factor / 4 * self._n
+            and self._n > self._min_capacity
+        ):
+            self._rebuild(max(self._min_capacity, self._n // 2))
+
+        return v
+
+    def _find_slot(self, key: object, h: int) -> int:
+        """Returns the index of the slot of the index which refers to key,
+        where h is the hash code of key, if key is in this map, otherwise the
+        index of the empty slot where key would be inserted.
+
+        Time complexity: O(1) expected."""
+        indices = self._indices
+        hashes = self._hashes
+        keys = self._keys
+        mask = self._n - 1
+        i = h & mask
+        while True:
+            e = indices[i]
+            if e == _EMPTY:
+                return i
+            if hashes[e] == h and (keys[e] is key or keys[e] == key):
+                return i
+            i = (i + 1) & mask
+
+    def _rebuild(self, new_capacity: int) -> None:
+        """Removes the holes from the dense arrays and rebuilds the index with
+        new_capacity slots, using the stored hash codes.
+
+        Time complexity: O(m + k), where m is new_capacity and k is the length
+        of the dense arrays."""
+        if self._size != len(self._keys):
+            live = [e for e, k in enumerate(self._keys) if k is not None]
+            self._hashes = array("Q", [self._hashes[e] for e in live])
+            self._keys = [self._keys[e] for e in live]
+            self._values = [self._values[e] for e in live]
+
+        self._n = new_capacity
+        mask = new_capacity - 1
+        indices = array(_index_typecode(new_capacity), [_EMPTY]) * new_capacity
+        for e, h in enumerate(self._hashes):
+            i = h & mask
+            while indices[i] != _EMPTY:
+                i = (i + 1) & mask
+            indices[i] = e
+        self._indices = indices
+
+    def _reserve(self, size: int) -> None:
+        """Enlarges this map (and removes the holes from the dense arrays), if
+        needed, so that it can hold size pairs key-value without exceeding its
+        maximum load factor.
+
+        Time complexity: O(n + m), if this map is rebuilt, where n is the old
+        capacity and m is the new one, otherwise O(1)."""
+        if len(self._keys) + size - self._size > self._max_load_factor * self._n:
+            n = self._n
+            while size > self._max_load_factor * n:
+                n *= 2
+            self._rebuild(n)
+
+    def _iter_items(self):
+        """Returns an iterator over the pairs (key, value) of this map, in
+        insertion order."""
+        for k, v in zip(self._keys, self._values):
+            if k is not None:
+                yield k, v
+
+    def show(self) -> None:
+        """Prints this hash table in table-like format, in insertion order."""
+        c = 0
+        data = []
+        for k, v in zip(self._keys, self._values):
+            if k is not None:
+                c += 1
+                data.append([c, k, v])
+        print(tabulate(data, headers=["#", "Keys", "Values"], tablefmt="grid"))
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        return self._indices[self._find_slot(key, self._hash(key))] != _EMPTY
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __str__(self):
+        return str([(k, v) for k, v in zip(self._keys, self._values) if k is not None])
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_compact_hash_table(t: CompactHashTable) -> bool:
+    """Returns true if t is a valid CompactHashTable, false otherwise."""
+    if not isinstance(t, CompactHashTable):
+        return False
+    if len(t._indices) != t._n or t._indices.typecode != _index_typecode(t._n):
+        return False
+    if not len(t._hashes) == len(t._keys) == len(t._values) < t._n:
+        return False
+    referenced = sorted(e for e in t._indices if e != _EMPTY)
+    live = [e for e, k in enumerate(t._keys) if k is not None]
+    if referenced != live or len(live) != t._size:
+        return False
+    for e in live:
+        k = t._keys[e]
+        h = t._hash(k)
+        if t._hashes[e] != h or t._indices[t._find_slot(k, h)] != e:
+            return False
+    return True
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A Fibonacci heap is a collection of heap-ordered trees, i.e. every node is
+smaller than or equal to its children. It's similar to a binomial heap, but it
+has a more relaxed structure, which allows it to postpone the work needed to
+keep its trees balanced until it's really needed, i.e. until the minimum is
+removed. This is why add, merge and decrease_key take O(1) amortized time.
+
+The roots of the trees are kept in a circular doubly-linked list (the "root
+list"), and so are the children of each node. A pointer to the root with the
+smallest element is maintained.
+
+When the minimum is removed, its children are moved to the root list and the
+trees in the root list are "consolidated", i.e. trees whose roots have the same
+degree (number of children) are linked until all roots have distinct degrees.
+
+When the element of a node is decreased and becomes smaller than its parent,
+the node is cut from its parent and moved to the root list. To keep the trees
+"bushy", a node which loses a second child is also cut from its parent, and so
+on ("cascading cut"). A node is "marked" when it has lost one child since it
+became the child of another node. This ensures that the size of a tree whose
+root has degree k is at least the (k + 2)th Fibonacci number, hence the name.
+
+# References
+
+- Chapter 19 of Introduction to Algorithms (3rd ed.) by CLRS
+- Fibonacci heaps and their uses in improved network optimization algorithms,
+by M. Fredman and R. Tarjan (1987)
+- https://en.wikipedia.org/wiki/Fibonacci_heap
+"""
+
+from andz.ds.MergeableHeap import MergeableHeap
+
+__all__ = ["FibonacciHeap", "is_fibonacci_heap"]
+
+
+class _FibonacciHeapNode:
+    """_FibonacciHeapNode is the node used internally by FibonacciHeap, which
+    is also the handle returned by FibonacciHeap.add."""
+
+    def __init__(self, key):
+        self.key = key
+        self.parent = None
+        # Any of the children of this node.
+        self.child = None
+        # Siblings of this node in the circular doubly-linked list.
+        self.left = self
+        self.right = self
+        # Number of children of this node.
+        self.degree = 0
+        # Whether this node has lost a child since it became a child.
+        self.mark = False
+
+    def __str__(self):
+        return str(self.key)
+
+    def __repr__(self):
+        return f"(key: {self.key}, degree: {self.degree}, mark: {self.mark})"
+
+
+def _splice(a: _FibonacciHeapNode, b: _FibonacciHeapNode) -> None:
+    """Concatenates the circular doubly-linked lists which contain a and b.
+
+    Time complexity: O(1)."""
+    a_right = a.right
+    b_left = b.left
+    a.right = b
+    b.left = a
+    b_left.right = a_right
+    a_right.left = b_left
+
+
+def _unlink(x: _FibonacciHeapNode) -> None:
+    """Removes x from the circular doubly-linked list in which it is.
+
+    Time complexity: O(1)."""
+    x.left.right = x.right
+    x.right.left = x.left
+    x.left = x.right = x
+
+
+def _siblings(x: _FibonacciHeapNode) -> list:
+    """Returns the list of the nodes in the circular doubly-linked list in which
+    x is, starting from x.
+
+    Time complexity: O(k), where k is the number of siblings of x."""
+    nodes = [x]
+    y = x.right
+    while y is not x:
+        nodes.append(y)
+        y = y.right
+    return nodes
+
+
+class FibonacciHeap(MergeableHeap):
+    """Min Fibonacci heap.
+
+    This heap allows duplicates.
+
+    Time complexities (amortized):
+
+    - add: O(1)
+    - find_min: O(1)
+    - merge: O(1)
+    - decrease_key: O(1)
+    - remove_min: O(log(n))"""
+
+    def __init__(self, ls=None):
+        # The root with the smallest element, which is also the entry point to
+        # the root list.
+        self._min = None
+        MergeableHeap.__init__(self, ls)
+
+    def clear(self) -> None:
+        """Removes all elements from this FibonacciHeap.
+
+        Time complexity: O(1)."""
+        self._min = None
+        self._n = 0
+
+    def add(self, x: object) -> _FibonacciHeapNode:
+        """Adds x to this FibonacciHeap and returns a handle to it.
+
+        Time complexity: O(1)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        node = _FibonacciHeapNode(x)
+        self._add_root(node)
+        self._n += 1
+        return node
+
+    def find_min(self) -> object:
+        """Returns the smallest element in this FibonacciHeap.
+
+        Time complexity: O(1)."""
+        return self._min.key if self._min is not None else None
+
+    def remove_min(self) -> object:
+        """Removes and returns the smallest element in this FibonacciHeap.
+
+        Time complexity: O(log(n)) amortized."""
+        z = self._min
+        if z is None:
+            return None
+
+        if z.child is not None:
+            for child in _siblings(z.child):
+                child.parent = None
+            _splice(z, z.child)
+            z.child = None
+            z.degree = 0
+
+        if z.right is z:
+            self._min = None
+        else:
+            self._min = z.right
+            _unlink(z)
+            self._consolidate()
+
+        self._n -= 1
+        return z.key
+
+    def decrease_key(self, handle: _FibonacciHeapNode, x: object) -> None:
+        """Replaces the element referred to by handle with x, which must be
+        smaller than or equal to it.
+
+        Time complexity: O(1) amortized."""
+        self._check_decrease_key(handle, x)
+        handle.key = x
+        parent = handle.parent
+        if parent is not None and x < parent.key:
+            self._cut(handle, parent)
+            self._cascading_cut(parent)
+        if x < self._min.key:
+            self._min = handle
+
+    def merge(self, o: "FibonacciHeap") -> None:
+        """Moves all elements of o to this FibonacciHeap, so that o is empty
+        afterwards.
+
+        Time complexity: O(1)."""
+        self._check_merge(o)
+        if o._min is not None:
+            self._add_root(o._min)
+            self._n += o._n
+        o.clear()
+
+    def _remove(self, handle: _FibonacciHeapNode) -> None:
+        """Removes the element referred to by handle from this FibonacciHeap.
+
+        The node is moved to the root list, as if its element were smaller than
+        every other element, and then it's removed as the minimum.
+
+        Time complexity: O(log(n)) amortized."""
+        parent = handle.parent
+        if parent is not None:
+            self._cut(handle, parent)
+            self._cascading_cut(parent)
+        self._min = handle
+        self.remove_min()
+
+    def _add_root(self, node: _FibonacciHeapNode) -> None:
+        """Adds the circular doubly-linked list of roots in which node is to
+        the root list, where node must be the smallest of them.
+
+        Time complexity: O(1)."""
+        if self._min is None:
+            self._min = node
+        else:
+            _splice(self._min, node)
+            if node.key < self._min.key:
+                self._min = node
+
+    def _consolidate(self) -> None:
+        """Links the trees in the root list until all roots have distinct
+        degrees, and finds the new minimum.
+
+        Time complexity: O(log(n)) amortized."""
+        # by_degree[k] is the root with degree k, if any.
+        by_degree = []
+
+        for x in _siblings(self._min):
+            _unlink(x)
+            k = x.degree
+            while k < len(by_degree) and by_degree[k] is not None:
+                y = by_degree[k]
+                if y.key < x.key:
+                    x, y = y, x
+                self._link(y, x)
+                by_degree[k] = None
+                k += 1
+            if k >= len(by_degree):
+                by_degree.extend([None] * (k + 1 - len(by_degree)))
+            by_degree[k] = x
+
+        self._min = None
+        for x in by_degree:
+            if x is not None:
+                self._add_root(x)
+
+    @staticmethod
+    def _link(y: _FibonacciHeapNode, x: _FibonacciHeapNode) -> None:
+        """Makes y, which must be a root not in the root list, a child of x.
+
+        Time complexity: O(1)."""
+        y.parent = x
+        y.mark = False
+        if x.child is None:
+            x.child = y
+        else:
+            _splice(x.child, y)
+        x.degree += 1
+
+    def _cut(self, x: _FibonacciHeapNode, y: _FibonacciHeapNode) -> None:
+        """Cuts x from its parent y and moves it to the root list.
+
+        Time complexity: O(1)."""
+        if x.right is x:
+            y.child = None
+        else:
+            if y.child is x:
+                y.child = x.right
+            _unlink(x)
+        y.degree -= 1
+        x.parent = None
+        x.mark = False
+        _splice(self._min, x)
+
+    def _cascading_cut(self, y: _FibonacciHeapNode) -> None:
+        """Cuts y from its parent if y is marked, and so on up the tree,
+        otherwise marks y.
+
+        Time complexity: O(1) amortized."""
+        z = y.parent
+        while z is not None:
+            if not y.mark:
+                y.mark = True
+                return
+            self._cut(y, z)
+            y = z
+            z = y.parent
+
+    def _handles(self):
+        """Returns an iterator over all nodes of this FibonacciHeap.
+
+        Time complexity: O(n)."""
+        stack = _siblings(self._min) if self._min is not None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.child is not None:
+                stack.extend(_siblings(node.child))
+
+
+# pylint: disable=protected-access
+def is_fibonacci_heap(h: FibonacciHeap) -> bool:
+    """Returns true if h is a valid FibonacciHeap, false otherwise."""
+    if not isinstance(h, FibonacciHeap):
+        return False
+    if h._min is None:
+        return h.size == 0
+    n = 0
+    for node in h._handles():
+        n += 1
+        if node.parent is None and node.key < h._min.key:
+            return False
+        if node.left.right is not node or node.right.left is not node:
+            return False
+        children = _siblings(node.child) if node.child is not None else []
+        if len(children) != node.degree:
+            return False
+        for child in children:
+            if child.parent is not node or child.key < node.key:
+                return False
+    return n == h.size
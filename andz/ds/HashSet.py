@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A hash set is a set implemented with a hash table which stores only keys (and
+no values). Using a hash table with dummy values as a set wastes the whole
+array of values, i.e. one pointer for each slot.
+
+HashSet shares its engine with LinearProbingHashTable: the hash codes are
+mixed with a seed (see andz.ds.hashing), and the probing, the backward-shift
+deletion (so there are no tombstones) and the resizing policy (the table is
+enlarged when its load factor exceeds the maximum one and shrunk when it drops
+below a quarter of it) are the functions in andz.ds.linear_probing.
+
+For each slot, HashSet also stores the 32 highest bits of the (mixed) hash code
+of its key, as an unsigned 32-bit integer in an array (which takes 4 bytes per
+slot, rather than the 8 of the pointer to a value). These cached hash codes
+determine the home slots of the keys, so:
+
+- the keys are compared (with __eq__) only if their hash codes are equal,
+
+- the table is resized without calling hash on the keys again, and
+
+- the union and the intersection of two sets with the same hash function and
+seed reuse the cached hash codes of the elements of the smaller set, which is
+the only one that is iterated (the larger one is copied, in the case of the
+union, with a single copy of its arrays).
+
+# References
+
+- https://en.wikipedia.org/wiki/Set_(abstract_data_type)
+- https://docs.python.org/3/library/collections.abc.html#collections.abc.MutableSet
+- https://github.com/python/cpython/blob/3.12/Objects/setobject.c
+"""
+
+from array import array
+from collections.abc import Hashable, MutableSet, Set, Sized
+from secrets import randbits
+
+from tabulate import tabulate
+
+from andz.ds.hashing import mix
+from andz.ds.linear_probing import (
+    backward_shift,
+    capacity_for,
+    grown_capacity,
+    probe_hashed,
+    reinsert,
+    shrunk_capacity,
+)
+
+__all__ = ["HashSet", "is_hash_set"]
+
+
+class HashSet(MutableSet):
+    """Resizable set of hashable objects (other than None), which uses linear
+    probing and caches the hash codes of its elements.
+
+    The capacity, the max_load_factor, the hash_function and the seed have the
+    same meaning as in LinearProbingHashTable.
+
+    Public interface:
+
+    - size
+    - capacity
+    - load_factor
+    - max_load_factor
+    - seed
+    - add
+    - discard
+    - update
+    - union
+    - intersection
+    - from_iterable
+    - copy
+    - clear
+    - show
+
+    and the operators and the methods of collections.abc.MutableSet (e.g. in,
+    len, iter, remove, pop, |, &, - and <=)."""
+
+    def __init__(
+        self,
+        capacity: int = 11,
+        max_load_factor: float = 0.7,
+        hash_function=None,
+        seed: int = None,
+    ):
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an instance of int")
+        if capacity < 1:
+            raise ValueError("capacity must be greater or equal to 1")
+        if not isinstance(max_load_factor, (int, float)):
+            raise TypeError("max_load_factor must be a number")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in the interval (0, 1)")
+        if hash_function is not None and not callable(hash_function):
+            raise TypeError("hash_function must be callable")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        self._hash_function = hash if hash_function is None else hash_function
+        self._seed = randbits(64) if seed is None else seed
+        self._n = capacity  # self._n holds the size of the buffers.
+        self._min_capacity = capacity
+        self._max_load_factor = max_load_factor
+        self._size = 0  # The number of elements.
+        self._keys = [None] * capacity
+        self._hashes = array("I", [0]) * capacity
+
+    @classmethod
+    def from_iterable(cls, iterable, expected_size: int = None) -> "HashSet":
+        """Returns a new HashSet (with the default parameters) which contains
+        the elements of iterable.
+
+        If expected_size (or the length of iterable, if it's sized) is given,
+        the set is allocated once with enough capacity.
+
+        Time complexity: O(k) expected, where k is the number of elements of
+        iterable."""
+        if expected_size is not None:
+            if not isinstance(expected_size, int):
+                raise TypeError("expected_size must be an instance of int")
+            if expected_size < 0:
+                raise ValueError("expected_size must be non-negative")
+        s = cls()
+        if expected_size is not None:
+            s._reserve(expected_size)
+        s.update(iterable)
+        return s
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # Used by the operators of collections.abc.Set, e.g. - and ^.
+        return cls.from_iterable(it)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements of this set.
+
+        Time complexity: O(1)."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slots of this set.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the size and the capacity of this set.
+
+        Time complexity: O(1)."""
+        return self._size / self._n
+
+    @property
+    def max_load_factor(self) -> float:
+        """Returns the load factor above which this set is enlarged.
+
+        Time complexity: O(1)."""
+        return self._max_load_factor
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed which is mixed with the hash codes of the elements.
+
+        Time complexity: O(1)."""
+        return self._seed
+
+    def _hash(self, key: object) -> int:
+        """Returns the 32 highest bits of the mixed hash code of key.
+
+        If key is None or it's not hashable, a TypeError is raised."""
+        if key is None:
+            raise TypeError("key cannot be None.")
+        if not isinstance(key, Hashable):
+            raise TypeError("key must be an instance of a hashable type")
+        return mix(self._hash_function(key), self._seed) >> 32
+
+    def _compatible(self, other: object) -> bool:
+        """Returns true if other is a HashSet whose cached hash codes are
+        equal to the ones of this set, for the same keys."""
+        return (
+            isinstance(other, HashSet)
+            and other._hash_function is self._hash_function
+            and other._seed == self._seed
+        )
+
+    def _find_slot(self, key: object, h: int) -> int:
+        """Returns the index of the slot which contains key, where h is its
+        cached hash code, if key is in this set, otherwise the index of the
+        empty slot where key would be inserted.
+
+        Time complexity: O(1) expected."""
+        return probe_hashed(self._keys, self._hashes, key, h, h % self._n)
+
+    def add(self, key: object) -> None:
+        """Adds key to this set, if it's not already in it.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected amortized."""
+        assert is_hash_set(self)
+        self._add_hashed(key, self._hash(key))
+        assert is_hash_set(self)
+
+    def _add_hashed(self, key: object, h: int) -> None:
+        """Adds key, whose cached hash code is h, to this set, if it's not
+        already in it.
+
+        Time complexity: O(1) expected amortized."""
+        i = self._find_slot(key, h)
+        if self._keys[i] is None:
+            new_capacity = grown_capacity(self._size, self._n, self._max_load_factor)
+            if new_capacity != self._n:
+                self._resize(new_capacity)
+                i = self._find_slot(key, h)
+            self._keys[i] = key
+            self._hashes[i] = h
+            self._size += 1
+
+    def discard(self, key: object) -> None:
+        """Removes key from this set, if it's in it.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected amortized."""
+        assert is_hash_set(self)
+
+        keys = self._keys
+        hashes = self._hashes
+        n = self._n
+        i = self._find_slot(key, self._hash(key))
+        if keys[i] is None:
+            return
+
+        i = backward_shift(keys, (hashes,), i, lambda j: hashes[j] % n)
+        keys[i] = None
+        hashes[i] = 0
+        self._size -= 1
+
+        new_capacity = shrunk_capacity(
+            self._size, self._n, self._max_load_factor, self._min_capacity
+        )
+        if new_capacity != self._n:
+            self._resize(new_capacity)
+
+        assert is_hash_set(self)
+
+    def update(self, iterable) -> None:
+        """Adds the elements of iterable to this set.
+
+        If iterable is sized, this set is resized (at most) once, before
+        adding the elements (assuming that they are new). If an element is not
+        valid, an exception is raised, but the elements before it have already
+        been added.
+
+        Time complexity: O(k) expected amortized, where k is the number of
+        elements of iterable."""
+        assert is_hash_set(self)
+
+        if isinstance(iterable, Sized):
+            self._reserve(self._size + len(iterable))
+
+        if self._compatible(iterable):
+            for i, k in enumerate(iterable._keys):
+                if k is not None:
+                    self._add_hashed(k, iterable._hashes[i])
+        else:
+            for key in iterable:
+                self._add_hashed(key, self._hash(key))
+
+        assert is_hash_set(self)
+
+    def union(self, other) -> "HashSet":
+        """Returns a new HashSet (with the same parameters as this set) which
+        contains the elements of this set and of the iterable other.
+
+        If other is a HashSet with the same hash function and seed, the larger
+        set is copied and only the elements of the smaller one are added to
+        the copy, reusing their cached hash codes.
+
+        Time complexity: O(n + k) expected, where n is the capacity of the
+        larger set and k the size of the smaller one, if other is such a
+        HashSet, otherwise O(n + k), where n is the capacity of this set and k
+        the number of elements of other."""
+        if self._compatible(other) and other._size > self._size:
+            result = other.copy()
+            result._max_load_factor = self._max_load_factor
+            result._min_capacity = self._min_capacity
+            result.update(self)
+        else:
+            result = self.copy()
+            result.update(other)
+        return result
+
+    def intersection(self, other) -> "HashSet":
+        """Returns a new HashSet (with the same parameters as this set) which
+        contains the elements of this set which are also in the iterable
+        other.
+
+        If other is a HashSet, only the smaller set is iterated (and, if other
+        has the same hash function and seed, the cached hash codes of its
+        elements are reused).
+
+        Time complexity: O(k) expected, where k is the size of the smaller set,
+        if other is a HashSet, otherwise the number of elements of other."""
+        result = HashSet(
+            self._min_capacity, self._max_load_factor, self._hash_function, self._seed
+        )
+        if self._compatible(other):
+            small, large = (self, other) if self._size <= other._size else (other, self)
+            for i, k in enumerate(small._keys):
+                if k is not None:
+                    h = small._hashes[i]
+                    if large._keys[large._find_slot(k, h)] is not None:
+                        result._add_hashed(k, h)
+        elif isinstance(other, HashSet) and other._size > self._size:
+            for k in self:
+                if k in other:
+                    result.add(k)
+        else:
+            for k in other:
+                if k in self:
+                    result.add(k)
+        return result
+
+    def copy(self) -> "HashSet":
+        """Returns a shallow copy of this set, with the same parameters.
+
+        Time complexity: O(n), where n is the capacity of this set."""
+        s = HashSet(
+            self._min_capacity, self._max_load_factor, self._hash_function, self._seed
+        )
+        s._n = self._n
+        s._size = self._size
+        s._keys = self._keys[:]
+        s._hashes = self._hashes[:]
+        return s
+
+    def clear(self) -> None:
+        """Removes all elements from this set, and shrinks it to its initial
+        capacity.
+
+        Time complexity: O(m), where m is the initial capacity."""
+        self._n = self._min_capacity
+        self._size = 0
+        self._keys = [None] * self._n
+        self._hashes = array("I", [0]) * self._n
+
+    def _resize(self, new_capacity: int) -> None:
+        """Moves all elements to new buffers of size new_capacity, which must
+        be greater than the size of this set, using their cached hash codes.
+
+        Time complexity: O(n + m), where n is the old capacity and m is
+        new_capacity."""
+        old_keys = self._keys
+        old_hashes = self._hashes
+        keys = [None] * new_capacity
+        hashes = array("I", [0]) * new_capacity
+        reinsert(
+            old_keys,
+            (old_hashes,),
+            keys,
+            (hashes,),
+            lambda j: old_hashes[j] % new_capacity,
+        )
+        self._n = new_capacity
+        self._keys = keys
+        self._hashes = hashes
+
+    def _reserve(self, size: int) -> None:
+        """Enlarges this set, if needed, so that it can hold size elements
+        without exceeding its maximum load factor.
+
+        Time complexity: O(n + m), if this set is resized, where n is the old
+        capacity and m is the new one, otherwise O(1)."""
+        if size > self._max_load_factor * self._n:
+            self._resize(capacity_for(size, self._max_load_factor))
+
+    def show(self) -> None:
+        """Prints this set in table-like format."""
+        data = [[c, k] for c, k in enumerate(self, 1)]
+        print(tabulate(data, headers=["#", "Keys"], tablefmt="grid"))
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        return self._keys[self._find_slot(key, self._hash(key))] is not None
+
+    def __iter__(self):
+        for k in self._keys:
+            if k is not None:
+                yield k
+
+    def __len__(self):
+        return self._size
+
+    def __or__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if not isinstance(other, Set):
+            return NotImplemented
+        return self.intersection(other)
+
+    __ror__ = __or__
+    __rand__ = __and__
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_hash_set(s: HashSet) -> bool:
+    """Returns true if s is a valid HashSet, false otherwise."""
+    if not isinstance(s, HashSet):
+        return False
+    if not len(s._keys) == len(s._hashes) == s._n:
+        return False
+    if s._size != s._n - s._keys.count(None) or s._size >= s._n:
+        return False
+    for i, k in enumerate(s._keys):
+        if k is None:
+            if s._hashes[i] != 0:
+                return False
+        elif s._hashes[i] != s._hash(k) or s._find_slot(k, s._hashes[i]) != i:
+            return False
+    return True
@@ -9,7 +9,7 @@ Author: Nelson Brochado
 
 Created: 13/02/2017
 
-Updated: 06/04/2018
+Updated: 19/10/2026
 
 # Description
 
@@ -17,7 +17,15 @@ Since a hash table (or map) can be implemented in many ways, mostly because
 these ways reflect the way collisions are handled, where the most famous
 techniques are "separate chaining" and "open addressing", it is convenient to
 have this abstract class from which all implementations should derive, and they
-should all implement at least two methods: put and get.
+should all implement the methods put, get, delete and _iter_items.
+
+The other primitives (__len__, __contains__ and _reserve) have default
+implementations, which the implementations should override with more efficient
+ones. On top of them, this class provides the bulk operations
+(from_items, put_many and get_many), the views keys, values and items (which,
+like the ones of dict, are lazy and reflect the changes of the table) and the
+iteration over the keys. The implementations can override the bulk operations
+with faster ones, which avoid the overhead of a call to put or get per item.
 
 # References
 
@@ -25,6 +33,7 @@ should all implement at least two methods: put and get.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import ItemsView, KeysView, Sized, ValuesView
 
 __all__ = ["HashTable"]
 
@@ -44,3 +53,145 @@ class HashTable(ABC):
         """
         Get the value associated with the key.
         """
+
+    @abstractmethod
+    def delete(self, key: object) -> object:
+        """
+        Delete the mapping of the key and return its value.
+        """
+
+    def __len__(self):
+        """
+        Return the number of pairs key-value.
+
+        By default, the pairs returned by _iter_items are counted, in O(n)
+        time.
+        """
+        return sum(1 for _ in self._iter_items())
+
+    def __contains__(self, key):
+        """
+        Return true if the key is in the hash table.
+
+        By default, this is true if get does not return None, so a key
+        associated with None is not found.
+        """
+        return self.get(key) is not None
+
+    @abstractmethod
+    def _iter_items(self):
+        """
+        Return an iterator over the pairs key-value.
+
+        The views, the iteration and the default __len__ use it.
+        """
+
+    def _reserve(self, size: int) -> None:
+        """
+        Make room for size pairs key-value without further resizing.
+        """
+
+    @classmethod
+    def from_items(cls, iterable, expected_size: int = None) -> "HashTable":
+        """Returns a new hash table (of this class, with the default arguments)
+        which contains the pairs (key, value) of iterable.
+
+        If expected_size is not None, the hash table is presized to hold
+        expected_size pairs, otherwise, if iterable is sized (e.g. a list), it's
+        presized to hold len(iterable) pairs, so that it's not resized while
+        the pairs are inserted.
+
+        Time complexity: O(k) expected, where k is the number of pairs in
+        iterable."""
+        if expected_size is not None:
+            if not isinstance(expected_size, int):
+                raise TypeError("expected_size must be an instance of int")
+            if expected_size < 0:
+                raise ValueError("expected_size must be greater or equal to 0")
+        t = cls()
+        if expected_size is not None:
+            t._reserve(expected_size)
+        t.put_many(iterable)
+        return t
+
+    def put_many(self, iterable) -> None:
+        """Inserts the pairs (key, value) of iterable in this hash table, as
+        put would do.
+
+        If iterable is sized, the hash table is resized (at most) once, before
+        inserting the pairs (assuming that their keys are new). If a key is
+        not valid, an exception is raised, but the pairs before it have
+        already been inserted.
+
+        Time complexity: O(k) expected amortized, where k is the number of
+        pairs in iterable."""
+        # len(self) is computed only for the hash tables which can be presized,
+        # since the default __len__ takes O(n) time.
+        if (
+            isinstance(iterable, Sized)
+            and type(self)._reserve is not HashTable._reserve
+        ):
+            self._reserve(len(self) + len(iterable))
+        for key, value in iterable:
+            self.put(key, value)
+
+    def get_many(self, keys) -> list:
+        """Returns the list of the values associated with the keys in the
+        iterable keys (None for the keys which are not in this hash table).
+
+        Time complexity: O(k) expected, where k is the number of keys."""
+        return [self.get(key) for key in keys]
+
+    def keys(self) -> KeysView:
+        """Returns a view of the keys of this hash table.
+
+        Time complexity: O(1)."""
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        """Returns a view of the values of this hash table.
+
+        Time complexity: O(1)."""
+        return _HashTableValuesView(self)
+
+    def items(self) -> ItemsView:
+        """Returns a view of the pairs (key, value) of this hash table.
+
+        Time complexity: O(1)."""
+        return _HashTableItemsView(self)
+
+    def __iter__(self):
+        """Iterates over the keys of this hash table, which must not be
+        modified in the meantime."""
+        for key, _ in self._iter_items():
+            yield key
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.delete(key)
+
+
+# pylint: disable=protected-access
+class _HashTableValuesView(ValuesView):
+    """View of the values of a HashTable, which, unlike ValuesView, does not
+    look up each key."""
+
+    def __iter__(self):
+        for _, value in self._mapping._iter_items():
+            yield value
+
+
+class _HashTableItemsView(ItemsView):
+    """View of the pairs (key, value) of a HashTable, which, unlike ItemsView,
+    does not look up each key and does not rely on KeyError."""
+
+    def __contains__(self, item):
+        key, value = item
+        if key not in self._mapping:
+            return False
+        v = self._mapping.get(key)
+        return v is value or v == value
+
+    def __iter__(self):
+        yield from self._mapping._iter_items()
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A hash table which maps 64-bit integers to 64-bit integers, stored in two NumPy
+int64 arrays (of keys and values), rather than in Python lists.
+
+A LinearProbingHashTable with n integer keys and values stores, for each slot,
+two references (16 bytes) and, for each pair, two boxed int objects (28 or 32
+bytes each), so each pair takes more than 100 bytes. An Int64HashTable stores
+16 bytes for each slot, i.e. 16 / α bytes for each pair, where α is the load
+factor (between 0.375 and 0.75, by default).
+
+The collisions are resolved with linear probing, as in LinearProbingHashTable
+(with backward-shift deletion, so there are no tombstones), and the keys are
+hashed with the finalizer of SplitMix64 (mixed with a random seed), so that
+also clustered keys (e.g. multiples of the capacity) are spread out. The
+capacity is a power of 2. The empty slots contain the smallest int64,
+-2^63, which therefore cannot be used as a key.
+
+The batch operations get_many and put_many are vectorized: the probing of all
+keys is advanced simultaneously (one NumPy operation on all the keys which
+have not yet found their slot, for each step of the probing), so the number
+of NumPy operations is proportional to the longest probe sequence, rather than
+to the number of keys. In put_many, when more keys reach the same empty slot,
+one of them takes it and the others continue the probing.
+
+# References
+
+- https://prng.di.unimi.it/splitmix64.c
+- https://en.wikipedia.org/wiki/Linear_probing
+"""
+
+from secrets import randbits
+
+import numpy as np
+
+from andz.ds.hashing import MASK_64, mix
+
+__all__ = ["Int64HashTable", "is_int64_hash_table"]
+
+# The key of the empty slots.
+_EMPTY = np.iinfo(np.int64).min
+
+
+def _mix_array(keys: np.ndarray, seed: int) -> np.ndarray:
+    """Returns the uint64 array of the hash codes of the int64 array keys, as
+    computed by andz.ds.hashing.mix."""
+    h = keys.view(np.uint64) ^ np.uint64(seed)
+    h ^= h >> np.uint64(30)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(27)
+    h *= np.uint64(0x94D049BB133111EB)
+    h ^= h >> np.uint64(31)
+    return h
+
+
+class Int64HashTable:
+    """Hash table of int64 keys and int64 values stored in NumPy arrays.
+
+    The capacity (i.e. the number of slots) is always a power of 2. It's
+    doubled, whenever the load factor would exceed max_load_factor, or halved,
+    whenever it drops below max_load_factor / 4 (but the capacity never goes
+    below the initial one).
+
+    Public interface:
+
+    - size
+    - capacity
+    - load_factor
+    - max_load_factor
+    - nbytes
+    - put
+    - get
+    - delete
+    - put_many
+    - get_many
+    - contains_many
+    - to_arrays
+
+    and the operators [], in and len, as for dict."""
+
+    def __init__(
+        self, capacity: int = 16, max_load_factor: float = 0.75, seed: int = None
+    ):
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an instance of int")
+        if capacity < 1:
+            raise ValueError("capacity must be greater or equal to 1")
+        if not isinstance(max_load_factor, (int, float)):
+            raise TypeError("max_load_factor must be a number")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in the interval (0, 1)")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        self._seed = (randbits(64) if seed is None else seed) & MASK_64
+        self._max_load_factor = max_load_factor
+        n = 1
+        while n < capacity:
+            n *= 2
+        self._min_capacity = n
+        self._allocate(n)
+
+    def _allocate(self, n: int) -> None:
+        """Allocates empty arrays of n slots.
+
+        Time complexity: O(n)."""
+        self._n = n  # self._n holds the size of the arrays.
+        self._keys = np.full(n, _EMPTY, dtype=np.int64)
+        self._values = np.zeros(n, dtype=np.int64)
+        self._size = 0  # The number of pairs key-value.
+
+    @property
+    def size(self) -> int:
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(1)."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slots.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the size and the capacity of this map.
+
+        Time complexity: O(1)."""
+        return self._size / self._n
+
+    @property
+    def max_load_factor(self) -> float:
+        """Returns the load factor above which this map is enlarged.
+
+        Time complexity: O(1)."""
+        return self._max_load_factor
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes of the arrays of this map.
+
+        Time complexity: O(1)."""
+        return self._keys.nbytes + self._values.nbytes
+
+    @staticmethod
+    def _check_int64(x: int, name: str) -> int:
+        """Returns x as an int, if it's an integer which fits into an int64,
+        otherwise it raises TypeError or ValueError."""
+        if not isinstance(x, (int, np.integer)) or isinstance(x, bool):
+            raise TypeError(f"{name} must be an integer")
+        x = int(x)
+        if not _EMPTY <= x <= np.iinfo(np.int64).max:
+            raise ValueError(f"{name} must fit into an int64")
+        return x
+
+    @staticmethod
+    def _check_key(key: int) -> int:
+        """Returns key as an int, if it's a valid key, otherwise it raises
+        TypeError or ValueError."""
+        key = Int64HashTable._check_int64(key, "key")
+        if key == _EMPTY:
+            raise ValueError("key cannot be the smallest int64")
+        return key
+
+    @staticmethod
+    def _check_keys(keys) -> np.ndarray:
+        """Returns keys as a one-dimensional int64 array, if they're valid
+        keys, otherwise it raises TypeError or ValueError."""
+        keys = np.asarray(keys)
+        if keys.ndim != 1:
+            raise ValueError("keys must be one-dimensional")
+        if keys.size == 0:
+            return keys.astype(np.int64)
+        if not np.can_cast(keys.dtype, np.int64):
+            raise TypeError("keys must be an array of int64 integers")
+        keys = keys.astype(np.int64, copy=False)
+        if (keys == _EMPTY).any():
+            raise ValueError("keys cannot contain the smallest int64")
+        return keys
+
+    def put(self, key: int, value: int) -> None:
+        """Inserts the pair (key: value) in this map.
+
+        If key or value is not an integer, a TypeError is raised, and if it
+        doesn't fit into an int64 (or key is the smallest int64), a ValueError
+        is raised.
+
+        Time complexity: O(1) expected amortized."""
+        key = Int64HashTable._check_key(key)
+        value = Int64HashTable._check_int64(value, "value")
+        i = self._find_slot(key)
+        if self._keys[i] == _EMPTY:
+            if self._size + 1 > self._max_load_factor * self._n:
+                self._resize(2 * self._n)
+                i = self._find_slot(key)
+            self._keys[i] = key
+            self._size += 1
+        self._values[i] = value
+
+    def get(self, key: int) -> int:
+        """Returns the value associated with key, or None, if there's no such
+        key.
+
+        Time complexity: O(1) expected."""
+        key = Int64HashTable._check_key(key)
+        i = self._find_slot(key)
+        return int(self._values[i]) if self._keys[i] != _EMPTY else None
+
+    def delete(self, key: int) -> int:
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
+
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(1) expected amortized."""
+        key = Int64HashTable._check_key(key)
+        keys = self._keys
+        values = self._values
+        mask = self._n - 1
+        i = self._find_slot(key)
+        if keys[i] == _EMPTY:
+            return None
+        v = int(values[i])
+
+        # Backward-shift deletion, as in LinearProbingHashTable.delete.
+        j = i
+        while True:
+            j = (j + 1) & mask
+            k = int(keys[j])
+            if k == _EMPTY:
+                break
+            h = mix(k, self._seed) & mask
+            if (i < j and i < h <= j) or (j < i and (h <= j or i < h)):
+                continue
+            keys[i] = k
+            values[i] = values[j]
+            i = j
+        keys[i] = _EMPTY
+        self._size -= 1
+
+        if (
+            self._size < self._max_load_factor / 4 * self._n
+            and self._n > self._min_capacity
+        ):
+            self._resize(max(self._min_capacity, self._n // 2))
+
+        return v
+
+    def put_many(self, keys, values) -> None:
+        """Inserts the pairs (keys[i]: values[i]) in this map, where keys and
+        values are one-dimensional arrays (or sequences) of integers of the
+        same length.
+
+        If a key occurs more than once, its last value is kept. This map is
+        resized (at most) once, before inserting the new keys. If keys or values
+        are not valid, an exception is raised and nothing is inserted.
+
+        Time complexity: O(k) expected amortized, where k is the number of
+        pairs, with O(p) vectorized operations, where p is the length of the
+        longest probe sequence."""
+        keys = Int64HashTable._check_keys(keys)
+        values = np.asarray(values)
+        if values.shape != keys.shape:
+            raise ValueError("keys and values must have the same length")
+        if values.size > 0 and not np.can_cast(values.dtype, np.int64):
+            raise TypeError("values must be an array of int64 integers")
+        values = values.astype(np.int64, copy=False)
+
+        # Keep the last occurrence of each key.
+        keys, last = np.unique(keys[::-1], return_index=True)
+        values = values[::-1][last]
+
+        slots = self._find_slots(keys)
+        found = slots >= 0
+        self._values[slots[found]] = values[found]
+
+        new = ~found
+        self._reserve(self._size + int(new.sum()))
+        self._insert_new(keys[new], values[new])
+
+    def get_many(self, keys, default: int = -1) -> np.ndarray:
+        """Returns the int64 array of the values associated with the keys in
+        the one-dimensional array (or sequence) keys, where the keys which are
+        not in this map are associated with default.
+
+        Time complexity: O(k) expected, where k is the number of keys, with
+        O(p) vectorized operations, where p is the length of the longest probe
+        sequence."""
+        default = Int64HashTable._check_int64(default, "default")
+        keys = Int64HashTable._check_keys(keys)
+        slots = self._find_slots(keys)
+        result = np.full(len(keys), default, dtype=np.int64)
+        found = slots >= 0
+        result[found] = self._values[slots[found]]
+        return result
+
+    def contains_many(self, keys) -> np.ndarray:
+        """Returns the boolean array which tells, for each key in the
+        one-dimensional array (or sequence) keys, whether it's in this map.
+
+        Time complexity: O(k) expected, where k is the number of keys, with
+        O(p) vectorized operations, where p is the length of the longest probe
+        sequence."""
+        return self._find_slots(Int64HashTable._check_keys(keys)) >= 0
+
+    def to_arrays(self) -> tuple:
+        """Returns the int64 arrays of the keys and of the associated values in
+        this map (in no particular order).
+
+        Time complexity: O(n), where n is the capacity of this map."""
+        full = self._keys != _EMPTY
+        return self._keys[full], self._values[full]
+
+    def _find_slot(self, key: int) -> int:
+        """Returns the index of the slot which contains key, if key is in this
+        map, otherwise the index of the empty slot where key would be inserted.
+
+        Time complexity: O(1) expected."""
+        keys = self._keys
+        mask = self._n - 1
+        i = mix(key, self._seed) & mask
+        while True:
+            k = keys[i]
+            if k == key or k == _EMPTY:
+                return i
+            i = (i + 1) & mask
+
+    def _find_slots(self, keys: np.ndarray) -> np.ndarray:
+        """Returns the array of the indices of the slots which contain the keys
+        in the int64 array keys, where the keys which are not in this map have
+        index -1.
+
+        Time complexity: O(k) expected, where k is the number of keys, with
+        O(p) vectorized operations, where p is the length of the longest probe
+        sequence."""
+        table_keys = self._keys
+        mask = self._n - 1
+        pos = (_mix_array(keys, self._seed) & np.uint64(mask)).astype(np.intp)
+        slots = np.full(len(keys), -1, dtype=np.intp)
+        pending = np.arange(len(keys))
+        while len(pending) > 0:
+            p = pos[pending]
+            slot_keys = table_keys[p]
+            found = slot_keys == keys[pending]
+            slots[pending[found]] = p[found]
+            go_on = ~found & (slot_keys != _EMPTY)
+            pending = pending[go_on]
+            pos[pending] = (p[go_on] + 1) & mask
+        return slots
+
+    def _reserve(self, size: int) -> None:
+        """Enlarges this map, if needed, so that it can hold size pairs
+        key-value without exceeding its maximum load factor.
+
+        Time complexity: O(n + m), if this map is resized, where n is the old
+        capacity and m is the new one, otherwise O(1)."""
+        n = self._n
+        while size > self._max_load_factor * n:
+            n *= 2
+        if n != self._n:
+            self._resize(n)
+
+    def _resize(self, new_capacity: int) -> None:
+        """Moves all pairs key-value to new arrays of new_capacity slots, which
+        must be a power of 2 greater than the size of this map.
+
+        Time complexity: O(n + m), where n is the old capacity and m is
+        new_capacity, with O(p) vectorized operations, where p is the length of
+        the longest probe sequence."""
+        keys, values = self.to_arrays()
+        self._allocate(new_capacity)
+        self._insert_new(keys, values)
+
+    def _insert_new(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """Inserts the pairs (keys[i]: values[i]), where the keys are distinct
+        and not in this map, which must be able to hold them without exceeding
+        its maximum load factor.
+
+        Time complexity: O(k) expected, where k is the number of pairs, with
+        O(p) vectorized operations, where p is the length of the longest probe
+        sequence."""
+        table_keys = self._keys
+        table_values = self._values
+        mask = self._n - 1
+        pos = (_mix_array(keys, self._seed) & np.uint64(mask)).astype(np.intp)
+        pending = np.arange(len(keys))
+        while len(pending) > 0:
+            p = pos[pending]
+            empty = np.flatnonzero(table_keys[p] == _EMPTY)
+            # Among the keys which reach the same empty slot, the first one
+            # takes it. After this step, the slots of all the other keys are
+            # full, so they all continue the probing.
+            _, first = np.unique(p[empty], return_index=True)
+            taken = np.zeros(len(pending), dtype=bool)
+            taken[empty[first]] = True
+            table_keys[p[taken]] = keys[pending[taken]]
+            table_values[p[taken]] = values[pending[taken]]
+            pending = pending[~taken]
+            pos[pending] = (p[~taken] + 1) & mask
+        self._size += len(keys)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        if not isinstance(key, (int, np.integer)) or isinstance(key, bool):
+            return False
+        key = int(key)
+        if not _EMPTY < key <= np.iinfo(np.int64).max:
+            return False
+        return self._keys[self._find_slot(key)] != _EMPTY
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __str__(self):
+        keys, values = self.to_arrays()
+        return str(list(zip(keys.tolist(), values.tolist())))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_int64_hash_table(t: Int64HashTable) -> bool:
+    """Returns true if t is a valid Int64HashTable, false otherwise."""
+    if not isinstance(t, Int64HashTable):
+        return False
+    if not len(t._keys) == len(t._values) == t._n or t._n & (t._n - 1) != 0:
+        return False
+    keys, _ = t.to_arrays()
+    if len(keys) != t._size or len(np.unique(keys)) != len(keys):
+        return False
+    return bool((t._find_slots(keys) >= 0).all())
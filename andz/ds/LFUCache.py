@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+An LFU (least frequently used) cache evicts the entry which has been accessed
+(with get or put) the least number of times, since it was inserted. Among the
+entries with the same frequency, it evicts the least recently used one. Unlike
+an LRU cache, it keeps the entries which are accessed often, even if many other
+entries are accessed (only once) in the meantime, e.g. by a scan.
+
+To perform all operations in O(1) time, the entries are grouped into frequency
+buckets: the bucket of frequency f contains the entries which have been
+accessed f times, in a doubly-linked list (in order of recency), and the
+non-empty buckets themselves are kept in a doubly-linked list, in increasing
+order of frequency. An access moves its entry from the bucket of frequency f to
+the one of frequency f + 1, which is either the next bucket or a new bucket
+inserted after the current one, and an eviction removes the first entry of the
+first bucket.
+
+# References
+
+- Ketan Shah, Anirban Mitra and Dhruv Matani, "An O(1) algorithm for
+implementing the LFU cache eviction scheme", 2010.
+- https://en.wikipedia.org/wiki/Least_frequently_used
+"""
+
+from andz.ds.Cache import Cache, _CacheEntry, _list_insert_after, _list_remove
+
+__all__ = ["LFUCache", "is_lfu_cache"]
+
+
+class _LFUBucket:
+    """_LFUBucket is a bucket of the entries of an LFUCache which have been
+    accessed the same number of times, which is also a node of the list of the
+    buckets."""
+
+    __slots__ = ("frequency", "entries", "prev", "next")
+
+    def __init__(self, frequency: int):
+        self.frequency = frequency
+        # The sentinel of the list of the entries of this bucket.
+        self.entries = _CacheEntry()
+        self.prev = self
+        self.next = self
+
+    def __repr__(self):
+        return f"(frequency: {self.frequency})"
+
+
+def _add_bucket_after(bucket: _LFUBucket, frequency: int) -> _LFUBucket:
+    """Inserts a new bucket with the given frequency after bucket, and returns
+    it.
+
+    Time complexity: O(1)."""
+    new = _LFUBucket(frequency)
+    new.prev = bucket
+    new.next = bucket.next
+    bucket.next.prev = new
+    bucket.next = new
+    return new
+
+
+def _remove_bucket(bucket: _LFUBucket) -> None:
+    """Removes bucket from the list of the buckets.
+
+    Time complexity: O(1)."""
+    bucket.prev.next = bucket.next
+    bucket.next.prev = bucket.prev
+
+
+class LFUCache(Cache):
+    """Cache with the LFU (least frequently used) replacement policy, where
+    the ties are broken by recency.
+
+    It provides the public interface of Cache and the method frequency. items
+    returns the entries in increasing order of frequency (and, for equal
+    frequencies, from the least to the most recently used)."""
+
+    def __init__(self, capacity=128, weight=None):
+        Cache.__init__(self, capacity, weight)
+        # The sentinel of the list of the buckets, whose frequency is 0.
+        self._buckets = _LFUBucket(0)
+
+    def frequency(self, key: object) -> int:
+        """Returns the number of accesses of key since it was inserted (or 0,
+        if key is not in this cache), without counting it as an access.
+
+        Time complexity: O(1) expected."""
+        entry = self._entries.get(key)
+        return entry.bucket.frequency if entry is not None else 0
+
+    def _link(self, entry: _CacheEntry) -> None:
+        bucket = self._buckets.next
+        if bucket.frequency != 1:
+            bucket = _add_bucket_after(self._buckets, 1)
+        _list_insert_after(bucket.entries.prev, entry)
+        entry.bucket = bucket
+
+    def _touch(self, entry: _CacheEntry) -> None:
+        bucket = entry.bucket
+        target = bucket.next
+        if target.frequency != bucket.frequency + 1:
+            target = _add_bucket_after(bucket, bucket.frequency + 1)
+        self._unlink(entry)
+        _list_insert_after(target.entries.prev, entry)
+        entry.bucket = target
+
+    def _unlink(self, entry: _CacheEntry) -> None:
+        bucket = entry.bucket
+        _list_remove(entry)
+        entry.bucket = None
+        if bucket.entries.next is bucket.entries:
+            _remove_bucket(bucket)
+
+    def _victim(self, keep: _CacheEntry) -> _CacheEntry:
+        bucket = self._buckets.next
+        entry = bucket.entries.next
+        if entry is keep:
+            # keep is the most recently used entry of its bucket, so it's the
+            # only one, if it's also the least recently used one.
+            entry = entry.next
+            if entry is bucket.entries:
+                entry = bucket.next.entries.next
+        return entry
+
+    def _iter_entries(self):
+        bucket = self._buckets.next
+        while bucket is not self._buckets:
+            entry = bucket.entries.next
+            while entry is not bucket.entries:
+                yield entry
+                entry = entry.next
+            bucket = bucket.next
+
+
+# pylint: disable=protected-access
+def is_lfu_cache(c: LFUCache) -> bool:
+    """Returns true if c is a valid LFUCache, false otherwise."""
+    if not isinstance(c, LFUCache):
+        return False
+    count = 0
+    frequency = 0
+    bucket = c._buckets
+    while bucket.next is not c._buckets:
+        if bucket.next.prev is not bucket:
+            return False
+        bucket = bucket.next
+        if bucket.frequency <= frequency or bucket.entries.next is bucket.entries:
+            return False
+        frequency = bucket.frequency
+        entry = bucket.entries
+        while entry.next is not bucket.entries:
+            if entry.next.prev is not entry:
+                return False
+            entry = entry.next
+            if entry.bucket is not bucket or c._entries.get(entry.key) is not entry:
+                return False
+            count += 1
+    if c._buckets.prev is not bucket or count != len(c._entries):
+        return False
+    return abs(sum(e.weight for e in c._entries.values()) - c._weight) < 1e-9
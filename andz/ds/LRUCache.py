@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+An LRU (least recently used) cache evicts the entry which has not been accessed
+(with get or put) for the longest time. It exploits temporal locality: the
+entries which have been accessed recently are likely to be accessed again soon.
+
+The entries are kept in a (circular, intrusive) doubly-linked list, in order of
+recency, from the least recently used one (the next to be evicted) to the most
+recently used one. An access moves its entry to the end of the list, and an
+eviction removes the entry at the front, so both take O(1) time (unlike with a
+queue, which cannot remove an entry from the middle).
+
+# References
+
+- https://en.wikipedia.org/wiki/Cache_replacement_policies#LRU
+- https://leetcode.com/problems/lru-cache/
+"""
+
+from andz.ds.Cache import Cache, _CacheEntry, _list_insert_after, _list_remove
+
+__all__ = ["LRUCache", "is_lru_cache"]
+
+
+class LRUCache(Cache):
+    """Cache with the LRU (least recently used) replacement policy.
+
+    It provides the public interface of Cache. items returns the entries from
+    the least to the most recently used."""
+
+    def __init__(self, capacity=128, weight=None):
+        Cache.__init__(self, capacity, weight)
+        # The sentinel of the list of the entries, where self._head.next is
+        # the least recently used entry and self._head.prev the most recently
+        # used one.
+        self._head = _CacheEntry()
+
+    def _link(self, entry: _CacheEntry) -> None:
+        _list_insert_after(self._head.prev, entry)
+
+    def _touch(self, entry: _CacheEntry) -> None:
+        if entry is not self._head.prev:
+            _list_remove(entry)
+            _list_insert_after(self._head.prev, entry)
+
+    def _unlink(self, entry: _CacheEntry) -> None:
+        _list_remove(entry)
+
+    def _victim(self, keep: _CacheEntry) -> _CacheEntry:
+        entry = self._head.next
+        return entry if entry is not keep else entry.next
+
+    def _iter_entries(self):
+        entry = self._head.next
+        while entry is not self._head:
+            yield entry
+            entry = entry.next
+
+
+# pylint: disable=protected-access
+def is_lru_cache(c: LRUCache) -> bool:
+    """Returns true if c is a valid LRUCache, false otherwise."""
+    if not isinstance(c, LRUCache):
+        return False
+    entries = []
+    entry = c._head
+    while entry.next is not c._head:
+        if entry.next.prev is not entry:
+            return False
+        entry = entry.next
+        entries.append(entry)
+    if c._head.prev is not entry or len(entries) != len(c._entries):
+        return False
+    if any(c._entries.get(e.key) is not e for e in entries):
+        return False
+    return abs(sum(e.weight for e in entries) - c._weight) < 1e-9
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 01/06/2015
 
-Updated: 02/04/2018
+Updated: 19/10/2026
 
 # Description
 
@@ -31,11 +31,60 @@ function, which might cause hash collisions, where the hash function generates
 the same index (i.e. the same position or bucket) for more than one key. Such
 collisions must be resolved or accommodated in some way.
 
+Python's hash function is not a good hash function, in this sense: the hash
+code of an integer is (almost always) the integer itself, so, for example, all
+multiples of the capacity of the table are mapped to the same slot and form a
+single cluster, which makes the operations take O(n) time. Keys with this
+property can occur naturally (e.g. ids which are multiples of a round number)
+or be crafted by an attacker (a "collision flood" or "hash flooding" attack).
+For this reason, LinearProbingHashTable scrambles the hash codes with the
+finalizer of the SplitMix64 generator (see andz.ds.hashing), after mixing them
+with a random seed chosen (by default) for each table, so that the keys which
+collide cannot be predicted. Clients can also supply their own hash function
+(instead of Python's hash), whose hash codes are then mixed in the same way.
+
 ## Resolving collisions
 
 There are different ways to resolve collisions, where the most famous techniques
 are "separate chaining" and "open addressing".
 
+## Load factor
+
+The load factor of a hash table is the ratio between the number of stored
+(key, value) pairs and the number of slots. With linear probing, the expected
+number of probes of a search grows as 1 / (1 - α)^2, where α is the load
+factor, so the table is enlarged when α exceeds a maximum load factor (0.7, by
+default), which keeps the expected number of probes constant. Symmetrically,
+the table is shrunk when α drops below a quarter of the maximum load factor,
+so that its memory usage stays proportional to the number of pairs. Since the
+size of the table is (roughly) doubled or halved, the cost of resizing is O(1)
+amortized per operation.
+
+## Incremental resizing
+
+Although the cost of resizing is O(1) amortized, a single insertion which
+triggers a resize still moves all pairs to the new buffers, which, for a large
+table, can take a long time. With incremental_resize=True, a resize only
+allocates the new buffers, and the pairs are moved from the old buffers to the
+new ones a few slots at a time, during the following insertions and deletions
+(as Redis does with its dictionaries). Meanwhile, new keys are inserted into the
+new buffers, and the lookups consult both the new and the old buffers.
+
+The number of slots migrated per operation is fixed when the resize starts, so
+that the migration completes before the new buffers would need to be resized
+again (it's 2, when the table is enlarged, and about 4 / max_load_factor, when
+it's shrunk). So, no insertion or deletion moves more than a constant number
+of pairs, although the allocation of the new buffers still takes O(n) time
+(but it's done by a single, fast, memory allocation).
+
+The slots of the old buffers are migrated in order, starting after an empty
+slot s, which stays empty until the migration completes. Since the probe
+sequence of a key never goes past an empty slot, the probe sequence of a key
+which has not been migrated can only start in the migrated part of the old
+buffers (which is now empty) if it continues in the non-migrated part, so such
+probe sequences start at the first non-migrated slot instead. The same holds
+for the backward-shift deletion of a key from the old buffers.
+
 # TODO
 
 - Add complexity analysis to operations
@@ -43,13 +92,6 @@ are "separate chaining" and "open addressing".
 - No difference between non-existence of a key in the table and existence of a
 key with None as associated value: maybe we want to differentiate the two cases?
 
-- Resizing the hash table only whenever we reach a full table may not be the
-best option in terms of performance...
-
-- Should a client of this class be able to specify its custom hash function?
-
-- Size could be implemented as a counter.
-
 - Improve is_hash_table function
 
 # References
@@ -63,13 +105,27 @@ best option in terms of performance...
 - https://en.wikipedia.org/wiki/Hash_function
 - https://en.wikipedia.org/wiki/Linear_probing
 - https://en.wikipedia.org/wiki/Open_addressing
+- https://en.wikipedia.org/wiki/Hash_table#Load_factor
+- https://prng.di.unimi.it/splitmix64.c
+- https://en.wikipedia.org/wiki/Collision_attack#Hash_flooding
+- https://github.com/redis/redis/blob/unstable/src/dict.c (incremental rehashing)
 """
 
-from collections.abc import Hashable
+from collections.abc import Hashable, Sized
+from secrets import randbits
 
 from tabulate import tabulate
 
+from andz.ds.hashing import mix
 from andz.ds.HashTable import HashTable
+from andz.ds.linear_probing import (
+    backward_shift,
+    capacity_for,
+    grown_capacity,
+    probe,
+    reinsert,
+    shrunk_capacity,
+)
 
 __all__ = ["LinearProbingHashTable", "has_duplicates_ignore_nones", "is_hash_table"]
 
@@ -78,47 +134,122 @@ class LinearProbingHashTable(HashTable):
     """Resizable hash table which uses linear probing, which is a specific
     "open addressing" technique, to resolve collisions.
 
-    The process of resizing consists in doubling the current capacity of the
-    hash table each time.
+    The process of resizing consists in (roughly) doubling the current capacity
+    of the hash table, whenever its load factor would exceed max_load_factor,
+    or halving it, whenever its load factor drops below max_load_factor / 4
+    (but the capacity never goes below the initial one).
+
+    The hash function mixes the hash code of the key, given by hash_function
+    (by default, the Python's built-in hash function), with seed (by default,
+    a random 64-bit integer), and then it uses the % operator. Two tables with
+    the same seed (and hash function) map the keys to the same slots.
 
-    The hash function uses both the Python's built-in hash function and the %
-    operator.
+    If incremental_resize is true, the pairs are moved to the new buffers of a
+    resize incrementally, during the following insertions and deletions, so
+    that no single insertion or deletion takes more than O(1) expected time
+    (apart from the allocation of the new buffers).
 
     You can access and put an item in the hash table by using the same
     convenient notation that is used by the Python's standard dict class:
 
         h = LinearProbingHashTable()
         h[12] = 3
-        print(h[12])"""
-
-    def __init__(self, capacity: int = 11):
+        print(h[12])
+
+    It also supports the bulk operations from_items, put_many and get_many, the
+    views keys, values and items, iteration over the keys, the in operator and
+    the del statement (which, unlike delete, raises KeyError if the key is not
+    in the hash table)."""
+
+    def __init__(
+        self,
+        capacity: int = 11,
+        max_load_factor: float = 0.7,
+        hash_function=None,
+        seed: int = None,
+        incremental_resize: bool = False,
+    ):
         if not isinstance(capacity, int):
             raise TypeError("capacity must be an instance of int")
         if capacity < 1:
             raise ValueError("capacity must be greater or equal to 1")
+        if not isinstance(max_load_factor, (int, float)):
+            raise TypeError("max_load_factor must be a number")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in the interval (0, 1)")
+        if hash_function is not None and not callable(hash_function):
+            raise TypeError("hash_function must be callable")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        if not isinstance(incremental_resize, bool):
+            raise TypeError("incremental_resize must be an instance of bool")
+        self._hash_function = hash if hash_function is None else hash_function
+        self._seed = randbits(64) if seed is None else seed
         self._n = capacity  # self._n holds the size of the buffers.
+        self._min_capacity = capacity
+        self._max_load_factor = max_load_factor
+        self._size = 0  # The number of pairs key-value.
         self._keys = [None] * self._n
         self._values = [None] * self._n
+        self._incremental_resize = incremental_resize
+        # The old buffers of an incremental resize in progress (or None), where
+        # the slots from self._old_start (included) to self._old_stop (which
+        # is empty) have not been migrated yet.
+        self._old_keys = None
+        self._old_values = None
+        self._old_start = 0
+        self._old_stop = 0
+        self._migration_step = 0  # The number of slots migrated per operation.
 
     @property
     def size(self) -> int:
-        """Returns the number of pairs key-value in this map."""
-        assert is_hash_table(self)
-        return sum(k is not None for k in self._keys)
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(1)."""
+        return self._size
 
     @property
     def capacity(self) -> int:
-        """Returns the number of allocated cells in memory."""
-        assert is_hash_table(self)
-        return len(self._keys)
+        """Returns the number of allocated cells in memory.
 
-    @staticmethod
-    def _hash_code(key, size: int) -> int:
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the size and the capacity of this map.
+
+        Time complexity: O(1)."""
+        return self._size / self._n
+
+    @property
+    def max_load_factor(self) -> float:
+        """Returns the load factor above which this map is enlarged.
+
+        Time complexity: O(1)."""
+        return self._max_load_factor
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed which is mixed with the hash codes of the keys.
+
+        Time complexity: O(1)."""
+        return self._seed
+
+    @property
+    def resizing(self) -> bool:
+        """Returns true if an incremental resize is in progress, i.e. if some
+        pairs are still in the old buffers, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._old_keys is not None
+
+    def _hash_code(self, key, size: int) -> int:
         """Returns a hash code (an int) between 0 and size (excluded).
 
         size must be the size of the buffer based on which this function should
         return a hash value."""
-        return hash(key) % size
+        return mix(self._hash_function(key), self._seed) % size
 
     @staticmethod
     def _rehash(old_hash: int, size: int) -> int:
@@ -131,7 +262,9 @@ class LinearProbingHashTable(HashTable):
     def put(self, key: object, value: object) -> None:
         """Inserts the pair (key: value) in this map.
 
-        If key is None, a TypeError is raised, because keys cannot be None."""
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected amortized."""
         assert is_hash_table(self)
 
         if key is None:
@@ -139,75 +272,233 @@ class LinearProbingHashTable(HashTable):
         if not isinstance(key, Hashable):
             raise TypeError("key must be an instance of a hashable type")
 
-        self._put(key, value, self._n)
+        if self._old_keys is not None:
+            self._migrate(self._migration_step)
+            if self._old_keys is not None and self._update_old(key, value):
+                assert is_hash_table(self)
+                return
 
-        assert is_hash_table(self)
+        i = self._find_slot(key)
 
-    def _put(self, key: object, value: object, size: int) -> None:
-        """Helper method of self.put."""
-        hash_value = LinearProbingHashTable._hash_code(key, size)
+        if self._keys[i] is None:
+            new_capacity = grown_capacity(self._size, self._n, self._max_load_factor)
+            if new_capacity != self._n:
+                if self._incremental_resize:
+                    self._start_resize(new_capacity)
+                else:
+                    self._resize(new_capacity)
+                i = self._find_slot(key)
+            self._keys[i] = key
+            self._size += 1
 
-        # No need to allocate new space.
-        if self._keys[hash_value] is None:
-            self._keys[hash_value] = key
-            self._values[hash_value] = value
+        self._values[i] = value
 
-        # If self already contains_key key, then its value is overridden.
-        elif self._keys[hash_value] == key:
-            self._values[hash_value] = value
+        assert is_hash_table(self)
 
-        # Collision: there's already a (key: value) pair at the slot dedicated
-        # to this (key: value) pair, according to the self._hash_code function.
-        # We need to _rehash, i.e. find another slot for this (key: value) pair.
-        else:
-            next_slot = LinearProbingHashTable._rehash(hash_value, size)
-            rehashed = False
+    def put_many(self, iterable) -> None:
+        """Inserts the pairs (key, value) of iterable in this map, as put
+        would do, but with the probing inlined and the validity of this map
+        checked only once.
 
-            while self._keys[next_slot] is not None and self._keys[next_slot] != key:
+        If iterable is sized, this map is resized (at most) once, before
+        inserting the pairs (assuming that their keys are new). If a key is
+        not valid, an exception is raised, but the pairs before it have
+        already been inserted.
 
-                next_slot = LinearProbingHashTable._rehash(next_slot, size)
+        If incremental_resize is true, the pairs are simply inserted with put,
+        so that the bound on the time of each insertion still holds.
 
-                # Allocate new buffer of length len(self.keys) * 2 + 1.
-                if next_slot == hash_value:
-                    rehashed = True
+        Time complexity: O(k) expected amortized, where k is the number of
+        pairs in iterable."""
+        assert is_hash_table(self)
 
+        if self._incremental_resize:
+            for key, value in iterable:
+                self.put(key, value)
+            return
+
+        if isinstance(iterable, Sized):
+            self._reserve(self._size + len(iterable))
+
+        keys = self._keys
+        values = self._values
+        n = self._n
+        hash_function = self._hash_function
+        seed = self._seed
+        for key, value in iterable:
+            if key is None:
+                raise TypeError("key cannot be None.")
+            if not isinstance(key, Hashable):
+                raise TypeError("key must be an instance of a hashable type")
+            i = probe(keys, key, mix(hash_function(key), seed) % n)
+            if keys[i] is None:
+                new_capacity = grown_capacity(self._size, n, self._max_load_factor)
+                if new_capacity != n:
+                    self._resize(new_capacity)
                     keys = self._keys
                     values = self._values
+                    n = self._n
+                    i = self._find_slot(key)
+                keys[i] = key
+                self._size += 1
+            values[i] = value
 
-                    new_size = len(self._keys) * 2 + 1
-                    self._keys = [None] * new_size
-                    self._values = [None] * new_size
-
-                    # Rehashing and putting all elements in the new bigger
-                    # buffer.
-                    #
-                    # Note: the calls to self._put in the following loop will
-                    # never reach these statements, because there will be slots
-                    # available, and because the way hashing and rehashing is
-                    # currently implemented.
-                    for k in keys:
-                        v = LinearProbingHashTable._get(k, keys, values, self._n)
-                        self._put(k, v, new_size)
-
-                    # After resizing the buffers, we insert the original
-                    # (key: value) pair.
-                    self._put(key, value, new_size)
-                    self._n = new_size
-
-            # We exited the loop either because we have found a free slot or a
-            # slot containing our key, and not after having re-sized the table.
-            if not rehashed:
-                if self._keys[next_slot] is None:
-                    self._keys[next_slot] = key
-                    self._values[next_slot] = value
-                else:
-                    assert self._keys[next_slot] == key
-                    self._values[next_slot] = value
+        assert is_hash_table(self)
+
+    def _find_slot(self, key: object) -> int:
+        """Returns the index of the slot which contains key, if key is in this
+        map, otherwise the index of the empty slot where key would be inserted.
+
+        Since the load factor is always smaller than 1, there's always at least
+        one empty slot, so the probing terminates.
+
+        Time complexity: O(1) expected."""
+        return probe(self._keys, key, self._hash_code(key, self._n))
+
+    def _resize(self, new_capacity: int) -> None:
+        """Moves all pairs key-value to new buffers of size new_capacity, which
+        must be greater than the size of this map.
+
+        If an incremental resize is in progress, it's completed first.
+
+        Time complexity: O(n + m), where n is the old capacity and m is
+        new_capacity."""
+        if self._old_keys is not None:
+            self._migrate(len(self._old_keys))
+        old_keys = self._keys
+        old_values = self._values
+        self._n = new_capacity
+        self._keys = [None] * new_capacity
+        self._values = [None] * new_capacity
+        reinsert(
+            old_keys,
+            (old_values,),
+            self._keys,
+            (self._values,),
+            lambda j: self._hash_code(old_keys[j], new_capacity),
+        )
+
+    def _start_resize(self, new_capacity: int) -> None:
+        """Allocates new buffers of size new_capacity, which must be greater
+        than the size of this map, and keeps the current ones as the old
+        buffers, whose pairs are then migrated by the following operations.
+
+        If an incremental resize is already in progress, it's completed first.
+
+        Time complexity: O(m) (or O(n + m), if another incremental resize has
+        to be completed), where n is the old capacity and m is new_capacity."""
+        if self._old_keys is not None:
+            self._migrate(len(self._old_keys))
+        keys = self._keys
+        if self._size == 0:
+            # There's nothing to migrate.
+            self._n = new_capacity
+            self._keys = [None] * new_capacity
+            self._values = [None] * new_capacity
+            return
+        self._old_keys = keys
+        self._old_values = self._values
+        self._old_stop = keys.index(None)
+        self._old_start = (self._old_stop + 1) % self._n
+        # Migrate the old buffers before the new ones have to be resized again.
+        inserts = max(1, int(self._max_load_factor * new_capacity) - self._size)
+        self._migration_step = -(-self._n // inserts)
+        self._n = new_capacity
+        self._keys = [None] * new_capacity
+        self._values = [None] * new_capacity
+
+    def _migrate(self, count: int) -> None:
+        """Moves the pairs in the next count slots of the old buffers to the
+        new buffers and, if the migration is complete, drops the old buffers.
+
+        Time complexity: O(count) expected."""
+        old_keys = self._old_keys
+        old_values = self._old_values
+        keys = self._keys
+        values = self._values
+        n = len(old_keys)
+        i = self._old_start
+        stop = self._old_stop
+        while count > 0 and i != stop:
+            k = old_keys[i]
+            if k is not None:
+                j = self._find_slot(k)
+                keys[j] = k
+                values[j] = old_values[i]
+                old_keys[i] = old_values[i] = None
+            i = (i + 1) % n
+            count -= 1
+        self._old_start = i
+        if i == stop:
+            self._old_keys = self._old_values = None
+
+    def _find_old_slot(self, key: object) -> int:
+        """Returns the index of the slot of the old buffers which contains key,
+        if key has not been migrated yet, otherwise the index of an empty slot
+        of the old buffers.
+
+        Time complexity: O(1) expected."""
+        keys = self._old_keys
+        n = len(keys)
+        start = self._old_start
+        i = self._hash_code(key, n)
+        if (i - start) % n > (self._old_stop - start) % n:
+            # The probe sequence starts in the migrated part.
+            i = start
+        return probe(keys, key, i)
+
+    def _update_old(self, key: object, value: object) -> bool:
+        """Associates value with key, if key is in the old buffers, and returns
+        true, otherwise it returns false.
+
+        Time complexity: O(1) expected."""
+        i = self._find_old_slot(key)
+        if self._old_keys[i] is None:
+            return False
+        self._old_values[i] = value
+        return True
+
+    def _delete_old(self, key: object) -> tuple:
+        """Deletes key from the old buffers, if it's there, with backward-shift
+        deletion, and returns (True, value), where value was associated with
+        key, otherwise it returns (False, None).
+
+        Time complexity: O(1) expected."""
+        keys = self._old_keys
+        values = self._old_values
+        i = self._find_old_slot(key)
+        if keys[i] is None:
+            return False, None
+        v = values[i]
+        n = len(keys)
+        start = self._old_start
+        span = (self._old_stop - start) % n
+
+        def home(j: int) -> int:
+            h = self._hash_code(keys[j], n)
+            # If h is in the migrated part, the probe sequence of keys[j]
+            # starts at start, see above.
+            return start if (h - start) % n > span else h
+
+        i = backward_shift(keys, (values,), i, home)
+        keys[i] = values[i] = None
+        return True, v
+
+    def _reserve(self, size: int) -> None:
+        """Enlarges this map, if needed, so that it can hold size pairs
+        key-value without exceeding its maximum load factor.
+
+        Time complexity: O(n + m), if this map is resized, where n is the old
+        capacity and m is the new one, otherwise O(1)."""
+        if size > self._max_load_factor * self._n:
+            self._resize(capacity_for(size, self._max_load_factor))
 
     def get(self, key: object) -> object:
         """Returns the value associated with key.
 
-        If key is None, a TypeError is raised, because keys cannot be None."""
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected."""
         assert is_hash_table(self)
 
         if key is None:
@@ -215,41 +506,59 @@ class LinearProbingHashTable(HashTable):
         if not isinstance(key, Hashable):
             raise TypeError("key must be an instance of a hashable type")
 
-        value = LinearProbingHashTable._get(key, self._keys, self._values, self._n)
+        i = self._find_slot(key)
+        if self._keys[i] is None and self._old_keys is not None:
+            value = self._old_values[self._find_old_slot(key)]
+        else:
+            value = self._values[i]
 
         assert is_hash_table(self)
 
         return value
 
-    @staticmethod
-    def _get(key: object, keys: list, values: list, size: int) -> object:
-        """Helper method of self.get."""
-        hash_value = LinearProbingHashTable._hash_code(key, size)
+    def get_many(self, keys) -> list:
+        """Returns the list of the values associated with the keys in the
+        iterable keys (None for the keys which are not in this map).
 
-        data = None
-        stop = False
-        found = False
-        position = hash_value
+        If a key is None, a TypeError is raised, because keys cannot be None.
 
-        while keys[position] is not None and not found and not stop:
+        Time complexity: O(k) expected, where k is the number of keys."""
+        assert is_hash_table(self)
 
-            if keys[position] == key:
-                found = True
-                data = values[position]
-            else:
-                # Find a new possible position by rehashing.
-                position = LinearProbingHashTable._rehash(position, size)
+        if self._old_keys is not None:
+            return [self.get(key) for key in keys]
+
+        table_keys = self._keys
+        values = self._values
+        n = self._n
+        hash_function = self._hash_function
+        seed = self._seed
+        result = []
+        for key in keys:
+            if key is None:
+                raise TypeError("key cannot be None.")
+            if not isinstance(key, Hashable):
+                raise TypeError("key must be an instance of a hashable type")
+            result.append(
+                values[probe(table_keys, key, mix(hash_function(key), seed) % n)]
+            )
+        return result
 
-                # We are at the initial slot, and thus nothing was found.
-                if position == hash_value:
-                    stop = True
+    def delete(self, key: object) -> object:
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
 
-        return data
+        If there's no mapping, nothing is done (and None is returned).
 
-    def delete(self, key: object) -> object:
-        """Deletes the mapping between key and its associated value.
+        The slot of key is not simply emptied, since that would break the probe
+        sequences of the keys after it in the same cluster (i.e. the maximal
+        sequence of non-empty slots), which could then not be found. Instead,
+        the following keys of the cluster are shifted backwards into the empty
+        slot, if that does not move them before their home slot (i.e. the slot
+        given by their hash code), until an empty slot is reached ("backward
+        shift deletion"). So, no tombstones are needed.
 
-        If there's no mapping, nothing is done."""
+        Time complexity: O(1) expected amortized."""
         assert is_hash_table(self)
 
         if key is None:
@@ -257,26 +566,73 @@ class LinearProbingHashTable(HashTable):
         if not isinstance(key, Hashable):
             raise TypeError("key must be an instance of a hashable type")
 
-        try:
-            i = self._keys.index(key)
-            v = self._values[i]
-            self._keys[i] = self._values[i] = None
-            return v
-        except ValueError:
-            pass
-        finally:
-            assert is_hash_table(self)
+        if self._old_keys is not None:
+            self._migrate(self._migration_step)
+            if self._old_keys is not None:
+                found, v = self._delete_old(key)
+                if found:
+                    self._size -= 1
+                    assert is_hash_table(self)
+                    return v
+
+        keys = self._keys
+        values = self._values
+        i = self._find_slot(key)
+        if keys[i] is None:
+            return None
+        v = values[i]
+
+        n = self._n
+        i = backward_shift(keys, (values,), i, lambda j: self._hash_code(keys[j], n))
+        keys[i] = values[i] = None
+        self._size -= 1
+
+        if self._old_keys is None:
+            new_capacity = shrunk_capacity(
+                self._size, self._n, self._max_load_factor, self._min_capacity
+            )
+            if new_capacity != self._n:
+                if self._incremental_resize:
+                    self._start_resize(new_capacity)
+                else:
+                    self._resize(new_capacity)
+
+        assert is_hash_table(self)
+
+        return v
 
     def show(self) -> None:
         """Prints this hash table in table-like format."""
         c = 0
         data = []
-        for i, _ in enumerate(self._keys):
-            if self._keys[i] is not None:
-                c += 1
-                data.append([c, self._keys[i], self._values[i]])
+        for k, v in self._iter_items():
+            c += 1
+            data.append([c, k, v])
         print(tabulate(data, headers=["#", "Keys", "Values"], tablefmt="grid"))
 
+    def _iter_items(self):
+        """Returns an iterator over the pairs (key, value) of this map."""
+        for k, v in zip(self._keys, self._values):
+            if k is not None:
+                yield k, v
+        if self._old_keys is not None:
+            for k, v in zip(self._old_keys, self._old_values):
+                if k is not None:
+                    yield k, v
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        if self._keys[self._find_slot(key)] is not None:
+            return True
+        return (
+            self._old_keys is not None
+            and self._old_keys[self._find_old_slot(key)] is not None
+        )
+
     def __getitem__(self, key):
         return self.get(key)
 
@@ -284,7 +640,7 @@ class LinearProbingHashTable(HashTable):
         self.put(key, value)
 
     def __str__(self):
-        return str([(k, v) for k, v in zip(self._keys, self._values) if k is not None])
+        return str(list(self._iter_items()))
 
     def __repr__(self):
         return self.__str__()
@@ -305,4 +661,13 @@ def is_hash_table(t: HashTable) -> bool:
         return False
     if len(t._keys) != len(t._values) or len(t._keys) != t._n:
         return False
-    return not has_duplicates_ignore_nones(t._keys)
+    keys = t._keys
+    if t._old_keys is not None:
+        if len(t._old_keys) != len(t._old_values):
+            return False
+        if t._old_keys[t._old_stop] is not None:
+            return False
+        keys = keys + t._old_keys
+    if t._size != len(keys) - keys.count(None):
+        return False
+    return not has_duplicates_ignore_nones(keys)
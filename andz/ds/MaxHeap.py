@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 15/02/2016
 
-Updated: 29/09/2017
+Updated: 19/10/2026
 
 # Description
 
@@ -35,14 +35,20 @@ class MaxHeap(BinaryHeap):
     - find_max
     - remove_max"""
 
-    def __init__(self, ls=None):
-        BinaryHeap.__init__(self, ls)
+    # Elements with equal keys are removed in insertion order.
+    _seq_step = -1
+
+    def __init__(
+        self, ls=None, key=None, lazy_delete: bool = False, compact_fraction=0.5
+    ):
+        BinaryHeap.__init__(self, ls, key, lazy_delete, compact_fraction)
 
     def find_max(self):
         """Returns the greatest element in this MaxHeap.
 
-        Time complexity: O(1)."""
-        return self.heap[0] if not self.is_empty() else None
+        Time complexity: O(1), if there are no deleted elements at the root."""
+        self._purge_root()
+        return self._undecorate(self.heap[0]) if not self.is_empty() else None
 
     def remove_max(self):
         """Removes and returns the greatest element in this MaxHeap.
@@ -50,12 +56,13 @@ class MaxHeap(BinaryHeap):
         Time complexity: O(log(n))."""
         assert is_max_heap(self)
         if not self.is_empty():
-            self._swap(0, self.size - 1)
-            m = self.heap.pop()
-            if not self.is_empty():
-                self._push_down(0)
+            m = self._remove_root()
             assert is_max_heap(self)
-            return m
+            return self._undecorate(m)
+
+    def _has_higher_priority(self, x: object, y: object) -> bool:
+        """Returns true if x is greater than y, false otherwise."""
+        return x > y
 
     def _push_down(self, i: int) -> None:
         """Max-heapifies this MaxHeap starting from index i.
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Contains the abstract class MergeableHeap, from which PairingHeap, BinomialHeap
+and FibonacciHeap derive.
+
+A mergeable heap (or meldable heap) is a min-heap which, in addition to the
+usual operations of a heap, supports an efficient merge (or meld) operation,
+i.e. an operation which combines two heaps into one. BinaryHeap.merge needs to
+rebuild the whole array, so it takes O(n + m) time, whereas the heaps deriving
+from this class are pointer-based and merge in O(1) or O(log(n)) time.
+
+Since these heaps are pointer-based, MergeableHeap.add returns a "handle" to the
+inserted element, which can later be passed to decrease_key to decrease the
+priority of that element without searching for it.
+
+# References
+
+- Chapter 19 of Introduction to Algorithms (3rd ed.) by CLRS
+- https://en.wikipedia.org/wiki/Mergeable_heap
+"""
+
+from abc import ABC, abstractmethod
+
+__all__ = ["MergeableHeap"]
+
+
+class MergeableHeap(ABC):
+    """Abstract class to represent mergeable min-heaps.
+
+    It provides the same public interface as MinHeap, i.e.
+
+    - size
+    - is_empty
+    - clear
+    - add
+    - add_many
+    - pop_many
+    - pushpop
+    - replace
+    - contains
+    - delete
+    - merge
+    - find_min
+    - remove_min
+
+    plus the decrease_key operation. So, a MergeableHeap can be used wherever a
+    MinHeap is used, with the following differences:
+
+    - add returns a handle to the inserted element, which has a key attribute,
+      which is the element itself;
+    - merge(o) moves all elements of o to this heap, so o is empty afterwards
+      (but the handles of its elements are still valid and now refer to this
+      heap).
+
+    It's the responsibility of the client to ensure that inserted elements are
+    comparable among them and that handles passed to decrease_key belong to
+    this heap."""
+
+    def __init__(self, ls=None):
+        self._n = 0
+        if ls is not None:
+            self.add_many(ls)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this heap.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    def is_empty(self) -> bool:
+        """Returns true if this heap is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._n == 0
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all elements from this heap."""
+
+    @abstractmethod
+    def add(self, x: object) -> object:
+        """Adds x to this heap and returns a handle to it."""
+
+    @abstractmethod
+    def find_min(self) -> object:
+        """Returns the smallest element in this heap, or None if this heap is
+        empty."""
+
+    @abstractmethod
+    def remove_min(self) -> object:
+        """Removes and returns the smallest element in this heap, or None if
+        this heap is empty."""
+
+    @abstractmethod
+    def decrease_key(self, handle: object, x: object) -> None:
+        """Replaces the element referred to by handle with x, which must be
+        smaller than or equal to it."""
+
+    @abstractmethod
+    def merge(self, o: "MergeableHeap") -> None:
+        """Moves all elements of o, which must be of the same type as this
+        heap, to this heap."""
+
+    @abstractmethod
+    def _remove(self, handle: object) -> None:
+        """Removes the element referred to by handle from this heap."""
+
+    @abstractmethod
+    def _handles(self):
+        """Returns an iterator over the handles of all elements of this heap,
+        in no particular order."""
+
+    def add_many(self, iterable) -> None:
+        """Adds all objects in iterable to this heap.
+
+        If one of the objects is None, ValueError is raised and this heap is not
+        modified.
+
+        Time complexity: O(k * c), where k is the number of objects to add and c
+        is the (amortized) cost of self.add."""
+        items = list(iterable)
+        if any(x is None for x in items):
+            raise ValueError("all elements of iterable must be not None")
+        for x in items:
+            self.add(x)
+
+    def pop_many(self, k: int) -> list:
+        """Removes and returns (at most) the k smallest elements in this heap,
+        in increasing order.
+
+        Time complexity: O(k * log(n)) amortized."""
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 0:
+            raise ValueError("k must be greater or equal to 0")
+        return [self.remove_min() for _ in range(min(k, self._n))]
+
+    def pushpop(self, x: object) -> object:
+        """Adds x to this heap and then removes and returns the smallest element.
+
+        If x would be the smallest element, x is returned immediately and this
+        heap is not modified.
+
+        Time complexity: O(log(n)) amortized."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        if self.is_empty() or not self.find_min() < x:
+            return x
+        m = self.remove_min()
+        self.add(x)
+        return m
+
+    def replace(self, x: object) -> object:
+        """Removes and returns the smallest element of this heap and then adds x
+        to it.
+
+        If this heap is empty, x is simply added to it and None is returned.
+
+        Time complexity: O(log(n)) amortized."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        m = self.remove_min()
+        self.add(x)
+        return m
+
+    def contains(self, x: object) -> bool:
+        """Returns true if x is in this heap, false otherwise.
+
+        Time complexity: O(n)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        return self._find(x) is not None
+
+    def delete(self, x: object) -> None:
+        """Removes the first found x from this heap.
+
+        If x is not in this heap, LookupError is raised.
+
+        Time complexity: O(n)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        handle = self._find(x)
+        if handle is None:
+            raise LookupError("x not found")
+        self._remove(handle)
+
+    def _find(self, x: object) -> object:
+        """Returns the handle of the first found x in this heap, or None if x is
+        not in this heap.
+
+        Time complexity: O(n)."""
+        for handle in self._handles():
+            if handle.key == x:
+                return handle
+        return None
+
+    def _check_merge(self, o: "MergeableHeap") -> None:
+        """Raises an exception if o cannot be merged into this heap."""
+        if not isinstance(o, type(self)):
+            raise TypeError(f"o must be an instance of {type(self).__name__}")
+        if o is self:
+            raise ValueError("a heap cannot be merged with itself")
+
+    @staticmethod
+    def _check_decrease_key(handle: object, x: object) -> None:
+        """Raises an exception if the element referred to by handle cannot be
+        replaced with x by decrease_key."""
+        if handle is None:
+            raise TypeError("handle cannot be None")
+        if x is None:
+            raise ValueError("x cannot be None")
+        if handle.key < x:
+            raise ValueError("x cannot be greater than the current element")
+
+    def __str__(self):
+        return str([handle.key for handle in self._handles()])
+
+    def __repr__(self):
+        return self.__str__()
@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 01/07/2015
 
-Updated: 29/09/2017
+Updated: 19/10/2026
 
 # Description
 
@@ -52,14 +52,17 @@ class MinHeap(BinaryHeap):
     - find_min
     - remove_min"""
 
-    def __init__(self, ls=None):
-        BinaryHeap.__init__(self, ls)
+    def __init__(
+        self, ls=None, key=None, lazy_delete: bool = False, compact_fraction=0.5
+    ):
+        BinaryHeap.__init__(self, ls, key, lazy_delete, compact_fraction)
 
     def find_min(self):
         """Returns the smallest element in this MinHeap.
 
-        Time complexity: O(1)."""
-        return self.heap[0] if not self.is_empty() else None
+        Time complexity: O(1), if there are no deleted elements at the root."""
+        self._purge_root()
+        return self._undecorate(self.heap[0]) if not self.is_empty() else None
 
     def remove_min(self):
         """Removes and returns the smallest element in this MinHeap.
@@ -67,12 +70,13 @@ class MinHeap(BinaryHeap):
         Time complexity: O(log(n))."""
         assert is_min_heap(self)
         if not self.is_empty():
-            self._swap(0, self.size - 1)
-            m = self.heap.pop()
-            if not self.is_empty():
-                self._push_down(0)
+            m = self._remove_root()
             assert is_min_heap(self)
-            return m
+            return self._undecorate(m)
+
+    def _has_higher_priority(self, x: object, y: object) -> bool:
+        """Returns true if x is smaller than y, false otherwise."""
+        return x < y
 
     def _push_down(self, i: int) -> None:
         """Min-heapifies this MinHeap starting from index i.
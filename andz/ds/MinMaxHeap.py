@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 18/02/2016
 
-Updated: 23/03/2024
+Updated: 19/10/2026
 
 # Description
 
@@ -38,7 +38,6 @@ Even levels are 0, 2, 4, 6, etc., whereas odd levels are 1, 3, 5, 7, etc.
 - http://www.math.clemson.edu/~warner/M865/HeapDelete.html
 """
 
-import math
 from logging import getLogger
 
 from andz.ds.BinaryHeap import BinaryHeap
@@ -55,265 +54,273 @@ class MinMaxHeap(BinaryHeap):
     - find_max
     - find_min
     - remove_max
-    - remove_min"""
+    - remove_min
+    - pushpop_max
+    - pushpop_min"""
 
-    def __init__(self, ls=None):
-        BinaryHeap.__init__(self, ls)
+    def __init__(
+        self, ls=None, key=None, lazy_delete: bool = False, compact_fraction=0.5
+    ):
+        BinaryHeap.__init__(self, ls, key, lazy_delete, compact_fraction)
 
     def find_max(self):
         """Returns the greatest element in this MinMaxHeap.
 
-        Time complexity: O(1)."""
+        Time complexity: O(1), if there are no deleted elements at the top."""
+        self._purge_max()
         if not self.is_empty():
-            return self.heap[self._find_max_index()]
+            return self._undecorate(self.heap[self._find_max_index()])
 
     def find_min(self):
         """Returns the smallest element in this MinMaxHeap.
 
-        Time complexity: O(1)."""
+        Time complexity: O(1), if there are no deleted elements at the root."""
+        self._purge_root()
         if not self.is_empty():
-            return self.heap[0]
+            return self._undecorate(self.heap[0])
 
     def remove_max(self):
         """Removes and returns the greatest element in this MinMaxHeap.
 
         Time complexity: O(log(n))."""
-        assert is_min_max_heap(self)
-
+        self._purge_max()
         if not self.is_empty():
-            i = self._find_max_index()
-
-            if i == self.size - 1:
-                m = self.heap.pop()
-                assert is_min_max_heap(self)
-                return m
-
-            self._swap(i, self.size - 1)
-            m = self.heap.pop()
-            self._push_up(i)
-            self._push_down(i)
-            assert is_min_max_heap(self)
-            return m
+            m = self._remove_at(self._find_max_index())
+            if self._lazy_delete:
+                self._count(self._undecorate(m), -1)
+            return self._undecorate(m)
 
     def remove_min(self):
         """Removes and returns the smallest element in this MinMaxHeap.
 
         Time complexity: O(log(n))."""
         if not self.is_empty():
-            if self.size == 1:
-                m = self.heap.pop()
-                assert is_min_max_heap(self)
-                return m
-
-            self._swap(0, self.size - 1)
-            m = self.heap.pop()
-            self._push_up(0)
-            self._push_down(0)
-            assert is_min_max_heap(self)
-            return m
+            return self._undecorate(self._remove_root())
+
+    def pushpop_min(self, x: object) -> object:
+        """Adds x to this MinMaxHeap and then removes and returns the smallest
+        element, performing at most one trickle-down.
+
+        This is equivalent to self.pushpop(x).
+
+        Time complexity: O(log(n))."""
+        return self.pushpop(x)
+
+    def pushpop_max(self, x: object) -> object:
+        """Adds x to this MinMaxHeap and then removes and returns the greatest
+        element, performing at most one trickle-up and one trickle-down.
+
+        If x would be the greatest element, x is returned immediately and this
+        MinMaxHeap is not modified.
+
+        Time complexity: O(log(n))."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        self._purge_max()
+        entry = x if self._key is None else self._decorate(x)
+        if self.heap:
+            i = self._find_max_index()
+            if self.heap[i] > entry:
+                entry, self.heap[i] = self.heap[i], entry
+                self._push_up(i)
+                self._push_down(i)
+                if self._lazy_delete:
+                    self._count(x, 1)
+                    self._count(self._undecorate(entry), -1)
+        return self._undecorate(entry)
+
+    def _has_higher_priority(self, x: object, y: object) -> bool:
+        """Returns true if x is smaller than y, false otherwise.
+
+        The root of a MinMaxHeap is its smallest element, so pop_many, pushpop
+        and replace operate on the minimum."""
+        return x < y
 
     def _push_down(self, i: int) -> None:
-        """This operation is also called "bubble-down" or "shift-down"."""
+        """This operation is also called "bubble-down" or "shift-down".
+
+        Since self._build_heap calls this method for each internal node, the
+        iterative trickle-down below also makes building a MinMaxHeap from a
+        list (or with self.add_many) fast."""
         if self._is_on_even_level(i):
             self._push_down_min(i)
         else:
             self._push_down_max(i)
 
     def _push_down_min(self, i: int) -> None:
-        """Helper method for self._push_down."""
-        if self._has_children(i):
-            m = self._index_of_min(i)
+        """Helper method for self._push_down.
 
-            if self._is_grandchild(m, i):
-                if self.heap[m] < self.heap[i]:
-                    self._swap(i, m)
+        It moves the element at index i, which is on an even (or min) level,
+        down to its grandchildren (or children), while it's greater than the
+        smallest of them.
 
-                    mp = self._parent_index(m)
-                    if mp != -1 and self.heap[m] > self.heap[mp]:
-                        self._swap(m, mp)
-                    self._push_down_min(m)
-
-            else:  # self.heap[m] is a child of self.heap[i].
-                if self.heap[m] < self.heap[i]:
-                    self._swap(i, m)
+        Time complexity: O(log(n))."""
+        heap = self.heap
+        n = len(heap)
+
+        while True:
+            c = 2 * i + 1  # Index of the left child.
+            if c >= n:
+                return
+
+            # Find the index m of the smallest element among the children and
+            # the grandchildren of i, which are at indices c, c + 1 and
+            # 2 * c + 1, ..., 2 * c + 4, respectively.
+            m = c
+            if c + 1 < n and heap[c + 1] < heap[m]:
+                m = c + 1
+            g = 2 * c + 1  # Index of the leftmost grandchild.
+            for j in range(g, min(g + 4, n)):
+                if heap[j] < heap[m]:
+                    m = j
+
+            if not heap[m] < heap[i]:
+                return
+
+            heap[i], heap[m] = heap[m], heap[i]
+
+            if m < g:  # heap[m] is a child of heap[i].
+                return
+
+            # heap[m] is a grandchild of heap[i], so its parent is on a max
+            # level, and it must be greater than or equal to heap[m].
+            p = (m - 1) // 2
+            if heap[m] > heap[p]:
+                heap[m], heap[p] = heap[p], heap[m]
+            i = m
 
     def _push_down_max(self, i: int) -> None:
-        """Helper method for self._push_down."""
-        if self._has_children(i):
-            m = self._index_of_max(i)
+        """Helper method for self._push_down.
+
+        It moves the element at index i, which is on an odd (or max) level,
+        down to its grandchildren (or children), while it's smaller than the
+        greatest of them.
+
+        Time complexity: O(log(n))."""
+        heap = self.heap
+        n = len(heap)
 
-            if self._is_grandchild(m, i):
-                if self.heap[m] > self.heap[i]:
-                    self._swap(i, m)
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                return
 
-                    mp = self._parent_index(m)
-                    if mp != -1 and self.heap[m] < self.heap[mp]:
-                        self._swap(m, mp)
-                    self._push_down_max(m)
+            m = c
+            if c + 1 < n and heap[c + 1] > heap[m]:
+                m = c + 1
+            g = 2 * c + 1
+            for j in range(g, min(g + 4, n)):
+                if heap[j] > heap[m]:
+                    m = j
 
-            else:  # self.heap[m] is a child of self.heap[i].
-                if self.heap[m] > self.heap[i]:
-                    self._swap(i, m)
+            if not heap[m] > heap[i]:
+                return
+
+            heap[i], heap[m] = heap[m], heap[i]
+
+            if m < g:
+                return
+
+            p = (m - 1) // 2
+            if heap[m] < heap[p]:
+                heap[m], heap[p] = heap[p], heap[m]
+            i = m
 
     def _push_up(self, i: int) -> None:
         """This operation is also called "bubble-up" or "shift-up"."""
-        p = self._parent_index(i)
+        if i == 0:
+            return
 
-        # Let x be the element at index i.
-        # If x has a parent at position p, we call it y.
+        p = (i - 1) // 2
+
+        # Let x be the element at index i and y its parent, at index p.
         if self._is_on_even_level(i):
-            if p != -1 and self.heap[i] > self.heap[p]:
+            if self.heap[i] > self.heap[p]:
                 # If x is greater than y, swap x with y.
                 # Now, x is at index p, and y at index i.
                 # _push_up_max from the new index of x, i.e. p.
                 self._swap(i, p)
                 self._push_up_max(p)
             else:
-                # x does not have a parent OR x <= y.
+                # x <= y.
                 self._push_up_min(i)
         else:
             # Odd or max level.
-            if p != -1 and self.heap[i] < self.heap[p]:
+            if self.heap[i] < self.heap[p]:
                 self._swap(i, p)
                 self._push_up_min(p)
             else:
                 self._push_up_max(i)
 
     def _push_up_min(self, i: int) -> None:
-        """Helper method for self._push_up."""
-        g = self._grandparent_index(i)
-        # Let x be the element at index i.
-        # If x has a grandparent at position g, we call it z.
+        """Helper method for self._push_up.
+
+        It moves the element at index i, which is on an even (or min) level, up
+        to its grandparent, while it's smaller than it.
 
-        # If the z exists and x is smaller than z, swap x and z.
-        # Now, x is at index g and z at index i.
-        if g != -1 and self.heap[i] < self.heap[g]:
-            self._swap(i, g)
-            self._push_up_min(g)
+        Time complexity: O(log(n))."""
+        heap = self.heap
+        x = heap[i]
+        # Nodes at indices 0, 1 and 2 do not have a grandparent.
+        while i > 2:
+            g = (i - 3) // 4  # Index of the grandparent.
+            if not x < heap[g]:
+                break
+            heap[i] = heap[g]
+            i = g
+        heap[i] = x
 
     def _push_up_max(self, i: int) -> None:
-        """Helper method for self._push_up."""
-        g = self._grandparent_index(i)
-        if g != -1 and self.heap[i] > self.heap[g]:
-            self._swap(i, g)
-            self._push_up_max(g)
+        """Helper method for self._push_up.
+
+        It moves the element at index i, which is on an odd (or max) level, up
+        to its grandparent, while it's greater than it.
+
+        Time complexity: O(log(n))."""
+        heap = self.heap
+        x = heap[i]
+        while i > 2:
+            g = (i - 3) // 4
+            if not x > heap[g]:
+                break
+            heap[i] = heap[g]
+            i = g
+        heap[i] = x
+
+    def _purge_max(self) -> None:
+        """Removes the maximum while it's a deleted element (see
+        BinaryHeap._purge_root).
+
+        Time complexity: O(1), if there are no deleted elements, otherwise
+        O(log(n)) for each removed element."""
+        while self._deleted and self.heap:
+            i = self._find_max_index()
+            if not self._consume_tombstone(self._undecorate(self.heap[i])):
+                break
+            self._remove_at(i)
 
     def _find_max_index(self) -> int:
         """Returns the index of the maximum element in this MinMaxHeap.
 
         Time complexity: O(1)."""
-        if self.is_empty():
+        if not self.heap:
             return -1
-        if self.size == 1:
+        if len(self.heap) == 1:
             return 0
-        if self.size == 2:
+        if len(self.heap) == 2:
             return 1
         return 1 if self.heap[1] > self.heap[2] else 2
 
-    def _index_of_min(self, i: int) -> int:
-        """Returns the index of the smallest element among the children and
-        grandchildren of the node at index i.
-
-        Time complexity: O(1)."""
-        m = l = self._left_index(i)
-        r = self._right_index(i)
-
-        if r != -1 and self.heap[r] < self.heap[m]:
-            m = r
-
-        if l != -1:
-            gll = self._left_index(l)
-            if gll != -1 and self.heap[gll] < self.heap[m]:
-                m = gll
-            glr = self._right_index(l)
-            if glr != -1 and self.heap[glr] < self.heap[m]:
-                m = glr
-
-        if r != -1:
-            grl = self._left_index(r)
-            if grl != -1 and self.heap[grl] < self.heap[m]:
-                m = grl
-            grr = self._right_index(r)
-            if grr != -1 and self.heap[grr] < self.heap[m]:
-                m = grr
-
-        return m
-
-    def _index_of_max(self, i: int) -> int:
-        """Returns the index of the largest element among the children and
-        grandchildren of the node at index i.
-
-        Time complexity: O(1)."""
-        m = l = self._left_index(i)
-        r = self._right_index(i)
-
-        if r != -1 and self.heap[r] > self.heap[m]:
-            m = r
-
-        if l != -1:
-            gll = self._left_index(l)
-            if gll != -1 and self.heap[gll] > self.heap[m]:
-                m = gll
-            glr = self._right_index(l)
-            if glr != -1 and self.heap[glr] > self.heap[m]:
-                m = glr
-
-        if r != -1:
-            grl = self._left_index(r)
-            if grl != -1 and self.heap[grl] > self.heap[m]:
-                m = grl
-            grr = self._right_index(r)
-            if grr != -1 and self.heap[grr] > self.heap[m]:
-                m = grr
-
-        return m
-
-    def _has_children(self, i: int) -> bool:
-        """Returns true if the node at index i has at least one child, false
-        otherwise.
-
-        Time complexity: O(1)."""
-        assert self._is_good_index(i)
-        return self._left_index(i) != -1 or self._right_index(i) != -1
-
-    def _is_child(self, c: int, i: int) -> bool:
-        """Returns true if c is a child of i, false otherwise.
-
-        Time complexity: O(1)."""
-        assert self._is_good_index(c) and self._is_good_index(i)
-        return c == self._left_index(i) or c == self._right_index(i)
-
-    def _is_grandchild(self, g: int, i: int) -> bool:
-        """Returns true if g is a grandchild of i, false otherwise.
-
-        Time complexity: O(1)."""
-        l = self._left_index(i)
-        if l == -1:
-            assert self._right_index(i) == -1
-            assert self._is_good_index(g)
-            return False
-        r = self._right_index(i)
-        if r == -1:
-            return self._is_child(g, l)
-        return self._is_child(g, l) or self._is_child(g, r)
-
-    def _grandparent_index(self, i: int) -> int:
-        """Returns the grandparent's index of the node at index i.
-
-        -1 is returned either if i has not a parent or the parent of i does not
-        have a parent.
-
-        Time complexity: O(1)."""
-        p = self._parent_index(i)
-        return -1 if p == -1 else self._parent_index(p)
-
     def _is_on_even_level(self, i: int) -> bool:
         """Returns true if node at index i is on a even-level, i.e., if i is on
         a level multiple of 2.
 
-        Time complexity: O(int(log(i + 1) % 2) == 0)."""
+        The level of the node at index i is floor(log2(i + 1)), i.e. the number
+        of bits of i + 1 minus 1.
+
+        Time complexity: O(1)."""
         assert self._is_good_index(i)
-        return int(math.log2(i + 1) % 2) == 0
+        return (i + 1).bit_length() % 2 == 1
 
     def _is_on_odd_level(self, i: int) -> bool:
         """Returns true when self._is_on_even_level(i) returns false, and
@@ -328,13 +335,16 @@ def is_min_max_heap(h: MinMaxHeap) -> bool:
     if not isinstance(h, MinMaxHeap):
         return False
 
+    # The deleted elements (if any) are still in h.heap, so h.size is not used.
+    n = len(h.heap)
+
     if h.heap:
 
-        if h.size == 1:
+        if n == 1:
             return True
-        if h.size == 2:
+        if n == 2:
             return max(h.heap) == h.heap[1] and min(h.heap) == h.heap[0]
-        if h.size >= 3:
+        if n >= 3:
             if h.heap[0] != min(h.heap) or (
                 h.heap[1] != max(h.heap) and h.heap[2] != max(h.heap)
             ):
@@ -350,18 +360,21 @@ def is_min_max_heap(h: MinMaxHeap) -> bool:
             if r != -1 and l == -1:
                 return False
 
+            # It suffices to compare item with its children and grandchildren,
+            # which are at indices 2 * i + 1, 2 * i + 2 and 4 * i + 3, ...,
+            # 4 * i + 6, respectively: the other descendants are then implied by
+            # transitivity.
+            descendants = [d for d in range(2 * i + 1, 2 * i + 3) if d < n]
+            descendants += [d for d in range(4 * i + 3, 4 * i + 7) if d < n]
+
             if h._is_on_even_level(i):
                 # If item is on an even (or min) level, then item should be
                 # smaller or equal than its descendants.
-                if l != -1 and item > h.heap[l]:
-                    return False
-                if r != -1 and item > h.heap[r]:
+                if any(item > h.heap[d] for d in descendants):
                     return False
             else:  # odd (or max) level
                 # If item is on an odd (or max) level, then item should be
                 # greater or equal than descendants.
-                if l != -1 and item < h.heap[l]:
-                    return False
-                if r != -1 and item < h.heap[r]:
+                if any(item < h.heap[d] for d in descendants):
                     return False
     return True
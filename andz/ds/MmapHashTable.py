@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A hash table whose slots live in a memory-mapped file, so that it can be much
+larger than the available RAM and it persists across processes.
+
+The file consists of a header of 64 bytes, followed by an array of capacity
+slots of fixed width: each slot contains the length of its key plus 1 (0, if
+the slot is empty), the key (padded to key_size bytes), the length of its value
+and the value (padded to value_size bytes). The keys and the values are bytes.
+
+Opening a table only maps the file into memory (which takes O(1) time,
+independently of its size) and the operating system loads the pages of the
+file only when they are accessed, so a lookup reads (usually) a single page.
+In read-only mode, get returns the value as a memoryview of the mapped file,
+without copying it.
+When the table is opened in read-only mode, the pages are shared by all
+processes which map the same file, i.e. they are in memory only once.
+
+The collisions are resolved with linear probing (with backward-shift deletion),
+as in LinearProbingHashTable. Since the hash codes must be the same in all
+processes (whereas the built-in hash of bytes is randomized for each process),
+the keys are hashed with (keyed) BLAKE2b, with the seed stored in the header.
+
+A table is usually built offline, with MmapHashTable.build (or by running this
+module as a script, see main), and then opened read-only by many processes. It
+can also be opened in read-write mode, in which case it can be modified (and
+resized, by rewriting the file) by a single process.
+
+# References
+
+- https://docs.python.org/3/library/mmap.html
+- https://docs.python.org/3/library/hashlib.html#blake2
+- https://en.wikipedia.org/wiki/Memory-mapped_file
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections.abc import Sized
+from hashlib import blake2b
+from secrets import randbits
+
+from andz.ds.HashTable import HashTable
+from andz.ds.linear_probing import capacity_for, grown_capacity
+
+__all__ = ["MmapHashTable", "is_mmap_hash_table"]
+
+_MAGIC = b"ANDZMHT1"
+
+# magic, capacity, size, key_size, value_size, seed and max_load_factor.
+_HEADER = struct.Struct("<8sQQIIQd")
+_HEADER_SIZE = 64
+
+
+def _slot_struct(key_size: int, value_size: int) -> struct.Struct:
+    """Returns the struct of a slot with the given key and value sizes."""
+    return struct.Struct(f"<I{key_size}sI{value_size}s")
+
+
+class MmapHashTable(HashTable):
+    """Hash table of bytes keys and bytes values stored in a memory-mapped file
+    at path, which must have been created with MmapHashTable.build.
+
+    If writable is false, the table is opened read-only, otherwise it can be
+    modified.
+
+    Public interface:
+
+    - size
+    - capacity
+    - load_factor
+    - max_load_factor
+    - key_size
+    - value_size
+    - writable
+    - build
+    - put
+    - get
+    - delete
+    - flush
+    - close
+
+    the bulk operations, the views and the operators of HashTable. A table can
+    be used as a context manager, which closes it on exit."""
+
+    def __init__(self, path: str, writable: bool = False):
+        self._path = path
+        self._writable = writable
+        # If true, the file is removed when this map is closed.
+        self._temporary = False
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            self._map(self._file)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _map(self, f) -> None:
+        """Maps the file f into memory and reads its header.
+
+        Time complexity: O(1)."""
+        access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+        self._mm = mmap.mmap(f.fileno(), 0, access=access)
+        header = self._mm[: _HEADER.size]
+        if len(header) < _HEADER.size or header[:8] != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"{self._path} is not an MmapHashTable file")
+        (
+            _,
+            self._n,
+            self._size,
+            self._key_size,
+            self._value_size,
+            self._seed,
+            self._max_load_factor,
+        ) = _HEADER.unpack(header)
+        self._slot = _slot_struct(self._key_size, self._value_size)
+        if len(self._mm) != _HEADER_SIZE + self._n * self._slot.size:
+            self._mm.close()
+            raise ValueError(f"{self._path} is truncated")
+        # The values returned by get are slices of this view, if read-only.
+        self._view = None if self._writable else memoryview(self._mm)
+
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        iterable,
+        key_size: int,
+        value_size: int,
+        expected_size: int = None,
+        max_load_factor: float = 0.7,
+        seed: int = None,
+    ) -> "MmapHashTable":
+        """Builds a table at path (replacing the file at path, if any) which
+        contains the pairs (key, value) of iterable, where the keys and the
+        values are bytes of at most key_size and value_size bytes, and returns
+        it, opened read-only.
+
+        The capacity of the table is chosen so that it can hold expected_size
+        pairs or, if expected_size is None, len(iterable) pairs (iterable is
+        first converted to a list, if it's not sized). If a key occurs more than
+        once, its last value is kept.
+
+        The table is written to a temporary file, which replaces the file at
+        path only once it's complete, so the processes which have the old table
+        open are not affected.
+
+        Time complexity: O(k) expected, where k is the number of pairs in
+        iterable (plus the time to allocate the file)."""
+        for name, x in (("key_size", key_size), ("value_size", value_size)):
+            if not isinstance(x, int):
+                raise TypeError(f"{name} must be an instance of int")
+            if x < 0:
+                raise ValueError(f"{name} must be greater or equal to 0")
+        if not isinstance(max_load_factor, (int, float)):
+            raise TypeError("max_load_factor must be a number")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in the interval (0, 1)")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        if expected_size is None:
+            if not isinstance(iterable, Sized):
+                iterable = list(iterable)
+            expected_size = len(iterable)
+        elif not isinstance(expected_size, int):
+            raise TypeError("expected_size must be an instance of int")
+        elif expected_size < 0:
+            raise ValueError("expected_size must be greater or equal to 0")
+
+        seed = (randbits(64) if seed is None else seed) & 0xFFFFFFFFFFFFFFFF
+        capacity = capacity_for(expected_size, max_load_factor)
+        tmp = f"{path}.tmp"
+        MmapHashTable._create(
+            tmp, capacity, key_size, value_size, seed, max_load_factor
+        )
+        try:
+            with cls(tmp, writable=True) as t:
+                t.put_many(iterable)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        return cls(path)
+
+    @staticmethod
+    def _create(
+        path: str,
+        capacity: int,
+        key_size: int,
+        value_size: int,
+        seed: int,
+        max_load_factor: float,
+    ) -> None:
+        """Creates the file of an empty table at path.
+
+        The slots are not written: the file is extended with zeros (which is
+        what an empty slot consists of), so, on most file systems, it's sparse.
+
+        Time complexity: O(1)."""
+        slot = _slot_struct(key_size, value_size)
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC, capacity, 0, key_size, value_size, seed, max_load_factor
+                ).ljust(_HEADER_SIZE, b"\0")
+            )
+            f.truncate(_HEADER_SIZE + capacity * slot.size)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(1)."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slots.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the size and the capacity of this map.
+
+        Time complexity: O(1)."""
+        return self._size / self._n
+
+    @property
+    def max_load_factor(self) -> float:
+        """Returns the load factor above which this map is enlarged.
+
+        Time complexity: O(1)."""
+        return self._max_load_factor
+
+    @property
+    def key_size(self) -> int:
+        """Returns the maximum number of bytes of a key.
+
+        Time complexity: O(1)."""
+        return self._key_size
+
+    @property
+    def value_size(self) -> int:
+        """Returns the maximum number of bytes of a value.
+
+        Time complexity: O(1)."""
+        return self._value_size
+
+    @property
+    def writable(self) -> bool:
+        """Returns true if this map has been opened in read-write mode.
+
+        Time complexity: O(1)."""
+        return self._writable
+
+    @classmethod
+    def from_items(
+        cls,
+        iterable,
+        expected_size: int = None,
+        path: str = None,
+        key_size: int = None,
+        value_size: int = None,
+    ) -> "MmapHashTable":
+        """Returns a new table, opened in read-write mode, which contains the
+        pairs (key, value) of iterable, built with MmapHashTable.build.
+
+        If path is None, the table is built in a temporary file, which is
+        removed when the table is closed. If key_size or value_size is None,
+        it's the length of the longest key or value of iterable (so longer
+        ones cannot be inserted later).
+
+        Time complexity: O(k) expected, where k is the number of pairs in
+        iterable."""
+        pairs = list(iterable)
+        if key_size is None:
+            key_size = max((len(key) for key, _ in pairs), default=0)
+        if value_size is None:
+            value_size = max((len(value) for _, value in pairs), default=0)
+        temporary = path is None
+        if temporary:
+            fd, path = tempfile.mkstemp(suffix=".mht")
+            os.close(fd)
+        try:
+            cls.build(path, pairs, key_size, value_size, expected_size).close()
+            t = cls(path, writable=True)
+        except BaseException:
+            if temporary and os.path.exists(path):
+                os.remove(path)
+            raise
+        t._temporary = temporary  # pylint: disable=protected-access
+        return t
+
+    def _check_key(self, key: bytes) -> bytes:
+        """Returns key as bytes, if it's a valid key, otherwise it raises
+        TypeError or ValueError."""
+        if not isinstance(key, (bytes, bytearray, memoryview)):
+            raise TypeError("key must be bytes")
+        key = bytes(key)
+        if len(key) > self._key_size:
+            raise ValueError(f"key cannot be longer than {self._key_size} bytes")
+        return key
+
+    def _check_writable(self) -> None:
+        """Raises OSError if this map is read-only."""
+        if not self._writable:
+            raise OSError("this MmapHashTable has been opened read-only")
+
+    def _hash_code(self, key: bytes, size: int) -> int:
+        """Returns a hash code (an int) between 0 and size (excluded), which
+        is the same in all processes."""
+        h = blake2b(key, digest_size=8, key=self._seed.to_bytes(8, "little"))
+        return int.from_bytes(h.digest(), "little") % size
+
+    def _offset(self, i: int) -> int:
+        """Returns the offset in the file of the slot i."""
+        return _HEADER_SIZE + i * self._slot.size
+
+    def _read_key(self, i: int) -> bytes:
+        """Returns the key in slot i, or None if slot i is empty."""
+        offset = self._offset(i)
+        (length,) = struct.unpack_from("<I", self._mm, offset)
+        if length == 0:
+            return None
+        return self._mm[offset + 4 : offset + 3 + length]
+
+    def _find_slot(self, key: bytes) -> int:
+        """Returns the index of the slot which contains key, if key is in this
+        map, otherwise the index of the empty slot where key would be inserted.
+
+        Time complexity: O(1) expected."""
+        i = self._hash_code(key, self._n)
+        while True:
+            k = self._read_key(i)
+            if k is None or k == key:
+                return i
+            i = (i + 1) % self._n
+
+    def _write_size(self) -> None:
+        """Writes the size of this map into the header."""
+        struct.pack_into("<Q", self._mm, 16, self._size)
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """Inserts the pair (key: value) in this map, which must be writable.
+
+        If key or value is not bytes, a TypeError is raised. If it's too long,
+        a ValueError is raised.
+
+        Time complexity: O(1) expected amortized."""
+        self._check_writable()
+        key = self._check_key(key)
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            raise TypeError("value must be bytes")
+        value = bytes(value)
+        if len(value) > self._value_size:
+            raise ValueError(f"value cannot be longer than {self._value_size} bytes")
+
+        i = self._find_slot(key)
+        if self._read_key(i) is None:
+            new_capacity = grown_capacity(self._size, self._n, self._max_load_factor)
+            if new_capacity != self._n:
+                self._resize(new_capacity)
+                i = self._find_slot(key)
+            self._size += 1
+            self._write_size()
+        self._slot.pack_into(
+            self._mm, self._offset(i), len(key) + 1, key, len(value), value
+        )
+
+    def get(self, key: bytes) -> bytes:
+        """Returns the value associated with key, or None, if there's no such
+        key.
+
+        If this map is read-only, the value is a read-only memoryview of the
+        mapped file (so it's not copied, and it compares equal to the bytes of
+        the value), otherwise, since the slots of a writable map are moved by
+        put and delete, it's a copy of the value, as bytes.
+
+        Time complexity: O(1) expected."""
+        key = self._check_key(key)
+        i = self._find_slot(key)
+        offset = self._offset(i)
+        if struct.unpack_from("<I", self._mm, offset)[0] == 0:
+            return None
+        offset += 4 + self._key_size
+        (length,) = struct.unpack_from("<I", self._mm, offset)
+        if self._view is not None:
+            return self._view[offset + 4 : offset + 4 + length]
+        return self._mm[offset + 4 : offset + 4 + length]
+
+    def delete(self, key: bytes) -> bytes:
+        """Deletes the mapping between key and its associated value, and
+        returns the value, if this map is writable.
+
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(1) expected."""
+        self._check_writable()
+        v = self.get(key)
+        if v is None:
+            return None
+        key = self._check_key(key)
+        mm = self._mm
+        slot_size = self._slot.size
+        i = self._find_slot(key)
+
+        # Backward-shift deletion, as in LinearProbingHashTable.delete.
+        j = i
+        while True:
+            j = (j + 1) % self._n
+            k = self._read_key(j)
+            if k is None:
+                break
+            h = self._hash_code(k, self._n)
+            if (i < j and i < h <= j) or (j < i and (h <= j or i < h)):
+                continue
+            src = self._offset(j)
+            mm[self._offset(i) : self._offset(i) + slot_size] = mm[
+                src : src + slot_size
+            ]
+            i = j
+        mm[self._offset(i) : self._offset(i) + slot_size] = bytes(slot_size)
+
+        self._size -= 1
+        self._write_size()
+        return v
+
+    def _reserve(self, size: int) -> None:
+        """Enlarges this map, if it's writable and needed, so that it can hold
+        size pairs key-value without exceeding its maximum load factor.
+
+        Time complexity: O(n + m), if this map is resized, where n is the old
+        capacity and m is the new one, otherwise O(1)."""
+        if self._writable and size > self._max_load_factor * self._n:
+            self._resize(capacity_for(size, self._max_load_factor))
+
+    def _resize(self, new_capacity: int) -> None:
+        """Rewrites this map into a new file with new_capacity slots, which
+        replaces the current one.
+
+        Time complexity: O(n + m), where n is the old capacity and m is
+        new_capacity."""
+        tmp = f"{self._path}.resize"
+        MmapHashTable._create(
+            tmp,
+            new_capacity,
+            self._key_size,
+            self._value_size,
+            self._seed,
+            self._max_load_factor,
+        )
+        with MmapHashTable(tmp, writable=True) as t:
+            slot_size = self._slot.size
+            for i in range(self._n):
+                k = self._read_key(i)
+                if k is not None:
+                    j = t._find_slot(k)  # pylint: disable=protected-access
+                    src = self._offset(i)
+                    dst = t._offset(j)  # pylint: disable=protected-access
+                    t._mm[dst : dst + slot_size] = self._mm[src : src + slot_size]
+            t._size = self._size  # pylint: disable=protected-access
+            t._write_size()  # pylint: disable=protected-access
+        self._mm.close()
+        self._file.close()
+        os.replace(tmp, self._path)
+        self._file = open(self._path, "r+b")
+        self._map(self._file)
+
+    def _iter_items(self):
+        """Returns an iterator over the pairs (key, value) of this map."""
+        value_offset = 4 + self._key_size
+        for i in range(self._n):
+            offset = self._offset(i)
+            (length,) = struct.unpack_from("<I", self._mm, offset)
+            if length != 0:
+                key = self._mm[offset + 4 : offset + 3 + length]
+                (v_length,) = struct.unpack_from("<I", self._mm, offset + value_offset)
+                start = offset + value_offset + 4
+                yield key, self._mm[start : start + v_length]
+
+    def flush(self) -> None:
+        """Writes the changes of this map to the file."""
+        if self._writable:
+            self._mm.flush()
+
+    def close(self) -> None:
+        """Closes this map (and writes its changes to the file, or removes the
+        file, if this map was created by from_items in a temporary file)."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            if self._view is not None:
+                self._view.release()
+            try:
+                self._mm.close()
+            except BufferError:
+                # Some values returned by get are still referenced: the file is
+                # unmapped when they are released.
+                pass
+            if self._temporary:
+                os.remove(self._path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        if not isinstance(key, (bytes, bytearray, memoryview)):
+            return False
+        if len(key) > self._key_size:
+            return False
+        return self._read_key(self._find_slot(bytes(key))) is not None
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __str__(self):
+        return f"MmapHashTable(path: {self._path}, size: {self._size})"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_mmap_hash_table(t: MmapHashTable) -> bool:
+    """Returns true if t is a valid MmapHashTable, false otherwise."""
+    if not isinstance(t, MmapHashTable):
+        return False
+    n = 0
+    for i in range(t._n):
+        k = t._read_key(i)
+        if k is not None:
+            n += 1
+            if t._find_slot(k) != i:
+                return False
+    return n == t._size
+
+
+def main(argv=None) -> None:
+    """Builds an MmapHashTable from a file of lines of the form
+    key<TAB>value, where the keys and the values are encoded in UTF-8."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("output", help="path of the table to build")
+    parser.add_argument("input", help="path of the input file (- for stdin)")
+    parser.add_argument("--key-size", type=int, required=True)
+    parser.add_argument("--value-size", type=int, required=True)
+    parser.add_argument(
+        "--expected-size",
+        type=int,
+        default=None,
+        help="number of pairs (otherwise, the input is read into memory first)",
+    )
+    parser.add_argument("--max-load-factor", type=float, default=0.7)
+    args = parser.parse_args(argv)
+
+    def pairs(f):
+        for line in f:
+            key, value = line.rstrip("\n").split("\t", 1)
+            yield key.encode(), value.encode()
+
+    if args.input == "-":
+        t = MmapHashTable.build(
+            args.output,
+            pairs(sys.stdin),
+            args.key_size,
+            args.value_size,
+            args.expected_size,
+            args.max_load_factor,
+        )
+    else:
+        with open(args.input, encoding="utf-8") as f:
+            t = MmapHashTable.build(
+                args.output,
+                pairs(f),
+                args.key_size,
+                args.value_size,
+                args.expected_size,
+                args.max_load_factor,
+            )
+    with t:
+        print(f"Built {t.size} pairs, capacity {t.capacity}, at {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A min-heap of floating-point priorities (and, optionally, integer ids) stored in
+growable NumPy arrays, rather than in a Python list.
+
+A MinHeap of n floats stores n references to boxed float objects (8 bytes for
+the reference plus 24 bytes for each object), whereas a NumericMinHeap stores
+the priorities in a float64 array (8 bytes each) and the ids in a parallel int64
+array (8 bytes each), so each entry takes 16 bytes (plus the unused capacity of
+the arrays, which is at most as big as the used one).
+
+Moreover, the bulk operations are implemented with vectorized NumPy operations:
+
+- build (and add_many and merge, when many elements are added) uses Floyd's
+algorithm level by level: since the sub-trees rooted at the nodes of the same
+level are disjoint, all nodes of a level can be sifted down simultaneously, so
+the heap is built with O(log²(n)) vectorized operations on O(n) elements in
+total;
+
+- pop_many, when many elements are removed, finds the k smallest elements with
+a partial sort (numpy.argpartition) and rebuilds the heap with the remaining
+ones.
+
+The operations on single elements (add, remove_min, etc.) are implemented as in
+MinHeap, but on the arrays.
+
+# References
+
+- https://numpy.org/doc/stable/reference/generated/numpy.argpartition.html
+- https://en.wikipedia.org/wiki/Binary_heap#Building_a_heap
+"""
+
+import numpy as np
+
+__all__ = ["NumericMinHeap", "is_numeric_min_heap"]
+
+
+class NumericMinHeap:
+    """Min-heap of float64 priorities, each of which is associated with an int64
+    id, if with_ids is true (or ids are given).
+
+    It provides the same public interface as MinHeap, i.e.
+
+    - size
+    - is_empty
+    - clear
+    - add
+    - add_many
+    - pop_many
+    - contains
+    - delete
+    - merge
+    - find_min
+    - remove_min
+
+    but the elements are (priority, id) pairs if this heap has ids, and
+    add_many and pop_many take and return NumPy arrays.
+
+    This heap allows duplicates, but not NaN priorities."""
+
+    # If k elements are removed with pop_many from a heap of size n, and
+    # k * log2(n) * _POP_MANY_FACTOR >= n, then the vectorized algorithm is used
+    # rather than k individual removals, which are much slower per element.
+    _POP_MANY_FACTOR = 64
+
+    def __init__(self, priorities=None, ids=None, with_ids: bool = False):
+        self._with_ids = with_ids or ids is not None
+        self._n = 0
+        self._keys = np.empty(16, dtype=np.float64)
+        self._ids = np.empty(16, dtype=np.int64) if self._with_ids else None
+        if priorities is not None:
+            self.add_many(priorities, ids)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this heap.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of elements this heap can contain before its
+        arrays need to be re-allocated.
+
+        Time complexity: O(1)."""
+        return len(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes allocated for the arrays of this heap.
+
+        Time complexity: O(1)."""
+        return self._keys.nbytes + (self._ids.nbytes if self._with_ids else 0)
+
+    @property
+    def with_ids(self) -> bool:
+        """Returns true if the elements of this heap have ids, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._with_ids
+
+    def is_empty(self) -> bool:
+        """Returns true if this heap is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._n == 0
+
+    def clear(self) -> None:
+        """Removes all elements from this heap (without shrinking its arrays).
+
+        Time complexity: O(1)."""
+        self._n = 0
+
+    def add(self, x: float, x_id: int = None) -> None:
+        """Adds priority x (with id x_id, if this heap has ids) to this heap.
+
+        Time complexity: O(log(n)) amortized."""
+        x = self._check_priority(x)
+        x_id = self._check_id(x_id)
+        self._ensure_capacity(self._n + 1)
+        self._keys[self._n] = x
+        if self._with_ids:
+            self._ids[self._n] = x_id
+        self._n += 1
+        self._sift_up(self._n - 1)
+
+    def add_many(self, priorities, ids=None) -> None:
+        """Adds all priorities (with the respective ids, if this heap has ids)
+        to this heap.
+
+        If k, the number of priorities, is large with respect to n, the size of
+        this heap, i.e. if k * log(n + k) > n + k, then the priorities are
+        appended to the arrays and the heap is rebuilt (with vectorized
+        operations), otherwise each of them is sifted up individually.
+
+        Time complexity: O(min(k * log(n + k), n + k))."""
+        keys = np.asarray(priorities, dtype=np.float64).ravel()
+        if np.isnan(keys).any():
+            raise ValueError("priorities cannot be NaN")
+        if self._with_ids:
+            if ids is None:
+                raise TypeError("ids must be given, since this heap has ids")
+            ids = np.asarray(ids, dtype=np.int64).ravel()
+            if len(ids) != len(keys):
+                raise ValueError("priorities and ids must have the same length")
+        elif ids is not None:
+            raise TypeError("ids cannot be given, since this heap has no ids")
+
+        k = len(keys)
+        n = self._n
+        self._ensure_capacity(n + k)
+        self._keys[n : n + k] = keys
+        if self._with_ids:
+            self._ids[n : n + k] = ids
+        self._n = n + k
+
+        if k * (n + k).bit_length() > n + k:
+            self._build_heap()
+        else:
+            for i in range(n, n + k):
+                self._sift_up(i)
+
+    def find_min(self):
+        """Returns the smallest priority (and its id, if this heap has ids) in
+        this heap, or None if this heap is empty.
+
+        Time complexity: O(1)."""
+        if self._n == 0:
+            return None
+        return self._element(0)
+
+    def remove_min(self):
+        """Removes and returns the smallest priority (and its id, if this heap
+        has ids) in this heap, or None if this heap is empty.
+
+        Time complexity: O(log(n))."""
+        if self._n == 0:
+            return None
+        m = self._element(0)
+        self._n -= 1
+        if self._n > 0:
+            self._move(self._n, 0)
+            self._sift_down(0)
+        return m
+
+    def pop_many(self, k: int):
+        """Removes and returns (at most) the k smallest priorities in this
+        heap, in increasing order, as a NumPy array, or as a pair of NumPy
+        arrays (priorities, ids), if this heap has ids.
+
+        Time complexity: O(min(k * log(n), n + k * log(k)))."""
+        if not isinstance(k, int):
+            raise TypeError("k must be an instance of int")
+        if k < 0:
+            raise ValueError("k must be greater or equal to 0")
+
+        n = self._n
+        k = min(k, n)
+
+        if k * n.bit_length() * NumericMinHeap._POP_MANY_FACTOR >= n:
+            keys = self._keys[:n]
+            if k == n:
+                selected = np.argsort(keys)
+                rest = selected[:0]
+            else:
+                part = np.argpartition(keys, k - 1)
+                selected = part[:k]
+                selected = selected[np.argsort(keys[selected])]
+                rest = part[k:]
+            out_keys = keys[selected]
+            out_ids = self._ids[selected] if self._with_ids else None
+            # Fancy indexing returns copies, so the arrays can be overwritten.
+            self._keys[: n - k] = keys[rest]
+            if self._with_ids:
+                self._ids[: n - k] = self._ids[:n][rest]
+            self._n = n - k
+            self._build_heap()
+        else:
+            out_keys = np.empty(k, dtype=np.float64)
+            out_ids = np.empty(k, dtype=np.int64) if self._with_ids else None
+            for j in range(k):
+                out_keys[j] = self._keys[0]
+                if self._with_ids:
+                    out_ids[j] = self._ids[0]
+                self._n -= 1
+                if self._n > 0:
+                    self._move(self._n, 0)
+                    self._sift_down(0)
+
+        return (out_keys, out_ids) if self._with_ids else out_keys
+
+    def contains(self, x: float) -> bool:
+        """Returns true if priority x is in this heap, false otherwise.
+
+        Time complexity: O(n)."""
+        return self._index(self._check_priority(x)) != -1
+
+    def delete(self, x: float) -> None:
+        """Removes the first found priority x from this heap.
+
+        If x is not in this heap, LookupError is raised.
+
+        Time complexity: O(n)."""
+        i = self._index(self._check_priority(x))
+        if i == -1:
+            raise LookupError("x not found")
+        self._n -= 1
+        if i < self._n:
+            self._move(self._n, i)
+            self._sift_up(i)
+            self._sift_down(i)
+
+    def merge(self, o: "NumericMinHeap") -> None:
+        """Merges this heap with the o heap, which must be a NumericMinHeap
+        with ids if and only if this heap has ids.
+
+        Time complexity: O(n + m)."""
+        if not isinstance(o, NumericMinHeap):
+            raise TypeError("o must be an instance of NumericMinHeap")
+        if o.with_ids != self._with_ids:
+            raise ValueError("o must have ids if and only if this heap has ids")
+        # pylint: disable=protected-access
+        self.add_many(o._keys[: o._n], o._ids[: o._n] if o._with_ids else None)
+
+    def _check_priority(self, x: float) -> float:
+        """Returns x as a float, if it's a valid priority, otherwise it raises
+        an exception."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        x = float(x)
+        if x != x:
+            raise ValueError("x cannot be NaN")
+        return x
+
+    def _check_id(self, x_id: int) -> int:
+        """Returns x_id, if it's a valid id for this heap, otherwise it raises
+        an exception."""
+        if self._with_ids:
+            if x_id is None:
+                raise TypeError("x_id must be given, since this heap has ids")
+            return int(x_id)
+        if x_id is not None:
+            raise TypeError("x_id cannot be given, since this heap has no ids")
+        return x_id
+
+    def _element(self, i: int):
+        """Returns the element at index i, i.e. its priority, or its priority
+        and its id, if this heap has ids."""
+        if self._with_ids:
+            return float(self._keys[i]), int(self._ids[i])
+        return float(self._keys[i])
+
+    def _ensure_capacity(self, m: int) -> None:
+        """Re-allocates the arrays of this heap, if they cannot contain m
+        elements, at least doubling their size.
+
+        Time complexity: O(n)."""
+        if m <= len(self._keys):
+            return
+        new_capacity = max(m, 2 * len(self._keys))
+        keys = np.empty(new_capacity, dtype=np.float64)
+        keys[: self._n] = self._keys[: self._n]
+        self._keys = keys
+        if self._with_ids:
+            ids = np.empty(new_capacity, dtype=np.int64)
+            ids[: self._n] = self._ids[: self._n]
+            self._ids = ids
+
+    def _move(self, i: int, j: int) -> None:
+        """Copies the element at index i to index j.
+
+        Time complexity: O(1)."""
+        self._keys[j] = self._keys[i]
+        if self._with_ids:
+            self._ids[j] = self._ids[i]
+
+    def _index(self, x: float) -> int:
+        """Returns the index of priority x in this heap if x is in this heap,
+        otherwise it returns -1.
+
+        Time complexity: O(n)."""
+        found = np.flatnonzero(self._keys[: self._n] == x)
+        return int(found[0]) if len(found) > 0 else -1
+
+    def _sift_up(self, i: int) -> None:
+        """Moves the element at index i up, while it's smaller than its parent.
+
+        Time complexity: O(log(n))."""
+        keys = self._keys
+        ids = self._ids
+        key = keys[i]
+        key_id = ids[i] if self._with_ids else None
+        while i > 0:
+            p = (i - 1) // 2
+            if not key < keys[p]:
+                break
+            keys[i] = keys[p]
+            if self._with_ids:
+                ids[i] = ids[p]
+            i = p
+        keys[i] = key
+        if self._with_ids:
+            ids[i] = key_id
+
+    def _sift_down(self, i: int) -> None:
+        """Moves the element at index i down, while it's greater than its
+        smallest child.
+
+        Time complexity: O(log(n))."""
+        keys = self._keys
+        ids = self._ids
+        n = self._n
+        key = keys[i]
+        key_id = ids[i] if self._with_ids else None
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and keys[c + 1] < keys[c]:
+                c += 1
+            if not keys[c] < key:
+                break
+            keys[i] = keys[c]
+            if self._with_ids:
+                ids[i] = ids[c]
+            i = c
+        keys[i] = key
+        if self._with_ids:
+            ids[i] = key_id
+
+    def _build_heap(self) -> None:
+        """Builds the heap with Floyd's algorithm, sifting down all internal
+        nodes of the same level simultaneously, from the deepest level to the
+        root.
+
+        Time complexity: Θ(n), with O(log²(n)) vectorized operations."""
+        n = self._n
+        if n < 2:
+            return
+        keys = self._keys
+        ids = self._ids
+
+        last_internal = n // 2 - 1
+        for level in range((last_internal + 1).bit_length() - 1, -1, -1):
+            first = 2**level - 1
+            idx = np.arange(first, min(2 * first + 1, last_internal + 1))
+
+            while len(idx) > 0:
+                left = 2 * idx + 1
+                has_left = left < n
+                idx = idx[has_left]
+                left = left[has_left]
+                if len(idx) == 0:
+                    break
+
+                # Index of the smallest child of each node in idx.
+                right = np.minimum(left + 1, n - 1)
+                m = np.where(keys[right] < keys[left], right, left)
+
+                swap = keys[m] < keys[idx]
+                idx = idx[swap]
+                m = m[swap]
+
+                # The nodes in idx are in disjoint sub-trees, so idx and m do
+                # not overlap, and fancy indexing returns copies.
+                keys[idx], keys[m] = keys[m], keys[idx]
+                if self._with_ids:
+                    ids[idx], ids[m] = ids[m], ids[idx]
+
+                idx = m
+
+    def __str__(self):
+        if self._with_ids:
+            return str(
+                list(zip(self._keys[: self._n].tolist(), self._ids[: self._n].tolist()))
+            )
+        return str(self._keys[: self._n].tolist())
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_numeric_min_heap(h: NumericMinHeap) -> bool:
+    """Returns true if h is a valid NumericMinHeap, false otherwise."""
+    if not isinstance(h, NumericMinHeap):
+        return False
+    if h.size < 2:
+        return True
+    keys = h._keys[: h.size]
+    children = np.arange(1, h.size)
+    return bool(np.all(keys[(children - 1) // 2] <= keys[children]))
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A pairing heap is a heap-ordered multi-way tree. It's a self-adjusting data
+structure which is simple to implement and that, in practice, is usually faster
+than the other mergeable heaps (such as the Fibonacci heap), even though its
+amortized bounds are, in theory, worse.
+
+A pairing heap is either empty or a root node together with a (possibly empty)
+list of pairing heaps (the sub-trees of the root). Every node is smaller than
+or equal to its children. The children of a node are stored in a doubly-linked
+list, so that a node can be cut from its parent in constant time.
+
+The fundamental operation is melding (or merging) two trees: the root with the
+greater key becomes the leftmost child of the other root. Removing the minimum
+(i.e. the root) requires the sub-trees of the root to be combined into one
+tree: this is done by melding them in pairs from left to right (first pass),
+and then by melding the resulting trees from right to left (second pass).
+
+# References
+
+- The pairing heap: a new form of self-adjusting heap, by M. Fredman, R.
+Sedgewick, D. Sleator and R. Tarjan (1986)
+- https://en.wikipedia.org/wiki/Pairing_heap
+- https://www.cs.cmu.edu/~sleator/papers/pairing-heaps.pdf
+"""
+
+from andz.ds.MergeableHeap import MergeableHeap
+
+__all__ = ["PairingHeap", "is_pairing_heap"]
+
+
+class _PairingHeapNode:
+    """_PairingHeapNode is the node used internally by PairingHeap, which is
+    also the handle returned by PairingHeap.add."""
+
+    def __init__(self, key):
+        self.key = key
+
+        # Leftmost child of this node.
+        self.child = None
+
+        # Right sibling of this node.
+        self.next = None
+
+        # Left sibling of this node, or its parent, if this node is the leftmost
+        # child of its parent. It's None only if this node is the root.
+        self.prev = None
+
+    def __str__(self):
+        return str(self.key)
+
+    def __repr__(self):
+        return f"(key: {self.key})"
+
+
+def _meld(a: _PairingHeapNode, b: _PairingHeapNode) -> _PairingHeapNode:
+    """Melds the trees rooted at a and b, which must not have siblings, and
+    returns the root of the resulting tree.
+
+    Time complexity: O(1)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if b.key < a.key:
+        a, b = b, a
+    b.prev = a
+    b.next = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    return a
+
+
+def _combine_siblings(first: _PairingHeapNode) -> _PairingHeapNode:
+    """Melds the tree rooted at first and all its right siblings into one tree,
+    using the "two-pass" strategy, and returns the root of the resulting tree.
+
+    Time complexity: O(k), where k is the number of siblings."""
+    if first is None:
+        return None
+
+    # First pass: meld the siblings in pairs from left to right.
+    trees = []
+    a = first
+    while a is not None:
+        b = a.next
+        c = b.next if b is not None else None
+        a.prev = a.next = None
+        if b is not None:
+            b.prev = b.next = None
+        trees.append(_meld(a, b))
+        a = c
+
+    # Second pass: meld the resulting trees from right to left.
+    root = trees.pop()
+    while trees:
+        root = _meld(trees.pop(), root)
+    return root
+
+
+class PairingHeap(MergeableHeap):
+    """Min pairing heap.
+
+    This heap allows duplicates.
+
+    Time complexities (amortized):
+
+    - add: O(1)
+    - find_min: O(1)
+    - merge: O(1)
+    - decrease_key: o(log(n)) (at most O(log(n)) and conjectured to be O(1))
+    - remove_min: O(log(n))"""
+
+    def __init__(self, ls=None):
+        self._root = None
+        MergeableHeap.__init__(self, ls)
+
+    def clear(self) -> None:
+        """Removes all elements from this PairingHeap.
+
+        Time complexity: O(1)."""
+        self._root = None
+        self._n = 0
+
+    def add(self, x: object) -> _PairingHeapNode:
+        """Adds x to this PairingHeap and returns a handle to it.
+
+        Time complexity: O(1)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        node = _PairingHeapNode(x)
+        self._root = _meld(self._root, node)
+        self._n += 1
+        return node
+
+    def find_min(self) -> object:
+        """Returns the smallest element in this PairingHeap.
+
+        Time complexity: O(1)."""
+        return self._root.key if self._root is not None else None
+
+    def remove_min(self) -> object:
+        """Removes and returns the smallest element in this PairingHeap.
+
+        Time complexity: O(log(n)) amortized."""
+        if self._root is None:
+            return None
+        m = self._root
+        self._root = _combine_siblings(m.child)
+        m.child = None
+        self._n -= 1
+        return m.key
+
+    def decrease_key(self, handle: _PairingHeapNode, x: object) -> None:
+        """Replaces the element referred to by handle with x, which must be
+        smaller than or equal to it.
+
+        The sub-tree rooted at handle is cut from its parent and melded with the
+        root.
+
+        Time complexity: o(log(n)) amortized."""
+        self._check_decrease_key(handle, x)
+        handle.key = x
+        if handle is not self._root:
+            self._cut(handle)
+            self._root = _meld(self._root, handle)
+
+    def merge(self, o: "PairingHeap") -> None:
+        """Moves all elements of o to this PairingHeap, so that o is empty
+        afterwards.
+
+        Time complexity: O(1)."""
+        self._check_merge(o)
+        self._root = _meld(self._root, o._root)
+        self._n += o._n
+        o.clear()
+
+    def _remove(self, handle: _PairingHeapNode) -> None:
+        """Removes the element referred to by handle from this PairingHeap.
+
+        Time complexity: O(log(n)) amortized."""
+        if handle is self._root:
+            self.remove_min()
+        else:
+            self._cut(handle)
+            sub = _combine_siblings(handle.child)
+            handle.child = None
+            self._root = _meld(self._root, sub)
+            self._n -= 1
+
+    @staticmethod
+    def _cut(node: _PairingHeapNode) -> None:
+        """Cuts the sub-tree rooted at node, which must not be the root, from
+        its parent.
+
+        Time complexity: O(1)."""
+        if node.prev.child is node:
+            node.prev.child = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def _handles(self):
+        """Returns an iterator over all nodes of this PairingHeap.
+
+        Time complexity: O(n)."""
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.next is not None:
+                stack.append(node.next)
+            if node.child is not None:
+                stack.append(node.child)
+
+
+# pylint: disable=protected-access
+def is_pairing_heap(h: PairingHeap) -> bool:
+    """Returns true if h is a valid PairingHeap, false otherwise."""
+    if not isinstance(h, PairingHeap):
+        return False
+    if h._root is None:
+        return h.size == 0
+    if h._root.prev is not None or h._root.next is not None:
+        return False
+    n = 0
+    for node in h._handles():
+        n += 1
+        child = node.child
+        prev = node
+        while child is not None:
+            if child.key < node.key or child.prev is not prev:
+                return False
+            prev = child
+            child = child.next
+    return n == h.size
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A radix heap is a monotone priority queue for non-negative integer keys, i.e. a
+min-priority queue where a key can be added only if it's not smaller than the
+last removed minimum. This is the case, for example, in Dijkstra's algorithm
+(with integer weights) or in event simulations, where time never goes back.
+
+The elements are kept in buckets: an element with key k is in the bucket with
+index i = bit_length(k xor last), where last is the last removed minimum (or 0,
+initially). So, bucket 0 contains the elements whose key is equal to last, and
+bucket i > 0 contains the elements whose key has the same bits as last above the
+(i - 1)th bit, but not the (i - 1)th bit, which is 1 (since key > last). Hence,
+all keys in bucket i are smaller than the keys in bucket j, if 0 < i < j.
+
+When the minimum is removed and bucket 0 is empty, the first non-empty bucket i
+is found, last becomes the smallest key in it, and its elements are moved to
+lower buckets (as their indices, with respect to the new last, are smaller than
+i), so at least one element (the minimum) goes to bucket 0. find_min only
+looks for the minimum in the first non-empty bucket, without changing last, so
+keys smaller than the current minimum (but not than last) can still be added.
+The minimum it finds is cached, and add keeps it up to date, so it's looked for
+at most once after each removal.
+
+Since each element can only move to lower buckets, it's moved at most
+O(log(C)) times, where C is the maximum key, so add takes O(1) time and
+remove_min takes O(log(C)) amortized time, independently of the number of
+elements, and each of these moves costs a single xor and bit_length, rather
+than comparisons between elements.
+
+# References
+
+- Faster Algorithms for the Shortest Path Problem (1990), by R. K. Ahuja, K.
+Mehlhorn, J. Orlin and R. E. Tarjan
+- http://ssp.impulsetrain.com/radix-heap.html
+"""
+
+from math import inf
+
+__all__ = ["RadixHeap", "is_radix_heap"]
+
+# The value of self._min_key when the minimum is not known.
+_UNKNOWN = -1
+
+
+class RadixHeap:
+    """Monotone min-priority queue of non-negative integers.
+
+    If key is not None, it's a function which maps each element to its
+    (non-negative integer) key, like in MinHeap, and elements are compared
+    according to it.
+
+    It provides the following public interface (compatible with MinHeap):
+
+    - size
+    - is_empty
+    - clear
+    - add
+    - add_many
+    - find_min
+    - remove_min
+
+    and, in addition, last, the last removed minimum key.
+
+    Equal keys are removed in no particular order."""
+
+    def __init__(self, ls=None, key=None):
+        if key is not None and not callable(key):
+            raise TypeError("key must be callable")
+        self._key = key
+        self._last = 0
+        self._n = 0
+        # self._buckets[i] contains the elements whose key k is such that
+        # (k ^ self._last).bit_length() == i.
+        self._buckets = [[]]
+        # An element with the smallest key and its key. self._min_key is
+        # _UNKNOWN if the minimum has not been looked for since the last
+        # removal, and inf if this RadixHeap is empty, so that add only needs
+        # to compare the key of the new element with it.
+        self._min = None
+        self._min_key = inf
+        if ls is not None:
+            self.add_many(ls)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in this RadixHeap.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def key(self):
+        """Returns the key function of this RadixHeap, or None.
+
+        Time complexity: O(1)."""
+        return self._key
+
+    @property
+    def last(self) -> int:
+        """Returns the last removed minimum key (or 0, if no element has been
+        removed yet), i.e. the smallest key which can be added.
+
+        Time complexity: O(1)."""
+        return self._last
+
+    def is_empty(self) -> bool:
+        """Returns true if this RadixHeap is empty, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._n == 0
+
+    def clear(self) -> None:
+        """Removes all elements from this RadixHeap, but it keeps self.last, so
+        smaller keys still cannot be added.
+
+        Time complexity: O(1)."""
+        self._buckets = [[]]
+        self._n = 0
+        self._min = None
+        self._min_key = inf
+
+    def add(self, x: object) -> None:
+        """Adds x to this RadixHeap.
+
+        If x (or its key) is not an integer, TypeError is raised. If it's
+        smaller than self.last, ValueError is raised.
+
+        Time complexity: O(1)."""
+        if x is None:
+            raise ValueError("x cannot be None")
+        k = x if self._key is None else self._key(x)
+        if not isinstance(k, int):
+            raise TypeError("the key of x must be an instance of int")
+        if k < self._last:
+            raise ValueError("the key of x cannot be smaller than self.last")
+        i = (k ^ self._last).bit_length()
+        buckets = self._buckets
+        if i >= len(buckets):
+            buckets.extend([] for _ in range(i + 1 - len(buckets)))
+        buckets[i].append(x)
+        if k <= self._min_key:
+            self._min = x
+            self._min_key = k
+        self._n += 1
+
+    def add_many(self, iterable) -> None:
+        """Adds all elements of iterable to this RadixHeap.
+
+        If one element is not valid, an exception is raised (as in self.add),
+        but the elements before it have already been added.
+
+        Time complexity: O(k), where k is the number of elements in iterable."""
+        for x in iterable:
+            self.add(x)
+
+    def find_min(self) -> object:
+        """Returns an element with the smallest key in this RadixHeap, or None
+        if this RadixHeap is empty.
+
+        Unlike remove_min, it does not change self.last. The element is the
+        one which remove_min would remove.
+
+        Time complexity: O(1), if the minimum is cached, otherwise O(log(C) +
+        b), where C is the maximum key and b is the number of elements in the
+        first non-empty bucket, which happens at most once after each call to
+        remove_min."""
+        if self._n == 0:
+            return None
+        if self._min_key == _UNKNOWN:
+            buckets = self._buckets
+            if buckets[0]:
+                self._min = buckets[0][-1]
+                self._min_key = self._last
+            else:
+                i = 1
+                while not buckets[i]:
+                    i += 1
+                # The last of the elements with the smallest key is the one
+                # which remove_min would move to bucket 0 last, and remove.
+                key = self._key
+                if key is None:
+                    self._min = self._min_key = min(reversed(buckets[i]))
+                else:
+                    self._min = min(reversed(buckets[i]), key=key)
+                    self._min_key = key(self._min)
+        return self._min
+
+    def remove_min(self) -> object:
+        """Removes and returns an element with the smallest key in this
+        RadixHeap, or None if this RadixHeap is empty.
+
+        Time complexity: O(log(C)) amortized, where C is the maximum key."""
+        if self._n == 0:
+            return None
+        if not self._buckets[0]:
+            self._redistribute()
+        self._n -= 1
+        self._min = None
+        self._min_key = _UNKNOWN if self._n else inf
+        return self._buckets[0].pop()
+
+    def _redistribute(self) -> None:
+        """Sets self._last to the smallest key in the first non-empty bucket
+        (which is the smallest key in this RadixHeap) and moves the elements of
+        that bucket to lower buckets.
+
+        It assumes that this RadixHeap is not empty and that bucket 0 is empty.
+
+        Time complexity: O(b), where b is the number of elements in the first
+        non-empty bucket."""
+        buckets = self._buckets
+        i = 1
+        while not buckets[i]:
+            i += 1
+        bucket = buckets[i]
+        buckets[i] = []
+
+        key = self._key
+        if key is None:
+            last = min(bucket)
+            for x in bucket:
+                buckets[(x ^ last).bit_length()].append(x)
+        else:
+            keys = [key(x) for x in bucket]
+            last = min(keys)
+            for k, x in zip(keys, bucket):
+                buckets[(k ^ last).bit_length()].append(x)
+
+        self._last = last
+
+    def __str__(self):
+        return str([x for bucket in self._buckets for x in bucket])
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_radix_heap(h: RadixHeap) -> bool:
+    """Returns true if h is a valid RadixHeap, false otherwise."""
+    if not isinstance(h, RadixHeap):
+        return False
+    n = 0
+    for i, bucket in enumerate(h._buckets):
+        for x in bucket:
+            k = x if h._key is None else h._key(x)
+            if k < h._last or (k ^ h._last).bit_length() != i:
+                return False
+        n += len(bucket)
+    if h._min_key == inf:
+        if n != 0:
+            return False
+    elif h._min_key != _UNKNOWN:
+        if n == 0 or not any(x is h._min for bucket in h._buckets for x in bucket):
+            return False
+        k = h._min if h._key is None else h._key(h._min)
+        if k != h._min_key or any(
+            (x if h._key is None else h._key(x)) < k
+            for bucket in h._buckets
+            for x in bucket
+        ):
+            return False
+    return n == h.size
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Robin Hood hashing is a variant of linear probing, where each key is stored
+together with its probe distance, i.e. the distance between its slot and its
+home slot (the slot given by its hash code).
+
+When a key is inserted, if the current slot contains a key whose probe distance
+is smaller than the one of the key being inserted (i.e. a "richer" key, which
+is closer to its home slot), then the key being inserted takes ("steals") that
+slot and the displaced key continues the probing instead. This minimizes the
+variance of the probe distances: the expected maximum probe distance is
+O(log(log(n))) rather than O(log(n)), so the table performs well even at high
+load factors (e.g. 0.9), which saves memory.
+
+Moreover, the keys in a cluster are ordered by their home slots, so a search can
+stop as soon as the current probe distance exceeds the probe distance of the
+key in the current slot: if the key were in the table, it would have been
+stored there. This makes unsuccessful searches much shorter.
+
+Deletion uses backward shifting, as in LinearProbingHashTable: the following
+keys of the cluster are shifted back by one slot, until an empty slot or a key
+in its home slot (with probe distance 0) is reached.
+
+# References
+
+- Robin Hood hashing (1986), by P. Celis
+- https://en.wikipedia.org/wiki/Hash_table#Robin_Hood_hashing
+- https://programming.guide/robin-hood-hashing.html
+- https://codecapsule.com/2013/11/17/robin-hood-hashing-backward-shift-deletion/
+"""
+
+from collections.abc import Hashable, Sized
+
+from andz.ds.linear_probing import grown_capacity, shrunk_capacity
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable, is_hash_table
+
+__all__ = ["RobinHoodHashTable", "is_robin_hood_hash_table"]
+
+
+class RobinHoodHashTable(LinearProbingHashTable):
+    """Resizable hash table which uses Robin Hood hashing to resolve
+    collisions.
+
+    It provides the same public interface as LinearProbingHashTable (and it's
+    resized and hashes the keys in the same way), but its default
+    max_load_factor is 0.9."""
+
+    def __init__(
+        self,
+        capacity: int = 11,
+        max_load_factor: float = 0.9,
+        hash_function=None,
+        seed: int = None,
+    ):
+        LinearProbingHashTable.__init__(
+            self, capacity, max_load_factor, hash_function, seed
+        )
+        # self._dists[i] is the probe distance of the key at slot i (if any).
+        self._dists = [0] * self._n
+
+    def put(self, key: object, value: object) -> None:
+        """Inserts the pair (key: value) in this map.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected amortized."""
+        assert is_robin_hood_hash_table(self)
+
+        if key is None:
+            raise TypeError("key cannot be None.")
+        if not isinstance(key, Hashable):
+            raise TypeError("key must be an instance of a hashable type")
+
+        i = self._index(key)
+        if i != -1:
+            self._values[i] = value
+        else:
+            new_capacity = grown_capacity(self._size, self._n, self._max_load_factor)
+            if new_capacity != self._n:
+                self._resize(new_capacity)
+            self._insert(key, value)
+            self._size += 1
+
+        assert is_robin_hood_hash_table(self)
+
+    def put_many(self, iterable) -> None:
+        """Inserts the pairs (key, value) of iterable in this map, as put
+        would do, but checking the validity of this map only once.
+
+        If iterable is sized, this map is resized (at most) once, before
+        inserting the pairs (assuming that their keys are new).
+
+        Time complexity: O(k) expected amortized, where k is the number of
+        pairs in iterable."""
+        assert is_robin_hood_hash_table(self)
+
+        if isinstance(iterable, Sized):
+            self._reserve(self._size + len(iterable))
+
+        for key, value in iterable:
+            if key is None:
+                raise TypeError("key cannot be None.")
+            if not isinstance(key, Hashable):
+                raise TypeError("key must be an instance of a hashable type")
+            i = self._index(key)
+            if i != -1:
+                self._values[i] = value
+            else:
+                new_capacity = grown_capacity(
+                    self._size, self._n, self._max_load_factor
+                )
+                if new_capacity != self._n:
+                    self._resize(new_capacity)
+                self._insert(key, value)
+                self._size += 1
+
+        assert is_robin_hood_hash_table(self)
+
+    def get(self, key: object) -> object:
+        """Returns the value associated with key.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected."""
+        assert is_robin_hood_hash_table(self)
+
+        if key is None:
+            raise TypeError("key cannot be None.")
+        if not isinstance(key, Hashable):
+            raise TypeError("key must be an instance of a hashable type")
+
+        i = self._index(key)
+        return self._values[i] if i != -1 else None
+
+    def get_many(self, keys) -> list:
+        """Returns the list of the values associated with the keys in the
+        iterable keys (None for the keys which are not in this map).
+
+        Time complexity: O(k) expected, where k is the number of keys."""
+        assert is_robin_hood_hash_table(self)
+
+        values = self._values
+        result = []
+        for key in keys:
+            if key is None:
+                raise TypeError("key cannot be None.")
+            if not isinstance(key, Hashable):
+                raise TypeError("key must be an instance of a hashable type")
+            i = self._index(key)
+            result.append(values[i] if i != -1 else None)
+        return result
+
+    def delete(self, key: object) -> object:
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
+
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(1) expected amortized."""
+        assert is_robin_hood_hash_table(self)
+
+        if key is None:
+            raise TypeError("key cannot be None.")
+        if not isinstance(key, Hashable):
+            raise TypeError("key must be an instance of a hashable type")
+
+        i = self._index(key)
+        if i == -1:
+            return None
+
+        keys = self._keys
+        values = self._values
+        dists = self._dists
+        v = values[i]
+
+        j = LinearProbingHashTable._rehash(i, self._n)
+        while keys[j] is not None and dists[j] > 0:
+            keys[i] = keys[j]
+            values[i] = values[j]
+            dists[i] = dists[j] - 1
+            i = j
+            j = LinearProbingHashTable._rehash(j, self._n)
+
+        keys[i] = values[i] = None
+        dists[i] = 0
+        self._size -= 1
+
+        new_capacity = shrunk_capacity(
+            self._size, self._n, self._max_load_factor, self._min_capacity
+        )
+        if new_capacity != self._n:
+            self._resize(new_capacity)
+
+        assert is_robin_hood_hash_table(self)
+
+        return v
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        return self._index(key) != -1
+
+    def _index(self, key: object) -> int:
+        """Returns the index of the slot which contains key, or -1, if key is
+        not in this map.
+
+        The search stops as soon as the current probe distance exceeds the
+        probe distance of the key in the current slot (or an empty slot is
+        found).
+
+        Time complexity: O(1) expected."""
+        keys = self._keys
+        dists = self._dists
+        i = self._hash_code(key, self._n)
+        d = 0
+        while keys[i] is not None and d <= dists[i]:
+            if keys[i] == key:
+                return i
+            i = LinearProbingHashTable._rehash(i, self._n)
+            d += 1
+        return -1
+
+    def _insert(self, key: object, value: object) -> None:
+        """Inserts the pair (key: value), where key is not in this map, which
+        must have at least one empty slot.
+
+        Time complexity: O(1) expected."""
+        keys = self._keys
+        values = self._values
+        dists = self._dists
+        i = self._hash_code(key, self._n)
+        d = 0
+        while keys[i] is not None:
+            # Steal the slot from the richer key, which continues the probing.
+            if dists[i] < d:
+                key, keys[i] = keys[i], key
+                value, values[i] = values[i], value
+                d, dists[i] = dists[i], d
+            i = LinearProbingHashTable._rehash(i, self._n)
+            d += 1
+        keys[i] = key
+        values[i] = value
+        dists[i] = d
+
+    def _resize(self, new_capacity: int) -> None:
+        """Moves all pairs key-value to new buffers of size new_capacity, which
+        must be greater than the size of this map.
+
+        Time complexity: O(n + m), where n is the old capacity and m is
+        new_capacity."""
+        keys = self._keys
+        values = self._values
+        self._n = new_capacity
+        self._keys = [None] * new_capacity
+        self._values = [None] * new_capacity
+        self._dists = [0] * new_capacity
+        for k, v in zip(keys, values):
+            if k is not None:
+                self._insert(k, v)
+
+
+# pylint: disable=protected-access
+def is_robin_hood_hash_table(t: RobinHoodHashTable) -> bool:
+    """Returns true if t is a valid RobinHoodHashTable, false otherwise."""
+    if not isinstance(t, RobinHoodHashTable) or not is_hash_table(t):
+        return False
+    if len(t._dists) != t._n:
+        return False
+    for i, k in enumerate(t._keys):
+        if k is None:
+            continue
+        d = (i - t._hash_code(k, t._n)) % t._n
+        if t._dists[i] != d:
+            return False
+        # The probe distance can increase by at most 1 from a slot to the next
+        # one, otherwise the key at slot i should have stolen the previous slot.
+        p = i - 1
+        if d > 0 and (t._keys[p] is None or t._dists[p] < d - 1):
+            return False
+    return True
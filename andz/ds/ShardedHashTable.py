@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A sharded hash table is a hash table which can be safely shared by multiple
+threads, where the keys are partitioned across N independent hash tables (the
+shards), each of which is protected by its own lock.
+
+The shard of a key is given by the highest bits of its (seeded and mixed) hash
+code, which are independent of the slot of the key in the shard. An operation
+on a key acquires only the lock of its shard, so operations on keys in
+different shards do not wait for each other (in particular, on a free-threaded
+build of Python, they run in parallel), whereas with a single lock all
+operations are serialized. Moreover, each shard is resized independently,
+when its own load factor exceeds the maximum one, so a resize copies only
+(about) 1/N of the pairs and it blocks only the operations on that shard.
+
+The bulk operations put_many and get_many group the keys by shard and acquire
+the lock of each shard only once.
+
+# References
+
+- https://docs.oracle.com/javase/8/docs/api/java/util/concurrent/ConcurrentHashMap.html
+- https://en.wikipedia.org/wiki/Shard_(database_architecture)
+"""
+
+import threading
+from secrets import randbits
+
+from andz.ds.hashing import mix
+from andz.ds.HashTable import HashTable
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+
+__all__ = ["ShardedHashTable"]
+
+
+class ShardedHashTable(HashTable):
+    """Thread-safe hash table made of shards LinearProbingHashTable instances
+    (each with the given initial capacity and max_load_factor), where shards
+    must be a power of 2.
+
+    Public interface:
+
+    - size
+    - shards
+    - put
+    - get
+    - delete
+    - put_many
+    - get_many
+
+    and the views and the operators of HashTable. Each operation on a single key
+    is atomic. The bulk operations are atomic with respect to each shard, but
+    not to the whole table.
+
+    Note that size (and len) and the iteration over the keys (or the views)
+    return a snapshot of each shard, taken at different times, which may be
+    outdated by the time it's used, if other threads modify the table."""
+
+    def __init__(
+        self,
+        shards: int = 16,
+        capacity: int = 11,
+        max_load_factor: float = 0.7,
+        seed: int = None,
+    ):
+        if not isinstance(shards, int):
+            raise TypeError("shards must be an instance of int")
+        if shards < 1 or shards & (shards - 1) != 0:
+            raise ValueError("shards must be a power of 2")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        self._seed = randbits(64) if seed is None else seed
+        self._shift = 64 - (shards.bit_length() - 1)
+        self._tables = [
+            LinearProbingHashTable(capacity, max_load_factor) for _ in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    @property
+    def size(self) -> int:
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(N), where N is the number of shards."""
+        return sum(table.size for table in self._tables)
+
+    @property
+    def shards(self) -> int:
+        """Returns the number of shards of this map.
+
+        Time complexity: O(1)."""
+        return len(self._tables)
+
+    def _shard(self, key: object) -> int:
+        """Returns the index of the shard of key.
+
+        If key is None or it's not hashable, a TypeError is raised."""
+        if key is None:
+            raise TypeError("key cannot be None.")
+        # A 64-bit int shifted right by 64 bits is 0, so 1 shard works, too.
+        return mix(hash(key), self._seed) >> self._shift
+
+    def put(self, key: object, value: object) -> None:
+        """Inserts the pair (key: value) in this map.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected amortized, excluding the waiting
+        time."""
+        i = self._shard(key)
+        with self._locks[i]:
+            self._tables[i].put(key, value)
+
+    def get(self, key: object) -> object:
+        """Returns the value associated with key, or None, if there's no such
+        key.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected, excluding the waiting time."""
+        i = self._shard(key)
+        with self._locks[i]:
+            return self._tables[i].get(key)
+
+    def delete(self, key: object) -> object:
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
+
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(1) expected amortized, excluding the waiting
+        time."""
+        i = self._shard(key)
+        with self._locks[i]:
+            return self._tables[i].delete(key)
+
+    def _group(self, keys) -> list:
+        """Returns the list of the lists of the positions in keys of the keys
+        of each shard."""
+        groups = [[] for _ in self._tables]
+        for j, key in enumerate(keys):
+            groups[self._shard(key)].append(j)
+        return groups
+
+    def put_many(self, iterable) -> None:
+        """Inserts the pairs (key, value) of iterable in this map, acquiring
+        the lock of each shard only once.
+
+        If a key is not valid, an exception is raised before any pair is
+        inserted.
+
+        Time complexity: O(k) expected amortized, where k is the number of
+        pairs in iterable, excluding the waiting time."""
+        pairs = list(iterable)
+        groups = self._group(key for key, _ in pairs)
+        for i, group in enumerate(groups):
+            if group:
+                with self._locks[i]:
+                    self._tables[i].put_many([pairs[j] for j in group])
+
+    def get_many(self, keys) -> list:
+        """Returns the list of the values associated with the keys in the
+        iterable keys (None for the keys which are not in this map), acquiring
+        the lock of each shard only once.
+
+        Time complexity: O(k) expected, where k is the number of keys,
+        excluding the waiting time."""
+        keys = list(keys)
+        result = [None] * len(keys)
+        for i, group in enumerate(self._group(keys)):
+            if group:
+                with self._locks[i]:
+                    values = self._tables[i].get_many([keys[j] for j in group])
+                for j, value in zip(group, values):
+                    result[j] = value
+        return result
+
+    def _reserve(self, size: int) -> None:
+        """Enlarges each shard, if needed, so that it can hold its expected
+        share of size pairs key-value without being resized."""
+        # The shards are not perfectly balanced, so some slack is added.
+        share = size // len(self._tables)
+        share += 4 * int(share**0.5)
+        for table, lock in zip(self._tables, self._locks):
+            with lock:
+                table._reserve(share)  # pylint: disable=protected-access
+
+    def _iter_items(self):
+        """Returns an iterator over the pairs (key, value) of this map, which
+        takes a snapshot of each shard (while holding its lock) when the
+        iteration reaches it."""
+        for table, lock in zip(self._tables, self._locks):
+            with lock:
+                items = list(table.items())
+            yield from items
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        i = self._shard(key)
+        with self._locks[i]:
+            return key in self._tables[i]
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __str__(self):
+        return str(list(self._iter_items()))
+
+    def __repr__(self):
+        return self.__str__()
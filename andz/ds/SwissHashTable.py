@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A "Swiss table" is an open-addressing hash table where, besides the keys and the
+values, a compact array of control bytes is kept, one for each slot. The
+control byte of a slot tells whether the slot is empty, deleted (i.e. it
+contains a tombstone) or full, and, in the latter case, it also contains 7 bits
+of the hash code of the key in it (its "fingerprint").
+
+The hash code of a key is first mixed with a seed, chosen (by default) at
+random for each table (see andz.ds.hashing), so that, for example, consecutive
+or strided integers, whose hash codes are the integers themselves, do not all
+start the probing in the same group and do not share the same fingerprint. The
+mixed hash code h is then split into two parts: h1 = h >> 7, which determines
+where the probing starts, and h2 = h & 0x7F, the fingerprint. The slots are
+divided into groups of 16 consecutive slots, and the probing examines one group
+at a time: the 16 control bytes of a group are compared with h2 all at once
+(here, with a vectorized NumPy operation) and only the keys of the slots whose
+fingerprint matches are compared with the searched key. Since a fingerprint
+matches by chance with probability 1/128, most of the full key comparisons
+(which call __eq__, e.g. on long strings) are avoided, in particular on
+unsuccessful searches. A search stops at the first group which contains an
+empty slot. The groups are probed quadratically, i.e. the i-th probed group is
+at distance 0 + 1 + ... + i from the first one, which visits all groups, since
+their number is a power of 2.
+
+A deleted slot can be marked as empty only if its group contains an empty slot
+(in which case no probe sequence has gone past this group), otherwise it's
+marked as deleted, so that the searches continue after it. The table is
+rehashed (and, if necessary, enlarged) when the full and deleted slots would
+exceed 7/8 of its capacity (by default).
+
+# References
+
+- https://abseil.io/about/design/swisstables
+- https://www.youtube.com/watch?v=ncHmEUmJZf4 (CppCon 2017: Matt Kulukundis,
+"Designing a Fast, Efficient, Cache-friendly Hash Table, Step by Step")
+- https://github.com/abseil/abseil-cpp/blob/master/absl/container/internal/raw_hash_set.h
+"""
+
+from collections.abc import Hashable
+from secrets import randbits
+
+import numpy as np
+from tabulate import tabulate
+
+from andz.ds.hashing import mix
+from andz.ds.HashTable import HashTable
+
+__all__ = ["SwissHashTable", "is_swiss_hash_table"]
+
+_GROUP_SIZE = 16
+
+# Control bytes of the empty and deleted slots. The control byte of a full slot
+# is the fingerprint of its key, which is smaller than 128.
+_EMPTY = 0x80
+_DELETED = 0xFE
+
+
+class SwissHashTable(HashTable):
+    """Hash table with a NumPy array of control bytes, whose groups of 16 slots
+    are probed with vectorized fingerprint matching.
+
+    The capacity is always a power of 2 (and at least 16). The hash codes of
+    the keys are mixed with seed (by default, a random 64-bit integer).
+
+    Public interface:
+
+    - size
+    - capacity
+    - load_factor
+    - max_load_factor
+    - seed
+    - put
+    - get
+    - delete
+    - show
+    - from_items
+    - put_many
+    - get_many
+    - keys
+    - values
+    - items
+
+    You can access and put an item in the hash table by using the same
+    convenient notation that is used by the Python's standard dict class."""
+
+    def __init__(
+        self, capacity: int = 16, max_load_factor: float = 0.875, seed: int = None
+    ):
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an instance of int")
+        if capacity < 1:
+            raise ValueError("capacity must be greater or equal to 1")
+        if not isinstance(max_load_factor, (int, float)):
+            raise TypeError("max_load_factor must be a number")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in the interval (0, 1)")
+        if seed is not None and not isinstance(seed, int):
+            raise TypeError("seed must be an instance of int")
+        self._max_load_factor = max_load_factor
+        self._seed = randbits(64) if seed is None else seed
+        groups = 1
+        while groups * _GROUP_SIZE < capacity:
+            groups *= 2
+        self._allocate(groups)
+
+    def _allocate(self, groups: int) -> None:
+        """Allocates empty buffers for groups groups of slots.
+
+        Time complexity: O(groups)."""
+        self._n = groups * _GROUP_SIZE  # self._n holds the size of the buffers.
+        self._group_mask = groups - 1
+        self._ctrl = np.full(self._n, _EMPTY, dtype=np.uint8)
+        self._keys = [None] * self._n
+        self._values = [None] * self._n
+        self._size = 0  # The number of full slots.
+        self._deleted = 0  # The number of deleted slots.
+
+    @property
+    def size(self) -> int:
+        """Returns the number of pairs key-value in this map.
+
+        Time complexity: O(1)."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of allocated slots.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def load_factor(self) -> float:
+        """Returns the ratio between the size and the capacity of this map.
+
+        Time complexity: O(1)."""
+        return self._size / self._n
+
+    @property
+    def max_load_factor(self) -> float:
+        """Returns the maximum ratio between the number of full and deleted
+        slots and the capacity of this map.
+
+        Time complexity: O(1)."""
+        return self._max_load_factor
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed which is mixed with the hash codes of the keys.
+
+        Time complexity: O(1)."""
+        return self._seed
+
+    def _split_hash(self, key: object) -> tuple:
+        """Returns (h1, h2), where h2 is the 7-bit fingerprint of key and h1 the
+        rest of its hash code, mixed with the seed of this map."""
+        h = mix(hash(key), self._seed)
+        return h >> 7, h & 0x7F
+
+    @staticmethod
+    def _check_key(key: object) -> None:
+        """Raises TypeError if key is None or it's not hashable."""
+        if key is None:
+            raise TypeError("key cannot be None.")
+        if not isinstance(key, Hashable):
+            raise TypeError("key must be an instance of a hashable type")
+
+    def put(self, key: object, value: object) -> None:
+        """Inserts the pair (key: value) in this map.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected amortized."""
+        SwissHashTable._check_key(key)
+        h1, h2 = self._split_hash(key)
+
+        i = self._find(key, h1, h2)
+        if i != -1:
+            self._values[i] = value
+            return
+
+        if self._size + self._deleted + 1 > self._max_load_factor * self._n:
+            # If many slots are deleted, rehashing without growing suffices.
+            if self._size + 1 > self._max_load_factor * self._n / 2:
+                self._rehash((self._group_mask + 1) * 2)
+            else:
+                self._rehash(self._group_mask + 1)
+
+        i = self._find_free(h1)
+        if self._ctrl[i] == _DELETED:
+            self._deleted -= 1
+        self._ctrl[i] = h2
+        self._keys[i] = key
+        self._values[i] = value
+        self._size += 1
+
+    def get(self, key: object) -> object:
+        """Returns the value associated with key, or None, if there's no such
+        key.
+
+        If key is None, a TypeError is raised, because keys cannot be None.
+
+        Time complexity: O(1) expected."""
+        SwissHashTable._check_key(key)
+        i = self._find(key, *self._split_hash(key))
+        return self._values[i] if i != -1 else None
+
+    def delete(self, key: object) -> object:
+        """Deletes the mapping between key and its associated value, and
+        returns the value.
+
+        If there's no mapping, nothing is done (and None is returned).
+
+        Time complexity: O(1) expected."""
+        SwissHashTable._check_key(key)
+        i = self._find(key, *self._split_hash(key))
+        if i == -1:
+            return None
+        v = self._values[i]
+        self._keys[i] = self._values[i] = None
+        start = i - i % _GROUP_SIZE
+        if (self._ctrl[start : start + _GROUP_SIZE] == _EMPTY).any():
+            self._ctrl[i] = _EMPTY
+        else:
+            self._ctrl[i] = _DELETED
+            self._deleted += 1
+        self._size -= 1
+        return v
+
+    def _find(self, key: object, h1: int, h2: int) -> int:
+        """Returns the index of the slot which contains key, or -1, if key is
+        not in this map.
+
+        Time complexity: O(1) expected."""
+        ctrl = self._ctrl
+        keys = self._keys
+        mask = self._group_mask
+        g = h1 & mask
+        step = 0
+        while True:
+            start = g * _GROUP_SIZE
+            group = ctrl[start : start + _GROUP_SIZE]
+            for j in np.flatnonzero(group == h2):
+                if keys[start + j] == key:
+                    return start + int(j)
+            if (group == _EMPTY).any():
+                return -1
+            step += 1
+            if step > mask:
+                # All groups have been probed.
+                return -1
+            g = (g + step) & mask
+
+    def _find_free(self, h1: int) -> int:
+        """Returns the index of the first empty or deleted slot in the probe
+        sequence given by h1.
+
+        Time complexity: O(1) expected."""
+        ctrl = self._ctrl
+        mask = self._group_mask
+        g = h1 & mask
+        step = 0
+        while True:
+            start = g * _GROUP_SIZE
+            free = np.flatnonzero(ctrl[start : start + _GROUP_SIZE] >= _EMPTY)
+            if len(free) > 0:
+                return start + int(free[0])
+            step += 1
+            g = (g + step) & mask
+
+    def _rehash(self, groups: int) -> None:
+        """Moves all pairs key-value to new buffers with groups groups, which
+        removes all deleted slots.
+
+        Time complexity: O(n + m), where n is the old capacity and m is the new
+        one."""
+        keys = self._keys
+        values = self._values
+        size = self._size
+        self._allocate(groups)
+        for k, v in zip(keys, values):
+            if k is not None:
+                h1, h2 = self._split_hash(k)
+                i = self._find_free(h1)
+                self._ctrl[i] = h2
+                self._keys[i] = k
+                self._values[i] = v
+        self._size = size
+
+    def _reserve(self, size: int) -> None:
+        """Rehashes (and enlarges) this map, if needed, so that it can hold size
+        pairs key-value without exceeding its maximum load factor.
+
+        Time complexity: O(n + m), if this map is rehashed, where n is the old
+        capacity and m is the new one, otherwise O(1)."""
+        if size + self._deleted > self._max_load_factor * self._n:
+            groups = self._group_mask + 1
+            while size > self._max_load_factor * groups * _GROUP_SIZE:
+                groups *= 2
+            self._rehash(groups)
+
+    def _iter_items(self):
+        """Returns an iterator over the pairs (key, value) of this map."""
+        for k, v in zip(self._keys, self._values):
+            if k is not None:
+                yield k, v
+
+    def show(self) -> None:
+        """Prints this hash table in table-like format."""
+        c = 0
+        data = []
+        for k, v in zip(self._keys, self._values):
+            if k is not None:
+                c += 1
+                data.append([c, k, v])
+        print(tabulate(data, headers=["#", "Keys", "Values"], tablefmt="grid"))
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        if key is None:
+            return False
+        return self._find(key, *self._split_hash(key)) != -1
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __str__(self):
+        return str([(k, v) for k, v in zip(self._keys, self._values) if k is not None])
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# pylint: disable=protected-access
+def is_swiss_hash_table(t: SwissHashTable) -> bool:
+    """Returns true if t is a valid SwissHashTable, false otherwise."""
+    if not isinstance(t, SwissHashTable):
+        return False
+    if not len(t._ctrl) == len(t._keys) == len(t._values) == t._n:
+        return False
+    full = 0
+    for i, k in enumerate(t._keys):
+        c = int(t._ctrl[i])
+        if k is None:
+            if c not in (_EMPTY, _DELETED):
+                return False
+        else:
+            full += 1
+            if c != t._split_hash(k)[1] or t._find(k, *t._split_hash(k)) != i:
+                return False
+    return full == t._size and int((t._ctrl == _DELETED).sum()) == t._deleted
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+A hierarchical timing wheel is a data structure to manage a large number of
+timers (or timeouts), whose expiration times are measured in discrete ticks.
+
+A (simple) timing wheel is a circular array of w slots, where slot i contains
+the timers which expire at a tick t such that t mod w = i. Scheduling and
+cancelling a timer take O(1) time, and advancing the time by one tick takes
+O(1) time (plus the time to fire the expired timers), but only timers which
+expire within the next w ticks can be stored.
+
+A hierarchical timing wheel consists of L simple timing wheels (or levels) of w
+slots each, where w is a power of 2: the slots of level l have a "width" of w^l
+ticks, so level 0 contains the timers which expire within the next w ticks,
+level 1 those which expire within the next w^2 ticks, and so on. More
+precisely, a timer which expires at tick t, which is d ticks in the future, is
+stored at the lowest level l such that d < w^(l + 1), in the slot
+floor(t / w^l) mod w. Every w^l ticks, the timers of the current slot of level
+l are cascaded (re-scheduled) to the lower levels, so each timer is moved at
+most L - 1 times, and scheduling, cancelling and advancing by one tick still
+take O(1) (amortized) time.
+
+Timers which expire beyond the horizon of the wheel, i.e. w^L ticks in the
+future, are kept in a MinHeap (with lazy deletion, so that they can be
+cancelled in O(1) amortized time), and they are moved to the wheel when they
+get within its horizon.
+
+# References
+
+- Hashed and hierarchical timing wheels: data structures for the efficient
+implementation of a timer facility (1987), by G. Varghese and T. Lauck
+- https://lwn.net/Articles/152436/
+- https://github.com/torvalds/linux/blob/v2.6.12/kernel/timer.c
+"""
+
+from andz.ds.MinHeap import MinHeap
+
+__all__ = ["TimingWheel"]
+
+
+class _TimingWheelTimer:
+    """_TimingWheelTimer is the timer used internally by TimingWheel, which is
+    also the handle returned by TimingWheel.schedule."""
+
+    __slots__ = ("expiry", "payload", "slot")
+
+    def __init__(self, expiry: int, payload: object):
+        # The tick at which this timer expires.
+        self.expiry = expiry
+
+        self.payload = payload
+
+        # The dictionary (slot) of the wheel or the overflow heap which contains
+        # this timer, or None if this timer has fired or has been cancelled.
+        self.slot = None
+
+    def __str__(self):
+        return str(self.payload)
+
+    def __repr__(self):
+        return f"(expiry: {self.expiry}, payload: {self.payload})"
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with levels levels of wheel_size slots each,
+    where wheel_size must be a power of 2.
+
+    Public interface:
+
+    - size
+    - time
+    - horizon
+    - is_empty
+    - schedule
+    - cancel
+    - advance
+
+    The payloads of the timers which expire at the same tick are returned in no
+    particular order."""
+
+    def __init__(self, wheel_size: int = 256, levels: int = 4):
+        if not isinstance(wheel_size, int):
+            raise TypeError("wheel_size must be an instance of int")
+        if wheel_size < 2 or wheel_size & (wheel_size - 1) != 0:
+            raise ValueError("wheel_size must be a power of 2 greater than 1")
+        if not isinstance(levels, int):
+            raise TypeError("levels must be an instance of int")
+        if levels < 1:
+            raise ValueError("levels must be greater or equal to 1")
+
+        self._bits = wheel_size.bit_length() - 1
+        self._mask = wheel_size - 1
+        self._levels = levels
+        self._horizon = wheel_size**levels
+
+        # self._wheels[l][i] is the slot i of level l, i.e. a dictionary whose
+        # keys are the timers in it (and values are None), so that a timer can
+        # be removed in O(1) time.
+        self._wheels = [[{} for _ in range(wheel_size)] for _ in range(levels)]
+        self._overflow = MinHeap(key=lambda timer: timer.expiry, lazy_delete=True)
+
+        # The next tick to be processed.
+        self._next = 1
+        self._n = 0
+
+    @property
+    def size(self) -> int:
+        """Returns the number of pending timers in this TimingWheel.
+
+        Time complexity: O(1)."""
+        return self._n
+
+    @property
+    def time(self) -> int:
+        """Returns the number of ticks this TimingWheel has been advanced.
+
+        Time complexity: O(1)."""
+        return self._next - 1
+
+    @property
+    def horizon(self) -> int:
+        """Returns the number of ticks, wheel_size^levels, beyond which the
+        timers are kept in the overflow heap.
+
+        Time complexity: O(1)."""
+        return self._horizon
+
+    def is_empty(self) -> bool:
+        """Returns true if there are no pending timers, false otherwise.
+
+        Time complexity: O(1)."""
+        return self._n == 0
+
+    def schedule(self, delay: int, payload: object) -> _TimingWheelTimer:
+        """Schedules a timer which expires in delay ticks (i.e. which is fired
+        by the delay-th call to self.advance(1), from now) and returns it, so
+        that it can be cancelled.
+
+        Time complexity: O(1), if delay < self.horizon, otherwise O(log(m)),
+        where m is the number of timers in the overflow heap."""
+        if not isinstance(delay, int):
+            raise TypeError("delay must be an instance of int")
+        if delay < 1:
+            raise ValueError("delay must be greater or equal to 1")
+        if payload is None:
+            raise ValueError("payload cannot be None")
+        timer = _TimingWheelTimer(self._next - 1 + delay, payload)
+        self._insert(timer)
+        self._n += 1
+        return timer
+
+    def cancel(self, timer: _TimingWheelTimer) -> bool:
+        """Cancels timer, if it's pending, and returns true, otherwise it
+        returns false (i.e. if timer has already fired or has been cancelled).
+
+        Time complexity: O(1) amortized."""
+        if not isinstance(timer, _TimingWheelTimer):
+            raise TypeError("timer must be a timer returned by self.schedule")
+        if timer.slot is None:
+            return False
+        if timer.slot is self._overflow:
+            self._overflow.delete(timer)
+        else:
+            del timer.slot[timer]
+        timer.slot = None
+        self._n -= 1
+        return True
+
+    def advance(self, ticks: int = 1) -> list:
+        """Advances the time of this TimingWheel by ticks ticks and returns the
+        payloads of the timers which expire in the meantime, in order of
+        expiration.
+
+        Time complexity: O(ticks + e) amortized, where e is the number of
+        expired timers."""
+        if not isinstance(ticks, int):
+            raise TypeError("ticks must be an instance of int")
+        if ticks < 0:
+            raise ValueError("ticks must be greater or equal to 0")
+
+        fired = []
+        wheel = self._wheels[0]
+        mask = self._mask
+
+        for _ in range(ticks):
+            index = self._next & mask
+            if index == 0:
+                self._cascade()
+            slot = wheel[index]
+            if slot:
+                for timer in slot:
+                    timer.slot = None
+                    fired.append(timer.payload)
+                self._n -= len(slot)
+                wheel[index] = {}
+            self._next += 1
+
+        return fired
+
+    def _insert(self, timer: _TimingWheelTimer) -> None:
+        """Inserts timer into the slot of the wheel where it belongs, given
+        self._next, or into the overflow heap, if it's beyond the horizon.
+
+        Time complexity: O(1), if timer is within the horizon, otherwise
+        O(log(m))."""
+        d = timer.expiry - self._next
+        if d >= self._horizon:
+            timer.slot = self._overflow
+            self._overflow.add(timer)
+            return
+        # The level is the smallest l such that d < wheel_size^(l + 1).
+        level = max(0, (d.bit_length() - 1) // self._bits)
+        slot = self._wheels[level][(timer.expiry >> (level * self._bits)) & self._mask]
+        slot[timer] = None
+        timer.slot = slot
+
+    def _cascade(self) -> None:
+        """Moves the timers of the current slot of each level l > 0, whose
+        period of wheel_size^l ticks has just started, to the lower levels, and
+        moves the timers of the overflow heap which are now within the horizon
+        to the wheel.
+
+        Time complexity: O(c) amortized, where c is the number of moved
+        timers."""
+        # The timers are pulled from the overflow heap whenever the slots of the
+        # highest level change, i.e. every wheel_size^(levels - 1) ticks, which
+        # is before any of them can be due, since the horizon is wheel_size
+        # times longer.
+        top = (self._levels - 1) * self._bits
+        if self._next & ((1 << top) - 1) == 0:
+            overflow = self._overflow
+            while not overflow.is_empty():
+                timer = overflow.find_min()
+                if timer.expiry - self._next >= self._horizon:
+                    break
+                overflow.remove_min()
+                self._insert(timer)
+
+        for level in range(1, self._levels):
+            shift = level * self._bits
+            index = (self._next >> shift) & self._mask
+            slot = self._wheels[level][index]
+            if slot:
+                self._wheels[level][index] = {}
+                for timer in slot:
+                    self._insert(timer)
+            # The higher levels are cascaded only when the slot index of this
+            # level wraps around to 0.
+            if index != 0:
+                break
+
+    def __str__(self):
+        return f"TimingWheel(time: {self.time}, size: {self.size})"
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Helpers to turn the hash codes returned by Python's hash (or by a custom hash
+function) into well-distributed 64-bit hash codes, shared by the hash-based
+data structures of this package (e.g. LinearProbingHashTable, HashSet,
+ShardedHashTable and BloomFilter).
+
+The hash code of an integer is (almost always) the integer itself, so its low
+bits alone are a poor choice of slot (or shard, or bit). mix combines the hash
+code with a seed and scrambles the result with the finalizer of the SplitMix64
+generator, so that each bit of the hash code affects all bits of the result,
+and the keys which collide cannot be predicted without knowing the seed.
+
+# References
+
+- https://prng.di.unimi.it/splitmix64.c
+- https://en.wikipedia.org/wiki/Collision_attack#Hash_flooding
+"""
+
+__all__ = ["MASK_64", "mix"]
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def mix(h: int, seed: int) -> int:
+    """Returns the (non-negative, 64-bit) hash code obtained by mixing the hash
+    code h with seed and scrambling the result with the finalizer of
+    SplitMix64, so that each bit of h affects all bits of the result.
+
+    Time complexity: O(1)."""
+    h = (h ^ seed) & MASK_64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return h ^ (h >> 31)
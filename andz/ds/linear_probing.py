@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+The engine of the hash-based data structures which resolve collisions with
+linear probing (LinearProbingHashTable and HashSet), i.e. the functions which
+probe, delete from and resize their arrays of slots, and their resizing policy.
+
+The keys are stored in a list, keys, where an empty slot contains None, and the
+other data of each slot (e.g. the values of a map, or the cached hash codes of
+the keys) in parallel arrays. The home slot of a key (i.e. the slot given by
+its hash code) is computed by the caller, so the same functions work with
+hash codes which are computed on the fly or cached.
+
+## Probing
+
+The probe sequence of a key starts at its home slot and goes forward
+(cyclically), until the key or an empty slot is found. Since the load factor is
+always smaller than 1, there's always at least one empty slot, so the probing
+terminates.
+
+## Deletion
+
+The slot of a deleted key is not simply emptied, since that would break the
+probe sequences of the keys after it in the same cluster (i.e. the maximal
+sequence of non-empty slots), which could then not be found. Instead, the
+following keys of the cluster are shifted backwards into the empty slot, if
+that does not move them before their home slot, until an empty slot is reached
+("backward shift deletion"). So, no tombstones are needed.
+
+## Resizing policy
+
+The capacity is (roughly) doubled when an insertion would make the load factor
+exceed the maximum load factor, and halved when a deletion makes it drop below
+a quarter of the maximum load factor (but it never goes below the minimum
+capacity), so that the cost of resizing is O(1) amortized per operation.
+
+# References
+
+- https://en.wikipedia.org/wiki/Linear_probing
+- https://en.wikipedia.org/wiki/Hash_table#Load_factor
+"""
+
+__all__ = [
+    "backward_shift",
+    "capacity_for",
+    "grown_capacity",
+    "probe",
+    "probe_hashed",
+    "reinsert",
+    "shrunk_capacity",
+]
+
+
+def probe(keys: list, key: object, i: int) -> int:
+    """Returns the index of the slot of keys which contains key, if any,
+    otherwise the index of the empty slot where key would be inserted, where i
+    is the home slot of key.
+
+    Time complexity: O(1) expected."""
+    n = len(keys)
+    while keys[i] is not None and keys[i] != key:
+        i = (i + 1) % n
+    return i
+
+
+def probe_hashed(keys: list, hashes, key: object, h: int, i: int) -> int:
+    """Returns the same index as probe, where hashes contains the cached hash
+    codes of keys and h is the one of key, so that key is compared (with
+    __eq__) only with the keys with the same hash code.
+
+    Time complexity: O(1) expected."""
+    n = len(keys)
+    while True:
+        k = keys[i]
+        if k is None or (hashes[i] == h and (k is key or k == key)):
+            return i
+        i = (i + 1) % n
+
+
+def backward_shift(keys: list, others: tuple, i: int, home) -> int:
+    """Deletes the key in slot i of keys (and the items in slot i of the
+    parallel arrays in others) with backward-shift deletion, where home(j)
+    returns the home slot of the key in slot j, and returns the index of the
+    slot which is left over at the end of the cluster, which the caller must
+    then empty (in keys and in the arrays in others).
+
+    Time complexity: O(1) expected."""
+    n = len(keys)
+    # i is the empty slot (or hole) and j the slot of the key to be moved.
+    j = i
+    while True:
+        j = (j + 1) % n
+        if keys[j] is None:
+            return i
+        h = home(j)
+        # The key at j can be moved to i only if its home slot h is not
+        # cyclically in the interval (i, j].
+        if (i < j and i < h <= j) or (j < i and (h <= j or i < h)):
+            continue
+        keys[i] = keys[j]
+        for a in others:
+            a[i] = a[j]
+        i = j
+
+
+def reinsert(
+    old_keys: list, old_others: tuple, keys: list, others: tuple, home
+) -> None:
+    """Inserts the keys of old_keys (and the items of the parallel arrays in
+    old_others) into the empty arrays keys (and others), where home(j) returns
+    the home slot in keys of the key in slot j of old_keys.
+
+    The keys must be distinct, so they are not compared.
+
+    Time complexity: O(n + m), where n is the length of old_keys and m the one
+    of keys."""
+    n = len(keys)
+    pairs = tuple(zip(others, old_others))
+    for j, k in enumerate(old_keys):
+        if k is not None:
+            i = home(j)
+            while keys[i] is not None:
+                i = (i + 1) % n
+            keys[i] = k
+            for a, old in pairs:
+                a[i] = old[j]
+
+
+def grown_capacity(size: int, capacity: int, max_load_factor: float) -> int:
+    """Returns the capacity to which a table with size keys and the given
+    capacity must be enlarged before a new key is inserted, or capacity, if it
+    needs not be enlarged.
+
+    Time complexity: O(1)."""
+    if size + 1 > max_load_factor * capacity:
+        return 2 * capacity + 1
+    return capacity
+
+
+def shrunk_capacity(
+    size: int, capacity: int, max_load_factor: float, min_capacity: int
+) -> int:
+    """Returns the capacity to which a table with size keys (after a deletion)
+    and the given capacity should be shrunk, or capacity, if it should not be
+    shrunk.
+
+    Time complexity: O(1)."""
+    if size < max_load_factor / 4 * capacity and capacity > min_capacity:
+        return max(min_capacity, capacity // 2)
+    return capacity
+
+
+def capacity_for(size: int, max_load_factor: float) -> int:
+    """Returns the smallest capacity of a table which can hold size keys
+    without exceeding max_load_factor.
+
+    Time complexity: O(1)."""
+    return int(size / max_load_factor) + 1
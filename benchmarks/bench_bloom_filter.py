@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks BloomFilteredHashTable, i.e. a hash table with a Bloom filter in
+front of it, against the bare table, with a workload where a given fraction of
+the lookups are misses (80%, by default).
+
+The lookups are performed one at a time (get) and in bulk (get_many), on a
+MmapHashTable (whose probing reads the slots from a memory-mapped file), and
+on a LinearProbingHashTable, where a miss is about as cheap as the filter, so
+the filter does not pay off. The false-positive rate and the size of the
+filter are reported, too.
+"""
+
+import argparse
+import os
+import tempfile
+from random import Random
+
+from andz.ds.BloomFilteredHashTable import BloomFilteredHashTable
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from andz.ds.MmapHashTable import MmapHashTable
+from benchmarks.utils import best_time, print_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=100000, help="number of pairs")
+    parser.add_argument("--misses", type=float, default=0.8, help="fraction")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+
+    keys = [rng.getrandbits(64).to_bytes(8, "little") for _ in range(args.n)]
+    pairs = [(k, k) for k in keys]
+    queries = [
+        (
+            rng.getrandbits(64).to_bytes(8, "big")
+            if rng.random() < args.misses
+            else rng.choice(keys)
+        )
+        for _ in range(args.n)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "table")
+        MmapHashTable.build(path, pairs, 8, 8).close()
+        with MmapHashTable(path) as mmap_table:
+            tables = {
+                "LinearProbingHashTable": LinearProbingHashTable.from_items(pairs),
+                "MmapHashTable": mmap_table,
+            }
+            rows = []
+            for name, table in tables.items():
+                filtered = BloomFilteredHashTable(table)
+                f = filtered.bloom_filter
+                for label, t in (("bare", table), ("filtered", filtered)):
+                    rows.append(
+                        [
+                            name,
+                            label,
+                            best_time(lambda t=t: [t.get(q) for q in queries]),
+                            best_time(lambda t=t: t.get_many(queries)),
+                        ]
+                    )
+            key_set = set(keys)
+            misses = [q for q in queries if q not in key_set]
+            fp_rate = sum(f.might_contain_many(misses)) / len(misses)
+
+    print_results(
+        f"{args.n} pairs, {args.n} lookups ({args.misses:.0%} misses)",
+        rows,
+        ["Table", "Filter", "get (s)", "get_many (s)"],
+    )
+    print(
+        f"Filter: {f.num_bits} bits ({f.num_bits / 8 / args.n:.2f} B/key), "
+        f"{f.num_hashes} hashes, measured false-positive rate "
+        f"{fp_rate:.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
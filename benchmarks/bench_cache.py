@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks LRUCache and LFUCache against an LRU cache built from a dict and a
+Queue, where moving a key to the back of the queue (on a hit) takes O(n) time,
+since the queue has to be rebuilt without the key.
+
+m accesses (a get, followed by a put on a miss) to keys drawn from a Zipf-like
+distribution are performed on caches of different capacities, and the times
+and hit rates are reported. Then, the hit rates of LRUCache and LFUCache are
+compared on the same workload interleaved with scans of keys which are
+accessed only once.
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.LFUCache import LFUCache
+from andz.ds.LRUCache import LRUCache
+from andz.ds.Queue import Queue
+from benchmarks.utils import best_time, print_results
+
+
+class QueueLRUCache:
+    """LRU cache made of a dict and a Queue of the keys, from the least to the
+    most recently used."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._map = {}
+        self._queue = Queue()
+
+    def _move_to_back(self, key) -> None:
+        queue = Queue()
+        while not self._queue.is_empty():
+            k = self._queue.dequeue()
+            if k != key:
+                queue.enqueue(k)
+        queue.enqueue(key)
+        self._queue = queue
+
+    def get(self, key):
+        if key not in self._map:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._move_to_back(key)
+        return self._map[key]
+
+    def put(self, key, value) -> None:
+        if key in self._map:
+            self._move_to_back(key)
+        else:
+            if len(self._map) == self.capacity:
+                del self._map[self._queue.dequeue()]
+            self._queue.enqueue(key)
+        self._map[key] = value
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / (self.hits + self.misses)
+
+
+def zipf_keys(rng: Random, m: int, universe: int) -> list:
+    """Returns m keys in [0, universe), where the key i has probability
+    proportional to 1 / (i + 1)."""
+    weights = [1 / (i + 1) for i in range(universe)]
+    return rng.choices(range(universe), weights, k=m)
+
+
+def run(cache, keys: list):
+    """Accesses the keys in cache, and returns cache."""
+    for k in keys:
+        if cache.get(k) is None:
+            cache.put(k, k)
+    return cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-m", type=int, default=20000, help="number of accesses")
+    parser.add_argument("--universe", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    keys = zipf_keys(rng, args.m, args.universe)
+
+    rows = []
+    for capacity in (100, 1000, 5000):
+        for name, cls in (
+            ("dict + Queue", QueueLRUCache),
+            ("LRUCache", LRUCache),
+            ("LFUCache", LFUCache),
+        ):
+            rows.append(
+                [
+                    capacity,
+                    name,
+                    best_time(lambda cls=cls, c=capacity: run(cls(c), keys)),
+                    run(cls(capacity), keys).hit_rate,
+                ]
+            )
+    print_results(
+        f"{args.m} Zipf-distributed accesses",
+        rows,
+        ["Capacity", "Cache", "Time (s)", "Hit rate"],
+    )
+
+    # Every 1000 accesses, 2000 keys never seen before are scanned.
+    scans = []
+    fresh = args.universe
+    for i in range(0, args.m, 1000):
+        scans.extend(keys[i : i + 1000])
+        scans.extend(range(fresh, fresh + 2000))
+        fresh += 2000
+    rows = [
+        [name, run(cls(1000), scans).hit_rate]
+        for name, cls in (("LRUCache", LRUCache), ("LFUCache", LFUCache))
+    ]
+    print_results(
+        "Zipf-distributed accesses interleaved with scans, capacity 1000",
+        rows,
+        ["Cache", "Hit rate"],
+    )
+
+
+if __name__ == "__main__":
+    main()
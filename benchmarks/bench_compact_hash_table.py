@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks CompactHashTable against LinearProbingHashTable: for different
+numbers n of integer keys, the memory allocated by the table (as measured by
+tracemalloc, excluding the keys and the values), the time to put the n pairs,
+the time to get them and the time to iterate over them (with str) are
+reported.
+"""
+
+import argparse
+import tracemalloc
+from random import Random
+
+from andz.ds.CompactHashTable import CompactHashTable
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from benchmarks.utils import best_time, print_results
+
+
+def fill(cls, keys: list):
+    """Returns a new instance of cls which maps each key in keys to itself."""
+    t = cls()
+    for k in keys:
+        t.put(k, k)
+    return t
+
+
+def memory(cls, keys: list) -> int:
+    """Returns the number of bytes allocated by fill(cls, keys)."""
+    tracemalloc.start()
+    t = fill(cls, keys)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del t
+    return allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=100000, help="largest number of keys")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+
+    rows = []
+    n = 1000
+    while n <= args.n:
+        keys = [rng.getrandbits(62) for _ in range(n)]
+        for cls in (LinearProbingHashTable, CompactHashTable):
+            t = fill(cls, keys)
+            rows.append(
+                [
+                    n,
+                    cls.__name__,
+                    t.capacity,
+                    memory(cls, keys) / n,
+                    best_time(lambda cls=cls: fill(cls, keys)),
+                    best_time(lambda t=t: [t.get(k) for k in keys]),
+                    best_time(lambda t=t: str(t)),
+                ]
+            )
+        n *= 10
+
+    print_results(
+        "Integer keys",
+        rows,
+        [
+            "n",
+            "Table",
+            "Capacity",
+            "Bytes per pair",
+            "Puts (s)",
+            "Gets (s)",
+            "Iteration (s)",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks the seeded hashing of LinearProbingHashTable against the plain
+hash(key) % capacity it used before, with an adversarial set of integer keys,
+the multiples of the capacity (which all have the same home slot with the plain
+hashing), and with benign ones, consecutive and random integers.
+
+The table has a fixed capacity (so that it's never resized) and m keys are
+inserted and then looked up. Besides the times, the mean number of probes (i.e.
+examined slots) of the lookups is reported.
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from benchmarks.utils import best_time, print_results
+
+
+class PlainLinearProbingHashTable(LinearProbingHashTable):
+    """LinearProbingHashTable with the hashing it used before it was seeded."""
+
+    def _hash_code(self, key, size: int) -> int:
+        return hash(key) % size
+
+
+# pylint: disable=protected-access
+def mean_probes(t: LinearProbingHashTable, keys: list) -> float:
+    """Returns the mean number of slots examined by t.get(k), for k in keys."""
+    total = 0
+    for k in keys:
+        i = t._hash_code(k, t._n)
+        total += 1
+        while t._keys[i] != k:
+            i = (i + 1) % t._n
+            total += 1
+    return total / len(keys)
+
+
+def fill(cls, capacity: int, keys: list) -> LinearProbingHashTable:
+    """Returns a new instance of cls with the given capacity which maps each
+    key in keys to itself."""
+    t = cls(capacity, 0.95, seed=0)
+    for k in keys:
+        t.put(k, k)
+    return t
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-m", type=int, default=3000, help="number of keys")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    capacity = 2 * args.m + 1
+
+    key_sets = {
+        "Multiples of capacity": [i * capacity for i in range(args.m)],
+        "Consecutive": list(range(args.m)),
+        "Random": [rng.getrandbits(64) for _ in range(args.m)],
+    }
+
+    rows = []
+    for name, keys in key_sets.items():
+        for cls in (PlainLinearProbingHashTable, LinearProbingHashTable):
+            t = fill(cls, capacity, keys)
+            rows.append(
+                [
+                    name,
+                    "plain" if cls is PlainLinearProbingHashTable else "seeded",
+                    best_time(lambda cls=cls, keys=keys: fill(cls, capacity, keys)),
+                    best_time(lambda t=t, keys=keys: [t.get(k) for k in keys]),
+                    mean_probes(t, keys),
+                ]
+            )
+
+    print_results(
+        f"{args.m} keys, capacity {capacity}",
+        rows,
+        ["Keys", "Hashing", "Puts (s)", "Gets (s)", "Mean probes"],
+    )
+
+
+if __name__ == "__main__":
+    main()
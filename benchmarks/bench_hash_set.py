@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks HashSet against a LinearProbingHashTable with dummy values (True)
+used as a set, and against the built-in set, for deduplicating m random keys
+(drawn from a range of m / 2 integers).
+
+The memory usage reported is the one of the buffers of the slots (excluding
+the keys themselves, which are shared). Then, the union and the intersection of
+a large and a small HashSet are timed, both when the two sets have the same
+seed (so that the cached hash codes are reused) and when they don't.
+"""
+
+import argparse
+import sys
+from random import Random
+
+from andz.ds.HashSet import HashSet
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from benchmarks.utils import best_time, print_results
+
+
+# pylint: disable=protected-access
+def slots_bytes(s) -> int:
+    """Returns the number of bytes of the buffers of the slots of s."""
+    if isinstance(s, HashSet):
+        return sys.getsizeof(s._keys) + sys.getsizeof(s._hashes)
+    if isinstance(s, LinearProbingHashTable):
+        return sys.getsizeof(s._keys) + sys.getsizeof(s._values)
+    return sys.getsizeof(s)
+
+
+def dedup_hash_set(keys: list) -> HashSet:
+    s = HashSet(seed=0)
+    for k in keys:
+        s.add(k)
+    return s
+
+
+def dedup_hash_table(keys: list) -> LinearProbingHashTable:
+    t = LinearProbingHashTable(seed=0)
+    for k in keys:
+        t.put(k, True)
+    return t
+
+
+def dedup_set(keys: list) -> set:
+    s = set()
+    for k in keys:
+        s.add(k)
+    return s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-m", type=int, default=200000, help="number of keys")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    keys = [rng.randrange(args.m // 2) for _ in range(args.m)]
+    queries = [rng.randrange(args.m) for _ in range(args.m)]
+
+    rows = []
+    for name, dedup in (
+        ("HashSet", dedup_hash_set),
+        ("LinearProbingHashTable", dedup_hash_table),
+        ("set", dedup_set),
+    ):
+        s = dedup(keys)
+        rows.append(
+            [
+                name,
+                len(s),
+                slots_bytes(s),
+                slots_bytes(s) / len(s),
+                best_time(lambda dedup=dedup: dedup(keys)),
+                best_time(lambda s=s: [q in s for q in queries]),
+            ]
+        )
+    print_results(
+        f"{args.m} keys",
+        rows,
+        ["Structure", "Size", "Slots (B)", "B/key", "Adds (s)", "Lookups (s)"],
+    )
+
+    large = HashSet(seed=1)
+    large.update(range(args.m))
+    rows = []
+    for name, seed in (("same seed", 1), ("different seeds", 2)):
+        small = HashSet(seed=seed)
+        small.update(range(0, 2 * args.m, 200))
+        rows.append(
+            [
+                name,
+                best_time(lambda small=small: small.union(large)),
+                best_time(lambda small=small: small.intersection(large)),
+            ]
+        )
+    print_results(
+        f"Large set of {args.m} keys and small set of {args.m // 100} keys",
+        rows,
+        ["Seeds", "Union (s)", "Intersection (s)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
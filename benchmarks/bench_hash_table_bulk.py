@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks the bulk operations of the hash tables against the equivalent loops
+of single operations: n pairs are inserted with put (into a table with the
+default capacity) and with from_items, and then looked up with get and with
+get_many.
+
+If the assertions are enabled (i.e. without -O), each put and get of
+LinearProbingHashTable checks the validity of the whole table, which takes
+O(n) time, whereas the bulk operations check it only once, so run this
+benchmark with -O to compare only the insertion and lookup paths.
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.CompactHashTable import CompactHashTable
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from andz.ds.RobinHoodHashTable import RobinHoodHashTable
+from andz.ds.SwissHashTable import SwissHashTable
+from benchmarks.utils import best_time, print_results
+
+
+def put_loop(cls, pairs: list):
+    """Returns a new instance of cls filled with pairs, one put at a time."""
+    t = cls()
+    for k, v in pairs:
+        t.put(k, v)
+    return t
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=200000, help="number of pairs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+
+    pairs = [(f"key-{rng.getrandbits(64)}", i) for i in range(args.n)]
+    keys = [k for k, _ in pairs]
+
+    rows = []
+    for cls in (
+        LinearProbingHashTable,
+        RobinHoodHashTable,
+        CompactHashTable,
+        SwissHashTable,
+    ):
+        t = cls.from_items(pairs)
+        rows.append(
+            [
+                cls.__name__,
+                best_time(lambda cls=cls: put_loop(cls, pairs)),
+                best_time(lambda cls=cls: cls.from_items(pairs)),
+                best_time(lambda t=t: [t.get(k) for k in keys]),
+                best_time(lambda t=t: t.get_many(keys)),
+            ]
+        )
+
+    print_results(
+        f"{args.n} pairs with string keys",
+        rows,
+        ["Table", "put loop (s)", "from_items (s)", "get loop (s)", "get_many (s)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
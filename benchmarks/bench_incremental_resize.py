@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks the incremental resizing of LinearProbingHashTable against the
+default one, which moves all pairs to the new buffers at once.
+
+m keys are inserted into an empty table (so that it's resized many times),
+then they are all looked up and deleted. Besides the total times, the maximum
+latency of a single put and of a single delete (i.e. of the operations which
+trigger a resize) is reported.
+"""
+
+import argparse
+import time
+
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from benchmarks.utils import best_time, print_results
+
+
+def max_latency(operation, keys: list) -> float:
+    """Returns the maximum latency (in milliseconds) of operation(k), for k in
+    keys."""
+    worst = 0.0
+    for k in keys:
+        start = time.perf_counter()
+        operation(k)
+        worst = max(worst, time.perf_counter() - start)
+    return worst * 1000
+
+
+def fill(incremental: bool, keys: list) -> LinearProbingHashTable:
+    """Returns a new LinearProbingHashTable which maps each key in keys to
+    itself."""
+    t = LinearProbingHashTable(seed=0, incremental_resize=incremental)
+    for k in keys:
+        t.put(k, k)
+    return t
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-m", type=int, default=1000000, help="number of keys")
+    args = parser.parse_args()
+    keys = list(range(args.m))
+
+    rows = []
+    for incremental in (False, True):
+        t = LinearProbingHashTable(seed=0, incremental_resize=incremental)
+        max_put = max_latency(lambda k, t=t: t.put(k, k), keys)
+        gets = best_time(lambda t=t: [t.get(k) for k in keys])
+        max_delete = max_latency(t.delete, keys)
+        rows.append(
+            [
+                "incremental" if incremental else "all at once",
+                best_time(lambda i=incremental: fill(i, keys)),
+                gets,
+                max_put,
+                max_delete,
+            ]
+        )
+
+    print_results(
+        f"{args.m} keys",
+        rows,
+        ["Resizing", "Puts (s)", "Gets (s)", "Max put (ms)", "Max delete (ms)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
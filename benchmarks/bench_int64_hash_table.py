@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks Int64HashTable against LinearProbingHashTable as a map from int64
+ids to int64 ids: n random pairs are inserted (with put_many) and then n
+present and n absent keys are looked up (with get_many), and the memory per
+pair and the throughput (operations per second) are reported.
+
+The scalar operations of Int64HashTable are also measured on a sample of the
+keys, since each of them goes through NumPy scalars.
+"""
+
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from andz.ds.Int64HashTable import Int64HashTable
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from benchmarks.utils import best_time, print_results
+
+
+def allocated(f) -> int:
+    """Returns the number of bytes allocated (and not freed) by f and the
+    result of f."""
+    tracemalloc.start()
+    result = f()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=1000000, help="number of pairs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    n = args.n
+
+    keys = rng.integers(0, 2**62, n, dtype=np.int64)
+    values = rng.integers(0, 2**62, n, dtype=np.int64)
+    absent = keys + 2**62
+    sample = keys[: min(n, 100000)].tolist()
+
+    rows = []
+
+    def build():
+        t = Int64HashTable()
+        t.put_many(keys, values)
+        return t
+
+    nbytes, t = allocated(build)
+    put = best_time(build)
+    hits = best_time(lambda: t.get_many(keys))
+    misses = best_time(lambda: t.get_many(absent))
+    scalar = best_time(lambda: [t.get(k) for k in sample]) * n / len(sample)
+    rows.append(
+        ["Int64HashTable", nbytes / n, n / put, n / hits, n / misses, n / scalar]
+    )
+
+    pairs = list(zip(keys.tolist(), values.tolist()))
+    key_list = keys.tolist()
+    absent_list = absent.tolist()
+    nbytes, t = allocated(lambda: LinearProbingHashTable.from_items(pairs))
+    # The keys and values are created by tolist, before the measurement.
+    put = best_time(lambda: LinearProbingHashTable.from_items(pairs), 1)
+    hits = best_time(lambda: t.get_many(key_list), 1)
+    misses = best_time(lambda: t.get_many(absent_list), 1)
+    scalar = best_time(lambda: [t.get(k) for k in sample]) * n / len(sample)
+    rows.append(
+        [
+            "LinearProbingHashTable",
+            nbytes / n + 2 * 32,  # Plus the two int objects of each pair.
+            n / put,
+            n / hits,
+            n / misses,
+            n / scalar,
+        ]
+    )
+
+    print_results(
+        f"{n} int64 pairs",
+        rows,
+        [
+            "Table",
+            "Bytes per pair",
+            "Puts/s (batch)",
+            "Hits/s (batch)",
+            "Misses/s (batch)",
+            "Hits/s (scalar)",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks the lazy deletion mode of MinHeap (lazy_delete=True) against the
+default one, on a timer-queue workload: n timers are scheduled, a fraction of
+them is cancelled (deleted) and then all remaining ones expire (are removed in
+order).
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.MinHeap import MinHeap
+from benchmarks.utils import best_time, print_results
+
+
+def run(timers: list, cancelled: list, **kwargs) -> list:
+    """Schedules timers, cancels the cancelled ones and returns the expired
+    ones, in order."""
+    h = MinHeap(list(timers), **kwargs)
+    for t in cancelled:
+        h.delete(t)
+    return h.pop_many(h.size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=20000, help="number of timers")
+    parser.add_argument(
+        "-c", type=float, default=0.1, help="fraction of cancelled timers"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    timers = rng.sample(range(10 * args.n), args.n)
+    cancelled = rng.sample(timers, int(args.c * args.n))
+
+    expected = run(timers, cancelled)
+    rows = [["eager", best_time(lambda: run(timers, cancelled))]]
+    for fraction in (0.1, 0.25, 0.5):
+        assert run(timers, cancelled, lazy_delete=True) == expected
+        rows.append(
+            [
+                f"lazy, compact_fraction = {fraction}",
+                best_time(
+                    lambda f=fraction: run(
+                        timers, cancelled, lazy_delete=True, compact_fraction=f
+                    )
+                ),
+            ]
+        )
+
+    print_results(
+        f"Timer queue: {args.n} timers, {len(cancelled)} cancelled",
+        rows,
+        ["Deletion mode", "Time (s)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
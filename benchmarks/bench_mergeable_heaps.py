@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Compares MinHeap with the mergeable heaps (PairingHeap, BinomialHeap and
+FibonacciHeap) on two workloads:
+
+- merge-heavy: many small heaps (shards) are merged into one, one at a time,
+  while elements keep being added and removed;
+
+- decrease-key-heavy: the access pattern of Dijkstra's algorithm, i.e. many
+  decrease_key operations interleaved with a few remove_min operations; since
+  MinHeap does not support decrease_key, the new (smaller) element is added
+  and the stale one is skipped when it's removed ("lazy deletion").
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.BinomialHeap import BinomialHeap
+from andz.ds.FibonacciHeap import FibonacciHeap
+from andz.ds.MinHeap import MinHeap
+from andz.ds.PairingHeap import PairingHeap
+from benchmarks.utils import best_time, print_results
+
+MERGEABLE_HEAPS = [PairingHeap, BinomialHeap, FibonacciHeap]
+
+
+def merge_heavy(cls, shards: list) -> None:
+    """Merges all shards into one heap of type cls, removing the minimum after
+    each merge."""
+    h = cls()
+    for shard in shards:
+        h.merge(cls(list(shard)))
+        h.remove_min()
+
+
+def decrease_key_heavy(cls, n: int, updates: list) -> None:
+    """Adds the elements 0, ..., n - 1 to a heap of type cls, applies the
+    decrease_key updates and then removes all elements."""
+    h = cls()
+    handles = [h.add((n + i, i)) for i in range(n)]
+    for step, (i, d) in enumerate(updates):
+        handle = handles[i]
+        if handle is not None and handle.key[0] > d:
+            h.decrease_key(handle, (d, i))
+        if step % 16 == 0:
+            handles[h.remove_min()[1]] = None
+    while not h.is_empty():
+        h.remove_min()
+
+
+def lazy_decrease_key_heavy(n: int, updates: list) -> None:
+    """Same as decrease_key_heavy, but with a MinHeap and lazy deletion."""
+    h = MinHeap()
+    best = [n + i for i in range(n)]
+    for i in range(n):
+        h.add((best[i], i))
+    for step, (i, d) in enumerate(updates):
+        if best[i] is not None and best[i] > d:
+            best[i] = d
+            h.add((d, i))
+        if step % 16 == 0:
+            key, j = h.remove_min()
+            while key != best[j]:
+                key, j = h.remove_min()
+            best[j] = None
+    while not h.is_empty():
+        h.remove_min()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=20000, help="workload size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+
+    shards = [[rng.random() for _ in range(16)] for _ in range(args.n // 16)]
+    rows = [["MinHeap", best_time(lambda: merge_heavy(MinHeap, shards))]]
+    for cls in MERGEABLE_HEAPS:
+        rows.append([cls.__name__, best_time(lambda c=cls: merge_heavy(c, shards))])
+    print_results(
+        f"Merge-heavy: {len(shards)} shards of 16 elements", rows, ["Heap", "Time (s)"]
+    )
+
+    n = args.n // 4
+    updates = [(rng.randrange(n), rng.randrange(2 * n)) for _ in range(args.n)]
+    rows = [
+        [
+            "MinHeap (lazy deletion)",
+            best_time(lambda: lazy_decrease_key_heavy(n, updates)),
+        ]
+    ]
+    for cls in MERGEABLE_HEAPS:
+        rows.append(
+            [cls.__name__, best_time(lambda c=cls: decrease_key_heavy(c, n, updates))]
+        )
+    print_results(
+        f"Decrease-key-heavy: {n} elements, {len(updates)} updates",
+        rows,
+        ["Heap", "Time (s)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks MinMaxHeap as a double-ended priority queue:
+
+- sliding-window minimum and maximum: each element of a stream is added
+  together with its position, and the minimum and maximum of the last w
+  elements are found by removing the expired elements from both ends ("lazy
+  deletion"); this is compared with using a MinHeap and a MaxHeap;
+
+- bounded double-ended priority queue: the k smallest elements of a stream are
+  kept with pushpop_max, and compared with remove_max followed by add;
+
+- construction: from a list (Floyd's algorithm) compared with adding the
+  elements one at a time.
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.MaxHeap import MaxHeap
+from andz.ds.MinHeap import MinHeap
+from andz.ds.MinMaxHeap import MinMaxHeap
+from benchmarks.utils import best_time, print_results
+
+
+def sliding_window_min_max_heap(stream: list, w: int) -> list:
+    """Returns the minimum and maximum of each window of w elements of stream,
+    using a MinMaxHeap."""
+    h = MinMaxHeap()
+    result = []
+    for t, x in enumerate(stream):
+        h.add((x, t))
+        while h.find_min()[1] <= t - w:
+            h.remove_min()
+        while h.find_max()[1] <= t - w:
+            h.remove_max()
+        result.append((h.find_min()[0], h.find_max()[0]))
+    return result
+
+
+def sliding_window_two_heaps(stream: list, w: int) -> list:
+    """Same as sliding_window_min_max_heap, but using a MinHeap and a
+    MaxHeap."""
+    low = MinHeap()
+    high = MaxHeap()
+    result = []
+    for t, x in enumerate(stream):
+        low.add((x, t))
+        high.add((x, t))
+        while low.find_min()[1] <= t - w:
+            low.remove_min()
+        while high.find_max()[1] <= t - w:
+            high.remove_max()
+        result.append((low.find_min()[0], high.find_max()[0]))
+    return result
+
+
+def bounded_pushpop_max(stream: list, k: int) -> None:
+    """Keeps the k smallest elements of stream using pushpop_max."""
+    h = MinMaxHeap(stream[:k])
+    for x in stream[k:]:
+        h.pushpop_max(x)
+
+
+def bounded_remove_max_add(stream: list, k: int) -> None:
+    """Keeps the k smallest elements of stream using remove_max and add."""
+    h = MinMaxHeap(stream[:k])
+    for x in stream[k:]:
+        if x < h.find_max():
+            h.remove_max()
+            h.add(x)
+
+
+def build_one_at_a_time(stream: list) -> None:
+    """Builds a MinMaxHeap by adding the elements of stream one at a time."""
+    h = MinMaxHeap()
+    for x in stream:
+        h.add(x)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=50000, help="stream length")
+    parser.add_argument("-w", type=int, default=1000, help="window size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    stream = [rng.random() for _ in range(args.n)]
+
+    assert sliding_window_min_max_heap(stream, args.w) == sliding_window_two_heaps(
+        stream, args.w
+    )
+
+    print_results(
+        f"Sliding-window min/max: {args.n} elements, window of {args.w}",
+        [
+            [
+                "MinMaxHeap",
+                best_time(lambda: sliding_window_min_max_heap(stream, args.w)),
+            ],
+            [
+                "MinHeap + MaxHeap",
+                best_time(lambda: sliding_window_two_heaps(stream, args.w)),
+            ],
+        ],
+        ["Structure", "Time (s)"],
+    )
+
+    print_results(
+        f"Bounded DEPQ: {args.w} smallest of {args.n} elements",
+        [
+            ["pushpop_max", best_time(lambda: bounded_pushpop_max(stream, args.w))],
+            [
+                "remove_max + add",
+                best_time(lambda: bounded_remove_max_add(stream, args.w)),
+            ],
+        ],
+        ["Operation", "Time (s)"],
+    )
+
+    print_results(
+        f"Construction: {args.n} elements",
+        [
+            ["MinMaxHeap(list)", best_time(lambda: MinMaxHeap(list(stream)))],
+            ["add_many", best_time(lambda: MinMaxHeap().add_many(stream))],
+            ["add (one at a time)", best_time(lambda: build_one_at_a_time(stream))],
+        ],
+        ["Method", "Time (s)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks MmapHashTable: a table of n pairs (with keys and values of 16 bytes)
+is built, then it's opened and random keys are looked up, by one process and by
+several processes at the same time (which share the pages of the file).
+
+As a comparison, the time to load the same pairs into a LinearProbingHashTable
+from a pickle file (the alternative for a persistent table which fits in
+memory) is also reported.
+"""
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+from multiprocessing import Pool
+from random import Random
+
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from andz.ds.MmapHashTable import MmapHashTable
+from benchmarks.utils import best_time, print_results
+
+
+def lookups(args) -> float:
+    """Opens the table at path and looks up m random keys of the n keys in it,
+    and returns the number of lookups per second."""
+    path, n, m, seed = args
+    rng = Random(seed)
+    keys = [b"key-%d" % rng.randrange(n) for _ in range(m)]
+    with MmapHashTable(path) as t:
+        start = time.perf_counter()
+        for k in keys:
+            t.get(k)
+        return m / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=1000000, help="number of pairs")
+    parser.add_argument("-m", type=int, default=100000, help="lookups per process")
+    parser.add_argument("-p", type=int, default=4, help="number of processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "table.db")
+        pairs = [(b"key-%d" % i, b"value-%d" % i) for i in range(args.n)]
+
+        start = time.perf_counter()
+        MmapHashTable.build(path, pairs, 16, 16).close()
+        build = time.perf_counter() - start
+
+        def open_close():
+            MmapHashTable(path).close()
+
+        pickled = os.path.join(tmp, "table.pickle")
+        with open(pickled, "wb") as f:
+            pickle.dump(pairs, f)
+
+        def load_pickle():
+            with open(pickled, "rb") as f:
+                return LinearProbingHashTable.from_items(pickle.load(f))
+
+        with Pool(args.p) as pool:
+            rates = pool.map(
+                lookups, [(path, args.n, args.m, seed) for seed in range(args.p)]
+            )
+
+        rows = [
+            ["Build (s)", build],
+            ["File size (MB)", os.path.getsize(path) / 2**20],
+            ["Open (s)", best_time(open_close)],
+            [
+                "Load from pickle into LinearProbingHashTable (s)",
+                best_time(load_pickle, 1),
+            ],
+            ["Lookups/s, 1 process", lookups((path, args.n, args.m, 0))],
+            [f"Lookups/s, {args.p} processes (total)", sum(rates)],
+        ]
+
+    print_results(f"MmapHashTable with {args.n} pairs", rows, ["Measure", "Value"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks NumericMinHeap against MinHeap with float priorities:
+
+- construction from an existing array of priorities (and ids);
+
+- removal of the k smallest priorities with pop_many;
+
+- memory per entry: the arrays of NumericMinHeap compared with the list of
+  MinHeap and the (boxed) floats (or (priority, id) tuples) it refers to.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from andz.ds.MinHeap import MinHeap
+from andz.ds.NumericMinHeap import NumericMinHeap
+from benchmarks.utils import best_time, print_results
+
+
+def min_heap_nbytes(h: MinHeap) -> int:
+    """Returns the number of bytes used by the list of h and its elements."""
+    total = sys.getsizeof(h.heap)
+    for x in h.heap:
+        total += sys.getsizeof(x)
+        if isinstance(x, tuple):
+            total += sum(sys.getsizeof(y) for y in x)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=1000000, help="number of elements")
+    parser.add_argument("-k", type=int, default=100000, help="elements to pop")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    keys = rng.random(args.n)
+    ids = np.arange(args.n, dtype=np.int64)
+    keys_list = keys.tolist()
+    pairs = list(zip(keys_list, ids.tolist()))
+
+    assert NumericMinHeap(keys).pop_many(args.k).tolist() == MinHeap(
+        list(keys_list)
+    ).pop_many(args.k)
+
+    print_results(
+        f"Construction: {args.n} elements",
+        [
+            ["MinHeap(list)", best_time(lambda: MinHeap(list(keys_list)))],
+            ["NumericMinHeap(array)", best_time(lambda: NumericMinHeap(keys))],
+            ["MinHeap(list of pairs)", best_time(lambda: MinHeap(list(pairs)))],
+            [
+                "NumericMinHeap(array, ids)",
+                best_time(lambda: NumericMinHeap(keys, ids)),
+            ],
+        ],
+        ["Method", "Time (s)"],
+    )
+
+    print_results(
+        f"pop_many: {args.k} of {args.n} elements (including construction)",
+        [
+            [
+                "MinHeap",
+                best_time(lambda: MinHeap(list(keys_list)).pop_many(args.k)),
+            ],
+            [
+                "NumericMinHeap",
+                best_time(lambda: NumericMinHeap(keys).pop_many(args.k)),
+            ],
+        ],
+        ["Structure", "Time (s)"],
+    )
+
+    h = NumericMinHeap(keys, ids)
+    print_results(
+        f"Memory: {args.n} elements",
+        [
+            ["MinHeap (floats)", min_heap_nbytes(MinHeap(list(keys_list))) / args.n],
+            ["NumericMinHeap", NumericMinHeap(keys).nbytes / args.n],
+            ["MinHeap (pairs)", min_heap_nbytes(MinHeap(list(pairs))) / args.n],
+            ["NumericMinHeap (ids)", h.nbytes / args.n],
+        ],
+        ["Structure", "Bytes per entry"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks RadixHeap against MinHeap on monotone workloads:
+
+- event simulation: each removed event at time t schedules new events at times
+  t + d, where d is a random delay in [0, C];
+
+- heap sort of integers in [0, C] (all elements are added and then removed).
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.MinHeap import MinHeap
+from andz.ds.RadixHeap import RadixHeap
+from benchmarks.utils import best_time, print_results
+
+
+def simulate(h, delays: list, n: int) -> list:
+    """Removes n events from h, which initially contains the events of the
+    first len(delays) // 2 delays, and schedules (at most) two new events for
+    each removed event, with the next delays. It returns the removed events."""
+    half = len(delays) // 2
+    for d in delays[:half]:
+        h.add(d)
+    j = half
+    removed = []
+    while len(removed) < n and not h.is_empty():
+        t = h.remove_min()
+        removed.append(t)
+        for _ in range(2 if len(removed) % 2 == 0 else 1):
+            h.add(t + delays[j % len(delays)])
+            j += 1
+    return removed
+
+
+def heap_sort(h, ls: list) -> list:
+    """Adds all elements of ls to h and then removes them."""
+    for x in ls:
+        h.add(x)
+    return [h.remove_min() for _ in range(len(ls))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=200000, help="number of events")
+    parser.add_argument("-C", type=int, default=10**6, help="maximum delay")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    delays = [rng.randint(0, args.C) for _ in range(args.n)]
+
+    assert simulate(RadixHeap(), delays, args.n) == simulate(MinHeap(), delays, args.n)
+    assert heap_sort(RadixHeap(), delays) == sorted(delays)
+
+    print_results(
+        f"Event simulation: {args.n} events, delays in [0, {args.C}]",
+        [
+            ["RadixHeap", best_time(lambda: simulate(RadixHeap(), delays, args.n))],
+            ["MinHeap", best_time(lambda: simulate(MinHeap(), delays, args.n))],
+        ],
+        ["Structure", "Time (s)"],
+    )
+
+    print_results(
+        f"Heap sort: {args.n} integers in [0, {args.C}]",
+        [
+            ["RadixHeap", best_time(lambda: heap_sort(RadixHeap(), delays))],
+            ["MinHeap", best_time(lambda: heap_sort(MinHeap(), delays))],
+        ],
+        ["Structure", "Time (s)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks RobinHoodHashTable against LinearProbingHashTable at different load
+factors: the tables are filled (without resizing) up to the given load factor
+with string keys, then all keys are looked up (hits) and as many absent keys
+are looked up (misses).
+
+Besides the times, the mean, 99th percentile and maximum number of probes (i.e.
+examined slots) of the hits and of the misses are reported.
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from andz.ds.RobinHoodHashTable import RobinHoodHashTable
+from benchmarks.utils import best_time, print_results
+
+
+# pylint: disable=protected-access
+def probes(t: LinearProbingHashTable, key: object) -> int:
+    """Returns the number of slots examined by t.get(key)."""
+    n = t._n
+    i = t._hash_code(key, n)
+    count = 1
+    d = 0
+    while t._keys[i] is not None and t._keys[i] != key:
+        if isinstance(t, RobinHoodHashTable) and d > t._dists[i]:
+            break
+        i = (i + 1) % n
+        d += 1
+        count += 1
+    return count
+
+
+def stats(values: list) -> list:
+    """Returns the mean, the 99th percentile and the maximum of values."""
+    values = sorted(values)
+    return [
+        sum(values) / len(values),
+        values[int(0.99 * (len(values) - 1))],
+        values[-1],
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=100003, help="capacity")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+
+    rows = []
+    for load_factor in (0.5, 0.7, 0.8, 0.9):
+        m = int(load_factor * args.n)
+        keys = [f"key-{rng.getrandbits(64)}" for _ in range(m)]
+        absent = [f"absent-{rng.getrandbits(64)}" for _ in range(m)]
+        for cls in (LinearProbingHashTable, RobinHoodHashTable):
+            t = cls(args.n, 0.95)
+            for k in keys:
+                t.put(k, k)
+            assert t.capacity == args.n
+            hits = best_time(lambda t=t: [t.get(k) for k in keys])
+            misses = best_time(lambda t=t: [t.get(k) for k in absent])
+            rows.append(
+                [load_factor, cls.__name__, hits, misses]
+                + stats([probes(t, k) for k in keys])
+                + stats([probes(t, k) for k in absent])
+            )
+
+    print_results(
+        f"Lookups: capacity {args.n}",
+        rows,
+        [
+            "Load factor",
+            "Table",
+            "Hits (s)",
+            "Misses (s)",
+            "Hit mean",
+            "Hit p99",
+            "Hit max",
+            "Miss mean",
+            "Miss p99",
+            "Miss max",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
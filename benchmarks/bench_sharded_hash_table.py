@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks ShardedHashTable against a LinearProbingHashTable behind a single
+global lock, with several threads performing a mix of gets and puts (of keys
+which are partly new, so the tables keep growing), for different numbers of
+threads and read ratios.
+
+The total throughput (operations per second of all threads) is reported. With
+the GIL, only one thread runs Python code at a time, so the throughput cannot
+scale with the number of threads (it would on a free-threaded build of Python),
+and the latencies of single operations are dominated by the thread switches.
+
+So, the cost of a resize is measured separately, with a single thread: the
+maximum latency of a put (which is the longest time for which a lock is held)
+while k keys are inserted.
+"""
+
+import argparse
+import threading
+import time
+from random import Random
+
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from andz.ds.ShardedHashTable import ShardedHashTable
+from benchmarks.utils import print_results
+
+
+class GlobalLockHashTable:
+    """LinearProbingHashTable with a single lock."""
+
+    def __init__(self):
+        self._table = LinearProbingHashTable()
+        self._lock = threading.Lock()
+
+    def put(self, key, value):
+        with self._lock:
+            self._table.put(key, value)
+
+    def get(self, key):
+        with self._lock:
+            return self._table.get(key)
+
+
+def run(table, threads: int, ops: int, read_ratio: float, keys: int) -> float:
+    """Runs threads threads, each performing ops operations on table, and
+    returns the throughput."""
+    barrier = threading.Barrier(threads + 1)
+
+    def work(t: int):
+        rng = Random(t)
+        plan = [
+            (rng.random() < read_ratio, rng.randrange(2 * keys)) for _ in range(ops)
+        ]
+        barrier.wait()
+        for is_read, k in plan:
+            if is_read:
+                table.get(k)
+            else:
+                table.put(k, k)
+
+    workers = [threading.Thread(target=work, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops / elapsed
+
+
+def max_put_latency(table, keys: int) -> float:
+    """Returns the maximum latency (in milliseconds) of a put, while keys keys
+    are inserted into table."""
+    worst = 0.0
+    for k in range(keys):
+        start = time.perf_counter()
+        table.put(k, k)
+        worst = max(worst, time.perf_counter() - start)
+    return worst * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-k", type=int, default=100000, help="preloaded keys")
+    parser.add_argument("--ops", type=int, default=20000, help="ops per thread")
+    parser.add_argument("--shards", type=int, default=16)
+    args = parser.parse_args()
+
+    tables = {
+        "Global lock": GlobalLockHashTable,
+        "Sharded": lambda: ShardedHashTable(args.shards),
+    }
+
+    rows = []
+    for read_ratio in (0.5, 0.9, 0.99):
+        for threads in (1, 4, 8):
+            for name, new_table in tables.items():
+                table = new_table()
+                for k in range(0, 2 * args.k, 2):
+                    table.put(k, k)
+                throughput = run(table, threads, args.ops, read_ratio, args.k)
+                rows.append([read_ratio, threads, name, throughput])
+
+    print_results(
+        f"{args.k} preloaded keys, {args.ops} operations per thread",
+        rows,
+        ["Read ratio", "Threads", "Table", "Ops/s"],
+    )
+
+    rows = [
+        [name, max_put_latency(new_table(), args.k)]
+        for name, new_table in tables.items()
+    ]
+    print_results(
+        f"Resizes while inserting {args.k} keys",
+        rows,
+        ["Table", "Max put latency (ms)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks SwissHashTable against LinearProbingHashTable and RobinHoodHashTable
+with string keys: each table is filled with n keys, then all keys are looked up
+(hits) and n absent keys are looked up (misses).
+
+Besides the times, the number of full key comparisons (i.e. calls to __eq__)
+per lookup is reported, which is what the fingerprints of SwissHashTable save.
+The keys are wrapped so that their comparisons can be counted (which also makes
+each comparison more expensive, like the comparison of long strings).
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from andz.ds.RobinHoodHashTable import RobinHoodHashTable
+from andz.ds.SwissHashTable import SwissHashTable
+from benchmarks.utils import best_time, print_results
+
+
+class CountingKey:
+    """String key which counts the calls to __eq__ of all instances."""
+
+    comparisons = 0
+
+    __slots__ = ("s", "h")
+
+    def __init__(self, s: str):
+        self.s = s
+        self.h = hash(s)
+
+    def __hash__(self):
+        return self.h
+
+    def __eq__(self, other):
+        CountingKey.comparisons += 1
+        return isinstance(other, CountingKey) and self.s == other.s
+
+
+def comparisons(t, keys: list) -> float:
+    """Returns the mean number of key comparisons of t.get(k), for k in
+    keys."""
+    CountingKey.comparisons = 0
+    for k in keys:
+        t.get(k)
+    return CountingKey.comparisons / len(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=100000, help="number of keys")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+
+    keys = [CountingKey(f"key-{rng.getrandbits(64)}") for _ in range(args.n)]
+    absent = [CountingKey(f"absent-{rng.getrandbits(64)}") for _ in range(args.n)]
+
+    rows = []
+    for cls in (LinearProbingHashTable, RobinHoodHashTable, SwissHashTable):
+        t = cls()
+        put = best_time(lambda t=t: [t.put(k, k) for k in keys], 1)
+        hits = best_time(lambda t=t: [t.get(k) for k in keys])
+        misses = best_time(lambda t=t: [t.get(k) for k in absent])
+        rows.append(
+            [
+                cls.__name__,
+                t.load_factor,
+                put,
+                hits,
+                misses,
+                comparisons(t, keys),
+                comparisons(t, absent),
+            ]
+        )
+
+    print_results(
+        f"{args.n} string keys",
+        rows,
+        [
+            "Table",
+            "Load factor",
+            "Puts (s)",
+            "Hits (s)",
+            "Misses (s)",
+            "Hit comparisons",
+            "Miss comparisons",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
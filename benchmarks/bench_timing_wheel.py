@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks TimingWheel against a timer queue based on MinHeap (with lazy
+deletion, so that cancelling a timer does not take linear time): n timers with
+random delays in [1, D] ticks are scheduled, a fraction of them is cancelled,
+and then the time is advanced, one tick at a time, until all timers have
+expired.
+
+The benchmark is run only once, since it's meant to be run with 1M-10M timers
+(use -n 10000000 for 10M timers).
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.MinHeap import MinHeap
+from andz.ds.TimingWheel import TimingWheel
+from benchmarks.utils import best_time, print_results
+
+
+class HeapTimerQueue:
+    """Timer queue with the same interface as TimingWheel, based on MinHeap."""
+
+    def __init__(self):
+        self.heap = MinHeap(key=lambda timer: timer[0], lazy_delete=True)
+        self.time = 0
+
+    def schedule(self, delay: int, payload: object) -> tuple:
+        """Schedules a timer which expires in delay ticks."""
+        # The payload is unique, so the timer (tuple) is unique too.
+        timer = (self.time + delay, payload)
+        self.heap.add(timer)
+        return timer
+
+    def cancel(self, timer: tuple) -> None:
+        """Cancels timer."""
+        self.heap.delete(timer)
+
+    def advance(self) -> list:
+        """Advances the time by one tick and returns the expired payloads."""
+        self.time += 1
+        fired = []
+        while not self.heap.is_empty() and self.heap.find_min()[0] <= self.time:
+            fired.append(self.heap.remove_min()[1])
+        return fired
+
+
+def run(queue, delays: list, cancelled: list, horizon: int, times: dict) -> int:
+    """Schedules, cancels and fires the timers, storing the time taken by each
+    phase in times, and returns the number of fired timers."""
+    timers = []
+    times["schedule"] = best_time(
+        lambda: timers.extend(queue.schedule(d, i) for i, d in enumerate(delays)),
+        repeat=1,
+    )
+    times["cancel"] = best_time(
+        lambda: [queue.cancel(timers[i]) for i in cancelled], repeat=1
+    )
+    fired = []
+    times["advance"] = best_time(
+        lambda: [fired.extend(queue.advance()) for _ in range(horizon)], repeat=1
+    )
+    return len(fired)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=1000000, help="number of timers")
+    parser.add_argument("-D", type=int, default=100000, help="maximum delay")
+    parser.add_argument(
+        "-c", type=float, default=0.5, help="fraction of cancelled timers"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    delays = [rng.randint(1, args.D) for _ in range(args.n)]
+    cancelled = rng.sample(range(args.n), int(args.c * args.n))
+
+    rows = []
+    for name, queue in [
+        ("TimingWheel", TimingWheel()),
+        ("MinHeap", HeapTimerQueue()),
+    ]:
+        times = {}
+        fired = run(queue, delays, cancelled, args.D, times)
+        assert fired == args.n - len(cancelled)
+        rows.append(
+            [
+                name,
+                times["schedule"],
+                times["cancel"],
+                times["advance"],
+                sum(times.values()),
+            ]
+        )
+
+    print_results(
+        f"Timers: {args.n} scheduled, {len(cancelled)} cancelled, "
+        f"delays in [1, {args.D}]",
+        rows,
+        ["Structure", "Schedule (s)", "Cancel (s)", "Advance (s)", "Total (s)"],
+    )
+
+
+if __name__ == "__main__":
+    main()
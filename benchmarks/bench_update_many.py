@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Benchmarks MinHeap.update_many, which changes the priorities of k of the n
+elements of a heap, with the two strategies ("sift" and "rebuild") forced, with
+the strategy chosen automatically (factor = 1), and with a call to delete and
+add for each element (only for small k, since it takes O(k * n) time).
+
+It can be used to tune the factor argument of update_many: the automatic
+strategy should be as fast as the fastest of the two forced ones.
+"""
+
+import argparse
+from random import Random
+
+from andz.ds.MinHeap import MinHeap
+from benchmarks.utils import best_time, print_results
+
+
+def update_one_at_a_time(h: MinHeap, pairs: list) -> None:
+    """Updates the elements of h with self.delete and self.add."""
+    for old, new in pairs:
+        h.delete(old)
+        h.add(new)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("# Description")[1])
+    parser.add_argument("-n", type=int, default=100000, help="number of elements")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = Random(args.seed)
+    elements = rng.sample(range(10 * args.n), args.n)
+
+    rows = []
+    for fraction in (0.0001, 0.001, 0.01, 0.05, 0.1, 0.3):
+        k = max(1, int(fraction * args.n))
+        pairs = [(old, old + rng.randint(-args.n, args.n)) for old in elements[:k]]
+        heaps = []
+
+        def update(factor):
+            h = MinHeap(list(elements))
+            heaps.append(h)
+            return best_time(lambda: h.update_many(pairs, factor), repeat=1)
+
+        row = [
+            k,
+            update(0.0),
+            update(float("inf")),
+            update(1.0),
+            MinHeap(list(elements)).update_many(pairs),
+        ]
+        if k <= 100:
+            h = MinHeap(list(elements))
+            heaps.append(h)
+            row.append(best_time(lambda: update_one_at_a_time(h, pairs), repeat=1))
+        else:
+            row.append(None)
+        assert all(g.heap[0] == heaps[0].heap[0] for g in heaps)
+        rows.append(row)
+
+    print_results(
+        f"update_many: {args.n} elements",
+        rows,
+        [
+            "k",
+            "sift (s)",
+            "rebuild (s)",
+            "auto (s)",
+            "auto strategy",
+            "delete + add (s)",
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Helper functions shared by the benchmarks.
+"""
+
+import time
+
+from tabulate import tabulate
+
+__all__ = ["best_time", "print_results"]
+
+
+def best_time(f, repeat: int = 3) -> float:
+    """Calls f (which takes no arguments) repeat times and returns the smallest
+    elapsed time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_results(title: str, rows: list, headers: list) -> None:
+    """Prints title followed by rows in a table-like format."""
+    print()
+    print(title)
+    print(tabulate(rows, headers=headers, tablefmt="grid", floatfmt=".4f"))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Common unit tests for the subclasses of MergeableHeap (e.g. PairingHeap,
+BinomialHeap and FibonacciHeap).
+"""
+
+from random import choice, randint
+
+from andz.ds.MinHeap import MinHeap
+
+
+class MergeableHeapTests:
+    def __init__(self, heap_class, is_heap):
+        # The subclass of MergeableHeap to test and the function which checks
+        # the invariants of its instances.
+        self.heap_class = heap_class
+        self.is_heap = is_heap
+
+    def test_heap_creation_default(self):
+        h = self.heap_class()
+        self.assertTrue(h.is_empty())
+        self.assertEqual(h.size, 0)
+        self.assertTrue(self.is_heap(h))
+
+    def test_heap_creation_given_list(self):
+        a = [12, 14, 28, 6, 7, 10, 18]
+        h = self.heap_class(a)
+        self.assertFalse(h.is_empty())
+        self.assertEqual(h.size, len(a))
+        self.assertTrue(self.is_heap(h))
+
+    def test_clear_heap_of_random_size(self):
+        h = self.heap_class([randint(-100, 100) for _ in range(100)])
+        self.assertIsNone(h.clear())
+        self.assertEqual(h.size, 0)
+        self.assertTrue(h.is_empty())
+        self.assertIsNone(h.find_min())
+
+    def test_add_when_argument_is_None(self):
+        self.assertRaises(ValueError, self.heap_class().add, None)
+
+    def test_add_returns_handle(self):
+        h = self.heap_class()
+        handle = h.add(2)
+        self.assertEqual(handle.key, 2)
+        self.assertEqual(h.size, 1)
+        self.assertEqual(h.find_min(), 2)
+
+    def test_add_multiple_elements(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        h = self.heap_class()
+        for i, elem in enumerate(a):
+            h.add(elem)
+            self.assertEqual(h.size, i + 1)
+            self.assertEqual(h.find_min(), min(a[: i + 1]))
+        self.assertTrue(self.is_heap(h))
+
+    def test_add_many_when_one_element_is_None(self):
+        h = self.heap_class([3, 1])
+        self.assertRaises(ValueError, h.add_many, [5, None])
+        self.assertEqual(h.size, 2)
+
+    def test_contains_when_argument_is_None(self):
+        self.assertRaises(ValueError, self.heap_class().contains, None)
+
+    def test_contains(self):
+        h = self.heap_class([6, 8, 2, 2, 60, 7, 9])
+        self.assertTrue(h.contains(60))
+        self.assertFalse(h.contains(10))
+
+    def test_delete_when_argument_is_None(self):
+        self.assertRaises(ValueError, self.heap_class().delete, None)
+
+    def test_delete_when_elem_does_not_exist(self):
+        self.assertRaises(LookupError, self.heap_class([1, 2]).delete, 3)
+
+    def test_delete_all_when_heap_of_random_size(self):
+        size = randint(3, 100)
+        a = [randint(-100, 100) for _ in range(size)]
+        h = self.heap_class(a)
+        h.remove_min()  # Makes the heap have more than one tree.
+        a.remove(min(a))
+
+        while a:
+            x = choice(a)
+            self.assertIsNone(h.delete(x))
+            a.remove(x)
+            self.assertTrue(self.is_heap(h))
+            self.assertEqual(h.find_min(), min(a) if a else None)
+
+        self.assertTrue(h.is_empty())
+
+    def test_find_min_when_empty_heap(self):
+        self.assertIsNone(self.heap_class().find_min())
+
+    def test_remove_min_when_empty_heap(self):
+        self.assertIsNone(self.heap_class().remove_min())
+
+    def test_remove_min_until_empty(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = self.heap_class(a)
+        for m in sorted(a):
+            self.assertEqual(h.remove_min(), m)
+            self.assertTrue(self.is_heap(h))
+        self.assertTrue(h.is_empty())
+
+    def test_pop_many(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = self.heap_class(a)
+        self.assertEqual(h.pop_many(3), sorted(a)[:3])
+        self.assertEqual(h.pop_many(len(a)), sorted(a)[3:])
+        self.assertRaises(TypeError, h.pop_many, 1.5)
+        self.assertRaises(ValueError, h.pop_many, -1)
+
+    def test_pushpop(self):
+        h = self.heap_class([5, 7, 9, 11])
+        self.assertEqual(h.pushpop(1), 1)
+        self.assertEqual(h.pushpop(8), 5)
+        self.assertEqual(h.find_min(), 7)
+        self.assertEqual(h.size, 4)
+        self.assertRaises(ValueError, h.pushpop, None)
+
+    def test_replace(self):
+        h = self.heap_class()
+        self.assertIsNone(h.replace(3))
+        self.assertEqual(h.replace(8), 3)
+        self.assertEqual(h.find_min(), 8)
+        self.assertRaises(ValueError, h.replace, None)
+
+    def test_decrease_key_invalid_arguments(self):
+        h = self.heap_class()
+        handle = h.add(10)
+        self.assertRaises(TypeError, h.decrease_key, None, 3)
+        self.assertRaises(ValueError, h.decrease_key, handle, None)
+        self.assertRaises(ValueError, h.decrease_key, handle, 11)
+
+    def test_decrease_key_random(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = self.heap_class()
+        handles = [h.add(x) for x in a]
+        h.add(-1000)
+        h.remove_min()  # Makes the trees deeper.
+
+        for _ in range(len(handles)):
+            handle = choice(handles)
+            h.decrease_key(handle, handle.key - randint(0, 100))
+            self.assertTrue(self.is_heap(h))
+            self.assertEqual(h.find_min(), min(x.key for x in handles))
+
+    def test_decrease_key_to_new_minimum(self):
+        h = self.heap_class(range(50))
+        h.remove_min()
+        handle = h.add(1000)
+        h.decrease_key(handle, -1)
+        self.assertEqual(h.remove_min(), -1)
+        self.assertTrue(self.is_heap(h))
+
+    def test_merge_with_other_type(self):
+        self.assertRaises(TypeError, self.heap_class().merge, MinHeap())
+
+    def test_merge_with_itself(self):
+        h = self.heap_class([1, 2])
+        self.assertRaises(ValueError, h.merge, h)
+
+    def test_merge_empty_heap_with_non_empty_heap(self):
+        a = self.heap_class()
+        ls = [-3, 5, 7, 9, 1, 5, 2]
+        b = self.heap_class(ls)
+        self.assertIsNone(a.merge(b))
+        self.assertEqual(a.size, len(ls))
+        self.assertTrue(b.is_empty())
+        self.assertEqual(a.pop_many(len(ls)), sorted(ls))
+
+    def test_merge_non_empty_heap_with_non_empty_heap(self):
+        ls1 = [randint(-100, 100) for _ in range(randint(1, 100))]
+        ls2 = [randint(-100, 100) for _ in range(randint(1, 100))]
+        a = self.heap_class(ls1)
+        b = self.heap_class(ls2)
+        handle = b.add(1000)
+        self.assertIsNone(a.merge(b))
+        self.assertTrue(self.is_heap(a))
+        self.assertTrue(b.is_empty())
+        a.decrease_key(handle, -1000)
+        self.assertEqual(a.pop_many(a.size), sorted(ls1 + ls2 + [-1000]))
+
+    def test_str(self):
+        h = self.heap_class([3, 1, 2])
+        self.assertEqual(str(h), repr(h))
+        for x in "123":
+            self.assertIn(x, str(h))
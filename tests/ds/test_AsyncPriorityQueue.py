@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.AsyncPriorityQueue
+module.
+"""
+
+import asyncio
+import unittest
+from random import randint
+
+from andz.ds.AsyncPriorityQueue import AsyncPriorityQueue
+
+
+class TestAsyncPriorityQueue(unittest.IsolatedAsyncioTestCase):
+    def test_create_capacity_not_int(self):
+        self.assertRaises(TypeError, AsyncPriorityQueue, 3.14)
+
+    def test_create_capacity_less_than_1(self):
+        self.assertRaises(ValueError, AsyncPriorityQueue, 0)
+
+    def test_create_default(self):
+        q = AsyncPriorityQueue()
+        self.assertTrue(q.is_empty())
+        self.assertFalse(q.is_full())
+        self.assertEqual(q.size, 0)
+        self.assertIsNone(q.capacity)
+        self.assertIsNone(q.find_min())
+
+    async def test_put_when_argument_is_None(self):
+        q = AsyncPriorityQueue()
+        with self.assertRaises(ValueError):
+            await q.put(None)
+        self.assertRaises(ValueError, q.put_nowait, None)
+
+    async def test_put_and_get(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        q = AsyncPriorityQueue()
+        for x in a:
+            await q.put(x)
+        self.assertEqual(q.size, len(a))
+        self.assertEqual(q.find_min(), min(a))
+        self.assertEqual([await q.get() for _ in a], sorted(a))
+
+    def test_put_nowait_when_full(self):
+        q = AsyncPriorityQueue(1)
+        q.put_nowait(1)
+        self.assertTrue(q.is_full())
+        self.assertRaises(asyncio.QueueFull, q.put_nowait, 2)
+
+    def test_get_nowait_when_empty(self):
+        self.assertRaises(asyncio.QueueEmpty, AsyncPriorityQueue().get_nowait)
+
+    async def test_get_waits_for_put(self):
+        q = AsyncPriorityQueue()
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+        await q.put(7)
+        self.assertEqual(await getter, 7)
+
+    async def test_put_waits_for_get(self):
+        q = AsyncPriorityQueue(1)
+        await q.put(3)
+        putter = asyncio.create_task(q.put(5))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(await q.get(), 3)
+        await putter
+        self.assertEqual(q.get_nowait(), 5)
+
+    async def test_get_with_timeout(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(AsyncPriorityQueue().get(), 0.01)
+
+    async def test_cancelled_getter_does_not_lose_elements(self):
+        q = AsyncPriorityQueue()
+        first = asyncio.create_task(q.get())
+        second = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait(1)
+        first.cancel()
+        self.assertEqual(await second, 1)
+
+    async def test_get_many_invalid_k(self):
+        q = AsyncPriorityQueue()
+        with self.assertRaises(TypeError):
+            await q.get_many(1.5)
+        with self.assertRaises(ValueError):
+            await q.get_many(0)
+
+    async def test_get_many(self):
+        q = AsyncPriorityQueue(4)
+        for x in [5, 3, 9, 1]:
+            q.put_nowait(x)
+        putter = asyncio.create_task(q.put(0))
+        await asyncio.sleep(0)
+        self.assertEqual(await q.get_many(3), [1, 3, 5])
+        await putter
+        self.assertEqual(await q.get_many(3), [0, 9])
+
+    async def test_producers_and_consumers(self):
+        q = AsyncPriorityQueue(8)
+        n = 200
+        results = []
+
+        async def produce(offset):
+            for i in range(n):
+                await q.put(offset + i)
+
+        async def consume():
+            for _ in range(n):
+                results.extend(await q.get_many(1))
+
+        await asyncio.gather(
+            *[produce(i * n) for i in range(4)], *[consume() for _ in range(4)]
+        )
+
+        self.assertTrue(q.is_empty())
+        self.assertEqual(sorted(results), list(range(4 * n)))
+
+    def test_str(self):
+        q = AsyncPriorityQueue()
+        q.put_nowait(1)
+        self.assertEqual(str(q), "[1]")
+        self.assertEqual(repr(q), str(q))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.BinomialHeap module.
+"""
+
+import unittest
+
+from andz.ds.BinomialHeap import BinomialHeap, is_binomial_heap
+from tests.ds.mergeable_heap_tests import MergeableHeapTests
+
+
+def tree_size(node) -> int:
+    """Returns the number of nodes of the tree rooted at node."""
+    return 1 + sum(tree_size(child) for child in node.children)
+
+
+class TestBinomialHeap(unittest.TestCase, MergeableHeapTests):
+    def __init__(self, method_name="__init__"):
+        unittest.TestCase.__init__(self, method_name)
+        MergeableHeapTests.__init__(self, BinomialHeap, is_binomial_heap)
+
+    def assert_tree_orders(self, h):
+        # There's a binomial tree of order k (with 2^k nodes) if and only if
+        # the kth bit of the size is 1.
+        n = h.size
+        self.assertEqual(len(h._trees), n.bit_length())
+        for k, tree in enumerate(h._trees):
+            if (n >> k) & 1:
+                self.assertEqual(tree.degree, k)
+                self.assertEqual(tree_size(tree), 2**k)
+            else:
+                self.assertIsNone(tree)
+
+    def test_tree_orders_after_add(self):
+        h = BinomialHeap()
+        for x in range(70):
+            h.add(x)
+            self.assert_tree_orders(h)
+
+    def test_tree_orders_after_remove_min(self):
+        h = BinomialHeap(range(70))
+        while not h.is_empty():
+            h.remove_min()
+            self.assert_tree_orders(h)
+
+    def test_tree_orders_after_merge(self):
+        a = BinomialHeap(range(13))
+        b = BinomialHeap(range(27))
+        a.merge(b)
+        self.assertEqual(a.size, 40)
+        self.assert_tree_orders(a)
+
+    def test_tree_orders_after_delete(self):
+        h = BinomialHeap(range(50))
+        for x in range(0, 50, 3):
+            h.delete(x)
+            self.assert_tree_orders(h)
+            self.assertTrue(is_binomial_heap(h))
+
+    def test_decrease_key_moves_entry(self):
+        h = BinomialHeap()
+        handles = [h.add(x) for x in range(8)]
+        handle = handles[7]
+        self.assertIsNotNone(handle.node.parent)
+        h.decrease_key(handle, -1)
+        # The entry moves up to the root, and the handle stays valid.
+        self.assertIsNone(handle.node.parent)
+        self.assertIs(h._min, handle.node)
+        h.decrease_key(handles[6], -2)
+        self.assertEqual(h.pop_many(3), [-2, -1, 0])
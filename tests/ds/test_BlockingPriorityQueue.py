@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.BlockingPriorityQueue
+module.
+"""
+
+import threading
+import unittest
+from random import randint
+
+from andz.ds.BlockingPriorityQueue import BlockingPriorityQueue, Empty, Full
+
+
+class TestBlockingPriorityQueue(unittest.TestCase):
+    def test_create_capacity_not_int(self):
+        self.assertRaises(TypeError, BlockingPriorityQueue, 3.14)
+
+    def test_create_capacity_less_than_1(self):
+        self.assertRaises(ValueError, BlockingPriorityQueue, 0)
+
+    def test_create_default(self):
+        q = BlockingPriorityQueue()
+        self.assertTrue(q.is_empty())
+        self.assertFalse(q.is_full())
+        self.assertEqual(q.size, 0)
+        self.assertIsNone(q.capacity)
+        self.assertIsNone(q.find_min())
+
+    def test_put_when_argument_is_None(self):
+        self.assertRaises(ValueError, BlockingPriorityQueue().put, None)
+
+    def test_put_and_get(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        q = BlockingPriorityQueue()
+        for x in a:
+            q.put(x)
+        self.assertEqual(q.size, len(a))
+        self.assertEqual(q.find_min(), min(a))
+        self.assertEqual([q.get() for _ in a], sorted(a))
+
+    def test_put_when_full_and_not_blocking(self):
+        q = BlockingPriorityQueue(1)
+        q.put(1)
+        self.assertTrue(q.is_full())
+        self.assertRaises(Full, q.put, 2, False)
+
+    def test_put_when_full_and_timeout_expires(self):
+        q = BlockingPriorityQueue(1)
+        q.put(1)
+        self.assertRaises(Full, q.put, 2, True, 0.01)
+        self.assertRaises(ValueError, q.put, 2, True, -1)
+
+    def test_get_when_empty_and_not_blocking(self):
+        self.assertRaises(Empty, BlockingPriorityQueue().get, False)
+
+    def test_get_when_empty_and_timeout_expires(self):
+        self.assertRaises(Empty, BlockingPriorityQueue().get, True, 0.01)
+
+    def test_get_waits_for_put(self):
+        q = BlockingPriorityQueue()
+        t = threading.Timer(0.01, q.put, args=(7,))
+        t.start()
+        self.assertEqual(q.get(timeout=5), 7)
+        t.join()
+
+    def test_put_waits_for_get(self):
+        q = BlockingPriorityQueue(1)
+        q.put(3)
+        t = threading.Timer(0.01, q.get)
+        t.start()
+        q.put(5, timeout=5)
+        t.join()
+        self.assertEqual(q.get(), 5)
+
+    def test_get_many_invalid_k(self):
+        q = BlockingPriorityQueue()
+        self.assertRaises(TypeError, q.get_many, 1.5)
+        self.assertRaises(ValueError, q.get_many, 0)
+
+    def test_get_many(self):
+        q = BlockingPriorityQueue()
+        for x in [5, 3, 9, 1]:
+            q.put(x)
+        self.assertEqual(q.get_many(3), [1, 3, 5])
+        self.assertEqual(q.get_many(3), [9])
+        self.assertRaises(Empty, q.get_many, 3, False)
+
+    def test_producers_and_consumers(self):
+        q = BlockingPriorityQueue(8)
+        n = 200
+        results = []
+        results_lock = threading.Lock()
+
+        def produce(offset):
+            for i in range(n):
+                q.put(offset + i)
+
+        def consume():
+            for _ in range(n // 4):
+                batch = q.get_many(4, timeout=5)
+                with results_lock:
+                    results.extend(batch)
+                for _ in range(4 - len(batch)):
+                    x = q.get(timeout=5)
+                    with results_lock:
+                        results.append(x)
+
+        threads = [threading.Thread(target=produce, args=(i * n,)) for i in range(4)]
+        threads += [threading.Thread(target=consume) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertTrue(q.is_empty())
+        self.assertEqual(sorted(results), list(range(4 * n)))
+
+    def test_str(self):
+        q = BlockingPriorityQueue()
+        q.put(1)
+        self.assertEqual(str(q), "[1]")
+        self.assertEqual(repr(q), str(q))
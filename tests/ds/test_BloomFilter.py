@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the BloomFilter class and the is_bloom_filter function.
+"""
+
+import unittest
+
+from andz.ds.BloomFilter import BloomFilter, is_bloom_filter
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_create_expected_size_not_int(self):
+        self.assertRaises(TypeError, BloomFilter, 10.0)
+
+    def test_create_expected_size_less_than_1(self):
+        self.assertRaises(ValueError, BloomFilter, 0)
+
+    def test_create_false_positive_rate_not_number(self):
+        self.assertRaises(TypeError, BloomFilter, 10, "0.1")
+
+    def test_create_false_positive_rate_not_in_0_1(self):
+        self.assertRaises(ValueError, BloomFilter, 10, 0)
+        self.assertRaises(ValueError, BloomFilter, 10, 1)
+
+    def test_create_hash_function_not_callable(self):
+        self.assertRaises(TypeError, BloomFilter, 10, 0.1, 3)
+
+    def test_create_seed_not_int(self):
+        self.assertRaises(TypeError, BloomFilter, 10, 0.1, None, "1")
+
+    def test_sizing(self):
+        f = BloomFilter(1000, 0.01)
+        # About 9.6 bits per element and 7 hash functions.
+        self.assertEqual(f.num_bits, 9586)
+        self.assertEqual(f.num_hashes, 7)
+        self.assertEqual(f.expected_size, 1000)
+        self.assertEqual(f.false_positive_rate, 0.01)
+        self.assertEqual(f.size, 0)
+        self.assertTrue(is_bloom_filter(f))
+
+    def test_add_key_None(self):
+        f = BloomFilter(10)
+        self.assertRaises(TypeError, f.add, None)
+        self.assertRaises(TypeError, f.might_contain, None)
+        self.assertNotIn(None, f)
+
+    def test_add_non_hashable_type(self):
+        f = BloomFilter(10)
+        self.assertRaises(TypeError, f.add, [])
+        self.assertRaises(TypeError, f.add_many, [1, []])
+        self.assertEqual(f.size, 0)
+
+    def test_no_false_negatives(self):
+        f = BloomFilter(1000, 0.05)
+        for i in range(1000):
+            f.add(str(i))
+        for i in range(1000):
+            self.assertTrue(f.might_contain(str(i)))
+            self.assertIn(str(i), f)
+        self.assertTrue(is_bloom_filter(f))
+
+    def test_false_positive_rate(self):
+        f = BloomFilter(2000, 0.01, seed=0)
+        f.add_many(range(2000))
+        hits = sum(f.might_contain_many(range(10**6, 10**6 + 20000)))
+        self.assertLess(hits / 20000, 0.02)
+        self.assertAlmostEqual(f.estimated_false_positive_rate(), 0.01, delta=0.002)
+
+    def test_size(self):
+        f = BloomFilter(100)
+        f.add(1)
+        f.add(1)
+        self.assertEqual(f.size, 1)
+        self.assertEqual(len(f), 1)
+        f.add_many([1, 2, 3])
+        self.assertEqual(f.size, 3)
+
+    def test_bulk_same_as_single(self):
+        f = BloomFilter(500, 0.02, seed=7)
+        g = BloomFilter(500, 0.02, seed=7)
+        keys = [f"key{i}" for i in range(500)]
+        f.add_many(keys)
+        for k in keys:
+            g.add(k)
+        # pylint: disable=protected-access
+        self.assertEqual(f._bits, g._bits)
+        queries = [f"other{i}" for i in range(2000)] + keys
+        self.assertEqual(
+            f.might_contain_many(queries), [g.might_contain(q) for q in queries]
+        )
+
+    def test_empty_bulk(self):
+        f = BloomFilter(10)
+        f.add_many([])
+        self.assertEqual(f.might_contain_many([]), [])
+        self.assertEqual(f.size, 0)
+
+    def test_custom_hash_function(self):
+        f = BloomFilter(10, hash_function=lambda k: hash(k.lower()))
+        f.add("Key")
+        self.assertIn("KEY", f)
+
+    def test_clear(self):
+        f = BloomFilter(10)
+        f.add_many(range(10))
+        f.clear()
+        self.assertEqual(f.size, 0)
+        self.assertFalse(any(f.might_contain_many(range(10))))
+        self.assertTrue(is_bloom_filter(f))
+
+    def test_str(self):
+        f = BloomFilter(1)
+        self.assertEqual(str(f), "BloomFilter(size=0, num_bits=10, num_hashes=7)")
+        self.assertEqual(repr(f), str(f))
+
+
+class TestIsBloomFilter(unittest.TestCase):
+    def test_not_bloom_filter(self):
+        self.assertFalse(is_bloom_filter(bytearray(8)))
+
+    def test_wrong_size(self):
+        f = BloomFilter(10)
+        f._size = 1  # pylint: disable=protected-access
+        self.assertFalse(is_bloom_filter(f))
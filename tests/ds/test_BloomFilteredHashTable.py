@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the BloomFilteredHashTable class.
+"""
+
+import unittest
+from random import randint
+
+from andz.ds.BloomFilteredHashTable import BloomFilteredHashTable
+from andz.ds.LinearProbingHashTable import LinearProbingHashTable
+from andz.ds.SwissHashTable import SwissHashTable
+
+
+class CountingHashTable(LinearProbingHashTable):
+    """LinearProbingHashTable which counts the calls to get."""
+
+    def __init__(self):
+        LinearProbingHashTable.__init__(self)
+        self.gets = 0
+
+    def get(self, key):
+        self.gets += 1
+        return LinearProbingHashTable.get(self, key)
+
+
+class TestBloomFilteredHashTable(unittest.TestCase):
+    def test_create(self):
+        table = LinearProbingHashTable()
+        t = BloomFilteredHashTable(table)
+        self.assertIs(t.table, table)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.bloom_filter.false_positive_rate, 0.01)
+
+    def test_create_without_table(self):
+        self.assertRaises(TypeError, BloomFilteredHashTable)
+        self.assertRaises(TypeError, BloomFilteredHashTable, None)
+
+    def test_create_table_not_hash_table(self):
+        self.assertRaises(TypeError, BloomFilteredHashTable, {})
+
+    def test_create_false_positive_rate_not_in_0_1(self):
+        self.assertRaises(
+            ValueError, BloomFilteredHashTable, LinearProbingHashTable(), 2
+        )
+
+    def test_create_non_empty_table(self):
+        table = LinearProbingHashTable.from_items((i, -i) for i in range(100))
+        t = BloomFilteredHashTable(table)
+        self.assertEqual(t.size, 100)
+        for i in range(100):
+            self.assertEqual(t.get(i), -i)
+
+    def test_put_get_delete(self):
+        t = BloomFilteredHashTable(SwissHashTable())
+        for i in range(1000):
+            t.put(i, str(i))
+        t[5] = "five"
+        self.assertEqual(len(t), 1000)
+        self.assertEqual(t[5], "five")
+        self.assertEqual(t.get(999), "999")
+        self.assertIsNone(t.get(1000))
+        self.assertIn(10, t)
+        self.assertNotIn(-10, t)
+        self.assertNotIn(None, t)
+        self.assertEqual(t.delete(10), "10")
+        self.assertIsNone(t.delete(10))
+        self.assertNotIn(10, t)
+        self.assertEqual(t.size, 999)
+
+    def test_key_None(self):
+        t = BloomFilteredHashTable(LinearProbingHashTable())
+        self.assertRaises(TypeError, t.put, None, 1)
+        self.assertRaises(TypeError, t.get, None)
+        self.assertRaises(TypeError, t.delete, None)
+        self.assertRaises(TypeError, t.put_many, [(1, 1), (None, 2)])
+        self.assertEqual(t.size, 0)
+
+    def test_misses_do_not_probe_table(self):
+        table = CountingHashTable()
+        t = BloomFilteredHashTable(table)
+        t.put_many((i, i) for i in range(1000))
+        for i in range(1000, 11000):
+            self.assertIsNone(t.get(i))
+        # The false-positive rate is 1%.
+        self.assertLess(table.gets, 300)
+
+    def test_get_many(self):
+        t = BloomFilteredHashTable(LinearProbingHashTable())
+        t.put_many((i, -i) for i in range(0, 1000, 2))
+        self.assertEqual(
+            t.get_many(range(1000)), [-i if i % 2 == 0 else None for i in range(1000)]
+        )
+        self.assertEqual(t.get_many([1001, 1003]), [None, None])
+        self.assertEqual(t.get_many([]), [])
+
+    def test_filter_grows(self):
+        t = BloomFilteredHashTable(LinearProbingHashTable())
+        for i in range(5000):
+            t.put(i, i)
+        f = t.bloom_filter
+        self.assertGreaterEqual(f.expected_size, f.size)
+        self.assertLess(f.estimated_false_positive_rate(), 0.01)
+
+    def test_filter_rebuilt_after_deletions(self):
+        t = BloomFilteredHashTable(LinearProbingHashTable())
+        for _ in range(20):
+            for i in range(200):
+                t.put(i, i)
+            for i in range(200):
+                t.delete(i)
+        self.assertEqual(t.size, 0)
+        self.assertLessEqual(t.bloom_filter.size, 64)
+
+    def test_random_operations(self):
+        t = BloomFilteredHashTable(LinearProbingHashTable())
+        d = {}
+        for _ in range(3000):
+            k = randint(0, 500)
+            if randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                t.put(k, -k)
+                d[k] = -k
+            self.assertEqual(t.get(k), d.get(k))
+        self.assertEqual(dict(t.items()), d)
+
+    def test_from_items(self):
+        t = BloomFilteredHashTable.from_items([(1, 2), (3, 4)], expected_size=1000)
+        self.assertEqual(t.get_many([1, 3, 5]), [2, 4, None])
+        self.assertGreaterEqual(t.bloom_filter.expected_size, 1000)
+        self.assertIsInstance(t.table, LinearProbingHashTable)
+
+    def test_from_items_with_table(self):
+        table = SwissHashTable()
+        t = BloomFilteredHashTable.from_items([(1, 2), (3, 4)], table=table)
+        self.assertIs(t.table, table)
+        self.assertEqual(t.get_many([1, 3, 5]), [2, 4, None])
+        self.assertRaises(
+            TypeError, BloomFilteredHashTable.from_items, [], expected_size="1"
+        )
+
+    def test_str(self):
+        t = BloomFilteredHashTable(LinearProbingHashTable())
+        t.put(1, 2)
+        self.assertEqual(str(t), "[(1, 2)]")
+        self.assertEqual(repr(t), "[(1, 2)]")
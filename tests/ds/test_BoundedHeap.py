@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.BoundedHeap module.
+"""
+
+import unittest
+from random import randint
+
+from andz.ds.BoundedHeap import BoundedHeap
+
+
+class TestBoundedHeap(unittest.TestCase):
+    def test_create_k_not_int(self):
+        self.assertRaises(TypeError, BoundedHeap, 3.14)
+        self.assertRaises(TypeError, BoundedHeap, "not at int")
+
+    def test_create_k_less_than_1(self):
+        self.assertRaises(ValueError, BoundedHeap, 0)
+        self.assertRaises(ValueError, BoundedHeap, -1)
+
+    def test_create(self):
+        h = BoundedHeap(3)
+        self.assertTrue(h.is_empty())
+        self.assertFalse(h.is_full())
+        self.assertEqual(h.size, 0)
+        self.assertEqual(h.capacity, 3)
+        self.assertIsNone(h.threshold)
+
+    def test_add_when_argument_is_None(self):
+        self.assertRaises(ValueError, BoundedHeap(3).add, None)
+
+    def test_add_largest(self):
+        h = BoundedHeap(3)
+        for x in [5, 1, 8]:
+            self.assertTrue(h.add(x))
+        self.assertTrue(h.is_full())
+        self.assertEqual(h.threshold, 1)
+        self.assertFalse(h.add(0))
+        self.assertFalse(h.add(1))
+        self.assertTrue(h.add(7))
+        self.assertEqual(h.size, 3)
+        self.assertEqual(h.threshold, 5)
+        self.assertEqual(h.sorted_result(), [8, 7, 5])
+        self.assertTrue(h.is_empty())
+
+    def test_add_smallest(self):
+        h = BoundedHeap(3, largest=False)
+        for x in [5, 1, 8]:
+            self.assertTrue(h.add(x))
+        self.assertEqual(h.threshold, 8)
+        self.assertFalse(h.add(9))
+        self.assertTrue(h.add(2))
+        self.assertEqual(h.sorted_result(), [1, 2, 5])
+
+    def test_feed_when_one_element_is_None(self):
+        h = BoundedHeap(2)
+        self.assertRaises(ValueError, h.feed, [1, 2, 3, None])
+        self.assertEqual(h.sorted_result(), [3, 2])
+
+    def test_feed_when_one_element_is_None_while_filling(self):
+        h = BoundedHeap(5)
+        self.assertRaises(ValueError, h.feed, [4, 1, None, 3])
+        self.assertEqual(h.sorted_result(), [4, 1])
+
+    def test_feed_fewer_than_k_elements(self):
+        h = BoundedHeap(10)
+        h.feed([3, 1, 2])
+        self.assertFalse(h.is_full())
+        self.assertEqual(h.sorted_result(), [3, 2, 1])
+
+    def test_feed_largest(self):
+        a = [randint(-1000, 1000) for _ in range(randint(10, 1000))]
+        k = randint(1, 10)
+        h = BoundedHeap(k)
+        h.feed(iter(a))
+        self.assertEqual(h.size, k)
+        self.assertEqual(h.sorted_result(), sorted(a, reverse=True)[:k])
+
+    def test_feed_smallest(self):
+        a = [randint(-1000, 1000) for _ in range(randint(10, 1000))]
+        k = randint(1, 10)
+        h = BoundedHeap(k, largest=False)
+        h.feed(a[: len(a) // 2])
+        h.feed(a[len(a) // 2 :])
+        self.assertEqual(h.sorted_result(), sorted(a)[:k])
+
+    def test_clear(self):
+        h = BoundedHeap(2)
+        h.feed(range(10))
+        self.assertIsNone(h.clear())
+        self.assertTrue(h.is_empty())
+
+    def test_str(self):
+        h = BoundedHeap(2)
+        h.feed([1, 2, 3])
+        self.assertEqual(str(h), "[2, 3]")
+        self.assertEqual(repr(h), str(h))
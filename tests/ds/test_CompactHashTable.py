@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.CompactHashTable
+module.
+"""
+
+import string
+import unittest
+from random import randint, sample, shuffle
+
+from andz.ds.CompactHashTable import CompactHashTable, is_compact_hash_table
+
+
+def gen_rand_list_of_distinct_ascii_and_numbers() -> list:
+    n = randint(1, 1000)
+    ls = list(string.ascii_lowercase) + sample(range(n), n)
+    shuffle(ls)
+    return ls
+
+
+class CountingKey:
+    """Key which counts the calls to __hash__ of all instances."""
+
+    hashes = 0
+
+    def __init__(self, x):
+        self.x = x
+
+    def __hash__(self):
+        CountingKey.hashes += 1
+        return hash(self.x)
+
+    def __eq__(self, other):
+        return isinstance(other, CountingKey) and self.x == other.x
+
+
+class TestCompactHashTable(unittest.TestCase):
+    def test_create_capacity_not_int(self):
+        self.assertRaises(TypeError, CompactHashTable, 3.14)
+
+    def test_create_capacity_less_than_1(self):
+        self.assertRaises(ValueError, CompactHashTable, 0)
+
+    def test_create_max_load_factor_not_in_0_1(self):
+        self.assertRaises(TypeError, CompactHashTable, 8, "0.5")
+        self.assertRaises(ValueError, CompactHashTable, 8, 1)
+
+    def test_create_seed_not_int(self):
+        self.assertRaises(TypeError, CompactHashTable, 8, 0.7, 1.5)
+
+    def test_strided_int_keys(self):
+        # The low bits of these hash codes are all equal, so, without mixing,
+        # all keys would form a single cluster of the index.
+        for stride in (1, 64, 1024):
+            t = CompactHashTable(seed=0)
+            keys = range(0, 4096 * stride, stride)
+            t.put_many((k, -k) for k in keys)
+            self.assertTrue(is_compact_hash_table(t))
+            self.assertEqual(t.get_many(keys), [-k for k in keys])
+            # pylint: disable=protected-access
+            mask = t.capacity - 1
+            distances = [
+                (i - t._hashes[e]) & mask for i, e in enumerate(t._indices) if e != -1
+            ]
+            self.assertLess(max(distances), 100)
+
+    def test_create(self):
+        t = CompactHashTable(100)
+        self.assertEqual(t.capacity, 128)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.max_load_factor, 0.7)
+        self.assertTrue(is_compact_hash_table(t))
+
+    def test_key_None(self):
+        t = CompactHashTable()
+        self.assertRaises(TypeError, t.put, None, 5)
+        self.assertRaises(TypeError, t.get, None)
+        self.assertRaises(TypeError, t.delete, None)
+
+    def test_non_hashable_type(self):
+        t = CompactHashTable()
+        self.assertRaises(TypeError, t.put, [], 12)
+        self.assertRaises(TypeError, t.get, {})
+        self.assertRaises(TypeError, t.delete, [])
+
+    def test_get_empty_table(self):
+        self.assertIsNone(CompactHashTable().get("a"))
+
+    def test_put_and_get_all(self):
+        t = CompactHashTable()
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        for v, k in enumerate(ls):
+            t[k] = v
+        self.assertEqual(t.size, len(ls))
+        self.assertEqual(len(t), len(ls))
+        self.assertLessEqual(t.load_factor, 0.7)
+        self.assertTrue(is_compact_hash_table(t))
+        for v, k in enumerate(ls):
+            self.assertEqual(t[k], v)
+        self.assertIsNone(t.get("not a key"))
+
+    def test_put_same_key_multiple_times(self):
+        t = CompactHashTable()
+        t.put("three", 3)
+        t.put(5, 6)
+        t.put("three", "three")
+        self.assertEqual(t.size, 2)
+        self.assertEqual(t.get("three"), "three")
+        self.assertEqual(str(t), "[('three', 'three'), (5, 6)]")
+
+    def test_insertion_order(self):
+        t = CompactHashTable()
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        for k in ls:
+            t.put(k, k)
+        for k in ls[::3]:
+            t.delete(k)
+        t.put(ls[1], "updated")
+        t.put("new", "new")
+        expected = [(k, k) for i, k in enumerate(ls) if i % 3 != 0]
+        expected[0] = (ls[1], "updated")
+        expected.append(("new", "new"))
+        self.assertEqual(str(t), str(expected))
+        self.assertTrue(is_compact_hash_table(t))
+
+    def test_index_typecode_depends_on_capacity(self):
+        t = CompactHashTable()
+        self.assertEqual(t._indices.itemsize, 1)  # pylint: disable=protected-access
+        for i in range(200):
+            t.put(i, i)
+        self.assertEqual(t.capacity, 512)
+        self.assertEqual(t._indices.itemsize, 2)  # pylint: disable=protected-access
+        self.assertTrue(is_compact_hash_table(t))
+
+    def test_resize_does_not_rehash_keys(self):
+        t = CompactHashTable()
+        keys = [CountingKey(i) for i in range(1000)]
+        CountingKey.hashes = 0
+        for k in keys:
+            t.put(k, k.x)
+        self.assertEqual(CountingKey.hashes, len(keys))
+        self.assertEqual(t.capacity, 2048)
+
+    def test_delete_key_not_present(self):
+        t = CompactHashTable()
+        t.put(-10, "ten")
+        self.assertIsNone(t.delete(7))
+        self.assertEqual(t.size, 1)
+
+    def test_delete_shrinks(self):
+        t = CompactHashTable()
+        for i in range(1000):
+            t.put(i, i)
+        for i in range(1000):
+            self.assertEqual(t.delete(i), i)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.capacity, 8)
+        self.assertTrue(is_compact_hash_table(t))
+
+    def test_insert_delete_churn(self):
+        t = CompactHashTable()
+        d = {}
+        for _ in range(5000):
+            k = randint(-100, 100)
+            if randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                t.put(k, str(k))
+                d[k] = str(k)
+            self.assertEqual(t.size, len(d))
+        self.assertTrue(is_compact_hash_table(t))
+        self.assertEqual(str(t), str(list(d.items())))
+
+    def test_bulk_operations_and_views(self):
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        t = CompactHashTable.from_items([(k, i) for i, k in enumerate(ls)])
+        self.assertTrue(is_compact_hash_table(t))
+        t.put_many([(k, -i) for i, k in enumerate(ls[::2])])
+        self.assertEqual(t.size, len(ls))
+        expected = [-(i // 2) if i % 2 == 0 else i for i in range(len(ls))]
+        self.assertEqual(t.get_many(ls), expected)
+        self.assertEqual(t.get_many(["not a key"]), [None])
+        self.assertEqual(set(t), set(ls))
+        self.assertEqual(t.items(), set(zip(ls, expected)))
+        self.assertEqual(sorted(t.values()), sorted(expected))
+        self.assertIn(ls[0], t)
+        self.assertNotIn("not a key", t)
+        del t[ls[0]]
+        self.assertNotIn(ls[0], t.keys())
+        self.assertRaises(KeyError, t.__delitem__, ls[0])
+        self.assertTrue(is_compact_hash_table(t))
+
+
+class TestIsCompactHashTable(unittest.TestCase):
+    def test_not_compact_hash_table(self):
+        self.assertFalse(is_compact_hash_table({}))
+
+    def test_wrong_size(self):
+        t = CompactHashTable()
+        t.put("a", 1)
+        t._size = 2  # pylint: disable=protected-access
+        self.assertFalse(is_compact_hash_table(t))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.FibonacciHeap module.
+"""
+
+import unittest
+
+from andz.ds.FibonacciHeap import FibonacciHeap, _siblings, is_fibonacci_heap
+from tests.ds.mergeable_heap_tests import MergeableHeapTests
+
+
+class TestFibonacciHeap(unittest.TestCase, MergeableHeapTests):
+    def __init__(self, method_name="__init__"):
+        unittest.TestCase.__init__(self, method_name)
+        MergeableHeapTests.__init__(self, FibonacciHeap, is_fibonacci_heap)
+
+    def test_add_is_lazy(self):
+        h = FibonacciHeap(range(10))
+        self.assertEqual(len(_siblings(h._min)), 10)
+
+    def test_remove_min_consolidates(self):
+        h = FibonacciHeap(range(16))
+        h.remove_min()
+        # 15 nodes are consolidated into trees of degrees 0, 1, 2 and 3.
+        degrees = sorted(root.degree for root in _siblings(h._min))
+        self.assertEqual(degrees, [0, 1, 2, 3])
+        self.assertTrue(is_fibonacci_heap(h))
+
+    def test_decrease_key_cut_and_cascading_cut(self):
+        h = FibonacciHeap()
+        handles = [h.add(x) for x in range(16)]
+        h.remove_min()
+        # y is a child of a root, with (at least) two children.
+        y = next(x for x in handles[1:] if x.parent is not None and x.degree >= 2)
+        z = y.parent
+        a, b = _siblings(y.child)[:2]
+
+        # The first cut only marks y.
+        h.decrease_key(a, -1)
+        self.assertIsNone(a.parent)
+        self.assertTrue(y.mark)
+        self.assertIs(y.parent, z)
+        self.assertEqual(h.find_min(), -1)
+
+        # The second cut also cuts y, which is marked, but not the root z.
+        h.decrease_key(b, -2)
+        self.assertIsNone(b.parent)
+        self.assertIsNone(y.parent)
+        self.assertFalse(y.mark)
+        self.assertFalse(z.mark)
+        self.assertIsNone(z.parent)
+        roots = _siblings(h._min)
+        for node in (a, b, y, z):
+            self.assertIn(node, roots)
+        self.assertEqual(h.find_min(), -2)
+        self.assertTrue(is_fibonacci_heap(h))
+
+    def test_decrease_key_without_cut(self):
+        h = FibonacciHeap()
+        handles = [h.add(x) for x in range(0, 32, 2)]
+        h.remove_min()
+        x = next(x for x in handles[1:] if x.parent is not None)
+        h.decrease_key(x, x.parent.key + 1)
+        self.assertIsNotNone(x.parent)
+        self.assertFalse(x.parent.mark)
+        self.assertTrue(is_fibonacci_heap(h))
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the HashSet class and the is_hash_set function.
+"""
+
+import unittest
+from random import randint, sample
+
+from andz.ds.HashSet import HashSet, is_hash_set
+
+
+class TestHashSet(unittest.TestCase):
+    def test_create_capacity_not_int(self):
+        self.assertRaises(TypeError, HashSet, 3.0)
+
+    def test_create_capacity_less_than_1(self):
+        self.assertRaises(ValueError, HashSet, 0)
+
+    def test_create_max_load_factor_not_in_0_1(self):
+        self.assertRaises(ValueError, HashSet, 11, 1)
+
+    def test_create_hash_function_not_callable(self):
+        self.assertRaises(TypeError, HashSet, 11, 0.7, 3)
+
+    def test_create_seed_not_int(self):
+        self.assertRaises(TypeError, HashSet, 11, 0.7, None, "1")
+
+    def test_create_empty(self):
+        s = HashSet()
+        self.assertEqual(s.size, 0)
+        self.assertEqual(len(s), 0)
+        self.assertEqual(s.capacity, 11)
+        self.assertEqual(s.load_factor, 0)
+        self.assertEqual(s.max_load_factor, 0.7)
+        self.assertNotIn(1, s)
+        self.assertTrue(is_hash_set(s))
+
+    def test_add_key_None(self):
+        self.assertRaises(TypeError, HashSet().add, None)
+
+    def test_add_non_hashable_type(self):
+        self.assertRaises(TypeError, HashSet().add, [])
+
+    def test_contains_None(self):
+        self.assertNotIn(None, HashSet())
+
+    def test_add_and_contains(self):
+        s = HashSet(3)
+        ls = sample(range(10000), randint(1, 500))
+        for k in ls:
+            s.add(k)
+            s.add(k)
+        self.assertEqual(s.size, len(ls))
+        self.assertLessEqual(s.load_factor, 0.7)
+        for k in ls:
+            self.assertIn(k, s)
+        self.assertNotIn(-1, s)
+        self.assertEqual(sorted(s), sorted(ls))
+        self.assertTrue(is_hash_set(s))
+
+    def test_discard(self):
+        s = HashSet(5)
+        ls = sample(range(10000), randint(1, 500))
+        s.update(ls)
+        grown = s.capacity
+        s.discard(-1)
+        for k in ls:
+            s.discard(k)
+            self.assertNotIn(k, s)
+        self.assertEqual(s.size, 0)
+        self.assertEqual(s.capacity, 5)
+        self.assertLessEqual(s.capacity, grown)
+        self.assertTrue(is_hash_set(s))
+
+    def test_remove_and_pop(self):
+        s = HashSet.from_iterable(["a", "b"])
+        s.remove("a")
+        self.assertRaises(KeyError, s.remove, "a")
+        self.assertEqual(s.pop(), "b")
+        self.assertRaises(KeyError, s.pop)
+
+    def test_discard_keeps_colliding_keys_reachable(self):
+        s = HashSet(11, hash_function=lambda k: 0)
+        s.update([0, 11, 22, 33])
+        s.discard(0)
+        s.discard(22)
+        self.assertIn(11, s)
+        self.assertIn(33, s)
+        self.assertEqual(s.size, 2)
+
+    def test_add_discard_churn(self):
+        s = HashSet(7, hash_function=lambda k: k % 7)
+        expected = set()
+        for _ in range(3000):
+            k = randint(0, 60) * 7 + randint(0, 2)
+            if randint(0, 2) == 0:
+                s.discard(k)
+                expected.discard(k)
+            else:
+                s.add(k)
+                expected.add(k)
+            self.assertEqual(k in s, k in expected)
+        self.assertEqual(set(s), expected)
+
+    def test_update_resizes_once(self):
+        s = HashSet()
+        s.update(range(1000))
+        self.assertEqual(s.size, 1000)
+        self.assertEqual(s.capacity, int(1000 / 0.7) + 1)
+
+    def test_from_iterable_expected_size(self):
+        s = HashSet.from_iterable(iter(range(100)), expected_size=100)
+        self.assertEqual(s.capacity, int(100 / 0.7) + 1)
+        self.assertEqual(set(s), set(range(100)))
+        self.assertRaises(TypeError, HashSet.from_iterable, [], "1")
+        self.assertRaises(ValueError, HashSet.from_iterable, [], -1)
+
+    def test_union(self):
+        a = HashSet(seed=1)
+        a.update(range(0, 100))
+        b = HashSet(seed=1)
+        b.update(range(50, 1000))
+        c = HashSet(seed=2)
+        c.update(range(50, 1000))
+        for u in (a.union(b), b.union(a), a.union(c), a | b, a.union(range(50, 1000))):
+            self.assertEqual(set(u), set(range(1000)))
+            self.assertTrue(is_hash_set(u))
+        self.assertEqual(a.union(b).seed, 1)
+        self.assertEqual(a.size, 100)
+        self.assertEqual(b.size, 950)
+
+    def test_intersection(self):
+        a = HashSet(seed=1)
+        a.update(range(0, 100))
+        b = HashSet(seed=1)
+        b.update(range(50, 1000))
+        c = HashSet(seed=2)
+        c.update(range(50, 1000))
+        for i in (
+            a.intersection(b),
+            b.intersection(a),
+            a.intersection(c),
+            c.intersection(a),
+            a & b,
+            a.intersection(range(50, 1000)),
+        ):
+            self.assertEqual(set(i), set(range(50, 100)))
+            self.assertTrue(is_hash_set(i))
+
+    def test_set_operators(self):
+        a = HashSet.from_iterable([1, 2, 3])
+        b = HashSet.from_iterable([2, 3, 4])
+        self.assertEqual(set(a - b), {1})
+        self.assertEqual(set(a ^ b), {1, 4})
+        self.assertTrue(HashSet.from_iterable([2]) <= a)
+        self.assertEqual(a, HashSet.from_iterable([3, 2, 1]))
+        self.assertEqual(a, {1, 2, 3})
+
+    def test_copy(self):
+        a = HashSet.from_iterable("abc")
+        b = a.copy()
+        b.add("d")
+        self.assertEqual(a.size, 3)
+        self.assertEqual(b.size, 4)
+        self.assertEqual(a.seed, b.seed)
+
+    def test_clear(self):
+        s = HashSet(5)
+        s.update(range(100))
+        s.clear()
+        self.assertEqual(s.size, 0)
+        self.assertEqual(s.capacity, 5)
+        self.assertNotIn(1, s)
+
+    def test_custom_hash_function(self):
+        s = HashSet(hash_function=lambda k: hash(k.lower()))
+        s.update(["Key", "key"])
+        self.assertEqual(s.size, 2)
+        self.assertNotIn("KEY", s)
+
+    def test_show(self):
+        s = HashSet()
+        s.update(range(5))
+        s.show()
+
+    def test_str(self):
+        s = HashSet()
+        s.add(1)
+        self.assertEqual(str(s), "[1]")
+        self.assertEqual(repr(s), "[1]")
+
+
+class TestIsHashSet(unittest.TestCase):
+    def test_not_hash_set(self):
+        self.assertFalse(is_hash_set({1}))
+
+    def test_wrong_cached_hash(self):
+        s = HashSet.from_iterable([1, 2, 3])
+        # pylint: disable=protected-access
+        i = s._keys.index(1)
+        s._hashes[i] ^= 1
+        self.assertFalse(is_hash_set(s))
+
+    def test_wrong_size(self):
+        s = HashSet.from_iterable([1, 2, 3])
+        s._size = 2  # pylint: disable=protected-access
+        self.assertFalse(is_hash_set(s))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the default implementations of the HashTable abstract class.
+"""
+
+import unittest
+
+from andz.ds.HashTable import HashTable
+
+
+class PutGetHashTable(HashTable):
+    """Hash table which implements only put and get, so it's still
+    abstract."""
+
+    def __init__(self):
+        self.d = {}
+
+    def put(self, key, value):
+        self.d[key] = value
+
+    def get(self, key):
+        return self.d.get(key)
+
+
+class DictHashTable(PutGetHashTable):
+    """Hash table which implements only the abstract methods."""
+
+    def delete(self, key):
+        return self.d.pop(key, None)
+
+    def _iter_items(self):
+        return iter(self.d.items())
+
+
+class TestHashTable(unittest.TestCase):
+    def test_create_without_delete_and_iter_items(self):
+        self.assertRaises(TypeError, PutGetHashTable)
+
+    def test_default_contains(self):
+        t = DictHashTable()
+        t.put(3, "a")
+        t.put(4, None)
+        self.assertIn(3, t)
+        self.assertNotIn(5, t)
+        self.assertNotIn(4, t)  # The keys associated with None are not found.
+
+    def test_bulk_operations(self):
+        t = DictHashTable.from_items([(1, "a"), (2, "b")], expected_size=2)
+        t.put_many([(3, "c")])
+        self.assertEqual(t.get_many([1, 2, 3, 4]), ["a", "b", "c", None])
+        self.assertEqual(t.delete(3), "c")
+
+    def test_default_len_and_views(self):
+        t = DictHashTable.from_items([(1, "a"), (2, "b")])
+        self.assertEqual(len(t), 2)
+        self.assertEqual(sorted(t), [1, 2])
+        self.assertEqual(sorted(t.values()), ["a", "b"])
+        self.assertIn((1, "a"), t.items())
+        self.assertNotIn((1, "b"), t.items())
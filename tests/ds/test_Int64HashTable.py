@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.Int64HashTable module.
+"""
+
+import unittest
+from random import randint
+
+import numpy as np
+
+from andz.ds.Int64HashTable import Int64HashTable, is_int64_hash_table
+
+INT64_MIN = np.iinfo(np.int64).min
+INT64_MAX = np.iinfo(np.int64).max
+
+
+class TestInt64HashTable(unittest.TestCase):
+    def test_create_invalid_arguments(self):
+        self.assertRaises(TypeError, Int64HashTable, 3.14)
+        self.assertRaises(ValueError, Int64HashTable, 0)
+        self.assertRaises(TypeError, Int64HashTable, 16, "0.5")
+        self.assertRaises(ValueError, Int64HashTable, 16, 1)
+        self.assertRaises(TypeError, Int64HashTable, 16, 0.5, 1.5)
+
+    def test_create(self):
+        t = Int64HashTable(100)
+        self.assertEqual(t.capacity, 128)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.nbytes, 128 * 16)
+        self.assertTrue(is_int64_hash_table(t))
+
+    def test_put_invalid_key_or_value(self):
+        t = Int64HashTable()
+        self.assertRaises(TypeError, t.put, None, 1)
+        self.assertRaises(TypeError, t.put, "1", 1)
+        self.assertRaises(TypeError, t.put, 1.0, 1)
+        self.assertRaises(TypeError, t.put, 1, None)
+        self.assertRaises(ValueError, t.put, INT64_MIN, 1)
+        self.assertRaises(ValueError, t.put, INT64_MAX + 1, 1)
+        self.assertRaises(ValueError, t.put, 1, INT64_MAX + 1)
+
+    def test_put_get_delete(self):
+        t = Int64HashTable()
+        d = {}
+        for _ in range(2000):
+            k = randint(-300, 300) * 2**40
+            if randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                v = randint(INT64_MIN, INT64_MAX)
+                t[k] = v
+                d[k] = v
+            self.assertEqual(len(t), len(d))
+        self.assertTrue(is_int64_hash_table(t))
+        for k in range(-300, 301):
+            self.assertEqual(t[k * 2**40], d.get(k * 2**40))
+            self.assertEqual(k * 2**40 in t, k * 2**40 in d)
+        self.assertEqual(sorted(t.to_arrays()[0].tolist()), sorted(d))
+
+    def test_numpy_scalars(self):
+        t = Int64HashTable()
+        t.put(np.int32(5), np.int64(7))
+        self.assertEqual(t.get(np.int64(5)), 7)
+        self.assertIsInstance(t.get(5), int)
+
+    def test_contains_invalid_key(self):
+        t = Int64HashTable()
+        self.assertNotIn("a", t)
+        self.assertNotIn(INT64_MIN, t)
+        self.assertNotIn(2**70, t)
+
+    def test_delete_shrinks(self):
+        t = Int64HashTable()
+        t.put_many(np.arange(1000), np.arange(1000))
+        for k in range(1000):
+            self.assertEqual(t.delete(k), k)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.capacity, 16)
+
+    def test_put_many_invalid(self):
+        t = Int64HashTable()
+        self.assertRaises(ValueError, t.put_many, [[1]], [[1]])
+        self.assertRaises(ValueError, t.put_many, [1, 2], [1])
+        self.assertRaises(TypeError, t.put_many, [1.5], [1])
+        self.assertRaises(TypeError, t.put_many, [1], [1.5])
+        self.assertRaises(TypeError, t.put_many, np.array([2**63], np.uint64), [1])
+        self.assertRaises(ValueError, t.put_many, [INT64_MIN], [1])
+        self.assertEqual(t.size, 0)
+
+    def test_put_many_resizes_once(self):
+        t = Int64HashTable()
+        keys = np.arange(0, 3000 * 16, 16)
+        t.put_many(keys, -keys)
+        self.assertEqual(t.capacity, 4096)
+        self.assertEqual(t.size, 3000)
+        self.assertTrue(is_int64_hash_table(t))
+        self.assertEqual(t.get_many(keys).tolist(), (-keys).tolist())
+
+    def test_put_many_duplicates_and_updates(self):
+        t = Int64HashTable()
+        t.put(1, 10)
+        t.put_many([1, 2, 2, 3, 1], [11, 20, 21, 30, 12])
+        self.assertEqual(t.size, 3)
+        self.assertEqual(t.get_many([1, 2, 3, 4], default=0).tolist(), [12, 21, 30, 0])
+        self.assertTrue(is_int64_hash_table(t))
+
+    def test_put_many_empty(self):
+        t = Int64HashTable()
+        t.put_many([], [])
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.get_many([]).tolist(), [])
+
+    def test_get_many_and_contains_many(self):
+        t = Int64HashTable()
+        keys = np.random.randint(-(10**12), 10**12, 5000)
+        t.put_many(keys, keys * 2)
+        queries = np.concatenate([keys, keys + 1])
+        expected_in = np.isin(queries, keys)
+        self.assertEqual(t.contains_many(queries).tolist(), expected_in.tolist())
+        result = t.get_many(queries, default=-1)
+        self.assertTrue((result[expected_in] == queries[expected_in] * 2).all())
+        self.assertTrue((result[~expected_in] == -1).all())
+
+    def test_same_seed_same_layout(self):
+        t1 = Int64HashTable(seed=7)
+        t2 = Int64HashTable(seed=7)
+        for t in (t1, t2):
+            t.put_many(np.arange(100), np.arange(100))
+            t.put(1000, 1000)
+        self.assertEqual(str(t1), str(t2))
+
+
+class TestIsInt64HashTable(unittest.TestCase):
+    def test_not_int64_hash_table(self):
+        self.assertFalse(is_int64_hash_table({}))
+
+    def test_unreachable_key(self):
+        t = Int64HashTable(seed=0)
+        t.put(1, 1)
+        i = int(np.flatnonzero(t._keys == 1)[0])  # pylint: disable=protected-access
+        t._keys[i] = INT64_MIN  # pylint: disable=protected-access
+        t._keys[(i + 1) % t.capacity] = 1  # pylint: disable=protected-access
+        self.assertFalse(is_int64_hash_table(t))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the LFUCache class and the is_lfu_cache function.
+"""
+
+import unittest
+from random import randint
+
+from andz.ds.LFUCache import LFUCache, is_lfu_cache
+
+
+class TestLFUCache(unittest.TestCase):
+    def test_create_empty(self):
+        c = LFUCache(10)
+        self.assertEqual(c.size, 0)
+        self.assertEqual(c.capacity, 10)
+        self.assertEqual(c.items(), [])
+        self.assertEqual(c.frequency(1), 0)
+        self.assertTrue(is_lfu_cache(c))
+
+    def test_create_capacity_not_positive(self):
+        self.assertRaises(ValueError, LFUCache, -1)
+
+    def test_frequency(self):
+        c = LFUCache(10)
+        c.put(1, 1)
+        self.assertEqual(c.frequency(1), 1)
+        c.get(1)
+        c.put(1, 2)
+        self.assertEqual(c.frequency(1), 3)
+        self.assertIn(1, c)
+        self.assertEqual(c.frequency(1), 3)
+
+    def test_evicts_least_frequently_used(self):
+        c = LFUCache(3)
+        for k in "abc":
+            c.put(k, k)
+        c.get("a")
+        c.get("a")
+        c.get("c")
+        c.put("d", "d")
+        self.assertNotIn("b", c)
+        # Ties are broken by recency, so "d" is evicted before "c".
+        c.put("e", "e")
+        self.assertNotIn("d", c)
+        self.assertEqual([k for k, _ in c.items()], ["e", "c", "a"])
+        self.assertEqual(c.evictions, 2)
+        self.assertTrue(is_lfu_cache(c))
+
+    def test_resists_scans(self):
+        c = LFUCache(10)
+        for _ in range(3):
+            for k in range(5):
+                c.get(k)
+                c.put(k, k)
+        for k in range(100, 200):
+            c.put(k, k)
+        for k in range(5):
+            self.assertIn(k, c)
+
+    def test_put_never_evicts_its_entry(self):
+        c = LFUCache(10, weight=lambda k, v: v)
+        c.put("a", 4)
+        c.get("a")
+        c.put("b", 4)
+        # "b" has the lowest frequency, but it's the entry being put.
+        c.put("b", 8)
+        self.assertEqual(c.items(), [("b", 8)])
+        self.assertTrue(is_lfu_cache(c))
+
+    def test_delete(self):
+        c = LFUCache(3)
+        c.put(1, "one")
+        c.get(1)
+        c.put(2, "two")
+        self.assertEqual(c.delete(1), "one")
+        self.assertIsNone(c.delete(1))
+        self.assertEqual(c.items(), [(2, "two")])
+        self.assertEqual(c.frequency(1), 0)
+        self.assertTrue(is_lfu_cache(c))
+
+    def test_stats(self):
+        c = LFUCache(1)
+        c.put(1, 1)
+        c.get(1)
+        c.get(2)
+        c.put(2, 2)
+        self.assertEqual((c.hits, c.misses, c.evictions), (1, 1, 1))
+        self.assertEqual(c.hit_rate, 0.5)
+
+    def test_random_operations(self):
+        c = LFUCache(15)
+        # The expected entries: key -> (frequency, time of the last access).
+        expected = {}
+        for t in range(3000):
+            k = randint(0, 40)
+            if randint(0, 1) == 0:
+                c.put(k, -k)
+                if k in expected:
+                    expected[k] = (expected[k][0] + 1, t)
+                else:
+                    if len(expected) == 15:
+                        del expected[min(expected, key=expected.get)]
+                    expected[k] = (1, t)
+            elif c.get(k) is not None:
+                expected[k] = (expected[k][0] + 1, t)
+            self.assertEqual(
+                [k for k, _ in c.items()], sorted(expected, key=expected.get)
+            )
+        self.assertTrue(is_lfu_cache(c))
+
+    def test_memoize(self):
+        cache = LFUCache(100)
+
+        @cache.memoize
+        def binomial(n, k):
+            if k in (0, n):
+                return 1
+            return binomial(n - 1, k - 1) + binomial(n - 1, k)
+
+        self.assertEqual(binomial(30, 15), 155117520)
+        self.assertGreater(cache.hits, 100)
+        self.assertEqual(binomial(n=4, k=2), 6)
+
+    def test_clear(self):
+        c = LFUCache(3)
+        c.put(1, 1)
+        c.get(1)
+        c.clear()
+        self.assertEqual(c.size, 0)
+        self.assertTrue(is_lfu_cache(c))
+
+
+class TestIsLFUCache(unittest.TestCase):
+    def test_not_lfu_cache(self):
+        self.assertFalse(is_lfu_cache({}))
+
+    def test_wrong_bucket(self):
+        c = LFUCache()
+        c.put(1, 1)
+        c.put(2, 2)
+        c.get(2)
+        # pylint: disable=protected-access
+        c._entries[1].bucket = c._entries[2].bucket
+        self.assertFalse(is_lfu_cache(c))
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the LRUCache class and the is_lru_cache function, which also
+test the features common to all caches (of the andz.ds.Cache module).
+"""
+
+import unittest
+from collections import OrderedDict
+from random import randint
+
+from andz.algorithms.dp.fibonacci import bottom_up_fibonacci
+from andz.ds.LRUCache import LRUCache, is_lru_cache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_create_capacity_not_number(self):
+        self.assertRaises(TypeError, LRUCache, "10")
+
+    def test_create_capacity_not_positive(self):
+        self.assertRaises(ValueError, LRUCache, 0)
+
+    def test_create_weight_not_callable(self):
+        self.assertRaises(TypeError, LRUCache, 10, 3)
+
+    def test_create_empty(self):
+        c = LRUCache(10)
+        self.assertEqual(c.size, 0)
+        self.assertEqual(len(c), 0)
+        self.assertEqual(c.capacity, 10)
+        self.assertEqual(c.weight, 0)
+        self.assertEqual(c.hit_rate, 0)
+        self.assertEqual(c.items(), [])
+        self.assertTrue(is_lru_cache(c))
+
+    def test_get_put(self):
+        c = LRUCache(3)
+        c.put("a", 1)
+        c.put("b", None)
+        self.assertEqual(c.get("a"), 1)
+        self.assertIsNone(c.get("b", 2))
+        self.assertEqual(c.get("c", 3), 3)
+        self.assertIsNone(c.get("c"))
+        c.put("a", 10)
+        self.assertEqual(c.get("a"), 10)
+        self.assertEqual(c.size, 2)
+
+    def test_evicts_least_recently_used(self):
+        c = LRUCache(3)
+        for k in "abc":
+            c.put(k, k)
+        c.get("a")
+        c.put("d", "d")
+        self.assertNotIn("b", c)
+        self.assertEqual([k for k, _ in c.items()], ["c", "a", "d"])
+        c.put("c", "C")
+        c.put("e", "e")
+        self.assertEqual([k for k, _ in c.items()], ["d", "c", "e"])
+        self.assertEqual(c.evictions, 2)
+        self.assertTrue(is_lru_cache(c))
+
+    def test_in_and_len_are_not_accesses(self):
+        c = LRUCache(2)
+        c.put(1, 1)
+        c.put(2, 2)
+        self.assertIn(1, c)
+        c.put(3, 3)
+        self.assertNotIn(1, c)
+        self.assertEqual(c.hits + c.misses, 0)
+
+    def test_stats(self):
+        c = LRUCache(2)
+        c.put(1, 1)
+        c.get(1)
+        c.get(1)
+        c.get(2)
+        c.put(2, 2)
+        c.put(3, 3)
+        self.assertEqual(c.hits, 2)
+        self.assertEqual(c.misses, 1)
+        self.assertEqual(c.evictions, 1)
+        self.assertAlmostEqual(c.hit_rate, 2 / 3)
+        c.reset_stats()
+        self.assertEqual((c.hits, c.misses, c.evictions), (0, 0, 0))
+        self.assertEqual(c.size, 2)
+
+    def test_delete(self):
+        c = LRUCache(3)
+        c.put(1, "one")
+        c.put(2, "two")
+        self.assertEqual(c.delete(1), "one")
+        self.assertIsNone(c.delete(1))
+        self.assertEqual(c.items(), [(2, "two")])
+        self.assertEqual(c.evictions, 0)
+        self.assertTrue(is_lru_cache(c))
+
+    def test_clear(self):
+        c = LRUCache(3)
+        c.put(1, 1)
+        c.get(1)
+        c.clear()
+        self.assertEqual(c.size, 0)
+        self.assertEqual(c.weight, 0)
+        self.assertEqual(c.hits, 1)
+        self.assertTrue(is_lru_cache(c))
+
+    def test_weight(self):
+        c = LRUCache(10, weight=lambda k, v: len(v))
+        c.put("a", "xxxx")
+        c.put("b", "xxxx")
+        self.assertEqual(c.weight, 8)
+        c.put("c", "xxx")
+        self.assertEqual(c.weight, 7)
+        self.assertNotIn("a", c)
+        # Growing the value of an entry evicts the other ones, not the entry.
+        c.put("c", "x" * 10)
+        self.assertEqual(c.items(), [("c", "x" * 10)])
+        self.assertEqual(c.evictions, 2)
+        self.assertTrue(is_lru_cache(c))
+
+    def test_weight_not_valid(self):
+        c = LRUCache(10, weight=lambda k, v: v)
+        self.assertRaises(ValueError, c.put, "a", 11)
+        self.assertRaises(ValueError, c.put, "a", -1)
+        self.assertRaises(TypeError, c.put, "a", "1")
+        self.assertEqual(c.size, 0)
+        c.put("a", 0)
+        c.put("b", 10)
+        self.assertEqual(c.size, 2)
+
+    def test_unhashable_key(self):
+        self.assertRaises(TypeError, LRUCache().put, [], 1)
+
+    def test_random_operations(self):
+        c = LRUCache(20)
+        expected = OrderedDict()
+        for _ in range(3000):
+            k = randint(0, 40)
+            if randint(0, 1) == 0:
+                c.put(k, -k)
+                expected[k] = -k
+                expected.move_to_end(k)
+                if len(expected) > 20:
+                    expected.popitem(last=False)
+            elif c.get(k) is not None:
+                expected.move_to_end(k)
+            self.assertEqual(c.items(), list(expected.items()))
+        self.assertTrue(is_lru_cache(c))
+
+    def test_memoize(self):
+        cache = LRUCache(100)
+        calls = []
+
+        @cache.memoize
+        def fib(n):
+            calls.append(n)
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        self.assertEqual(fib(50), 12586269025)
+        self.assertEqual(len(calls), 51)
+        self.assertEqual(fib(50), 12586269025)
+        self.assertEqual(len(calls), 51)
+        self.assertIs(fib.cache, cache)
+        self.assertEqual(fib.__name__, "fib")
+        self.assertEqual(cache.misses, 51)
+        self.assertEqual(cache.hits, 49)
+
+    def test_memoize_dp_function(self):
+        fib = LRUCache(2).memoize(bottom_up_fibonacci)
+        self.assertEqual(fib(10), 55)
+        self.assertEqual(fib(10, return_seq=True)[-1], 55)
+        self.assertEqual(fib(10), 55)
+        self.assertEqual(fib.cache.hits, 1)
+        self.assertEqual(fib.cache.size, 2)
+
+    def test_memoize_result_too_heavy(self):
+        cache = LRUCache(5, weight=lambda k, v: len(v))
+
+        @cache.memoize
+        def f(n):
+            return "x" * n
+
+        self.assertEqual(f(10), "x" * 10)
+        self.assertEqual(f(3), "xxx")
+        self.assertEqual(cache.size, 1)
+
+    def test_memoize_not_callable(self):
+        self.assertRaises(TypeError, LRUCache().memoize, 3)
+
+    def test_str(self):
+        c = LRUCache()
+        c.put(1, 2)
+        self.assertEqual(str(c), "[(1, 2)]")
+        self.assertEqual(repr(c), "[(1, 2)]")
+
+
+class TestIsLRUCache(unittest.TestCase):
+    def test_not_lru_cache(self):
+        self.assertFalse(is_lru_cache(OrderedDict()))
+
+    def test_wrong_weight(self):
+        c = LRUCache()
+        c.put(1, 1)
+        c._weight = 2  # pylint: disable=protected-access
+        self.assertFalse(is_lru_cache(c))
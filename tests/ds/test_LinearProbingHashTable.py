@@ -9,7 +9,7 @@ Author: Nelson Brochado
 
 Created: 21/02/2016
 
-Updated: 19/02/2017
+Updated: 19/10/2026
 
 # Description
 
@@ -28,6 +28,7 @@ from random import choice, randint, sample, shuffle
 from andz.ds.LinearProbingHashTable import (
     LinearProbingHashTable,
     has_duplicates_ignore_nones,
+    is_hash_table,
 )
 
 
@@ -82,6 +83,13 @@ class TestLinearProbingHashTable(unittest.TestCase):
         self.assertRaises(ValueError, LinearProbingHashTable, 0)
         self.assertRaises(ValueError, LinearProbingHashTable, -1)
 
+    def test_create_max_load_factor_not_number(self):
+        self.assertRaises(TypeError, LinearProbingHashTable, 11, "0.5")
+
+    def test_create_max_load_factor_not_in_0_1(self):
+        self.assertRaises(ValueError, LinearProbingHashTable, 11, 0)
+        self.assertRaises(ValueError, LinearProbingHashTable, 11, 1)
+
     def test_create_set_initial_capacity(self):
         t = LinearProbingHashTable(9)
         self.assertEqual(t.capacity, 9)
@@ -238,3 +246,224 @@ class TestLinearProbingHashTable(unittest.TestCase):
             t.put(elem, choice(string.ascii_letters))
         print()
         t.show()
+
+    def test_len(self):
+        t = LinearProbingHashTable()
+        self.assertEqual(len(t), 0)
+        t.put(1, 2)
+        t.put(1, 3)
+        t.put(2, 3)
+        self.assertEqual(len(t), 2)
+        t.delete(1)
+        self.assertEqual(len(t), 1)
+
+    def test_load_factor_stays_below_max_load_factor(self):
+        t = LinearProbingHashTable(3, 0.5)
+        for i in range(randint(1, 1000)):
+            t.put(i, i)
+            self.assertLessEqual(t.load_factor, 0.5)
+            self.assertEqual(t.load_factor, t.size / t.capacity)
+        self.assertEqual(t.max_load_factor, 0.5)
+
+    def test_shrink(self):
+        t = LinearProbingHashTable(5)
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        for elem in ls:
+            t.put(elem, elem)
+        grown = t.capacity
+        for elem in ls:
+            self.assertEqual(t.delete(elem), elem)
+            self.assertGreaterEqual(t.capacity, 5)
+            if t.size > 0:
+                self.assertGreaterEqual(t.load_factor, 0.7 / 4 / 2)
+        self.assertEqual(t.capacity, 5)
+        self.assertLess(t.capacity, grown)
+
+    def test_delete_keeps_colliding_keys_reachable(self):
+        t = LinearProbingHashTable(11, hash_function=lambda k: 0)
+        # All these keys have the same home slot, so they form one cluster.
+        for k in (0, 11, 22, 33):
+            t.put(k, k)
+        # Deleting the first one must not make the others unreachable.
+        self.assertEqual(t.delete(0), 0)
+        self.assertEqual(t.delete(22), 22)
+        self.assertEqual(t.get(11), 11)
+        self.assertEqual(t.get(33), 33)
+        t.put(33, "thirty-three")
+        self.assertEqual(t.size, 2)
+        self.assertEqual(t.get(33), "thirty-three")
+
+    def test_insert_delete_churn(self):
+        t = LinearProbingHashTable(7, hash_function=lambda k: k % 7)
+        d = {}
+        for _ in range(5000):
+            # Few distinct keys which often collide.
+            k = randint(0, 60) * 7 + randint(0, 2)
+            if randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                t.put(k, -k)
+                d[k] = -k
+            self.assertEqual(t.size, len(d))
+        for k in range(61 * 7):
+            self.assertEqual(t.get(k), d.get(k))
+
+    def test_from_items(self):
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        t = LinearProbingHashTable.from_items([(k, i) for i, k in enumerate(ls)])
+        self.assertEqual(t.size, len(ls))
+        self.assertLessEqual(t.load_factor, t.max_load_factor)
+        for i, k in enumerate(ls):
+            self.assertEqual(t.get(k), i)
+
+    def test_from_items_expected_size(self):
+        self.assertRaises(TypeError, LinearProbingHashTable.from_items, [], 1.5)
+        self.assertRaises(ValueError, LinearProbingHashTable.from_items, [], -1)
+        t = LinearProbingHashTable.from_items(((i, i) for i in range(1000)), 1000)
+        self.assertEqual(t.capacity, int(1000 / 0.7) + 1)
+        self.assertEqual(t.size, 1000)
+
+    def test_put_many_resizes_once(self):
+        t = LinearProbingHashTable()
+        t.put_many([(i, i) for i in range(1000)])
+        self.assertEqual(t.capacity, int(1000 / 0.7) + 1)
+        # Duplicate keys update the values.
+        t.put_many([(i, -i) for i in range(500)])
+        self.assertEqual(t.size, 1000)
+        self.assertEqual(t.get(499), -499)
+        self.assertEqual(t.get(500), 500)
+
+    def test_put_many_key_None(self):
+        t = LinearProbingHashTable()
+        self.assertRaises(TypeError, t.put_many, [(1, 1), (None, 2)])
+        self.assertEqual(t.get(1), 1)
+
+    def test_get_many(self):
+        t = LinearProbingHashTable.from_items([("a", 1), ("b", 2)])
+        self.assertEqual(t.get_many(["b", "c", "a"]), [2, None, 1])
+        self.assertRaises(TypeError, t.get_many, ["a", None])
+        self.assertRaises(TypeError, t.get_many, [[]])
+
+    def test_contains_and_iter(self):
+        t = LinearProbingHashTable.from_items([("a", None), ("b", 2)])
+        self.assertIn("a", t)
+        self.assertNotIn("c", t)
+        self.assertNotIn(None, t)
+        self.assertEqual(sorted(t), ["a", "b"])
+
+    def test_views(self):
+        t = LinearProbingHashTable.from_items([("a", 1), ("b", 2)])
+        keys = t.keys()
+        values = t.values()
+        items = t.items()
+        t.put("c", 3)
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(keys, {"a", "b", "c"})
+        self.assertEqual(sorted(values), [1, 2, 3])
+        self.assertEqual(items, {("a", 1), ("b", 2), ("c", 3)})
+        self.assertIn(("c", 3), items)
+        self.assertNotIn(("c", 4), items)
+        self.assertNotIn(("d", None), items)
+
+    def test_delitem(self):
+        t = LinearProbingHashTable.from_items([("a", 1)])
+        del t["a"]
+        self.assertEqual(t.size, 0)
+        with self.assertRaises(KeyError):
+            del t["a"]
+
+    def test_create_hash_function_not_callable(self):
+        self.assertRaises(TypeError, LinearProbingHashTable, 11, 0.7, 3)
+
+    def test_create_seed_not_int(self):
+        self.assertRaises(TypeError, LinearProbingHashTable, 11, 0.7, None, "1")
+
+    def test_random_seed(self):
+        seeds = {LinearProbingHashTable().seed for _ in range(10)}
+        self.assertGreater(len(seeds), 1)
+
+    def test_same_seed_same_slots(self):
+        t1 = LinearProbingHashTable(seed=42)
+        t2 = LinearProbingHashTable(seed=42)
+        for i in range(100):
+            t1.put(i, i)
+            t2.put(i, i)
+        self.assertEqual(t1.seed, 42)
+        self.assertEqual(str(t1), str(t2))
+
+    def test_custom_hash_function(self):
+        t = LinearProbingHashTable(hash_function=lambda k: k.lower())
+        self.assertRaises(TypeError, t.put, "a", 1)
+        t = LinearProbingHashTable(hash_function=lambda k: hash(k.lower()))
+        t.put("Key", 1)
+        t.put("key", 2)
+        self.assertEqual(t.size, 2)
+        self.assertEqual(t.get_many(["Key", "key", "KEY"]), [1, 2, None])
+
+    def test_multiples_of_capacity_do_not_collide(self):
+        t = LinearProbingHashTable(2003, 0.9, seed=0)
+        for i in range(1000):
+            t.put(i * 2003, i)
+        self.assertEqual(t.capacity, 2003)
+        # pylint: disable=protected-access
+        homes = {t._hash_code(k, t.capacity) for k in t}
+        self.assertGreater(len(homes), 500)
+
+    def test_create_incremental_resize_not_bool(self):
+        self.assertRaises(TypeError, LinearProbingHashTable, incremental_resize="yes")
+
+    def test_incremental_resize_grow(self):
+        t = LinearProbingHashTable(5, incremental_resize=True)
+        resized = False
+        for i in range(500):
+            t.put(i, i)
+            resized = resized or t.resizing
+            self.assertEqual(t.size, i + 1)
+            # The keys not migrated yet are still found in the old buffers.
+            self.assertEqual(t.get(i // 2), i // 2)
+            self.assertIn(i // 3, t)
+        self.assertTrue(resized)
+        self.assertEqual(t.get_many(range(500)), list(range(500)))
+        self.assertEqual(sorted(t), list(range(500)))
+        self.assertTrue(is_hash_table(t))
+
+    def test_incremental_resize_migration_completes(self):
+        t = LinearProbingHashTable(5, incremental_resize=True)
+        for i in range(4):
+            t.put(i, i)
+        self.assertTrue(t.resizing)
+        capacity = t.capacity
+        # Updating keys migrates the old buffers, too.
+        for _ in range(5):
+            t.put(0, "zero")
+        self.assertFalse(t.resizing)
+        self.assertEqual(t.capacity, capacity)
+        self.assertEqual(t.get(0), "zero")
+
+    def test_incremental_resize_shrink(self):
+        t = LinearProbingHashTable(5, incremental_resize=True)
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        t.put_many((elem, elem) for elem in ls)
+        grown = t.capacity
+        for elem in ls:
+            self.assertEqual(t.delete(elem), elem)
+            self.assertIsNone(t.get(elem))
+            self.assertTrue(is_hash_table(t))
+        self.assertEqual(t.size, 0)
+        self.assertLess(t.capacity, grown)
+
+    def test_incremental_resize_colliding_keys(self):
+        t = LinearProbingHashTable(
+            7, hash_function=lambda k: k % 7, incremental_resize=True
+        )
+        d = {}
+        for _ in range(5000):
+            k = randint(0, 60) * 7 + randint(0, 2)
+            if randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                t.put(k, -k)
+                d[k] = -k
+            self.assertEqual(t.get(k), d.get(k))
+        self.assertEqual(dict(t.items()), d)
+        self.assertTrue(is_hash_table(t))
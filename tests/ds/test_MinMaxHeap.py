@@ -8,7 +8,7 @@ Author: Nelson Brochado
 
 Created: 20/02/2016
 
-Updated: 23/03/2024
+Updated: 19/10/2026
 
 # Description
 
@@ -228,3 +228,274 @@ class TestMinMaxHeap(unittest.TestCase):
         self.assertIsNone(a.merge(b))
         self.assertEqual(a.size, size * 2)
         self.assertEqual(b.size, size)
+
+    def test_add_many_when_one_element_is_None(self):
+        h = MinMaxHeap([3, 1])
+        self.assertRaises(ValueError, h.add_many, [5, None])
+        self.assertEqual(h.size, 2)
+
+    def test_add_many_few_elements(self):
+        a = [randint(-100, 100) for _ in range(100)]
+        h = MinMaxHeap(list(a))
+        b = [randint(-100, 100) for _ in range(3)]
+        self.assertIsNone(h.add_many(b))
+        self.assertEqual(h.size, len(a) + len(b))
+        self.assertTrue(is_min_max_heap(h))
+        self.assertEqual(h.find_min(), min(a + b))
+
+    def test_add_many_many_elements(self):
+        a = [randint(-100, 100) for _ in range(10)]
+        h = MinMaxHeap(list(a))
+        b = (randint(-100, 100) for _ in range(100))
+        self.assertIsNone(h.add_many(b))
+        self.assertEqual(h.size, 110)
+        self.assertTrue(is_min_max_heap(h))
+
+    def test_pop_many_invalid_k(self):
+        h = MinMaxHeap([1, 2, 3])
+        self.assertRaises(TypeError, h.pop_many, 1.5)
+        self.assertRaises(ValueError, h.pop_many, -1)
+
+    def test_pop_many(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = MinMaxHeap(list(a))
+        self.assertEqual(h.pop_many(3), sorted(a)[:3])
+        self.assertEqual(h.size, len(a) - 3)
+        self.assertTrue(is_min_max_heap(h))
+
+    def test_pop_many_more_than_size(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = MinMaxHeap(list(a))
+        self.assertEqual(h.pop_many(len(a) + 10), sorted(a))
+        self.assertTrue(h.is_empty())
+
+    def test_pushpop_when_argument_is_None(self):
+        self.assertRaises(ValueError, MinMaxHeap().pushpop, None)
+
+    def test_pushpop_when_empty_heap(self):
+        h = MinMaxHeap()
+        self.assertEqual(h.pushpop(3), 3)
+        self.assertTrue(h.is_empty())
+
+    def test_pushpop_when_x_becomes_root(self):
+        h = MinMaxHeap([5, 7, 9, 11])
+        self.assertEqual(h.pushpop(1), 1)
+        self.assertEqual(h.size, 4)
+
+    def test_pushpop_when_heap_has_random_size(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = MinMaxHeap(list(a))
+        x = randint(-100, 100)
+        self.assertEqual(h.pushpop(x), min(a + [x]))
+        self.assertEqual(h.size, len(a))
+        self.assertTrue(is_min_max_heap(h))
+
+    def test_replace_when_argument_is_None(self):
+        self.assertRaises(ValueError, MinMaxHeap([1]).replace, None)
+
+    def test_replace_when_empty_heap(self):
+        h = MinMaxHeap()
+        self.assertIsNone(h.replace(3))
+        self.assertEqual(h.find_min(), 3)
+
+    def test_replace_when_heap_has_random_size(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = MinMaxHeap(list(a))
+        x = randint(-100, 100)
+        self.assertEqual(h.replace(x), min(a))
+        self.assertEqual(h.size, len(a))
+        self.assertTrue(is_min_max_heap(h))
+
+    def test_pushpop_min_when_heap_has_random_size(self):
+        a = [randint(-100, 100) for _ in range(randint(3, 100))]
+        h = MinMaxHeap(list(a))
+        x = randint(-100, 100)
+        self.assertEqual(h.pushpop_min(x), min(a + [x]))
+        self.assertEqual(h.size, len(a))
+        self.assertTrue(is_min_max_heap(h))
+
+    def test_pushpop_max_when_argument_is_None(self):
+        self.assertRaises(ValueError, MinMaxHeap().pushpop_max, None)
+
+    def test_pushpop_max_when_empty_heap(self):
+        h = MinMaxHeap()
+        self.assertEqual(h.pushpop_max(3), 3)
+        self.assertTrue(h.is_empty())
+
+    def test_pushpop_max_when_x_is_greatest(self):
+        h = MinMaxHeap([5, 7, 9, 11])
+        self.assertEqual(h.pushpop_max(12), 12)
+        self.assertEqual(h.size, 4)
+
+    def test_pushpop_max_when_heap_has_random_size(self):
+        a = [randint(-100, 100) for _ in range(randint(1, 100))]
+        h = MinMaxHeap(list(a))
+        for _ in range(len(a)):
+            x = randint(-100, 100)
+            a.append(x)
+            self.assertEqual(h.pushpop_max(x), max(a))
+            a.remove(max(a))
+            self.assertTrue(is_min_max_heap(h))
+        self.assertEqual(h.find_min(), min(a))
+
+    def test_is_min_max_heap_when_grandchild_violates_order(self):
+        # 11 is a grandchild of 10, which is on a max level, but it's greater
+        # than it, even though each node is ordered w.r.t. its children.
+        h = MinMaxHeap()
+        h.heap = [0, 10, 20, 1, 2, 3, 4, 11]
+        self.assertFalse(is_min_max_heap(h))
+
+    def test_create_key_not_callable(self):
+        self.assertRaises(TypeError, MinMaxHeap, [1, 2], 3)
+
+    def test_key_orders_elements_by_key(self):
+        records = [{"id": i, "priority": randint(-100, 100)} for i in range(100)]
+        h = MinMaxHeap(list(records[:50]), key=lambda r: r["priority"])
+        h.add_many(records[50:60])
+        for r in records[60:]:
+            h.add(r)
+        self.assertEqual(h.key(records[0]), records[0]["priority"])
+        self.assertEqual(h.size, len(records))
+        self.assertTrue(is_min_max_heap(h))
+        self.assertEqual(h.find_min()["priority"], min(r["priority"] for r in records))
+        popped = [r["priority"] for r in h.pop_many(len(records))]
+        self.assertEqual(popped, sorted(popped))
+
+    def test_key_ties_are_broken_by_insertion_order(self):
+        # Dictionaries are not comparable, so comparing them would raise.
+        h = MinMaxHeap(key=lambda r: r["priority"])
+        for i in range(10):
+            h.add({"id": i, "priority": 0})
+        self.assertEqual([r["id"] for r in h.pop_many(10)], list(range(10)))
+
+    def test_key_contains_and_delete(self):
+        h = MinMaxHeap(["ccc", "a", "bb"], key=len)
+        self.assertTrue(h.contains("a"))
+        self.assertFalse(h.contains("dddd"))
+        self.assertIsNone(h.delete("ccc"))
+        self.assertTrue(is_min_max_heap(h))
+        self.assertRaises(LookupError, h.delete, "ccc")
+        self.assertEqual(str(h), str(["a", "bb"]))
+
+    def test_key_pushpop_and_replace(self):
+        h = MinMaxHeap(["ccc", "a", "bb"], key=len)
+        self.assertEqual(h.pushpop("dddd"), "a")
+        self.assertEqual(h.replace("eeeee"), "bb")
+        self.assertTrue(is_min_max_heap(h))
+
+    def test_key_merge(self):
+        a = MinMaxHeap(["ccc", "a"], key=len)
+        b = MinMaxHeap(["bb", "dddd"])
+        self.assertIsNone(a.merge(b))
+        self.assertTrue(is_min_max_heap(a))
+        self.assertEqual(a.pop_many(4), sorted(["a", "bb", "ccc", "dddd"], key=len))
+        self.assertIsNone(b.merge(MinMaxHeap(["zz", "y"], key=len)))
+        self.assertTrue(is_min_max_heap(b))
+        self.assertEqual(b.size, 4)
+
+    def test_create_invalid_compact_fraction(self):
+        self.assertRaises(TypeError, MinMaxHeap, None, None, True, "0.5")
+        self.assertRaises(ValueError, MinMaxHeap, None, None, True, 0)
+        self.assertRaises(ValueError, MinMaxHeap, None, None, True, 1)
+
+    def test_lazy_delete(self):
+        a = [randint(-100, 100) for _ in range(randint(1, 100))]
+        h = MinMaxHeap(list(a), lazy_delete=True, compact_fraction=0.9)
+        self.assertTrue(h.lazy_delete)
+        self.assertRaises(LookupError, h.delete, 1000)
+        deleted = sample(a, randint(0, len(a)))
+        for x in deleted:
+            self.assertTrue(h.contains(x))
+            self.assertIsNone(h.delete(x))
+            a.remove(x)
+            self.assertEqual(h.size, len(a))
+            self.assertTrue(is_min_max_heap(h))
+        self.assertEqual(h.pop_many(len(a)), sorted(a))
+        self.assertTrue(h.is_empty())
+
+    def test_lazy_delete_root(self):
+        h = MinMaxHeap([3, 1, 2, 1], lazy_delete=True)
+        self.assertIsNone(h.delete(1))
+        self.assertEqual(h.find_min(), 1)
+        self.assertIsNone(h.delete(1))
+        self.assertFalse(h.contains(1))
+        self.assertEqual(h.find_min(), 2)
+        self.assertEqual(h.size, 2)
+
+    def test_lazy_delete_compacts(self):
+        h = MinMaxHeap(list(range(10)), lazy_delete=True, compact_fraction=0.25)
+        h.delete(4)
+        h.delete(5)
+        self.assertEqual(len(h.heap), 10)
+        # 3 > 0.25 * 10, so the deleted elements are physically removed.
+        h.delete(6)
+        self.assertEqual(len(h.heap), 7)
+        self.assertEqual(h.size, 7)
+        self.assertTrue(is_min_max_heap(h))
+        self.assertRaises(LookupError, h.delete, 6)
+
+    def test_lazy_delete_pushpop_and_replace(self):
+        h = MinMaxHeap([1, 2, 3], lazy_delete=True)
+        h.delete(1)
+        self.assertEqual(h.pushpop(4), 2)
+        self.assertTrue(h.contains(4))
+        self.assertFalse(h.contains(2))
+        h.delete(4)
+        self.assertEqual(h.replace(0), 3)
+        self.assertEqual(h.size, 1)
+        self.assertTrue(is_min_max_heap(h))
+
+    def test_lazy_delete_merge(self):
+        a = MinMaxHeap([1, 2, 3], lazy_delete=True)
+        b = MinMaxHeap([4, 5, 6], lazy_delete=True)
+        a.delete(2)
+        b.delete(5)
+        self.assertIsNone(a.merge(b))
+        self.assertEqual(a.size, 4)
+        self.assertTrue(is_min_max_heap(a))
+        self.assertTrue(a.contains(6))
+        self.assertFalse(a.contains(5))
+        self.assertEqual(sorted(a.pop_many(4)), [1, 3, 4, 6])
+
+    def test_update_many_when_new_element_is_None(self):
+        h = MinMaxHeap([1, 2, 3])
+        self.assertRaises(ValueError, h.update_many, [(1, None)])
+
+    def test_update_many_when_old_element_not_found(self):
+        h = MinMaxHeap([1, 2, 3])
+        self.assertRaises(LookupError, h.update_many, [(1, 4), (1, 5)])
+        self.assertEqual(sorted(h.pop_many(3)), [1, 2, 3])
+
+    def test_update_many_chained(self):
+        h = MinMaxHeap([1, 2, 3])
+        # 7 is not in the heap, but it's added by the first pair.
+        h.update_many([(1, 7), (7, 8)])
+        self.assertTrue(is_min_max_heap(h))
+        self.assertEqual(sorted(h.pop_many(3)), [2, 3, 8])
+
+    def test_update_many_strategies(self):
+        a = [randint(-100, 100) for _ in range(200)]
+        for k, factor, strategy in [
+            (5, 1.0, "sift"),
+            (60, 1.0, "rebuild"),
+            (60, 0.1, "sift"),
+        ]:
+            h = MinMaxHeap(list(a))
+            olds = sample(a, k)
+            pairs = [(old, randint(-100, 100)) for old in olds]
+            self.assertEqual(h.update_many(pairs, factor), strategy)
+            self.assertTrue(is_min_max_heap(h))
+            expected = list(a)
+            for old, new in pairs:
+                expected.remove(old)
+                expected.append(new)
+            self.assertEqual(h.pop_many(len(a)), sorted(expected))
+
+    def test_update_many_lazy_delete(self):
+        h = MinMaxHeap([1, 2, 3, 4], lazy_delete=True)
+        h.delete(2)
+        self.assertRaises(LookupError, h.update_many, [(2, 5)])
+        h.update_many([(3, 2)])
+        self.assertTrue(h.contains(2))
+        self.assertFalse(h.contains(3))
+        self.assertEqual(sorted(h.pop_many(3)), [1, 2, 4])
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.MmapHashTable module.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from random import Random
+
+from andz.ds.MmapHashTable import MmapHashTable, is_mmap_hash_table, main
+
+
+class TestMmapHashTable(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "table.db")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def build(self, n=100, **kwargs):
+        pairs = [(b"key-%d" % i, b"value-%d" % i) for i in range(n)]
+        return MmapHashTable.build(self.path, pairs, 16, 16, **kwargs)
+
+    def test_build_invalid_arguments(self):
+        build = MmapHashTable.build
+        self.assertRaises(TypeError, build, self.path, [], 1.5, 8)
+        self.assertRaises(ValueError, build, self.path, [], 8, -1)
+        self.assertRaises(TypeError, build, self.path, [], 8, 8, None, "0.5")
+        self.assertRaises(ValueError, build, self.path, [], 8, 8, None, 1)
+        self.assertRaises(TypeError, build, self.path, [], 8, 8, None, 0.5, "1")
+        self.assertRaises(TypeError, build, self.path, [], 8, 8, 1.5)
+        self.assertRaises(ValueError, build, self.path, [], 8, 8, -1)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_build_invalid_pair(self):
+        self.assertRaises(
+            ValueError, MmapHashTable.build, self.path, [(b"x" * 9, b"")], 8, 8
+        )
+        self.assertRaises(TypeError, MmapHashTable.build, self.path, [("x", b"")], 8, 8)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_build_and_get(self):
+        with self.build(1000) as t:
+            self.assertFalse(t.writable)
+            self.assertEqual(t.size, 1000)
+            self.assertEqual(len(t), 1000)
+            self.assertEqual(t.key_size, 16)
+            self.assertEqual(t.value_size, 16)
+            self.assertEqual(t.capacity, int(1000 / 0.7) + 1)
+            self.assertLessEqual(t.load_factor, t.max_load_factor)
+            for i in range(1000):
+                self.assertEqual(t[b"key-%d" % i], b"value-%d" % i)
+            self.assertIsNone(t.get(b"key-1000"))
+            self.assertIn(b"key-0", t)
+            self.assertNotIn(b"key-1000", t)
+            self.assertNotIn("key-0", t)
+            self.assertNotIn(b"x" * 17, t)
+            self.assertTrue(is_mmap_hash_table(t))
+
+    def test_get_zero_copy(self):
+        t = self.build()
+        v = t.get(b"key-7")
+        self.assertIsInstance(v, memoryview)
+        self.assertTrue(v.readonly)
+        self.assertEqual(v, b"value-7")
+        self.assertEqual(bytes(v), b"value-7")
+        # The table can be closed while the value is still referenced.
+        t.close()
+        self.assertEqual(v.tobytes(), b"value-7")
+        del v
+        with MmapHashTable(self.path, writable=True) as t:
+            v = t.get(b"key-7")
+            self.assertIsInstance(v, bytes)
+            t.delete(b"key-7")
+            self.assertEqual(v, b"value-7")
+
+    def test_build_from_generator(self):
+        pairs = ((b"%d" % i, b"%d" % -i) for i in range(100))
+        with MmapHashTable.build(self.path, pairs, 8, 8) as t:
+            self.assertEqual(t.size, 100)
+            self.assertEqual(t.get(b"42"), b"-42")
+
+    def test_build_expected_size_too_small(self):
+        pairs = ((b"%d" % i, b"%d" % i) for i in range(100))
+        with MmapHashTable.build(self.path, pairs, 8, 8, expected_size=10) as t:
+            self.assertEqual(t.size, 100)
+            self.assertGreater(t.capacity, 100)
+            self.assertTrue(is_mmap_hash_table(t))
+
+    def test_duplicates_and_empty_bytes(self):
+        pairs = [(b"", b"a"), (b"a", b""), (b"", b"b"), (b"\0", b"\0\0")]
+        with MmapHashTable.build(self.path, pairs, 4, 4) as t:
+            self.assertEqual(t.size, 3)
+            self.assertEqual(t.get(b""), b"b")
+            self.assertEqual(t.get(b"a"), b"")
+            self.assertEqual(t.get(b"\0"), b"\0\0")
+            self.assertIsNone(t.get(b"\0\0"))
+
+    def test_read_only(self):
+        with self.build() as t:
+            self.assertRaises(OSError, t.put, b"a", b"b")
+            self.assertRaises(OSError, t.delete, b"key-1")
+            self.assertRaises(TypeError, t.get, "key-1")
+            self.assertRaises(ValueError, t.get, b"x" * 17)
+
+    def test_reopen(self):
+        self.build().close()
+        with MmapHashTable(self.path) as t:
+            self.assertEqual(
+                dict(t.items()), {b"key-%d" % i: b"value-%d" % i for i in range(100)}
+            )
+
+    def test_not_an_mmap_hash_table_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"x" * 100)
+        self.assertRaises(ValueError, MmapHashTable, self.path)
+        self.build().close()
+        with open(self.path, "r+b") as f:
+            f.truncate(100)
+        self.assertRaises(ValueError, MmapHashTable, self.path)
+
+    def test_from_items(self):
+        pairs = [(b"key-%d" % i, b"value-%d" % i) for i in range(100)]
+        t = MmapHashTable.from_items(pairs)
+        path = t._path
+        self.assertTrue(t.writable)
+        self.assertEqual(t.key_size, 6)
+        self.assertEqual(t.value_size, 8)
+        self.assertEqual(sorted(t.items()), sorted(pairs))
+        t.put(b"key", b"value")
+        self.assertEqual(t.get(b"key"), b"value")
+        self.assertTrue(is_mmap_hash_table(t))
+        t.close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_from_items_with_path(self):
+        with MmapHashTable.from_items(
+            [(b"a", b"b")], path=self.path, key_size=4, value_size=4
+        ) as t:
+            self.assertEqual(t.key_size, 4)
+            self.assertEqual(t.get(b"a"), b"b")
+        with MmapHashTable(self.path) as t:
+            self.assertEqual(t.get(b"a"), b"b")
+
+    def test_from_items_empty(self):
+        with MmapHashTable.from_items([]) as t:
+            self.assertEqual(t.size, 0)
+            self.assertIsNone(t.get(b""))
+
+    def test_from_items_invalid_pair(self):
+        self.assertRaises(TypeError, MmapHashTable.from_items, [("a", b"b")])
+
+    def test_writable(self):
+        self.build(0).close()
+        rng = Random(0)
+        d = {}
+        with MmapHashTable(self.path, writable=True) as t:
+            self.assertTrue(t.writable)
+            self.assertRaises(TypeError, t.put, b"a", "b")
+            self.assertRaises(ValueError, t.put, b"a", b"x" * 17)
+            for _ in range(3000):
+                k = b"%d" % rng.randint(0, 300)
+                if rng.randint(0, 2) == 0:
+                    self.assertEqual(t.delete(k), d.pop(k, None))
+                else:
+                    v = bytes(rng.randint(0, 255) for _ in range(rng.randint(0, 16)))
+                    t[k] = v
+                    d[k] = v
+                self.assertEqual(t.size, len(d))
+            self.assertTrue(is_mmap_hash_table(t))
+            del t[next(iter(d))]
+            d.pop(next(iter(d)))
+        with MmapHashTable(self.path) as t:
+            self.assertEqual(dict(t.items()), d)
+            self.assertEqual(sorted(t.keys()), sorted(d))
+            self.assertEqual(t.get_many(list(d)), list(d.values()))
+
+    def test_str(self):
+        with self.build(3) as t:
+            self.assertEqual(str(t), f"MmapHashTable(path: {self.path}, size: 3)")
+
+    def test_main(self):
+        tsv = os.path.join(self.dir.name, "pairs.tsv")
+        with open(tsv, "w", encoding="utf-8") as f:
+            f.write("a\t1\nb\t2\tx\nc\t\n")
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main([self.path, tsv, "--key-size", "4", "--value-size", "8"])
+        self.assertIn("Built 3 pairs", out.getvalue())
+        with MmapHashTable(self.path) as t:
+            self.assertEqual(dict(t.items()), {b"a": b"1", b"b": b"2\tx", b"c": b""})
+
+
+class TestIsMmapHashTable(unittest.TestCase):
+    def test_not_mmap_hash_table(self):
+        self.assertFalse(is_mmap_hash_table({}))
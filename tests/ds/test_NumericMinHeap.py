@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.NumericMinHeap module.
+"""
+
+import unittest
+from random import randint, random
+
+import numpy as np
+
+from andz.ds.NumericMinHeap import NumericMinHeap, is_numeric_min_heap
+
+
+class TestNumericMinHeap(unittest.TestCase):
+    def test_create_empty(self):
+        h = NumericMinHeap()
+        self.assertTrue(h.is_empty())
+        self.assertEqual(h.size, 0)
+        self.assertFalse(h.with_ids)
+        self.assertIsNone(h.find_min())
+        self.assertIsNone(h.remove_min())
+        self.assertTrue(is_numeric_min_heap(h))
+
+    def test_create_from_array(self):
+        a = np.random.default_rng(0).random(randint(1, 1000))
+        h = NumericMinHeap(a)
+        self.assertEqual(h.size, len(a))
+        self.assertTrue(is_numeric_min_heap(h))
+        self.assertEqual(h.find_min(), a.min())
+
+    def test_create_with_ids(self):
+        h = NumericMinHeap([3.0, 1.0, 2.0], [30, 10, 20])
+        self.assertTrue(h.with_ids)
+        self.assertEqual(h.remove_min(), (1.0, 10))
+        self.assertEqual(h.remove_min(), (2.0, 20))
+        self.assertEqual(h.remove_min(), (3.0, 30))
+
+    def test_nbytes(self):
+        h = NumericMinHeap(np.arange(1024, dtype=np.float64), np.arange(1024))
+        self.assertEqual(h.nbytes, 16 * h.capacity)
+
+    def test_add_none(self):
+        self.assertRaises(ValueError, NumericMinHeap().add, None)
+
+    def test_add_nan(self):
+        self.assertRaises(ValueError, NumericMinHeap().add, float("nan"))
+        self.assertRaises(ValueError, NumericMinHeap().add_many, [1.0, np.nan])
+
+    def test_add_id_mismatch(self):
+        self.assertRaises(TypeError, NumericMinHeap().add, 1.0, 1)
+        self.assertRaises(TypeError, NumericMinHeap(with_ids=True).add, 1.0)
+        self.assertRaises(TypeError, NumericMinHeap().add_many, [1.0], [1])
+        self.assertRaises(TypeError, NumericMinHeap(with_ids=True).add_many, [1.0])
+        self.assertRaises(
+            ValueError, NumericMinHeap(with_ids=True).add_many, [1.0, 2.0], [1]
+        )
+
+    def test_add(self):
+        h = NumericMinHeap()
+        ls = [random() for _ in range(randint(1, 500))]
+        for x in ls:
+            h.add(x)
+            self.assertTrue(is_numeric_min_heap(h))
+        self.assertEqual(h.size, len(ls))
+        self.assertEqual(h.find_min(), min(ls))
+
+    def test_add_many(self):
+        h = NumericMinHeap()
+        ls = []
+        for k in (1, 2, 100, 3, 1000, 1):
+            a = [random() for _ in range(k)]
+            ls.extend(a)
+            h.add_many(a)
+            self.assertTrue(is_numeric_min_heap(h))
+        self.assertEqual(h.pop_many(h.size).tolist(), sorted(ls))
+
+    def test_remove_min(self):
+        ls = [randint(-100, 100) for _ in range(randint(1, 500))]
+        h = NumericMinHeap(ls)
+        for x in sorted(ls):
+            self.assertEqual(h.remove_min(), x)
+            self.assertTrue(is_numeric_min_heap(h))
+        self.assertTrue(h.is_empty())
+
+    def test_pop_many_k_not_int(self):
+        self.assertRaises(TypeError, NumericMinHeap().pop_many, 1.5)
+
+    def test_pop_many_k_negative(self):
+        self.assertRaises(ValueError, NumericMinHeap().pop_many, -1)
+
+    def test_pop_many(self):
+        ls = [randint(-1000, 1000) for _ in range(2000)]
+        h = NumericMinHeap(ls)
+        s = sorted(ls)
+        # Both the sequential (small k) and the vectorized algorithms are used.
+        for k in (0, 1, 5, 500, 1, 3000):
+            popped = h.pop_many(k)
+            self.assertEqual(popped.tolist(), s[:k])
+            s = s[k:]
+            self.assertEqual(h.size, len(s))
+            self.assertTrue(is_numeric_min_heap(h))
+        self.assertTrue(h.is_empty())
+
+    def test_pop_many_with_ids(self):
+        keys = np.random.default_rng(1).permutation(1000).astype(np.float64)
+        h = NumericMinHeap(keys, keys.astype(np.int64) * 10)
+        for k in (3, 400):
+            popped_keys, popped_ids = h.pop_many(k)
+            self.assertTrue(np.all(popped_ids == popped_keys * 10))
+            self.assertTrue(np.all(np.diff(popped_keys) >= 0))
+        while not h.is_empty():
+            key, key_id = h.remove_min()
+            self.assertEqual(key_id, key * 10)
+
+    def test_contains_and_delete(self):
+        ls = [randint(-100, 100) for _ in range(randint(1, 300))]
+        h = NumericMinHeap(ls)
+        self.assertFalse(h.contains(1000))
+        self.assertRaises(LookupError, h.delete, 1000)
+        for x in list(ls):
+            self.assertTrue(h.contains(x))
+            h.delete(x)
+            ls.remove(x)
+            self.assertTrue(is_numeric_min_heap(h))
+            self.assertEqual(h.size, len(ls))
+        self.assertTrue(h.is_empty())
+
+    def test_merge(self):
+        a = [random() for _ in range(randint(0, 300))]
+        b = [random() for _ in range(randint(0, 300))]
+        h = NumericMinHeap(a)
+        h.merge(NumericMinHeap(b))
+        self.assertTrue(is_numeric_min_heap(h))
+        self.assertEqual(h.pop_many(h.size).tolist(), sorted(a + b))
+
+    def test_merge_invalid(self):
+        h = NumericMinHeap()
+        self.assertRaises(TypeError, h.merge, [1.0])
+        self.assertRaises(ValueError, h.merge, NumericMinHeap(with_ids=True))
+
+    def test_clear(self):
+        h = NumericMinHeap([3, 2, 1])
+        h.clear()
+        self.assertTrue(h.is_empty())
+        self.assertIsNone(h.find_min())
+
+
+class TestIsNumericMinHeap(unittest.TestCase):
+    def test_not_numeric_min_heap(self):
+        self.assertFalse(is_numeric_min_heap([1.0, 2.0]))
+
+    def test_invalid(self):
+        h = NumericMinHeap([1, 2, 3])
+        h._keys[0] = 10  # pylint: disable=protected-access
+        self.assertFalse(is_numeric_min_heap(h))
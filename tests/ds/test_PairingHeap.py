@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.PairingHeap module.
+"""
+
+import unittest
+
+from andz.ds.PairingHeap import PairingHeap, is_pairing_heap
+from tests.ds.mergeable_heap_tests import MergeableHeapTests
+
+
+def children(node) -> list:
+    """Returns the keys of the children of node, from left to right."""
+    keys = []
+    child = node.child
+    while child is not None:
+        keys.append(child.key)
+        child = child.next
+    return keys
+
+
+class TestPairingHeap(unittest.TestCase, MergeableHeapTests):
+    def __init__(self, method_name="__init__"):
+        unittest.TestCase.__init__(self, method_name)
+        MergeableHeapTests.__init__(self, PairingHeap, is_pairing_heap)
+
+    def test_add_melds_with_root(self):
+        h = PairingHeap(range(1, 10))
+        # Each added element becomes the leftmost child of the root.
+        self.assertEqual(children(h._root), [9, 8, 7, 6, 5, 4, 3, 2])
+
+    def test_remove_min_two_pass(self):
+        h = PairingHeap(range(1, 10))
+        h.remove_min()
+        # The first pass melds (9, 8), (7, 6), (5, 4) and (3, 2), and the
+        # second one melds the results from right to left.
+        self.assertEqual(h._root.key, 2)
+        self.assertEqual(children(h._root), [8, 6, 4, 3])
+        self.assertTrue(is_pairing_heap(h))
+
+    def test_decrease_key_cuts_sub_tree(self):
+        h = PairingHeap()
+        handles = [h.add(x) for x in range(1, 10)]
+        h.remove_min()
+        handle = handles[7]  # The child 8 of the root 2, whose child is 9.
+        h.decrease_key(handle, 0)
+        self.assertIs(h._root, handle)
+        self.assertEqual(children(handle), [2, 9])
+        self.assertEqual(children(handle.child), [6, 4, 3])
+        self.assertTrue(is_pairing_heap(h))
+
+    def test_decrease_key_of_root(self):
+        h = PairingHeap([3, 5])
+        handle = h._root
+        h.decrease_key(handle, 1)
+        self.assertIs(h._root, handle)
+        self.assertEqual(children(handle), [5])
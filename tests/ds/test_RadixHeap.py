@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.RadixHeap module.
+"""
+
+import unittest
+from random import randint
+
+from andz.ds.RadixHeap import RadixHeap, is_radix_heap
+
+
+class TestRadixHeap(unittest.TestCase):
+    def test_create_empty(self):
+        h = RadixHeap()
+        self.assertTrue(h.is_empty())
+        self.assertEqual(h.size, 0)
+        self.assertEqual(h.last, 0)
+        self.assertIsNone(h.find_min())
+        self.assertIsNone(h.remove_min())
+        self.assertTrue(is_radix_heap(h))
+
+    def test_create_key_not_callable(self):
+        self.assertRaises(TypeError, RadixHeap, None, 3)
+
+    def test_add_none(self):
+        self.assertRaises(ValueError, RadixHeap().add, None)
+
+    def test_add_not_int(self):
+        self.assertRaises(TypeError, RadixHeap().add, 3.5)
+        self.assertRaises(TypeError, RadixHeap().add, "a")
+
+    def test_add_negative(self):
+        self.assertRaises(ValueError, RadixHeap().add, -1)
+
+    def test_add_smaller_than_last(self):
+        h = RadixHeap([5, 10])
+        self.assertEqual(h.remove_min(), 5)
+        self.assertEqual(h.last, 5)
+        self.assertRaises(ValueError, h.add, 4)
+        h.add(5)
+        self.assertEqual(h.remove_min(), 5)
+
+    def test_find_min_does_not_change_last(self):
+        h = RadixHeap()
+        h.add(10)
+        self.assertEqual(h.find_min(), 10)
+        self.assertEqual(h.last, 0)
+        h.add(5)
+        self.assertTrue(is_radix_heap(h))
+        self.assertEqual(h.find_min(), 5)
+        self.assertEqual(h.remove_min(), 5)
+        self.assertEqual(h.remove_min(), 10)
+
+    def test_find_min_with_key(self):
+        h = RadixHeap([(12, "a"), (9, "b"), (14, "c")], key=lambda x: x[0])
+        self.assertEqual(h.find_min(), (9, "b"))
+        h.add((3, "d"))
+        self.assertEqual(h.find_min(), (3, "d"))
+        self.assertEqual(h.remove_min(), (3, "d"))
+        self.assertEqual(h.last, 3)
+
+    def test_find_min_is_cached(self):
+        calls = []
+
+        def key(e):
+            calls.append(e)
+            return e[0]
+
+        h = RadixHeap([(i, str(i)) for i in range(1, 100)], key=key)
+        h.find_min()
+        calls.clear()
+        for _ in range(10):
+            self.assertEqual(h.find_min(), (1, "1"))
+        h.add((0, "0"))
+        self.assertEqual(h.find_min(), (0, "0"))
+        # Only the key of the added element is computed.
+        self.assertEqual(calls, [(0, "0")])
+
+    def test_find_min_returns_next_removed_element(self):
+        h = RadixHeap(key=lambda e: e[0])
+        c = 0
+        for _ in range(2000):
+            if h.is_empty() or randint(0, 2) > 0:
+                h.add((h.last + randint(0, 20), c))
+                c += 1
+            else:
+                m = h.find_min()
+                self.assertIs(h.remove_min(), m)
+            self.assertTrue(is_radix_heap(h))
+
+    def test_remove_min(self):
+        ls = [randint(0, 10**6) for _ in range(randint(1, 500))]
+        h = RadixHeap(ls)
+        self.assertEqual(h.size, len(ls))
+        self.assertTrue(is_radix_heap(h))
+        for x in sorted(ls):
+            self.assertEqual(h.find_min(), x)
+            self.assertEqual(h.remove_min(), x)
+            self.assertTrue(is_radix_heap(h))
+        self.assertTrue(h.is_empty())
+
+    def test_monotone_workload(self):
+        h = RadixHeap([0])
+        expected = [0]
+        removed = []
+        for _ in range(2000):
+            m = h.remove_min()
+            removed.append(m)
+            expected.remove(m)
+            for _ in range(randint(0, 2)):
+                x = m + randint(0, 1000)
+                h.add(x)
+                expected.append(x)
+            self.assertTrue(is_radix_heap(h))
+            if h.is_empty():
+                h.add(m)
+                expected.append(m)
+        self.assertEqual(removed, sorted(removed))
+        self.assertEqual(h.size, len(expected))
+
+    def test_key(self):
+        ls = [(randint(0, 1000), str(i)) for i in range(100)]
+        h = RadixHeap(ls, key=lambda e: e[0])
+        self.assertTrue(is_radix_heap(h))
+        result = [h.remove_min() for _ in range(len(ls))]
+        self.assertEqual([e[0] for e in result], sorted(e[0] for e in ls))
+        self.assertEqual(sorted(result), sorted(ls))
+
+    def test_clear(self):
+        h = RadixHeap([3, 7])
+        h.remove_min()
+        h.clear()
+        self.assertTrue(h.is_empty())
+        self.assertEqual(h.last, 3)
+        self.assertRaises(ValueError, h.add, 2)
+
+
+class TestIsRadixHeap(unittest.TestCase):
+    def test_not_radix_heap(self):
+        self.assertFalse(is_radix_heap([1, 2]))
+
+    def test_wrong_cached_min(self):
+        h = RadixHeap([1, 2, 3])
+        self.assertEqual(h.find_min(), 1)
+        h._min = h._min_key = 2  # pylint: disable=protected-access
+        self.assertFalse(is_radix_heap(h))
+
+    def test_wrong_bucket(self):
+        h = RadixHeap([1, 2, 3])
+        h._buckets[0].append(4)  # pylint: disable=protected-access
+        self.assertFalse(is_radix_heap(h))
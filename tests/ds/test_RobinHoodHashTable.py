@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.RobinHoodHashTable
+module.
+"""
+
+import string
+import unittest
+from random import randint, sample, shuffle
+
+from andz.ds.RobinHoodHashTable import RobinHoodHashTable, is_robin_hood_hash_table
+
+
+def gen_rand_list_of_distinct_ascii_and_numbers() -> list:
+    n = randint(1, 1000)
+    ls = list(string.ascii_lowercase) + sample(range(n), n)
+    shuffle(ls)
+    return ls
+
+
+class TestRobinHoodHashTable(unittest.TestCase):
+    def test_create_capacity_not_int(self):
+        self.assertRaises(TypeError, RobinHoodHashTable, 3.14)
+
+    def test_create_capacity_less_than_1(self):
+        self.assertRaises(ValueError, RobinHoodHashTable, 0)
+
+    def test_create_max_load_factor_not_in_0_1(self):
+        self.assertRaises(ValueError, RobinHoodHashTable, 11, 1)
+
+    def test_create(self):
+        t = RobinHoodHashTable(9)
+        self.assertEqual(t.capacity, 9)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.max_load_factor, 0.9)
+        self.assertTrue(is_robin_hood_hash_table(t))
+
+    def test_key_None(self):
+        t = RobinHoodHashTable()
+        self.assertRaises(TypeError, t.put, None, 5)
+        self.assertRaises(TypeError, t.get, None)
+        self.assertRaises(TypeError, t.delete, None)
+
+    def test_non_hashable_type(self):
+        t = RobinHoodHashTable()
+        self.assertRaises(TypeError, t.put, [], 12)
+        self.assertRaises(TypeError, t.get, {})
+        self.assertRaises(TypeError, t.delete, [])
+
+    def test_get_empty_table(self):
+        self.assertIsNone(RobinHoodHashTable().get(3))
+
+    def test_put_and_get_all(self):
+        t = RobinHoodHashTable()
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        for v, k in enumerate(ls):
+            t[k] = v
+        self.assertEqual(t.size, len(ls))
+        self.assertEqual(len(t), len(ls))
+        self.assertLessEqual(t.load_factor, 0.9)
+        self.assertTrue(is_robin_hood_hash_table(t))
+        for v, k in enumerate(ls):
+            self.assertEqual(t[k], v)
+        self.assertIsNone(t.get("not a key"))
+
+    def test_put_same_key_multiple_times(self):
+        t = RobinHoodHashTable()
+        t.put(3, "three")
+        t.put(5, 6)
+        t.put(3, 3)
+        self.assertEqual(t.size, 2)
+        self.assertEqual(t.get(3), 3)
+
+    def test_colliding_keys(self):
+        t = RobinHoodHashTable(11, hash_function=lambda k: k % 11)
+        # 0, 11, 22 and 33 have the same home slot, as 1 and 12.
+        for k in (0, 11, 1, 22, 12, 33):
+            t.put(k, -k)
+        self.assertTrue(is_robin_hood_hash_table(t))
+        self.assertEqual(t.delete(11), -11)
+        self.assertTrue(is_robin_hood_hash_table(t))
+        for k in (0, 1, 22, 12, 33):
+            self.assertEqual(t.get(k), -k)
+        self.assertIsNone(t.get(11))
+        self.assertIsNone(t.get(44))
+
+    def test_delete_key_not_present(self):
+        t = RobinHoodHashTable()
+        t.put(-10, "ten")
+        self.assertIsNone(t.delete(7))
+        self.assertEqual(t.size, 1)
+
+    def test_delete_all(self):
+        t = RobinHoodHashTable(5)
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        for elem in ls:
+            t.put(elem, elem)
+        for key in ls:
+            self.assertEqual(t.delete(key), key)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.capacity, 5)
+
+    def test_insert_delete_churn(self):
+        t = RobinHoodHashTable(7)
+        d = {}
+        for _ in range(5000):
+            k = randint(0, 60) * 7 + randint(0, 2)
+            if randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                t.put(k, -k)
+                d[k] = -k
+            self.assertEqual(t.size, len(d))
+        self.assertTrue(is_robin_hood_hash_table(t))
+        for k in range(61 * 7):
+            self.assertEqual(t.get(k), d.get(k))
+
+    def test_bulk_operations_and_views(self):
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        t = RobinHoodHashTable.from_items([(k, i) for i, k in enumerate(ls)])
+        self.assertTrue(is_robin_hood_hash_table(t))
+        t.put_many([(k, -i) for i, k in enumerate(ls[::2])])
+        self.assertEqual(t.size, len(ls))
+        expected = [-(i // 2) if i % 2 == 0 else i for i in range(len(ls))]
+        self.assertEqual(t.get_many(ls), expected)
+        self.assertEqual(t.get_many(["not a key"]), [None])
+        self.assertEqual(set(t), set(ls))
+        self.assertEqual(t.items(), set(zip(ls, expected)))
+        self.assertEqual(sorted(t.values()), sorted(expected))
+        self.assertIn(ls[0], t)
+        self.assertNotIn("not a key", t)
+        del t[ls[0]]
+        self.assertNotIn(ls[0], t.keys())
+        self.assertRaises(KeyError, t.__delitem__, ls[0])
+        self.assertTrue(is_robin_hood_hash_table(t))
+
+
+class TestIsRobinHoodHashTable(unittest.TestCase):
+    def test_not_robin_hood_hash_table(self):
+        self.assertFalse(is_robin_hood_hash_table({}))
+
+    def test_wrong_probe_distance(self):
+        t = RobinHoodHashTable(11)
+        t.put(0, 0)
+        i = t._keys.index(0)  # pylint: disable=protected-access
+        t._dists[i] = 1  # pylint: disable=protected-access
+        self.assertFalse(is_robin_hood_hash_table(t))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.ShardedHashTable
+module.
+"""
+
+import threading
+import unittest
+from random import Random
+
+from andz.ds.LinearProbingHashTable import is_hash_table
+from andz.ds.ShardedHashTable import ShardedHashTable
+
+
+class TestShardedHashTable(unittest.TestCase):
+    def test_create_invalid_arguments(self):
+        self.assertRaises(TypeError, ShardedHashTable, 4.0)
+        self.assertRaises(ValueError, ShardedHashTable, 0)
+        self.assertRaises(ValueError, ShardedHashTable, 6)
+        self.assertRaises(TypeError, ShardedHashTable, 4, 11, 0.7, "1")
+        self.assertRaises(ValueError, ShardedHashTable, 4, 0)
+
+    def test_create(self):
+        t = ShardedHashTable(8)
+        self.assertEqual(t.shards, 8)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(len(t), 0)
+
+    def test_key_None(self):
+        t = ShardedHashTable()
+        self.assertRaises(TypeError, t.put, None, 1)
+        self.assertRaises(TypeError, t.get, None)
+        self.assertRaises(TypeError, t.delete, None)
+        self.assertNotIn(None, t)
+
+    def test_non_hashable_type(self):
+        t = ShardedHashTable()
+        self.assertRaises(TypeError, t.put, [], 1)
+        self.assertRaises(TypeError, t.get, {})
+
+    def test_put_get_delete(self):
+        t = ShardedHashTable(4)
+        d = {}
+        rng = Random(0)
+        for _ in range(3000):
+            k = rng.randint(0, 300)
+            if rng.randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                t[k] = -k
+                d[k] = -k
+            self.assertEqual(t.size, len(d))
+        for k in range(301):
+            self.assertEqual(t[k], d.get(k))
+            self.assertEqual(k in t, k in d)
+        self.assertEqual(dict(t.items()), d)
+
+    def test_one_shard(self):
+        t = ShardedHashTable(1)
+        for i in range(100):
+            t.put(i, i)
+        self.assertEqual(sorted(t), list(range(100)))
+
+    def test_shards_are_balanced(self):
+        t = ShardedHashTable(8, seed=0)
+        for i in range(8000):
+            t.put(i * 1024, i)
+        # pylint: disable=protected-access
+        for table in t._tables:
+            self.assertTrue(is_hash_table(table))
+            self.assertGreater(table.size, 800)
+            self.assertLess(table.size, 1200)
+
+    def test_bulk_operations(self):
+        t = ShardedHashTable.from_items([(i, str(i)) for i in range(1000)])
+        self.assertEqual(t.size, 1000)
+        t.put_many([(i, -i) for i in range(500, 1500)])
+        self.assertEqual(t.size, 1500)
+        self.assertEqual(t.get_many([0, 500, 1499, 1500]), ["0", -500, -1499, None])
+        self.assertRaises(TypeError, t.put_many, [(2000, 1), (None, 2)])
+        self.assertNotIn(2000, t)
+        del t[0]
+        self.assertRaises(KeyError, t.__delitem__, 0)
+        self.assertEqual(len(t.keys()), 1499)
+
+    def test_concurrent_threads(self):
+        t = ShardedHashTable(4)
+        errors = []
+
+        def work(thread_id):
+            try:
+                keys = [(thread_id, i) for i in range(500)]
+                for k in keys:
+                    t.put(k, k[1])
+                for k in keys[::2]:
+                    t.delete(k)
+                for k in keys:
+                    expected = None if k[1] % 2 == 0 else k[1]
+                    if t.get(k) != expected:
+                        errors.append(k)
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(t.size, 8 * 250)
+
+    def test_str(self):
+        t = ShardedHashTable()
+        t.put("a", 1)
+        self.assertEqual(str(t), "[('a', 1)]")
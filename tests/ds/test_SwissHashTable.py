@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.SwissHashTable module.
+"""
+
+import string
+import unittest
+from random import randint, sample, shuffle
+
+from andz.ds.SwissHashTable import SwissHashTable, is_swiss_hash_table
+
+
+def gen_rand_list_of_distinct_ascii_and_numbers() -> list:
+    n = randint(1, 1000)
+    ls = list(string.ascii_lowercase) + sample(range(n), n)
+    shuffle(ls)
+    return ls
+
+
+class CollidingKey:
+    """Key whose hash code is the same for all instances."""
+
+    def __init__(self, x):
+        self.x = x
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and self.x == other.x
+
+
+class TestSwissHashTable(unittest.TestCase):
+    def test_create_capacity_not_int(self):
+        self.assertRaises(TypeError, SwissHashTable, 3.14)
+
+    def test_create_capacity_less_than_1(self):
+        self.assertRaises(ValueError, SwissHashTable, 0)
+
+    def test_create_max_load_factor_not_in_0_1(self):
+        self.assertRaises(TypeError, SwissHashTable, 16, "0.5")
+        self.assertRaises(ValueError, SwissHashTable, 16, 1)
+
+    def test_create_seed_not_int(self):
+        self.assertRaises(TypeError, SwissHashTable, 16, 0.875, "1")
+
+    def test_same_seed_same_layout(self):
+        t1 = SwissHashTable(seed=42)
+        t2 = SwissHashTable(seed=42)
+        for i in range(100):
+            t1.put(i, i)
+            t2.put(i, i)
+        self.assertEqual(t1.seed, 42)
+        self.assertEqual(t1._keys, t2._keys)  # pylint: disable=protected-access
+
+    def test_sequential_and_strided_int_keys(self):
+        # The hash code of an int is the int itself, so, without mixing, these
+        # keys would start from the same few groups and (for the strides which
+        # are multiples of 128) have the same fingerprint.
+        for stride in (1, 128, 1024):
+            t = SwissHashTable()
+            keys = range(0, 4096 * stride, stride)
+            t.put_many((k, k) for k in keys)
+            self.assertTrue(is_swiss_hash_table(t))
+            self.assertEqual(t.get_many(keys), list(keys))
+            # pylint: disable=protected-access
+            groups = {t._split_hash(k)[0] & t._group_mask for k in keys}
+            fingerprints = {t._split_hash(k)[1] for k in keys}
+            self.assertGreater(len(groups), (t._group_mask + 1) // 2)
+            self.assertEqual(len(fingerprints), 128)
+
+    def test_create(self):
+        t = SwissHashTable(40)
+        self.assertEqual(t.capacity, 64)
+        self.assertEqual(t.size, 0)
+        self.assertEqual(t.max_load_factor, 0.875)
+        self.assertTrue(is_swiss_hash_table(t))
+
+    def test_key_None(self):
+        t = SwissHashTable()
+        self.assertRaises(TypeError, t.put, None, 5)
+        self.assertRaises(TypeError, t.get, None)
+        self.assertRaises(TypeError, t.delete, None)
+
+    def test_non_hashable_type(self):
+        t = SwissHashTable()
+        self.assertRaises(TypeError, t.put, [], 12)
+        self.assertRaises(TypeError, t.get, {})
+        self.assertRaises(TypeError, t.delete, [])
+
+    def test_get_empty_table(self):
+        self.assertIsNone(SwissHashTable().get("a"))
+
+    def test_put_and_get_all(self):
+        t = SwissHashTable()
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        for v, k in enumerate(ls):
+            t[k] = v
+        self.assertEqual(t.size, len(ls))
+        self.assertEqual(len(t), len(ls))
+        self.assertLessEqual(t.load_factor, 0.875)
+        self.assertTrue(is_swiss_hash_table(t))
+        for v, k in enumerate(ls):
+            self.assertEqual(t[k], v)
+        self.assertIsNone(t.get("not a key"))
+
+    def test_put_same_key_multiple_times(self):
+        t = SwissHashTable()
+        t.put("three", 3)
+        t.put(5, 6)
+        t.put("three", "three")
+        self.assertEqual(t.size, 2)
+        self.assertEqual(t.get("three"), "three")
+
+    def test_colliding_keys(self):
+        # All keys have the same fingerprint and start from the same group, so
+        # they fill more than one group.
+        t = SwissHashTable()
+        keys = [CollidingKey(i) for i in range(40)]
+        for k in keys:
+            t.put(k, k.x)
+        self.assertTrue(is_swiss_hash_table(t))
+        for k in keys[::2]:
+            self.assertEqual(t.delete(k), k.x)
+        self.assertTrue(is_swiss_hash_table(t))
+        for k in keys:
+            self.assertEqual(t.get(CollidingKey(k.x)), None if k.x % 2 == 0 else k.x)
+
+    def test_delete_key_not_present(self):
+        t = SwissHashTable()
+        t.put(-10, "ten")
+        self.assertIsNone(t.delete(7))
+        self.assertEqual(t.size, 1)
+
+    def test_insert_delete_churn(self):
+        t = SwissHashTable()
+        d = {}
+        for _ in range(5000):
+            k = f"key-{randint(0, 200)}"
+            if randint(0, 2) == 0:
+                self.assertEqual(t.delete(k), d.pop(k, None))
+            else:
+                t.put(k, k)
+                d[k] = k
+            self.assertEqual(t.size, len(d))
+        self.assertTrue(is_swiss_hash_table(t))
+        for i in range(201):
+            self.assertEqual(t.get(f"key-{i}"), d.get(f"key-{i}"))
+
+    def test_bulk_operations_and_views(self):
+        ls = gen_rand_list_of_distinct_ascii_and_numbers()
+        t = SwissHashTable.from_items([(k, i) for i, k in enumerate(ls)])
+        self.assertTrue(is_swiss_hash_table(t))
+        t.put_many([(k, -i) for i, k in enumerate(ls[::2])])
+        self.assertEqual(t.size, len(ls))
+        expected = [-(i // 2) if i % 2 == 0 else i for i in range(len(ls))]
+        self.assertEqual(t.get_many(ls), expected)
+        self.assertEqual(t.get_many(["not a key"]), [None])
+        self.assertEqual(set(t), set(ls))
+        self.assertEqual(t.items(), set(zip(ls, expected)))
+        self.assertEqual(sorted(t.values()), sorted(expected))
+        self.assertIn(ls[0], t)
+        self.assertNotIn("not a key", t)
+        del t[ls[0]]
+        self.assertNotIn(ls[0], t.keys())
+        self.assertRaises(KeyError, t.__delitem__, ls[0])
+        self.assertTrue(is_swiss_hash_table(t))
+
+
+class TestIsSwissHashTable(unittest.TestCase):
+    def test_not_swiss_hash_table(self):
+        self.assertFalse(is_swiss_hash_table({}))
+
+    def test_wrong_fingerprint(self):
+        t = SwissHashTable()
+        t.put("a", 1)
+        i = t._keys.index("a")  # pylint: disable=protected-access
+        t._ctrl[i] = (t._ctrl[i] + 1) % 128  # pylint: disable=protected-access
+        self.assertFalse(is_swiss_hash_table(t))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the classes and functions in the andz.ds.TimingWheel module.
+"""
+
+import unittest
+from random import randint, sample
+
+from andz.ds.TimingWheel import TimingWheel
+
+
+class TestTimingWheel(unittest.TestCase):
+    def test_create_invalid_wheel_size(self):
+        self.assertRaises(TypeError, TimingWheel, 2.0)
+        self.assertRaises(ValueError, TimingWheel, 1)
+        self.assertRaises(ValueError, TimingWheel, 12)
+
+    def test_create_invalid_levels(self):
+        self.assertRaises(TypeError, TimingWheel, 8, "2")
+        self.assertRaises(ValueError, TimingWheel, 8, 0)
+
+    def test_create(self):
+        w = TimingWheel(8, 3)
+        self.assertTrue(w.is_empty())
+        self.assertEqual(w.size, 0)
+        self.assertEqual(w.time, 0)
+        self.assertEqual(w.horizon, 512)
+        self.assertEqual(w.advance(10), [])
+        self.assertEqual(w.time, 10)
+
+    def test_schedule_invalid(self):
+        w = TimingWheel()
+        self.assertRaises(TypeError, w.schedule, 1.5, "a")
+        self.assertRaises(ValueError, w.schedule, 0, "a")
+        self.assertRaises(ValueError, w.schedule, 1, None)
+
+    def test_advance_invalid(self):
+        self.assertRaises(TypeError, TimingWheel().advance, 1.0)
+        self.assertRaises(ValueError, TimingWheel().advance, -1)
+
+    def test_cancel_invalid(self):
+        self.assertRaises(TypeError, TimingWheel().cancel, "not a timer")
+
+    def test_schedule_and_advance(self):
+        w = TimingWheel(4, 2)
+        w.schedule(1, "a")
+        w.schedule(3, "b")
+        w.schedule(3, "c")
+        self.assertEqual(w.size, 3)
+        self.assertEqual(w.advance(), ["a"])
+        self.assertEqual(w.advance(), [])
+        self.assertEqual(sorted(w.advance()), ["b", "c"])
+        self.assertTrue(w.is_empty())
+
+    def test_timers_fire_in_order(self):
+        # With 4 slots and 2 levels, the horizon is 16 ticks, so all levels and
+        # the overflow heap are used.
+        w = TimingWheel(4, 2)
+        delays = [randint(1, 100) for _ in range(500)]
+        for i, d in enumerate(delays):
+            w.schedule(d, i)
+        fired = []
+        for t in range(1, 101):
+            for i in w.advance():
+                self.assertEqual(delays[i], t)
+                fired.append(i)
+        self.assertEqual(sorted(fired), list(range(len(delays))))
+        self.assertTrue(w.is_empty())
+
+    def test_advance_many_ticks(self):
+        w = TimingWheel(4, 2)
+        delays = [randint(1, 50) for _ in range(100)]
+        for i, d in enumerate(delays):
+            w.schedule(d, i)
+        fired = w.advance(30)
+        self.assertEqual(
+            sorted(fired), sorted(i for i, d in enumerate(delays) if d <= 30)
+        )
+        self.assertEqual([delays[i] for i in fired], sorted(delays[i] for i in fired))
+
+    def test_schedule_while_advancing(self):
+        w = TimingWheel(4, 2)
+        w.advance(13)
+        w.schedule(20, "a")
+        self.assertEqual(w.advance(19), [])
+        self.assertEqual(w.advance(), ["a"])
+        self.assertEqual(w.time, 33)
+
+    def test_cancel(self):
+        w = TimingWheel(4, 2)
+        delays = [randint(1, 60) for _ in range(200)]
+        timers = [w.schedule(d, i) for i, d in enumerate(delays)]
+        cancelled = set(sample(range(len(delays)), 100))
+        for i in cancelled:
+            self.assertTrue(w.cancel(timers[i]))
+            self.assertFalse(w.cancel(timers[i]))
+        self.assertEqual(w.size, 100)
+        fired = w.advance(60)
+        self.assertEqual(sorted(fired), sorted(set(range(len(delays))) - cancelled))
+        self.assertFalse(w.cancel(timers[fired[0]]))
+        self.assertTrue(w.is_empty())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Meta-info
+
+Author: Nelson Brochado
+
+Created: 19/10/2026
+
+Updated: 19/10/2026
+
+# Description
+
+Unit tests for the functions in the andz.ds.linear_probing module.
+"""
+
+import unittest
+from random import Random
+
+from andz.ds.linear_probing import (
+    backward_shift,
+    capacity_for,
+    grown_capacity,
+    probe,
+    probe_hashed,
+    reinsert,
+    shrunk_capacity,
+)
+
+
+def insert(keys: list, homes: dict, key: int) -> None:
+    keys[probe(keys, key, homes[key])] = key
+
+
+class TestLinearProbing(unittest.TestCase):
+    def test_probe(self):
+        keys = [None, 3, 7, None, 5]
+        self.assertEqual(probe(keys, 3, 1), 1)
+        self.assertEqual(probe(keys, 7, 1), 2)
+        self.assertEqual(probe(keys, 8, 1), 3)
+        self.assertEqual(probe(keys, 5, 4), 4)
+        self.assertEqual(probe(keys, 6, 4), 0)  # It wraps around.
+
+    def test_probe_hashed(self):
+        class Key:
+            comparisons = 0
+
+            def __eq__(self, other):
+                Key.comparisons += 1
+                return self is other
+
+            __hash__ = object.__hash__
+
+        a, b = Key(), Key()
+        keys = [a, b, None]
+        hashes = [1, 2, 0]
+        self.assertEqual(probe_hashed(keys, hashes, b, 2, 0), 1)
+        self.assertEqual(probe_hashed(keys, hashes, Key(), 2, 0), 2)
+        # Only b has the same hash code as the keys looked up.
+        self.assertEqual(Key.comparisons, 1)
+
+    def test_backward_shift(self):
+        rng = Random(0)
+        for _ in range(200):
+            n = rng.randint(2, 20)
+            homes = {k: rng.randrange(n) for k in range(rng.randint(1, n - 1))}
+            keys = [None] * n
+            for k in homes:
+                insert(keys, homes, k)
+            values = [None if k is None else -k for k in keys]
+            deleted = rng.choice(list(homes))
+            i = backward_shift(
+                keys,
+                (values,),
+                probe(keys, deleted, homes[deleted]),
+                lambda j: homes[keys[j]],
+            )
+            keys[i] = values[i] = None
+            for k in homes:
+                j = probe(keys, k, homes[k])
+                if k == deleted:
+                    self.assertIsNone(keys[j])
+                else:
+                    self.assertEqual(keys[j], k)
+                    self.assertEqual(values[j], -k)
+
+    def test_reinsert(self):
+        old_keys = [None, 3, 8, None, 1]
+        old_values = [None, "c", "h", None, "a"]
+        keys = [None] * 7
+        values = [None] * 7
+        reinsert(old_keys, (old_values,), keys, (values,), lambda j: old_keys[j] % 7)
+        # 8 and 1 have the same home slot, and 8 is inserted first.
+        self.assertEqual(keys, [None, 8, 1, 3, None, None, None])
+        self.assertEqual(values, [None, "h", "a", "c", None, None, None])
+
+    def test_grown_capacity(self):
+        self.assertEqual(grown_capacity(6, 10, 0.7), 10)
+        self.assertEqual(grown_capacity(7, 10, 0.7), 21)
+
+    def test_shrunk_capacity(self):
+        self.assertEqual(shrunk_capacity(2, 40, 0.7, 11), 20)
+        self.assertEqual(shrunk_capacity(7, 40, 0.7, 11), 40)
+        self.assertEqual(shrunk_capacity(1, 20, 0.7, 11), 11)
+        self.assertEqual(shrunk_capacity(0, 11, 0.7, 11), 11)
+
+    def test_capacity_for(self):
+        self.assertEqual(capacity_for(0, 0.7), 1)
+        self.assertEqual(capacity_for(7, 0.7), 11)
+        self.assertGreater(0.7 * capacity_for(100, 0.7), 100)